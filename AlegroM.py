@@ -2,11 +2,33 @@ import sys
 import os
 import subprocess
 import ctypes
+import platform
 import webbrowser
 import logging
 import json
+import gzip
+import copy
+import re
+import csv
 import time
-from datetime import datetime
+import asyncio
+import socket
+import struct
+import random
+import math
+import heapq
+import bisect
+import threading
+import contextlib
+from collections import deque, namedtuple
+import hashlib
+import hmac
+import argparse
+import fnmatch
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from array import array
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -14,14 +36,15 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, 
     QLabel, QGridLayout, QFrame, QSystemTrayIcon, QMenu, QHBoxLayout,
     QProgressBar, QDialog, QCheckBox, QMessageBox, QStatusBar,
-    QGroupBox, QTextEdit, QFileDialog, QTabWidget, QListWidget,
-    QListWidgetItem, QSlider, QSpinBox, QComboBox
+    QGroupBox, QFileDialog, QInputDialog, QTabWidget, QListWidget,
+    QListWidgetItem, QSlider, QSpinBox, QComboBox, QTreeWidget,
+    QTreeWidgetItem, QAbstractScrollArea, QLineEdit, QAbstractItemView
 )
 from PySide6.QtCore import (
-    Qt, QTimer, QSize, QSharedMemory, QThread, Signal
+    Qt, QTimer, QSize, QSharedMemory, QThread, Signal, QEvent, QFileSystemWatcher
 )
 from PySide6.QtGui import (
-    QAction, QIcon, QFont, QColor
+    QAction, QIcon, QFont, QColor, QPainter, QPainterPath, QPen, QTransform
 )
 
 try:
@@ -31,6 +54,29 @@ except ImportError:
     HAS_PSUTIL = False
     psutil = None
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pa_ipc = None
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+    pq = None
+
 # ==============================================
 # GLOBAL KONFİGÜRASYON
 # ==============================================
@@ -64,6 +110,9 @@ class Logger:
         self.backup_dir = Path("backups")
         self.backup_dir.mkdir(exist_ok=True)
         
+        self.cache_dir = Path("cache")
+        self.cache_dir.mkdir(exist_ok=True)
+        
         self.setup_logging()
         self._initialized = True
     
@@ -139,6 +188,99 @@ def get_application_icon():
         QApplication.style().StandardPixmap.SP_ComputerIcon
     )
 
+# ==============================================
+# KOMUT ÇALIŞTIRMA
+# ==============================================
+DEFAULT_COMMAND_TIMEOUT = 60
+
+def kill_process_tree(pid: int, grace: float = 3.0) -> int:
+    """Shell ve tüm alt süreçlerini sonlandırır; durmayanları zorla öldürür"""
+    if HAS_PSUTIL:
+        try:
+            parent = psutil.Process(pid)
+            procs = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return 0
+        for proc in procs:
+            try:
+                proc.terminate()
+            except psutil.Error:
+                pass
+        gone, alive = psutil.wait_procs(procs, timeout=grace)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(alive, timeout=grace)
+        return len(procs)
+    
+    if os.name == 'nt':
+        subprocess.run(f"taskkill /PID {pid} /T /F", shell=True, capture_output=True,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+    else:
+        try:
+            os.killpg(pid, 9)
+        except OSError:
+            pass
+    return 1
+
+def run_process(command: str, timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT,
+                cancel_event: Optional[threading.Event] = None, poll: float = 0.1) -> Dict:
+    """Komutu süre bütçesi ve iptal desteğiyle çalıştırır; süreç ağacı asla geride kalmaz"""
+    started = time.monotonic()
+    deadline = started + timeout if timeout else None
+    proc = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+        start_new_session=os.name != 'nt'
+    )
+    status = 'ok'
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=poll)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel_event is not None and cancel_event.is_set():
+                status = 'cancelled'
+            elif deadline is not None and time.monotonic() >= deadline:
+                status = 'timeout'
+            else:
+                continue
+            kill_process_tree(proc.pid)
+            stdout, stderr = proc.communicate()
+            break
+    
+    return {
+        'returncode': proc.returncode,
+        'stdout': stdout or "",
+        'stderr': stderr or "",
+        'status': status,
+        'duration': time.monotonic() - started
+    }
+
+def install_system_backend(backend=None, runner=None) -> Tuple:
+    """psutil ve komut çalıştırıcı yerine sahte arka uç kurar (benchmark/tekrar); öncekini döndürür"""
+    global psutil, HAS_PSUTIL, run_process
+    previous = (psutil, HAS_PSUTIL, run_process)
+    if backend is not None:
+        psutil = backend
+        HAS_PSUTIL = True
+    if runner is not None:
+        run_process = runner
+    return previous
+
+def system_time() -> float:
+    """Örneklerin zaman damgası; iz tekrarında kaydın kendi saati kullanılır"""
+    clock = getattr(psutil, 'trace_time', None)
+    return clock() if clock is not None else time.time()
+
 # ==============================================
 # ARKA PLAN İŞÇİSİ (THREAD)
 # ==============================================
@@ -147,241 +289,5547 @@ class WorkerThread(QThread):
     finished = Signal(bool, str)
     log_signal = Signal(str, str, str)
     
-    def __init__(self, operation_name: str, command: str):
+    def __init__(self, operation_name: str, command: str, timeout: Optional[float] = DEFAULT_COMMAND_TIMEOUT):
         super().__init__()
         self.operation_name = operation_name
         self.command = command
+        self.timeout = timeout
+        self.cancel_event = threading.Event()
         self.logger = Logger()
     
+    def cancel(self):
+        self.cancel_event.set()
+    
     def run(self):
         try:
             self.log_signal.emit("INFO", self.operation_name, "Başlatılıyor...")
+            self.progress.emit(0)
             
-            result = subprocess.run(
-                self.command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                timeout=60,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
+            result = run_process(self.command, self.timeout, self.cancel_event)
+            self.progress.emit(100)
             
-            if result.returncode == 0:
+            if result['status'] == 'cancelled':
+                self.log_signal.emit("WARNING", self.operation_name, "İptal edildi")
+                self.finished.emit(False, "İşlem iptal edildi")
+            elif result['status'] == 'timeout':
+                self.log_signal.emit("ERROR", self.operation_name, f"Zaman aşımı ({self.timeout} sn)")
+                self.finished.emit(False, f"İşlem zaman aşımına uğradı ({self.timeout} sn)")
+            elif result['returncode'] == 0:
                 self.log_signal.emit("SUCCESS", self.operation_name, "Başarılı")
-                self.finished.emit(True, result.stdout[:200])
+                self.finished.emit(True, result['stdout'][:200])
             else:
-                self.log_signal.emit("ERROR", self.operation_name, f"Hata: {result.stderr[:100]}")
-                self.finished.emit(False, result.stderr[:200])
+                self.log_signal.emit("ERROR", self.operation_name, f"Hata: {result['stderr'][:100]}")
+                self.finished.emit(False, result['stderr'][:200])
                 
-        except subprocess.TimeoutExpired:
-            self.log_signal.emit("ERROR", self.operation_name, "Zaman aşımı")
-            self.finished.emit(False, "İşlem zaman aşımına uğradı")
         except Exception as e:
             self.log_signal.emit("ERROR", self.operation_name, f"Beklenmeyen hata: {str(e)}")
             self.finished.emit(False, str(e))
 
+# ==============================================
+# ZAMAN SERİSİ TAMPONLARI
+# ==============================================
+def format_bytes(value: float) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if abs(value) < 1024 or unit == 'TB':
+            return f"{value:.1f} {unit}"
+        value /= 1024.0
+
+class RingBuffer:
+    """Sabit kapasiteli, array tabanlı sayısal halka tampon"""
+    __slots__ = ('capacity', '_data', '_index', '_count', 'total_appended')
+    
+    def __init__(self, capacity: int, typecode: str = 'd'):
+        self.capacity = max(1, int(capacity))
+        self._data = array(typecode, bytes(array(typecode).itemsize * self.capacity))
+        self._index = 0
+        self._count = 0
+        self.total_appended = 0
+    
+    def append(self, value: float):
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        self.total_appended += 1
+    
+    def __len__(self):
+        return self._count
+    
+    def values(self) -> List[float]:
+        """Değerleri eskiden yeniye sıralı döndürür"""
+        if self._count < self.capacity:
+            return self._data[:self._count].tolist()
+        return (self._data[self._index:] + self._data[:self._index]).tolist()
+    
+    def tail(self, n: int) -> List[float]:
+        n = min(n, self._count)
+        if n <= 0:
+            return []
+        start = (self._index - n) % self.capacity
+        if start < self._index:
+            return self._data[start:self._index].tolist()
+        return (self._data[start:] + self._data[:self._index]).tolist()
+    
+    def last(self, default=None):
+        if not self._count:
+            return default
+        return self._data[self._index - 1]
+
+class DeviceSeries:
+    """Tek bir cihazın metriklerini ortak zaman damgasıyla tutar"""
+    __slots__ = ('timestamps', 'series', 'last_seen')
+    
+    def __init__(self, metrics: Tuple[str, ...], capacity: int):
+        self.timestamps = RingBuffer(capacity, 'd')
+        # float32 yeterli hassasiyette ve yarı bellek
+        self.series = {m: RingBuffer(capacity, 'f') for m in metrics}
+        self.last_seen = 0.0
+    
+    def append(self, timestamp: float, values: Dict):
+        self.timestamps.append(timestamp)
+        for metric, buffer in self.series.items():
+            buffer.append(values.get(metric, 0.0))
+        self.last_seen = timestamp
+    
+    def latest(self) -> Dict:
+        return {m: round(b.last(0.0), 2) for m, b in self.series.items()}
+    
+    def summary(self) -> Dict:
+        """Tampondaki her metriğin ortalama ve tepe değeri"""
+        result = {}
+        for metric, buffer in self.series.items():
+            values = buffer.values()
+            if values:
+                result[metric] = {'avg': round(sum(values) / len(values), 2),
+                                  'max': round(max(values), 2)}
+        return result
+
+# ==============================================
+# G/Ç HIZ ÖRNEKLEYİCİ
+# ==============================================
+NIC_METRICS = ('rx_bps', 'tx_bps', 'rx_pps', 'tx_pps', 'errors', 'drops')
+DISK_METRICS = ('read_bps', 'write_bps', 'read_iops', 'write_iops', 'latency_ms', 'busy_percent')
+
+def counter_delta(current: int, previous: int, wrap_bits: Optional[int] = None) -> Optional[int]:
+    """Sayaç farkını döndürür; azalma sıfırlanma sayılır (None), taşma yalnızca wrap_bits verilirse düzeltilir"""
+    if current >= previous:
+        return current - previous
+    if wrap_bits and previous < 2 ** wrap_bits:
+        return current + 2 ** wrap_bits - previous
+    return None
+
+def counter_wrap_bits() -> Optional[int]:
+    """Arka uç ham (taşan) sayaç veriyorsa bit genişliği; psutil nowrap=True ile taşmayı zaten düzeltir"""
+    return getattr(psutil, 'counter_bits', None)
+
+class IORateSampler:
+    """Arayüz ve disk başına sayaç farklarından anlık hız hesaplar"""
+    def __init__(self, capacity: int = 3600, stale_after: float = 300.0):
+        self.capacity = capacity
+        self.stale_after = stale_after
+        self.nics: Dict[str, DeviceSeries] = {}
+        self.disks: Dict[str, DeviceSeries] = {}
+        self._prev_nic = {}
+        self._prev_disk = {}
+        self._prev_time = None
+    
+    def sample(self, now: Optional[float] = None) -> Dict:
+        if not HAS_PSUTIL:
+            return {'nics': {}, 'disks': {}}
+        now = system_time() if now is None else now
+        elapsed = None if self._prev_time is None else now - self._prev_time
+        self._prev_time = now
+        
+        try:
+            nic_counters = psutil.net_io_counters(pernic=True) or {}
+        except Exception:
+            nic_counters = {}
+        try:
+            disk_counters = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            disk_counters = {}
+        
+        bits = counter_wrap_bits()
+        nic_rates = self._update(
+            nic_counters, self._prev_nic, self.nics, NIC_METRICS, elapsed, now, self._nic_rates, bits
+        )
+        disk_rates = self._update(
+            disk_counters, self._prev_disk, self.disks, DISK_METRICS, elapsed, now, self._disk_rates, bits
+        )
+        self._evict(now)
+        return {'nics': nic_rates, 'disks': disk_rates}
+    
+    def _update(self, counters, previous, store, metrics, elapsed, now, rate_func, bits=None) -> Dict:
+        rates = {}
+        for name, current in counters.items():
+            prev = previous.get(name)
+            previous[name] = current
+            # Yeni görünen cihaz: yalnızca taban değeri kaydedilir
+            if prev is None or not elapsed or elapsed <= 0:
+                continue
+            # Sıfırlanan (sürücü yeniden yüklenen, yeniden bağlanan) cihazda bu örnek atlanır
+            values = rate_func(current, prev, elapsed, bits)
+            if values is None:
+                continue
+            series = store.get(name)
+            if series is None:
+                series = store[name] = DeviceSeries(metrics, self.capacity)
+            series.append(now, values)
+            rates[name] = values
+        
+        # Kaybolan cihazların taban değerleri silinir, seri bir süre korunur
+        for name in set(previous) - set(counters):
+            del previous[name]
+        return rates
+    
+    @staticmethod
+    def _nic_rates(cur, prev, elapsed, bits=None) -> Optional[Dict]:
+        deltas = [counter_delta(getattr(cur, f), getattr(prev, f), bits) for f in
+                  ('bytes_recv', 'bytes_sent', 'packets_recv', 'packets_sent',
+                   'errin', 'errout', 'dropin', 'dropout')]
+        if None in deltas:
+            return None
+        rx, tx, prx, ptx, errin, errout, dropin, dropout = deltas
+        return {
+            'rx_bps': rx / elapsed,
+            'tx_bps': tx / elapsed,
+            'rx_pps': prx / elapsed,
+            'tx_pps': ptx / elapsed,
+            'errors': errin + errout,
+            'drops': dropin + dropout
+        }
+    
+    @staticmethod
+    def _disk_rates(cur, prev, elapsed, bits=None) -> Optional[Dict]:
+        deltas = [counter_delta(getattr(cur, f), getattr(prev, f), bits) for f in
+                  ('read_bytes', 'write_bytes', 'read_count', 'write_count',
+                   'read_time', 'write_time')]
+        if None in deltas:
+            return None
+        rbytes, wbytes, rcount, wcount, rtime, wtime = deltas
+        ops = rcount + wcount
+        busy = 0.0
+        if hasattr(cur, 'busy_time'):
+            busy_delta = counter_delta(cur.busy_time, prev.busy_time, bits) or 0
+            busy = min(100.0, busy_delta / (elapsed * 10.0))
+        return {
+            'read_bps': rbytes / elapsed,
+            'write_bps': wbytes / elapsed,
+            'read_iops': rcount / elapsed,
+            'write_iops': wcount / elapsed,
+            'latency_ms': (rtime + wtime) / ops if ops else 0.0,
+            'busy_percent': busy
+        }
+    
+    def _evict(self, now: float):
+        for store in (self.nics, self.disks):
+            for name in [n for n, s in store.items() if now - s.last_seen > self.stale_after]:
+                del store[name]
+    
+    def latest(self) -> Dict:
+        return {
+            'nics': {n: s.latest() for n, s in self.nics.items()},
+            'disks': {n: s.latest() for n, s in self.disks.items()}
+        }
+    
+    def total_network_rate(self) -> float:
+        return sum(s.series['rx_bps'].last(0.0) + s.series['tx_bps'].last(0.0)
+                   for s in self.nics.values())
+    
+    def max_disk_latency(self) -> float:
+        return max((s.series['latency_ms'].last(0.0) for s in self.disks.values()), default=0.0)
+
+# ==============================================
+# DONANIM ENVANTERİ
+# ==============================================
+INVENTORY_VERSION = 1
+
+def read_cpu_model() -> str:
+    """İşlemci model adı: kayıt defteri, /proc/cpuinfo veya sysctl"""
+    if HAS_WINREG:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0") as key:
+                return str(winreg.QueryValueEx(key, "ProcessorNameString")[0]).strip()
+        except OSError:
+            pass
+    try:
+        with open('/proc/cpuinfo', 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    if sys.platform == 'darwin':
+        code, output = run_capture("sysctl -n machdep.cpu.brand_string", timeout=5)
+        if code == 0 and output.strip():
+            return output.strip()
+    return platform.processor() or platform.machine() or "?"
+
+class HardwareInventory:
+    """Statik donanım bilgisi diskte önbelleklenir; dinamik alanlar kısa TTL'li ortak önbellekten okunur"""
+    def __init__(self, path: Path = Path("cache") / "hardware.json", dynamic_ttl: float = 1.0):
+        self.path = Path(path)
+        self.dynamic_ttl = dynamic_ttl
+        self.logger = Logger()
+        self.collected = None
+        self._lock = threading.Lock()
+        self._dynamic = None
+        self._dynamic_expires = 0.0
+        # Ucuz temel alanlar hemen, ayrıntılar diskteki son envanterden gelir
+        self.static = self.basic_static()
+        self.load()
+
+    @staticmethod
+    def basic_static() -> Dict:
+        info = {
+            'platform': sys.platform,
+            'os': platform.platform(),
+            'machine': platform.machine(),
+            'hostname': socket.gethostname(),
+            'python_version': sys.version,
+            'app_version': APP_VERSION
+        }
+        if HAS_PSUTIL:
+            info['cpu'] = {
+                'physical_cores': psutil.cpu_count(logical=False),
+                'logical_cores': psutil.cpu_count(logical=True)
+            }
+        return info
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INVENTORY_VERSION or not isinstance(data.get('static'), dict):
+            return False
+        # Sürüm/yorumlayıcı gibi bu çalıştırmaya ait alanlar önbellekten ezilmez
+        self.static = {**data['static'], **{k: v for k, v in self.basic_static().items() if k != 'cpu'}}
+        self.collected = data.get('collected')
+        return True
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.path.with_suffix('.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({'version': INVENTORY_VERSION, 'collected': self.collected,
+                           'static': self.static}, f, indent=2, ensure_ascii=False)
+            os.replace(temp, self.path)
+        except OSError as e:
+            self.logger.log("WARNING", "INVENTORY", f"Envanter kaydedilemedi: {str(e)}")
+
+    def collect_static(self) -> Dict:
+        """Yavaş değişen donanım bilgisini toplar (arka plan thread'inde çağrılır)"""
+        info = self.basic_static()
+        if not HAS_PSUTIL:
+            return info
+
+        physical = psutil.cpu_count(logical=False)
+        logical = psutil.cpu_count(logical=True)
+        cpu = {
+            'model': read_cpu_model(),
+            'physical_cores': physical,
+            'logical_cores': logical,
+            'threads_per_core': logical // physical if physical and logical else None,
+            'freq_min': None,
+            'freq_max': None
+        }
+        try:
+            freq = psutil.cpu_freq()
+        except Exception:
+            freq = None
+        if freq:
+            cpu['freq_min'] = freq.min or None
+            cpu['freq_max'] = freq.max or freq.current or None
+        info['cpu'] = cpu
+
+        info['memory'] = {
+            'total': psutil.virtual_memory().total,
+            'swap_total': psutil.swap_memory().total if hasattr(psutil, 'swap_memory') else None
+        }
+
+        volumes = []
+        for part in psutil.disk_partitions(all=False):
+            try:
+                total = psutil.disk_usage(part.mountpoint).total
+            except OSError:
+                total = None
+            volumes.append({'device': part.device, 'mountpoint': part.mountpoint,
+                            'fstype': part.fstype, 'total': total})
+        info['volumes'] = volumes
+
+        nics = []
+        try:
+            stats = psutil.net_if_stats()
+            addrs = psutil.net_if_addrs()
+        except (OSError, AttributeError):
+            stats, addrs = {}, {}
+        for name in sorted(set(stats) | set(addrs)):
+            stat = stats.get(name)
+            entries = addrs.get(name, [])
+            nics.append({
+                'name': name,
+                'mac': next((a.address for a in entries if a.family == getattr(psutil, 'AF_LINK', None)), None),
+                'ipv4': [a.address for a in entries if a.family == socket.AF_INET],
+                'speed_mbps': stat.speed if stat else None,
+                'mtu': stat.mtu if stat else None
+            })
+        info['nics'] = nics
+
+        battery = self._battery()
+        info['battery'] = {'present': battery is not None}
+        return info
+
+    @staticmethod
+    def _battery():
+        sensors = getattr(psutil, 'sensors_battery', None)
+        if sensors is None:
+            return None
+        try:
+            return sensors()
+        except Exception:
+            return None
+
+    def refresh(self) -> bool:
+        """Statik envanteri yeniden toplar; değiştiyse diske yazar"""
+        static = self.collect_static()
+        with self._lock:
+            changed = static != self.static
+            self.static = static
+            self.collected = time.time()
+            self._dynamic_expires = 0.0
+        self.save()
+        if changed:
+            self.logger.log("INFO", "INVENTORY", "Donanım envanteri güncellendi")
+        return changed
+
+    def invalidate(self):
+        self._dynamic_expires = 0.0
+
+    def dynamic(self) -> Dict:
+        """Hızlı değişen alanlar; TTL içinde tekrar eden çağrılar aynı sonucu paylaşır"""
+        now = time.monotonic()
+        if self._dynamic is not None and now < self._dynamic_expires:
+            return self._dynamic
+
+        info = {}
+        if HAS_PSUTIL:
+            try:
+                freq = psutil.cpu_freq()
+            except Exception:
+                freq = None
+            info['cpu_freq'] = freq.current if freq else None
+
+            mem = psutil.virtual_memory()
+            info['ram'] = {'total': mem.total, 'available': mem.available,
+                           'percent': mem.percent, 'used': mem.used}
+            try:
+                disk = psutil.disk_usage('/')
+                info['disk'] = {'total': disk.total, 'used': disk.used,
+                                'free': disk.free, 'percent': disk.percent}
+            except OSError:
+                info['disk'] = None
+            try:
+                net = psutil.net_io_counters()
+                info['network'] = {'bytes_sent': net.bytes_sent, 'bytes_recv': net.bytes_recv}
+            except Exception:
+                info['network'] = None
+            try:
+                info['uptime'] = time.time() - psutil.boot_time()
+            except Exception:
+                info['uptime'] = None
+
+            battery = self._battery()
+            info['battery'] = None if battery is None else {
+                'percent': battery.percent,
+                'plugged': battery.power_plugged,
+                'secsleft': battery.secsleft if isinstance(battery.secsleft, int) and battery.secsleft >= 0 else None
+            }
+
+        self._dynamic = info
+        self._dynamic_expires = now + self.dynamic_ttl
+        return info
+
+    def summary_lines(self) -> List[str]:
+        """Rapor ve Monitor sekmesi için okunabilir envanter"""
+        static = self.static
+        dynamic = self.dynamic()
+        lines = [f"🖥️ {static.get('hostname', '?')} — {static.get('os', static.get('platform'))}"]
+        cpu = static.get('cpu', {})
+        if cpu:
+            freq = ""
+            if cpu.get('freq_min') and cpu.get('freq_max'):
+                freq = f", {cpu['freq_min']:.0f}-{cpu['freq_max']:.0f} MHz"
+            elif cpu.get('freq_max'):
+                freq = f", maks. {cpu['freq_max']:.0f} MHz"
+            if dynamic.get('cpu_freq'):
+                freq += f" (şu an {dynamic['cpu_freq']:.0f} MHz)"
+            lines.append(f"🧮 CPU: {cpu.get('model', '?')} — {cpu.get('physical_cores')} çekirdek / "
+                         f"{cpu.get('logical_cores')} thread{freq}")
+        memory = static.get('memory')
+        ram = dynamic.get('ram')
+        if memory or ram:
+            total = (memory or ram)['total']
+            used = f", kullanılan {format_bytes(ram['used'])} (%{ram['percent']:.0f})" if ram else ""
+            lines.append(f"🧠 RAM: {format_bytes(total)}{used}")
+        for volume in static.get('volumes', []):
+            size = format_bytes(volume['total']) if volume.get('total') else "?"
+            lines.append(f"💽 {volume['mountpoint']} ({volume['fstype']}): {size}")
+        for nic in static.get('nics', []):
+            if not nic['ipv4'] or all(ip.startswith('127.') for ip in nic['ipv4']):
+                continue
+            speed = f", {nic['speed_mbps']} Mbps" if nic.get('speed_mbps') else ""
+            lines.append(f"🌐 {nic['name']}: {', '.join(nic['ipv4'])}{speed}")
+        battery = dynamic.get('battery')
+        if battery:
+            state = "şarjda" if battery['plugged'] else "pilde"
+            left = f", ~{battery['secsleft'] // 60} dk" if battery['secsleft'] else ""
+            lines.append(f"🔋 Pil: %{battery['percent']:.0f} ({state}{left})")
+        if dynamic.get('uptime'):
+            lines.append(f"⏱️ Çalışma süresi: {timedelta(seconds=int(dynamic['uptime']))}")
+        return lines
+
+class HardwareInventoryThread(QThread):
+    result_ready = Signal(bool)
+
+    def __init__(self, inventory: HardwareInventory):
+        super().__init__()
+        self.inventory = inventory
+
+    def run(self):
+        try:
+            changed = self.inventory.refresh()
+        except Exception as e:
+            Logger().log("ERROR", "INVENTORY", f"Hata: {str(e)}")
+            changed = False
+        self.result_ready.emit(changed)
+
+# ==============================================
+# TERMAL KISILMA ALGILAMA
+# ==============================================
+# Öncelikli CPU sıcaklık kaynakları; hiçbiri yoksa tüm sensörlere bakılır
+CPU_SENSOR_NAMES = ('coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'cpu-thermal', 'soc_thermal', 'acpitz')
+
+class ThrottleDetector:
+    """Yük altındaki CPU frekansını azamiyle ve sıcaklığı sınırla karşılaştırır; süregelen kısılmayı olay olarak kaydeder"""
+    def __init__(self, sensors=None, max_freq: Optional[float] = None, freq_ratio: float = 0.75,
+                 load_threshold: float = 50.0, temp_limit: float = 90.0, sustain: float = 10.0,
+                 recovery: float = 5.0, temp_interval: float = 5.0):
+        # None: etkin psutil arka ucu (sentetik/tekrar arka uçları install_system_backend ile gelir)
+        self.sensors = sensors
+        self.max_freq = max_freq
+        self.freq_ratio = freq_ratio
+        self.load_threshold = load_threshold
+        self.temp_limit = temp_limit
+        self.sustain = sustain
+        self.recovery = recovery
+        self.temp_interval = temp_interval
+        self.logger = Logger()
+        self.episodes = deque(maxlen=200)
+        self.events = deque(maxlen=50)
+        self.active = None
+        self.last = {'ratio': None, 'temperature': None, 'limit': None, 'throttled': False}
+        self.observed = 0.0
+        self._episode = None
+        self._clear_since = None
+        self._last_time = None
+        self._temp_cache = (None, None)
+        self._temp_read_at = None
+
+    def _source(self):
+        return self.sensors if self.sensors is not None else psutil
+
+    def read_frequency(self) -> Optional[float]:
+        """Çekirdeklerin anlık frekansının azamiye ortalama oranı (0-1); bilinmiyorsa None"""
+        try:
+            freqs = self._source().cpu_freq(percpu=True)
+        except Exception:
+            return None
+        if hasattr(freqs, 'current'):
+            freqs = [freqs]
+        ratios = []
+        for freq in freqs or []:
+            top = freq.max or self.max_freq
+            if top and freq.current:
+                # Turbo frekansı azamiyi aşabilir
+                ratios.append(min(1.0, freq.current / top))
+        return sum(ratios) / len(ratios) if ratios else None
+
+    def read_temperature(self, now: float) -> Tuple[Optional[float], Optional[float]]:
+        """En sıcak CPU sensörü ve onun sınırı; sensör okuması temp_interval'da bir yapılır"""
+        if self._temp_read_at is not None and 0 <= now - self._temp_read_at < self.temp_interval:
+            return self._temp_cache
+        self._temp_read_at = now
+        self._temp_cache = (None, None)
+        reader = getattr(self._source(), 'sensors_temperatures', None)
+        if reader is None:
+            return self._temp_cache
+        try:
+            sensors = reader() or {}
+        except Exception:
+            return self._temp_cache
+        groups = [sensors[name] for name in CPU_SENSOR_NAMES if sensors.get(name)] or list(sensors.values())
+        readings = [t for group in groups for t in group if t.current]
+        if readings:
+            hottest = max(readings, key=lambda t: t.current)
+            self._temp_cache = (hottest.current, hottest.high or self.temp_limit)
+        return self._temp_cache
+
+    def sample(self, now: float, cpu_load: float) -> Dict:
+        """İzleme adımında çağrılır; frekans oranı, sıcaklık ve kısılma durumunu döndürür"""
+        ratio = self.read_frequency()
+        temperature, limit = self.read_temperature(now)
+        reasons = []
+        # Boştayken frekans düşüşü güç tasarrufudur; yalnızca yük altındaki düşüş kısılmadır
+        if ratio is not None and ratio < self.freq_ratio and cpu_load >= self.load_threshold:
+            reasons.append('frekans')
+        if temperature is not None and temperature >= limit:
+            reasons.append('sıcaklık')
+
+        if self._last_time is not None and now > self._last_time:
+            self.observed += now - self._last_time
+        self._last_time = now
+        self._update(now, reasons, ratio, temperature)
+        self.last = {'ratio': ratio, 'temperature': temperature, 'limit': limit,
+                     'throttled': self.active is not None}
+        return self.last
+
+    def _update(self, now: float, reasons: List[str], ratio: Optional[float], temperature: Optional[float]):
+        if reasons:
+            self._clear_since = None
+            if self._episode is None:
+                self._episode = {'start': now, 'end': None, 'duration': 0.0, 'min_ratio': None,
+                                 'max_temp': None, 'reasons': []}
+            episode = self._episode
+            if ratio is not None and (episode['min_ratio'] is None or ratio < episode['min_ratio']):
+                episode['min_ratio'] = round(ratio, 3)
+            if temperature is not None and (episode['max_temp'] is None or temperature > episode['max_temp']):
+                episode['max_temp'] = round(temperature, 1)
+            episode['reasons'] = sorted(set(episode['reasons']) | set(reasons))
+            if self.active is None and now - episode['start'] >= self.sustain:
+                self.active = episode
+                self.events.append({'type': 'started', 'episode': dict(episode)})
+                self.logger.log("WARNING", "THERMAL", "CPU kısılması başladı", dict(episode))
+            return
+
+        if self._episode is None:
+            return
+        if self.active is None:
+            # Kısa süreli düşüş dönem sayılmaz
+            self._episode = None
+            return
+        if self._clear_since is None:
+            self._clear_since = now
+        if now - self._clear_since >= self.recovery:
+            self._close(self._clear_since)
+
+    def _close(self, end: float):
+        episode = self.active
+        episode['end'] = end
+        episode['duration'] = round(end - episode['start'], 1)
+        self.episodes.append(episode)
+        self.events.append({'type': 'ended', 'episode': dict(episode)})
+        self.logger.log("WARNING", "THERMAL", f"CPU kısılması bitti ({episode['duration']} sn)", dict(episode))
+        self.active = self._episode = self._clear_since = None
+
+    def drain_events(self) -> List[Dict]:
+        events = list(self.events)
+        self.events.clear()
+        return events
+
+    def throttled_seconds(self, since: Optional[float] = None) -> float:
+        """Kısılmada geçen süre; since verilirse yalnızca o andan sonrası"""
+        now = self._last_time
+        if now is None:
+            return 0.0
+        since = since if since is not None else float('-inf')
+        spans = [(e['start'], e['end']) for e in self.episodes]
+        if self.active is not None:
+            spans.append((self.active['start'], now))
+        return sum(max(0.0, end - max(start, since)) for start, end in spans)
+
+    def throttled_share(self, window: float = 600.0) -> float:
+        """Son pencerede kısılmada geçen sürenin yüzdesi"""
+        span = min(window, self.observed)
+        if span <= 0:
+            return 0.0
+        return min(100.0, self.throttled_seconds(self._last_time - window) / span * 100)
+
+    def summary_lines(self, limit: int = 5) -> List[str]:
+        """Rapor ve istatistikler için okunabilir özet"""
+        lines = []
+        ratio, temperature = self.last['ratio'], self.last['temperature']
+        state = f"azami değere oranı %{ratio * 100:.0f}" if ratio is not None else "okunamıyor"
+        if temperature is not None:
+            state += f", sıcaklık {temperature:.0f}°C (sınır {self.last['limit']:.0f}°C)"
+        lines.append(f"⚙️ CPU frekansı: {state}")
+        share = self.throttled_share()
+        lines.append(f"🔥 Kısılma: {len(self.episodes)} dönem, toplam "
+                     f"{timedelta(seconds=int(self.throttled_seconds()))} (son 10 dk %{share:.0f})")
+        if self.active is not None:
+            lines.append(f"⚠️ Şu an kısılıyor: {', '.join(self.active['reasons'])} "
+                         f"({int(self._last_time - self.active['start'])} sn)")
+        if share >= 10:
+            lines.append("💡 Sistem termal sınırlı görünüyor; güç planı ve GPU ayarlarının etkisi sınırlı kalır")
+        for episode in list(self.episodes)[-limit:]:
+            details = []
+            if episode['min_ratio'] is not None:
+                details.append(f"en düşük %{episode['min_ratio'] * 100:.0f}")
+            if episode['max_temp'] is not None:
+                details.append(f"en yüksek {episode['max_temp']:.0f}°C")
+            lines.append(f"   {datetime.fromtimestamp(episode['start']).strftime('%H:%M:%S')} — "
+                         f"{episode['duration']:.0f} sn, {', '.join(episode['reasons'])}"
+                         f"{' (' + ', '.join(details) + ')' if details else ''}")
+        return lines
+
 # ==============================================
 # SİSTEM MONİTÖRÜ
 # ==============================================
 class SystemMonitor:
-    def __init__(self):
+    def __init__(self, history_capacity: int = 86400, inventory: Optional[HardwareInventory] = None,
+                 throttle: Optional[ThrottleDetector] = None):
         self.logger = Logger()
+        self.inventory = inventory or HardwareInventory()
+        # 1 Hz'de 24 saat; grafikler doğrudan bu tamponlardan çizilir
         self.history = {
-            'cpu': [],
-            'ram': [],
-            'disk': [],
-            'network': []
+            'cpu': RingBuffer(history_capacity, 'f'),
+            'ram': RingBuffer(history_capacity, 'f'),
+            'disk': RingBuffer(history_capacity, 'f'),
+            'network': RingBuffer(history_capacity, 'f'),
+            # Frekansın azamiye oranı (%) ve CPU sıcaklığı; okunamayan örnekler NaN
+            'cpu_freq': RingBuffer(history_capacity, 'f'),
+            'cpu_temp': RingBuffer(history_capacity, 'f')
         }
+        self.history_times = RingBuffer(history_capacity, 'd')
+        self.io_sampler = IORateSampler()
+        self.throttle = throttle or ThrottleDetector()
+    
+    def record_tick(self, cpu: float, ram: float, disk: float) -> Dict:
+        """Her izleme adımında toplam metrikleri ve G/Ç hızlarını kaydeder"""
+        now = system_time()
+        rates = self.io_sampler.sample(now)
+        self.history_times.append(now)
+        self.history['cpu'].append(cpu)
+        self.history['ram'].append(ram)
+        self.history['disk'].append(disk)
+        self.history['network'].append(self.io_sampler.total_network_rate())
+        
+        # Çekirdek azami frekansını bildirmeyen sistemlerde envanterdeki değer kullanılır
+        self.throttle.max_freq = self.inventory.static.get('cpu', {}).get('freq_max')
+        thermal = self.throttle.sample(now, cpu)
+        self.history['cpu_freq'].append(thermal['ratio'] * 100 if thermal['ratio'] is not None else math.nan)
+        self.history['cpu_temp'].append(thermal['temperature'] if thermal['temperature'] is not None else math.nan)
+        return rates
     
     def get_system_info(self) -> Dict:
+        static = self.inventory.static
         info = {
             'timestamp': datetime.now().isoformat(),
-            'platform': sys.platform,
-            'python_version': sys.version,
+            'platform': static['platform'],
+            'python_version': static['python_version'],
             'app_version': APP_VERSION
         }
         
         if HAS_PSUTIL:
-            # CPU Bilgileri
+            dynamic = self.inventory.dynamic()
+            cpu = static.get('cpu', {})
+            # CPU yüzdesi izleyicinin son ölçümünden; ek çağrı ölçüm aralığını kısaltır
+            cpu_percent = self.history['cpu'].last(None)
             info['cpu'] = {
-                'percent': psutil.cpu_percent(interval=0.1),
-                'cores': psutil.cpu_count(logical=False),
-                'threads': psutil.cpu_count(logical=True),
-                'freq': psutil.cpu_freq().current if psutil.cpu_freq() else None
-            }
-            
-            # RAM Bilgileri
-            mem = psutil.virtual_memory()
-            info['ram'] = {
-                'total': mem.total,
-                'available': mem.available,
-                'percent': mem.percent,
-                'used': mem.used
+                'percent': round(cpu_percent, 1) if cpu_percent is not None else psutil.cpu_percent(interval=None),
+                'model': cpu.get('model'),
+                'cores': cpu.get('physical_cores'),
+                'threads': cpu.get('logical_cores'),
+                'freq': dynamic.get('cpu_freq')
             }
+            info['ram'] = dynamic.get('ram')
+            info['disk'] = dynamic.get('disk')
+            info['network'] = dynamic.get('network')
             
-            # Disk Bilgileri
-            try:
-                disk = psutil.disk_usage('/')
-                info['disk'] = {
-                    'total': disk.total,
-                    'used': disk.used,
-                    'free': disk.free,
-                    'percent': disk.percent
-                }
-            except:
-                info['disk'] = None
-            
-            # Network
-            net = psutil.net_io_counters()
-            info['network'] = {
-                'bytes_sent': net.bytes_sent,
-                'bytes_recv': net.bytes_recv
+            # Cihaz başına son G/Ç hızları
+            info['io_rates'] = self.io_sampler.latest()
+            info['thermal'] = {
+                'freq_ratio': self.throttle.last['ratio'],
+                'temperature': self.throttle.last['temperature'],
+                'throttled': self.throttle.last['throttled'],
+                'episodes': len(self.throttle.episodes),
+                'throttled_seconds': round(self.throttle.throttled_seconds(), 1)
             }
         
         return info
     
-    def get_performance_score(self) -> int:
+    def get_performance_score(self, cpu_load: Optional[float] = None) -> int:
         if not HAS_PSUTIL:
             return 0
         
         score = 100
         
-        # CPU yüksekse puan düşür
-        cpu_load = psutil.cpu_percent(interval=0.5)
+        # CPU yüksekse puan düşür (bloklamayan okuma: son çağrıdan bu yana)
+        if cpu_load is None:
+            cpu_load = psutil.cpu_percent(interval=None)
         if cpu_load > 80:
             score -= 30
         elif cpu_load > 60:
             score -= 15
         
+        dynamic = self.inventory.dynamic()
+        
         # RAM yüksekse puan düşür
-        ram_percent = psutil.virtual_memory().percent
+        ram_percent = dynamic['ram']['percent']
         if ram_percent > 85:
             score -= 30
         elif ram_percent > 70:
             score -= 15
         
         # Disk doluluğu
-        try:
-            disk_percent = psutil.disk_usage('/').percent
+        if dynamic['disk']:
+            disk_percent = dynamic['disk']['percent']
             if disk_percent > 90:
                 score -= 20
             elif disk_percent > 80:
                 score -= 10
-        except:
-            pass
+        
+        # Disk gecikmesi yüksekse puan düşür
+        disk_latency = self.io_sampler.max_disk_latency()
+        if disk_latency > 100:
+            score -= 10
+        elif disk_latency > 50:
+            score -= 5
+        
+        # Son 10 dakikada kısılmada geçen süre: makine yükten önce ısıdan sınırlanıyor
+        throttled = self.throttle.throttled_share(600)
+        if throttled >= 25:
+            score -= 20
+        elif throttled >= 5:
+            score -= 10
         
         return max(0, min(100, score))
 
 # ==============================================
-# OPERASYON GEÇMİŞİ
+# UYGULAMA KAYNAK BÜTÇESİ
 # ==============================================
-class OperationHistory:
-    def __init__(self):
-        self.history = []
-        self.max_history = 50
-        self.logger = Logger()
+def user_idle_seconds() -> Optional[float]:
+    """Son klavye/fare girdisinden bu yana geçen süre (yalnızca Windows)"""
+    if os.name != 'nt':
+        return None
     
-    def add(self, operation: str, command: str, success: bool, 
-            result: str = "", details: Dict = None):
-        entry = {
-            'id': len(self.history) + 1,
-            'timestamp': datetime.now().isoformat(),
-            'operation': operation,
-            'command': command[:100],
-            'success': success,
-            'result': result[:200],
-            'details': details or {}
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint)]
+    
+    try:
+        info = LASTINPUTINFO()
+        info.cbSize = ctypes.sizeof(info)
+        if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+            return None
+        return ((ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000.0
+    except (AttributeError, OSError):
+        return None
+
+class OverheadBudget:
+    """Uygulamanın kendi CPU ve RSS kullanımını ölçer, bütçe aşılırsa örnekleme yavaşlatılır"""
+    def __init__(self, cpu_budget: float = 1.0, rss_budget_mb: float = 250, window: int = 30,
+                 max_factor: float = 4.0):
+        self.cpu_budget = cpu_budget
+        self.rss_budget = rss_budget_mb * 1024 * 1024
+        self.max_factor = max_factor
+        self.cpu = RingBuffer(window, 'f')
+        self.rss = RingBuffer(window, 'd')
+        self.factor = 1.0
+        self.process = psutil.Process() if HAS_PSUTIL else None
+        self.cpu_count = (psutil.cpu_count() if HAS_PSUTIL else 1) or 1
+        if self.process is not None:
+            try:
+                self.process.cpu_percent(None)
+            except psutil.Error:
+                self.process = None
+    
+    def sample(self) -> Dict:
+        if self.process is None:
+            return self.status()
+        try:
+            with self.process.oneshot():
+                # Toplam CPU kapasitesine oranla (tüm çekirdekler = %100)
+                self.cpu.append(self.process.cpu_percent(None) / self.cpu_count)
+                self.rss.append(self.process.memory_info().rss)
+        except psutil.Error:
+            return self.status()
+        
+        # Bütçe aşılınca aralık iki katına çıkar, altında kalınca yavaşça geri döner
+        cpu_avg = sum(self.cpu.values()) / len(self.cpu)
+        if cpu_avg > self.cpu_budget:
+            self.factor = min(self.max_factor, self.factor * 2)
+        elif cpu_avg < self.cpu_budget / 2:
+            self.factor = max(1.0, self.factor / 1.25)
+        return self.status()
+    
+    def status(self) -> Dict:
+        cpu_avg = sum(self.cpu.values()) / len(self.cpu) if len(self.cpu) else 0.0
+        rss = self.rss.last(0.0)
+        return {
+            'cpu_percent': round(self.cpu.last(0.0), 2),
+            'cpu_avg': round(cpu_avg, 2),
+            'cpu_budget': self.cpu_budget,
+            'rss': rss,
+            'rss_budget': self.rss_budget,
+            'over_cpu': cpu_avg > self.cpu_budget,
+            'over_rss': rss > self.rss_budget,
+            'factor': round(self.factor, 2)
         }
+
+# ==============================================
+# PROCESS ÖRNEKLEYİCİ
+# ==============================================
+class ProcessSampler:
+    """Tüm processlerin CPU ve bellek kullanımını tek geçişte toplar"""
+    def __init__(self, uss_top_n: int = 25):
+        self.uss_top_n = uss_top_n
+    
+    def sample(self) -> Dict:
+        processes = {}
+        if not HAS_PSUTIL:
+            return {'timestamp': system_time(), 'processes': processes}
         
-        self.history.append(entry)
+        handles = {}
+        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'create_time']):
+            info = proc.info
+            mem = info['memory_info']
+            if mem is None:
+                continue
+            processes[info['pid']] = {
+                'name': info['name'] or '?',
+                'cpu': info['cpu_percent'] or 0.0,
+                'rss': mem.rss,
+                'uss': None,
+                'create_time': info['create_time'] or 0.0
+            }
+            handles[info['pid']] = proc
         
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+        # USS pahalıdır; yalnızca en büyük RSS sahipleri için okunur
+        for pid in heapq.nlargest(self.uss_top_n, processes, key=lambda p: processes[p]['rss']):
+            try:
+                processes[pid]['uss'] = handles[pid].memory_full_info().uss
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, AttributeError):
+                continue
         
-        self.logger.log(
-            "INFO" if success else "ERROR",
-            "HISTORY",
-            f"{operation} - {'Başarılı' if success else 'Başarısız'}",
-            entry
-        )
+        return {'timestamp': system_time(), 'processes': processes}
+
+class ProcessSamplerThread(QThread):
+    snapshot_ready = Signal(dict)
     
-    def get_last(self, n: int = 10) -> List:
-        return self.history[-n:]
+    def __init__(self, sampler: ProcessSampler, interval_ms: int = 2000):
+        super().__init__()
+        self.sampler = sampler
+        self.interval_ms = interval_ms
+        # Arayüz dışı tüketiciler örnekleyici thread'inde çağrılır
+        self.listeners = []
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
     
-    def clear(self):
-        self.history.clear()
-        self.logger.log("INFO", "HISTORY", "Geçmiş temizlendi")
+    def set_interval(self, interval_ms: int):
+        """Aralığı değiştirir; kısalıyorsa beklemeyi hemen keser"""
+        shorter = interval_ms < self.interval_ms
+        self.interval_ms = interval_ms
+        if shorter:
+            self._wake.set()
+    
+    def run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                snapshot = self.sampler.sample()
+                for listener in list(self.listeners):
+                    listener(snapshot)
+                self.snapshot_ready.emit(snapshot)
+            except Exception as e:
+                Logger().log("ERROR", "PROCESS_SAMPLER", f"Hata: {str(e)}")
+            elapsed = time.monotonic() - started
+            self._wake.wait(max(0.05, self.interval_ms / 1000.0 - elapsed))
+            self._wake.clear()
+    
+    def stop(self):
+        self._stop_event.set()
+        self._wake.set()
+        self.wait(5000)
 
 # ==============================================
-# AYARLAR YÖNETİCİSİ
+# İZ KAYDI VE TEKRAR
 # ==============================================
-class SettingsManager:
-    def __init__(self):
-        self.settings_file = Path("alegro_settings.json")
-        self.default_settings = {
-            'general': {
-                'language': 'TR',
-                'theme': 'GX',
-                'start_minimized': False,
-                'minimize_to_tray': True,
-                'check_updates': True,
-                'auto_save_reports': True
-            },
-            'performance': {
-                'auto_boost_threshold': 70,
-                'monitor_interval': 2000,
-                'enable_logging': True,
-                'enable_sounds': False
-            },
-            'optimizations': {
-                'aggressive_mode': False,
-                'backup_before_ops': True,
-                'confirm_dangerous_ops': True,
-                'undo_history_size': 20
-            }
+TRACE_FORMAT = "alegro-trace"
+TRACE_VERSION = 1
+TRACE_MEMORY_FIELDS = ('total', 'available', 'percent', 'used', 'free')
+TRACE_DISK_USAGE_FIELDS = ('total', 'used', 'free', 'percent')
+TRACE_FREQ_FIELDS = ('current', 'min', 'max')
+NIC_COUNTER_FIELDS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                      'errin', 'errout', 'dropin', 'dropout')
+DISK_COUNTER_FIELDS = ('read_count', 'write_count', 'read_bytes', 'write_bytes',
+                       'read_time', 'write_time', 'busy_time')
+
+_svmem = namedtuple('svmem', TRACE_MEMORY_FIELDS)
+_sdiskusage = namedtuple('sdiskusage', TRACE_DISK_USAGE_FIELDS)
+_scpufreq = namedtuple('scpufreq', TRACE_FREQ_FIELDS)
+_snetio = namedtuple('snetio', NIC_COUNTER_FIELDS)
+_sdiskio = namedtuple('sdiskio', DISK_COUNTER_FIELDS)
+# Windows disk sayaçlarında busy_time yoktur
+_sdiskio_nobusy = namedtuple('sdiskio', DISK_COUNTER_FIELDS[:-1])
+_pmem = namedtuple('pmem', 'rss vms')
+_pfullmem = namedtuple('pfullmem', 'rss vms uss')
+
+class TraceRecorder:
+    """Örnekleyicinin sistem ve process anlık görüntülerini gzip'li JSON satırlarına yazar"""
+    def __init__(self, path: Path, keyframe_every: int = 30, flush_interval: float = 10.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.keyframe_every = keyframe_every
+        self.flush_interval = flush_interval
+        self.frames = 0
+        self.started = system_time()
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8', compresslevel=6)
+        self._last_flush = time.monotonic()
+        self._previous = {}
+        self._process_frames = 0
+        self._write({
+            'type': 'header',
+            'format': TRACE_FORMAT,
+            'version': TRACE_VERSION,
+            'started': self.started,
+            'platform': sys.platform,
+            'hostname': socket.gethostname(),
+            'app_version': APP_VERSION,
+            'cpu_count': psutil.cpu_count() if HAS_PSUTIL else None,
+            'cpu_cores': psutil.cpu_count(logical=False) if HAS_PSUTIL else None
+        })
+
+    def _offset(self, timestamp: float) -> float:
+        return round(timestamp - self.started, 3)
+
+    def _write(self, record: Dict):
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.frames += 1
+            # Çökmede en fazla flush_interval kadar kayıt kaybolur
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = time.monotonic()
+
+    def record_system(self, cpu: float):
+        """Sistem toplamlarını ve cihaz sayaçlarını kaydeder (CPU değeri izleyiciden gelir)"""
+        if not HAS_PSUTIL:
+            return
+        frame = {'type': 'system', 't': self._offset(system_time()), 'cpu': round(cpu, 1)}
+        mem = psutil.virtual_memory()
+        frame['memory'] = [getattr(mem, f) for f in TRACE_MEMORY_FIELDS]
+        try:
+            usage = psutil.disk_usage('/')
+            frame['disk_usage'] = [getattr(usage, f) for f in TRACE_DISK_USAGE_FIELDS]
+        except OSError:
+            frame['disk_usage'] = None
+        try:
+            freq = psutil.cpu_freq()
+            frame['freq'] = [getattr(freq, f) for f in TRACE_FREQ_FIELDS] if freq else None
+        except Exception:
+            frame['freq'] = None
+        try:
+            nics = psutil.net_io_counters(pernic=True) or {}
+        except Exception:
+            nics = {}
+        try:
+            disks = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            disks = {}
+        frame['nics'] = {name: [getattr(c, f, 0) for f in NIC_COUNTER_FIELDS] for name, c in nics.items()}
+        frame['disks'] = {name: [getattr(c, f, None) for f in DISK_COUNTER_FIELDS] for name, c in disks.items()}
+        self._write(frame)
+
+    def record_processes(self, snapshot: Dict):
+        """Örnekleyici dinleyicisi; ara karelerde yalnızca değişen satırlar yazılır"""
+        rows = {
+            pid: [pid, p['name'], round(p['cpu'], 1), p['rss'], p['uss'], p['create_time']]
+            for pid, p in snapshot['processes'].items()
+        }
+        frame = {'type': 'processes', 't': self._offset(snapshot['timestamp'])}
+        if self._process_frames % self.keyframe_every == 0:
+            frame['full'] = True
+            frame['rows'] = list(rows.values())
+        else:
+            previous = self._previous
+            frame['rows'] = [row for pid, row in rows.items() if previous.get(pid) != row]
+            frame['gone'] = [pid for pid in previous if pid not in rows]
+        self._previous = rows
+        self._process_frames += 1
+        self._write(frame)
+
+    def size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+def read_trace(path: Path):
+    """İz kayıtlarını sırayla verir; yarım kalmış (çökmüş) kaydın sonu sessizce atlanır"""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+    except (EOFError, ValueError, gzip.BadGzipFile) as e:
+        Logger().log("WARNING", "TRACE", f"İz dosyası eksik okundu: {str(e)}", {'path': str(path)})
+
+class MetricsArchive:
+    """İzleyici ve process örneklerini sürekli, saatlik iz parçalarına yazar; eski parçalar süre ve boyut sınırıyla silinir"""
+    def __init__(self, directory: Path = Path("metrics"), interval: float = 10.0, segment: float = 3600.0,
+                 retention_days: float = 30, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.interval = interval
+        self.segment = segment
+        self.retention_days = retention_days
+        self.max_bytes = max_bytes
+        self.logger = Logger()
+        # Sistem örnekleri arayüz, process örnekleri örnekleyici thread'inden gelir
+        self._lock = threading.Lock()
+        self._recorder = None
+        self._last = {}
+
+    def _due(self, kind: str, now: float) -> bool:
+        last = self._last.get(kind)
+        if last is not None and 0 <= now - last < self.interval:
+            return False
+        self._last[kind] = now
+        return True
+
+    def _current(self, now: float) -> Optional[TraceRecorder]:
+        if self._recorder is not None and not 0 <= now - self._recorder.started < self.segment:
+            self._close()
+        if self._recorder is None:
+            self._open()
+        return self._recorder
+
+    def record(self, cpu: float):
+        """İzleme adımında çağrılır; örnekler interval'da bir, dışa aktarımın okuduğu iz biçiminde yazılır"""
+        now = system_time()
+        with self._lock:
+            recorder = self._current(now) if self._due('system', now) else None
+        if recorder is not None:
+            recorder.record_system(cpu)
+
+    def record_processes(self, snapshot: Dict):
+        """Örnekleyici dinleyicisi; process anlık görüntüleri de interval'da bir arşivlenir"""
+        now = snapshot['timestamp']
+        with self._lock:
+            recorder = self._current(now) if self._due('processes', now) else None
+        if recorder is not None:
+            # Her parça kendi tam karesiyle başlar; ara kareler yalnızca farkları yazar
+            recorder.record_processes(snapshot)
+
+    def _open(self) -> bool:
+        stamp = datetime.fromtimestamp(system_time()).strftime('%Y%m%d_%H%M%S')
+        path = self.directory / f"trace_{stamp}.jsonl.gz"
+        # Saat geri alınmışsa mevcut parçanın üzerine yazılmaz
+        suffix = 0
+        while path.exists():
+            suffix += 1
+            path = self.directory / f"trace_{stamp}_{suffix}.jsonl.gz"
+        try:
+            self._recorder = TraceRecorder(path, flush_interval=60.0)
+        except OSError as e:
+            self.logger.log("ERROR", "ARCHIVE", f"Metrik arşivi açılamadı: {str(e)}")
+            return False
+        self.prune()
+        return True
+
+    def prune(self) -> int:
+        """Saklama süresini aşan, ardından toplam boyutu aşan en eski parçaları siler"""
+        current = self._recorder.path if self._recorder is not None else None
+        segments = []
+        for path in sorted(self.directory.glob("trace_*.jsonl.gz")):
+            if path == current:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            segments.append((path, stat.st_mtime, stat.st_size))
+        cutoff = time.time() - self.retention_days * 86400
+        total = sum(size for _, _, size in segments)
+        removed = 0
+        for path, mtime, size in segments:
+            if mtime >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            self.logger.log("INFO", "ARCHIVE", f"{removed} eski metrik parçası silindi")
+        return removed
+
+    def _close(self):
+        recorder, self._recorder = self._recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def close(self):
+        """Açık parçayı kapatır; tamamlanmış gzip dosyası dışa aktarımda eksiksiz okunur"""
+        with self._lock:
+            self._close()
+
+class ReplayError(Exception):
+    pass
+
+class ReplayNoSuchProcess(ReplayError):
+    pass
+
+class ReplayAccessDenied(ReplayError):
+    pass
+
+class ReplayProcess:
+    """İzdeki bir processin psutil.Process görünümü; öncelik/affinity değişiklikleri bellekte tutulur"""
+    def __init__(self, backend, row):
+        self._backend = backend
+        self._row = row
+        self.pid = row[0]
+        self.info = {}
+
+    def _current(self):
+        row = self._backend.row(self.pid)
+        if row is None or row[5] != self._row[5]:
+            raise self._backend.NoSuchProcess(self.pid)
+        self._row = row
+        return row
+
+    def _state(self) -> Dict:
+        return self._backend.overrides(self.pid, self._row[5])
+
+    def oneshot(self):
+        return contextlib.nullcontext()
+
+    def is_running(self) -> bool:
+        try:
+            self._current()
+            return True
+        except self._backend.Error:
+            return False
+
+    def name(self):
+        return self._current()[1]
+
+    def exe(self):
+        return self._current()[1]
+
+    def create_time(self):
+        return self._current()[5]
+
+    def status(self):
+        self._current()
+        return 'running'
+
+    def cpu_percent(self, interval=None):
+        return self._current()[2]
+
+    def memory_info(self):
+        row = self._current()
+        return _pmem(row[3], row[3])
+
+    def memory_full_info(self):
+        row = self._current()
+        return _pfullmem(row[3], row[3], row[4] if row[4] is not None else row[3])
+
+    def memory_percent(self):
+        return self._current()[3] / self._backend.total_memory() * 100
+
+    def children(self, recursive=False):
+        return []
+
+    def nice(self, value=None):
+        self._current()
+        state = self._state()
+        if value is None:
+            return state.get('nice', self._backend.normal_priority)
+        state['nice'] = value
+
+    def cpu_affinity(self, cpus=None):
+        self._current()
+        state = self._state()
+        if cpus is None:
+            return list(state.get('affinity', range(self._backend.cores)))
+        state['affinity'] = list(cpus)
+
+    def ionice(self, ioclass=None, value=None):
+        self._current()
+        state = self._state()
+        if ioclass is None:
+            return state.get('ionice')
+        state['ionice'] = (ioclass, value)
+
+    def terminate(self):
+        raise self._backend.AccessDenied(self.pid)
+
+    kill = suspend = resume = terminate
+
+class ReplayBackend:
+    """Kaydedilmiş izi psutil yerine 1x-100x hızda besler; izde olmayan PID'ler gerçek psutil'e devredilir"""
+    def __init__(self, path: Path, speed: float = 1.0, loop: bool = False, clock=time.monotonic, real=None):
+        if not 1.0 <= speed <= 100.0:
+            raise ValueError("Tekrar hızı 1x ile 100x arasında olmalı")
+        self.real = real if real is not None else psutil
+        self.path = Path(path)
+        self.speed = speed
+        self.loop = loop
+        self.clock = clock
+        self.logger = Logger()
+
+        header, system, processes = None, [], []
+        for record in read_trace(self.path):
+            kind = record.get('type')
+            if kind == 'header':
+                header = record
+            elif kind == 'system':
+                system.append(record)
+            elif kind == 'processes':
+                processes.append(record)
+        if header is None or header.get('format') != TRACE_FORMAT:
+            raise ValueError(f"Geçersiz iz dosyası: {self.path}")
+        if not system and not processes:
+            raise ValueError(f"İz dosyası boş: {self.path}")
+
+        self.header = header
+        self.started_at = header['started']
+        self._system = system
+        self._system_times = [f['t'] for f in system]
+        self._processes = processes
+        self._process_times = [f['t'] for f in processes]
+        self._keyframes = [i for i, f in enumerate(processes) if f.get('full')]
+        self.duration = max(self._system_times[-1:] + self._process_times[-1:])
+        self.cores = header.get('cpu_count') or 1
+        self.physical_cores = header.get('cpu_cores') or self.cores
+        # Döngüde sayaçlar geri gitmesin diye her tur bir tur boyu kadar kaydırılır
+        self._counter_span = {}
+        if len(system) > 1:
+            for key in ('nics', 'disks'):
+                first, last = system[0].get(key, {}), system[-1].get(key, {})
+                self._counter_span[key] = {
+                    name: [(b or 0) - (a or 0) for a, b in zip(first[name], last[name])]
+                    for name in first if name in last
+                }
+
+        if self.real is not None:
+            self.Error = self.real.Error
+            self.NoSuchProcess = self.real.NoSuchProcess
+            self.AccessDenied = self.real.AccessDenied
+            self.ZombieProcess = self.real.ZombieProcess
+        else:
+            self.Error = ReplayError
+            self.NoSuchProcess = ReplayNoSuchProcess
+            self.AccessDenied = ReplayAccessDenied
+            self.ZombieProcess = ReplayNoSuchProcess
+        self.normal_priority = getattr(self.real, 'NORMAL_PRIORITY_CLASS', 0)
+
+        self._lock = threading.Lock()
+        self._cursor = -1
+        self._table = {}
+        self._overrides = {}
+        self.finished = False
+        self._origin = clock()
+
+    def __getattr__(self, name):
+        # Sabitler ve kaydedilmeyen çağrılar (boot_time, net_if_stats ...) gerçek psutil'den
+        real = self.__dict__.get('real')
+        if real is None:
+            raise AttributeError(name)
+        return getattr(real, name)
+
+    # --- Zaman ---
+    def elapsed(self) -> float:
+        """Tekrar başlangıcından bu yana geçen iz süresi (döngüde turlar toplanır)"""
+        elapsed = (self.clock() - self._origin) * self.speed
+        if self.loop or elapsed < self.duration:
+            return elapsed
+        if not self.finished:
+            self.finished = True
+            self.logger.log("INFO", "TRACE", "İz tekrarı tamamlandı, son kare tutuluyor",
+                            {'path': str(self.path), 'duration': self.duration})
+        return self.duration
+
+    def _position(self) -> Tuple[float, int]:
+        elapsed = self.elapsed()
+        if self.loop and self.duration > 0:
+            return elapsed % self.duration, int(elapsed // self.duration)
+        return elapsed, 0
+
+    def trace_time(self) -> float:
+        return self.started_at + self.elapsed()
+
+    # --- Kareler ---
+    def _system_frame(self) -> Tuple[Optional[Dict], int]:
+        if not self._system:
+            return None, 0
+        position, lap = self._position()
+        index = max(0, bisect.bisect_right(self._system_times, position) - 1)
+        return self._system[index], lap
+
+    def _sync_processes(self):
+        """Süreç tablosunu şimdiki konuma getirir; geri sarmada en yakın tam kareden kurulur"""
+        position, _ = self._position()
+        target = max(0, bisect.bisect_right(self._process_times, position) - 1)
+        with self._lock:
+            if target == self._cursor or not self._processes:
+                return
+            start = self._cursor + 1
+            key = bisect.bisect_right(self._keyframes, target) - 1
+            if key >= 0 and (target < self._cursor or self._keyframes[key] > self._cursor):
+                start = self._keyframes[key]
+            elif target < self._cursor:
+                start, self._table = 0, {}
+            for frame in self._processes[start:target + 1]:
+                if frame.get('full'):
+                    self._table = {}
+                for pid in frame.get('gone', ()):
+                    self._table.pop(pid, None)
+                for row in frame['rows']:
+                    self._table[row[0]] = row
+            self._cursor = target
+
+    def row(self, pid: int) -> Optional[List]:
+        self._sync_processes()
+        return self._table.get(pid)
+
+    def overrides(self, pid: int, create_time: float) -> Dict:
+        with self._lock:
+            return self._overrides.setdefault((pid, create_time), {})
+
+    def total_memory(self) -> int:
+        frame, _ = self._system_frame()
+        return frame['memory'][0] if frame else 1
+
+    # --- psutil modül fonksiyonları ---
+    def process_iter(self, attrs=None, ad_value=None):
+        self._sync_processes()
+        with self._lock:
+            rows = list(self._table.values())
+        total = self.total_memory()
+        for row in rows:
+            proc = ReplayProcess(self, row)
+            info = {
+                'pid': row[0],
+                'name': row[1],
+                'cpu_percent': row[2],
+                'memory_info': _pmem(row[3], row[3]),
+                'memory_percent': row[3] / total * 100,
+                'create_time': row[5],
+                'exe': row[1]
+            }
+            proc.info = {k: info.get(k, ad_value) for k in attrs} if attrs else info
+            yield proc
+
+    def Process(self, pid: Optional[int] = None):
+        if pid is not None and pid != os.getpid():
+            row = self.row(pid)
+            if row is not None:
+                return ReplayProcess(self, row)
+        # Uygulamanın kendisi ve başlattığı komutlar gerçek processlerdir
+        if self.real is not None:
+            return self.real.Process(pid)
+        raise self.NoSuchProcess(pid)
+
+    def pid_exists(self, pid: int) -> bool:
+        return self.row(pid) is not None or (self.real is not None and self.real.pid_exists(pid))
+
+    def wait_procs(self, procs, timeout=None, callback=None):
+        replayed = [p for p in procs if isinstance(p, ReplayProcess)]
+        real = [p for p in procs if not isinstance(p, ReplayProcess)]
+        gone, alive = self.real.wait_procs(real, timeout, callback) if real else ([], [])
+        return gone, alive + replayed
+
+    def cpu_percent(self, interval=None, percpu=False):
+        frame, _ = self._system_frame()
+        value = frame['cpu'] if frame else 0.0
+        return [value] * self.cores if percpu else value
+
+    def cpu_count(self, logical=True):
+        return self.cores if logical else self.physical_cores
+
+    def cpu_freq(self, percpu=False):
+        frame, _ = self._system_frame()
+        if not frame or not frame.get('freq'):
+            return [] if percpu else None
+        freq = _scpufreq(*frame['freq'])
+        return [freq] * self.cores if percpu else freq
+
+    def sensors_temperatures(self, fahrenheit=False):
+        # Kayıtta sıcaklık yok; gerçek sensörler tekrar edilen yükle karıştırılmaz
+        return {}
+
+    def virtual_memory(self):
+        frame, _ = self._system_frame()
+        if frame is None:
+            return _svmem(1, 1, 0.0, 0, 1)
+        return _svmem(*frame['memory'])
+
+    def disk_usage(self, path):
+        frame, _ = self._system_frame()
+        if not frame or not frame.get('disk_usage'):
+            raise OSError(f"İzde disk kullanımı yok: {path}")
+        return _sdiskusage(*frame['disk_usage'])
+
+    def _counters(self, key: str) -> Dict[str, List]:
+        frame, lap = self._system_frame()
+        if frame is None:
+            return {}
+        counters = frame.get(key, {})
+        span = self._counter_span.get(key, {})
+        if not lap:
+            return counters
+        return {
+            name: [None if v is None else v + lap * s for v, s in zip(values, span.get(name, [0] * len(values)))]
+            for name, values in counters.items()
+        }
+
+    def net_io_counters(self, pernic=False):
+        counters = {name: _snetio(*values) for name, values in self._counters('nics').items()}
+        if pernic:
+            return counters
+        return _snetio(*(sum(c[i] for c in counters.values()) for i in range(len(NIC_COUNTER_FIELDS))))
+
+    def disk_io_counters(self, perdisk=False):
+        counters = {}
+        for name, values in self._counters('disks').items():
+            counters[name] = _sdiskio_nobusy(*values[:-1]) if values[-1] is None else _sdiskio(*values)
+        if perdisk:
+            return counters
+        if not counters:
+            return None
+        width = min(len(c) for c in counters.values())
+        fields = _sdiskio if width == len(DISK_COUNTER_FIELDS) else _sdiskio_nobusy
+        return fields(*(sum(c[i] for c in counters.values()) for i in range(width)))
+
+# ==============================================
+# SÜTUNLU DIŞA AKTARIM
+# ==============================================
+EXPORT_TABLES = ('metrics', 'processes', 'history')
+# Açık şemalar: her biçimde aynı sütun adları ve türleri
+EXPORT_SCHEMAS = {
+    'metrics': (
+        ('host', 'string'), ('timestamp', 'timestamp'), ('cpu_percent', 'float32'),
+        ('mem_percent', 'float32'), ('mem_used', 'int64'), ('mem_available', 'int64'),
+        ('disk_percent', 'float32'), ('cpu_freq_mhz', 'float32'),
+        ('net_rx_bps', 'float64'), ('net_tx_bps', 'float64'),
+        ('disk_read_bps', 'float64'), ('disk_write_bps', 'float64'), ('source', 'string')
+    ),
+    'processes': (
+        ('host', 'string'), ('timestamp', 'timestamp'), ('pid', 'int64'), ('name', 'string'),
+        ('cpu_percent', 'float32'), ('rss', 'int64'), ('uss', 'int64'), ('create_time', 'float64')
+    ),
+    'history': (
+        ('host', 'string'), ('timestamp', 'timestamp'), ('operation', 'string'), ('command', 'string'),
+        ('success', 'bool'), ('result', 'string'), ('details', 'string')
+    )
+}
+EXPORT_EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow', 'csv': '.csv.gz'}
+
+def export_formats() -> List[str]:
+    """Kurulu kütüphanelere göre kullanılabilir biçimler, tercih sırasıyla"""
+    formats = []
+    if HAS_PARQUET:
+        formats.append('parquet')
+    if HAS_PYARROW:
+        formats.append('arrow')
+    formats.append('csv')
+    return formats
+
+def _arrow_type(kind: str):
+    return {
+        'string': pa.string(), 'timestamp': pa.timestamp('us', tz='UTC'), 'float32': pa.float32(),
+        'float64': pa.float64(), 'int64': pa.int64(), 'bool': pa.bool_()
+    }[kind]
+
+class _ColumnSink:
+    """Bir tablonun satırlarını chunk_rows'luk parçalar halinde seçilen biçimde yazar"""
+    def __init__(self, table: str, path: Path, fmt: str, chunk_rows: int):
+        self.table = table
+        self.path = path
+        self.format = fmt
+        self.chunk_rows = chunk_rows
+        self.schema = EXPORT_SCHEMAS[table]
+        self.rows = 0
+        self.chunks = 0
+        self._buffer = []
+        self._writer = None
+        self._file = None
+        if fmt == 'csv':
+            self._file = gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow([name for name, _ in self.schema])
+        else:
+            self._arrow_schema = pa.schema([(name, _arrow_type(kind)) for name, kind in self.schema])
+            if fmt == 'parquet':
+                self._writer = pq.ParquetWriter(str(path), self._arrow_schema, compression='zstd')
+            else:
+                try:
+                    options = pa_ipc.IpcWriteOptions(compression='zstd')
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, ValueError):
+                    options = None
+                self._file = pa.OSFile(str(path), 'wb')
+                self._writer = pa_ipc.new_file(self._file, self._arrow_schema, options=options)
+
+    def append(self, row: Tuple):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        rows, self._buffer = self._buffer, []
+        if self.format == 'csv':
+            stamp = self.schema.index(('timestamp', 'timestamp'))
+            for row in rows:
+                row = list(row)
+                row[stamp] = datetime.fromtimestamp(row[stamp], timezone.utc).isoformat(timespec='milliseconds')
+                self._writer.writerow(row)
+        else:
+            columns = list(zip(*rows))
+            arrays = []
+            for (name, kind), values in zip(self.schema, columns):
+                if kind == 'timestamp':
+                    values = [round(v * 1_000_000) for v in values]
+                arrays.append(pa.array(values, type=_arrow_type(kind)))
+            table = pa.Table.from_arrays(arrays, schema=self._arrow_schema)
+            # Her parça Parquet'te bir satır grubu, Arrow'da bir kayıt grubudur
+            if self.format == 'parquet':
+                self._writer.write_table(table, row_group_size=len(rows))
+            else:
+                self._writer.write_table(table)
+        self.rows += len(rows)
+        self.chunks += 1
+
+    def close(self):
+        self.flush()
+        if self.format != 'csv':
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+class ColumnarExporter:
+    """Metrik arşivini, iz kayıtlarını (metrikler, process anlık görüntüleri) ve işlem geçmişini sütunlu dosyalara akıtır"""
+    def __init__(self, out_dir: Path, fmt: Optional[str] = None, since: Optional[float] = None,
+                 until: Optional[float] = None, chunk_rows: int = 65536, process_interval: float = 60.0,
+                 traces_dir: Path = Path("recordings"), logs_dir: Path = Path("logs"),
+                 host: Optional[str] = None, archive_dir: Path = Path("metrics")):
+        available = export_formats()
+        self.format = fmt if fmt in available else available[0]
+        self.out_dir = Path(out_dir)
+        self.since = since
+        self.until = until
+        self.chunk_rows = max(1, int(chunk_rows))
+        # Process tablosu en büyüğüdür; 0 = her kare
+        self.process_interval = process_interval
+        self.traces_dir = Path(traces_dir)
+        self.archive_dir = Path(archive_dir)
+        self.logs_dir = Path(logs_dir)
+        self.host = host or socket.gethostname()
+        self.logger = Logger()
+        if fmt and fmt != self.format:
+            self.logger.log("WARNING", "EXPORT", f"{fmt} biçimi kullanılamıyor, {self.format} ile yazılıyor")
+
+    def _in_range(self, timestamp: float) -> bool:
+        return ((self.since is None or timestamp >= self.since) and
+                (self.until is None or timestamp <= self.until))
+
+    def export(self, tables=EXPORT_TABLES, cancel_event: Optional[threading.Event] = None,
+               progress=None) -> Dict:
+        """Tabloları yazar; her iz dosyası yalnızca bir kez okunur, bellekte en fazla bir parça tutulur"""
+        started = time.monotonic()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        sinks = {}
+        report = {'format': self.format, 'tables': {}, 'traces': 0, 'cancelled': False}
+        try:
+            for table in tables:
+                path = self.out_dir / f"{table}_{self.host}_{stamp}{EXPORT_EXTENSIONS[self.format]}"
+                sinks[table] = _ColumnSink(table, path, self.format, self.chunk_rows)
+
+            if 'metrics' in sinks or 'processes' in sinks:
+                for path in self._trace_files():
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
+                    self._export_trace(path, sinks.get('metrics'), sinks.get('processes'), cancel_event)
+                    report['traces'] += 1
+                    if progress:
+                        progress(path.name, sum(s.rows for s in sinks.values()))
+            if 'history' in sinks and not (cancel_event is not None and cancel_event.is_set()):
+                for row in self._history_rows():
+                    sinks['history'].append(row)
+        finally:
+            for table, sink in sinks.items():
+                sink.close()
+                report['tables'][table] = {'path': str(sink.path), 'rows': sink.rows, 'chunks': sink.chunks}
+        report['cancelled'] = cancel_event is not None and cancel_event.is_set()
+        report['duration'] = round(time.monotonic() - started, 2)
+        self.logger.log("INFO", "EXPORT",
+                        f"{sum(t['rows'] for t in report['tables'].values())} satır {self.format} olarak yazıldı",
+                        report)
+        return report
+
+    # --- İz kayıtları ---
+    def _trace_files(self) -> List[Path]:
+        """Sürekli metrik arşivi ve elle başlatılan iz kayıtları; satırın kaynağı 'source' sütunundadır"""
+        files = []
+        paths = list(self.archive_dir.glob("trace_*.jsonl.gz")) + list(self.traces_dir.glob("trace_*.jsonl.gz"))
+        for path in sorted(set(paths), key=lambda p: p.name):
+            try:
+                # Son yazımı aralığın başından önceyse dosya açılmaz
+                if self.since is not None and path.stat().st_mtime < self.since:
+                    continue
+            except OSError:
+                continue
+            files.append(path)
+        return files
+
+    def _export_trace(self, path: Path, metrics: Optional[_ColumnSink], processes: Optional[_ColumnSink],
+                      cancel_event: Optional[threading.Event]):
+        started = None
+        host = self.host
+        previous = None
+        state = {}
+        last_emit = None
+        for index, record in enumerate(read_trace(path)):
+            kind = record.get('type')
+            if kind == 'header':
+                started = record['started']
+                host = record.get('hostname') or host
+                if self.until is not None and started > self.until:
+                    return
+                continue
+            if started is None:
+                return
+            if cancel_event is not None and index % 1000 == 0 and cancel_event.is_set():
+                return
+            timestamp = started + record['t']
+            if self.until is not None and timestamp > self.until:
+                return
+
+            if kind == 'system':
+                if metrics is not None:
+                    row = self._metric_row(host, timestamp, record, previous, path.name)
+                    previous = (timestamp, record)
+                    if self._in_range(timestamp):
+                        metrics.append(row)
+            elif kind == 'processes' and processes is not None:
+                # Ara kareler farktır; aralık dışındaki kareler de durumu güncellemek için uygulanır
+                if record.get('full'):
+                    state = {row[0]: row for row in record['rows']}
+                else:
+                    for pid in record.get('gone', []):
+                        state.pop(pid, None)
+                    for row in record['rows']:
+                        state[row[0]] = row
+                if not self._in_range(timestamp):
+                    continue
+                if last_emit is not None and timestamp - last_emit < self.process_interval:
+                    continue
+                last_emit = timestamp
+                for pid, name, cpu, rss, uss, create_time in state.values():
+                    processes.append((host, timestamp, pid, name, cpu, rss, uss, create_time))
+
+    @staticmethod
+    def _rate(current: Dict, previous: Dict, field: int, elapsed: float) -> float:
+        total = 0
+        for name, values in current.items():
+            old = previous.get(name)
+            if old is None or values[field] is None or old[field] is None:
+                continue
+            delta = counter_delta(values[field], old[field])
+            if delta is not None:
+                total += delta
+        return total / elapsed
+
+    def _metric_row(self, host: str, timestamp: float, record: Dict, previous, source: str) -> Tuple:
+        memory = dict(zip(TRACE_MEMORY_FIELDS, record['memory']))
+        disk = record.get('disk_usage')
+        freq = record.get('freq')
+        rates = [None] * 4
+        if previous is not None and timestamp > previous[0]:
+            elapsed = timestamp - previous[0]
+            prev = previous[1]
+            rates = [
+                self._rate(record['nics'], prev['nics'], NIC_COUNTER_FIELDS.index('bytes_recv'), elapsed),
+                self._rate(record['nics'], prev['nics'], NIC_COUNTER_FIELDS.index('bytes_sent'), elapsed),
+                self._rate(record['disks'], prev['disks'], DISK_COUNTER_FIELDS.index('read_bytes'), elapsed),
+                self._rate(record['disks'], prev['disks'], DISK_COUNTER_FIELDS.index('write_bytes'), elapsed)
+            ]
+        return (host, timestamp, record['cpu'], memory['percent'], memory['used'], memory['available'],
+                disk[TRACE_DISK_USAGE_FIELDS.index('percent')] if disk else None,
+                freq[0] if freq else None, *rates, source)
+
+    # --- İşlem geçmişi (günlük dosyalarındaki HISTORY kayıtları) ---
+    def _history_rows(self):
+        for path in sorted(self.logs_dir.glob("alegro_*.log")):
+            try:
+                day = datetime.strptime(path.stem.split('_', 1)[1], '%Y%m%d').timestamp()
+            except ValueError:
+                continue
+            # Dosya adındaki gün aralık dışındaysa dosya okunmaz
+            if (self.since is not None and day + 86400 < self.since) or (self.until is not None and day > self.until):
+                continue
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if '[HISTORY]' not in line:
+                        continue
+                    sep = line.find(' | {')
+                    if sep < 0:
+                        continue
+                    try:
+                        entry = json.loads(line[sep + 3:])
+                        timestamp = datetime.fromisoformat(entry['timestamp']).timestamp()
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if not self._in_range(timestamp):
+                        continue
+                    yield (self.host, timestamp, entry.get('operation'), entry.get('command'),
+                           bool(entry.get('success')), entry.get('result'),
+                           json.dumps(entry.get('details') or {}, ensure_ascii=False, default=str))
+
+class ExportThread(QThread):
+    progress = Signal(str, int)
+    result_ready = Signal(dict)
+
+    def __init__(self, exporter: ColumnarExporter, tables=EXPORT_TABLES):
+        super().__init__()
+        self.exporter = exporter
+        self.tables = tables
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            report = self.exporter.export(self.tables, self.cancel_event, self.progress.emit)
+        except Exception as e:
+            Logger().log("ERROR", "EXPORT", f"Hata: {str(e)}")
+            report = {'error': str(e)}
+        self.result_ready.emit(report)
+
+def parse_export_time(value: Optional[str], end: bool = False) -> Optional[float]:
+    """YYYY-MM-DD[THH:MM] → epoch; yalnızca gün verilen bitiş o günün sonunu kapsar"""
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value)
+    if end and len(value) == 10:
+        moment += timedelta(days=1)
+    return moment.timestamp()
+
+def run_export_cli(argv: List[str]) -> int:
+    """Arayüzsüz dışa aktarım: --export KLASÖR"""
+    parser = argparse.ArgumentParser(prog=APP_NAME)
+    parser.add_argument('--export', required=True, help="Çıktı klasörü")
+    parser.add_argument('--format', choices=('parquet', 'arrow', 'csv'), help="Varsayılan: kullanılabilen en iyisi")
+    parser.add_argument('--since', help="Başlangıç (YYYY-MM-DD[THH:MM])")
+    parser.add_argument('--until', help="Bitiş (YYYY-MM-DD[THH:MM])")
+    parser.add_argument('--tables', default=",".join(EXPORT_TABLES), help="Virgülle ayrılmış tablolar")
+    parser.add_argument('--process-interval', type=float, default=60.0, help="Process anlık görüntü aralığı (sn, 0 = tümü)")
+    parser.add_argument('--chunk-rows', type=int, default=65536, help="Parça başına satır")
+    args = parser.parse_args(argv)
+
+    tables = [t for t in args.tables.split(',') if t]
+    unknown = [t for t in tables if t not in EXPORT_TABLES]
+    if unknown:
+        parser.error(f"Bilinmeyen tablo: {', '.join(unknown)}")
+    try:
+        since, until = parse_export_time(args.since), parse_export_time(args.until, end=True)
+    except ValueError as e:
+        parser.error(str(e))
+
+    exporter = ColumnarExporter(args.export, args.format, since, until, args.chunk_rows, args.process_interval)
+    report = exporter.export(tables)
+    print(f"{report['format']} | {report['traces']} iz dosyası | {report['duration']} sn")
+    for table, info in report['tables'].items():
+        print(f"  {table}: {info['rows']} satır, {info['chunks']} parça → {info['path']}")
+    return 0
+
+# ==============================================
+# BELLEK ANALİZİ
+# ==============================================
+class MemoryLeakDetector:
+    """Process başına RSS geçmişinden kayan pencerede büyüme eğimi hesaplar"""
+    def __init__(self, window: int = 60, min_samples: int = 10,
+                 leak_slope_mb_min: float = 1.0, min_r2: float = 0.8,
+                 horizon_min: float = 10.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.leak_slope = leak_slope_mb_min * 1024 * 1024 / 60.0  # bayt/sn
+        self.min_r2 = min_r2
+        self.horizon = horizon_min * 60.0
+        self._lock = threading.Lock()
+        self._column = 0
+        self._slots: Dict[Tuple[int, float], int] = {}
+        self._meta: Dict[int, Dict] = {}
+        self._free: List[int] = []
+        self._allocate(256)
+    
+    def _allocate(self, capacity: int):
+        old = getattr(self, '_rss', None)
+        self.capacity = capacity
+        if HAS_NUMPY:
+            rss = np.zeros((capacity, self.window), dtype=np.float64)
+            mask = np.zeros((capacity, self.window), dtype=bool)
+            if old is not None:
+                rss[:old.shape[0]] = old
+                mask[:old.shape[0]] = self._mask
+            self._rss, self._mask = rss, mask
+            if old is None:
+                self._times = np.zeros(self.window, dtype=np.float64)
+        else:
+            rows = old or []
+            masks = getattr(self, '_mask', None) or []
+            self._rss = rows + [[0.0] * self.window for _ in range(capacity - len(rows))]
+            self._mask = masks + [[False] * self.window for _ in range(capacity - len(masks))]
+            if old is None:
+                self._times = [0.0] * self.window
+        start = len(old) if old is not None else 0
+        self._free.extend(range(capacity - 1, start - 1, -1))
+    
+    def update(self, snapshot: Dict):
+        processes = snapshot['processes']
+        with self._lock:
+            col = self._column % self.window
+            self._column += 1
+            self._times[col] = snapshot['timestamp']
+            
+            # PID yeniden kullanımına karşı anahtar (pid, başlangıç zamanı)
+            alive = set()
+            for pid, info in processes.items():
+                key = (pid, info['create_time'])
+                alive.add(key)
+                if key not in self._slots:
+                    if not self._free:
+                        self._allocate(self.capacity * 2)
+                    slot = self._free.pop()
+                    self._slots[key] = slot
+                    self._clear_row(slot)
+                self._meta[self._slots[key]] = info
+            
+            for key in [k for k in self._slots if k not in alive]:
+                slot = self._slots.pop(key)
+                self._meta.pop(slot, None)
+                self._free.append(slot)
+            
+            slots = [self._slots[(pid, info['create_time'])] for pid, info in processes.items()]
+            values = [info['rss'] for info in processes.values()]
+            if HAS_NUMPY:
+                self._mask[:, col] = False
+                if slots:
+                    index = np.fromiter(slots, dtype=np.intp, count=len(slots))
+                    self._rss[index, col] = np.fromiter(values, dtype=np.float64, count=len(values))
+                    self._mask[index, col] = True
+            else:
+                for row in self._mask:
+                    row[col] = False
+                for slot, value in zip(slots, values):
+                    self._rss[slot][col] = value
+                    self._mask[slot][col] = True
+    
+    def _clear_row(self, slot: int):
+        if HAS_NUMPY:
+            self._mask[slot] = False
+        else:
+            self._mask[slot] = [False] * self.window
+    
+    def _regression(self):
+        """Tüm processler için en küçük kareler eğimi ve R² (vektörel)"""
+        if HAS_NUMPY:
+            m = self._mask.astype(np.float64)
+            x = self._times - self._times.max()
+            y = self._rss
+            n = m.sum(axis=1)
+            sx = m @ x
+            sy = (m * y).sum(axis=1)
+            sxx = m @ (x * x)
+            sxy = (m * y) @ x
+            syy = (m * y * y).sum(axis=1)
+            cov = n * sxy - sx * sy
+            var_x = n * sxx - sx * sx
+            var_y = n * syy - sy * sy
+            with np.errstate(divide='ignore', invalid='ignore'):
+                slope = np.where(var_x > 0, cov / var_x, 0.0)
+                r2 = np.where((var_x > 0) & (var_y > 0), cov * cov / (var_x * var_y), 0.0)
+            return n.tolist(), slope.tolist(), r2.tolist()
+        
+        counts, slopes, r2s = [], [], []
+        base = max(self._times)
+        for row, mask in zip(self._rss, self._mask):
+            pts = [(t - base, v) for t, v, ok in zip(self._times, row, mask) if ok]
+            n = len(pts)
+            sx = sum(p[0] for p in pts)
+            sy = sum(p[1] for p in pts)
+            cov = n * sum(p[0] * p[1] for p in pts) - sx * sy
+            var_x = n * sum(p[0] * p[0] for p in pts) - sx * sx
+            var_y = n * sum(p[1] * p[1] for p in pts) - sy * sy
+            counts.append(n)
+            slopes.append(cov / var_x if var_x > 0 else 0.0)
+            r2s.append(cov * cov / (var_x * var_y) if var_x > 0 and var_y > 0 else 0.0)
+        return counts, slopes, r2s
+    
+    def candidates(self, top_n: int = 15) -> List[Dict]:
+        """Geri kazanım adaylarını bayt ve büyüme eğilimine göre sıralar"""
+        with self._lock:
+            if not self._slots:
+                return []
+            counts, slopes, r2s = self._regression()
+            ranked = []
+            for (pid, _), slot in self._slots.items():
+                info = self._meta.get(slot)
+                if info is None:
+                    continue
+                enough = counts[slot] >= self.min_samples
+                slope = slopes[slot] if enough else 0.0
+                memory = info['uss'] if info['uss'] is not None else info['rss']
+                leaking = enough and slope >= self.leak_slope and r2s[slot] >= self.min_r2
+                ranked.append({
+                    'pid': pid,
+                    'name': info['name'],
+                    'rss': info['rss'],
+                    'uss': info['uss'],
+                    'slope_mb_min': round(slope * 60.0 / (1024 * 1024), 3),
+                    'r2': round(r2s[slot], 3),
+                    'leaking': leaking,
+                    'score': memory + max(0.0, slope) * self.horizon
+                })
+        return heapq.nlargest(top_n, ranked, key=lambda c: c['score'])
+
+def trim_working_set(pid: int) -> bool:
+    """Windows'ta processin çalışma kümesini boşaltır (EmptyWorkingSet)"""
+    if os.name != 'nt':
+        return False
+    PROCESS_SET_QUOTA = 0x0100
+    PROCESS_QUERY_INFORMATION = 0x0400
+    try:
+        handle = ctypes.windll.kernel32.OpenProcess(
+            PROCESS_SET_QUOTA | PROCESS_QUERY_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        try:
+            return bool(ctypes.windll.psapi.EmptyWorkingSet(handle))
+        finally:
+            ctypes.windll.kernel32.CloseHandle(handle)
+    except (AttributeError, OSError):
+        return False
+
+# ==============================================
+# OYUN KURALLARI (PROCESS BAŞLATMA İZLEYİCİ)
+# ==============================================
+PRIORITY_LEVELS = ('idle', 'below_normal', 'normal', 'above_normal', 'high', 'realtime')
+IO_PRIORITY_LEVELS = ('very_low', 'low', 'normal', 'high')
+DEFAULT_PROCESS_RULES = [
+    {'pattern': 'csgo.exe', 'match': 'name', 'priority': 'high', 'affinity': None, 'io_priority': 'high'},
+    {'pattern': 'cs2.exe', 'match': 'name', 'priority': 'high', 'affinity': None, 'io_priority': 'high'}
+]
+
+def priority_value(level: str):
+    """Öncelik seviyesini platformun psutil değerine çevirir (Windows sınıfı / POSIX nice)"""
+    if os.name == 'nt':
+        return {
+            'idle': psutil.IDLE_PRIORITY_CLASS,
+            'below_normal': psutil.BELOW_NORMAL_PRIORITY_CLASS,
+            'normal': psutil.NORMAL_PRIORITY_CLASS,
+            'above_normal': psutil.ABOVE_NORMAL_PRIORITY_CLASS,
+            'high': psutil.HIGH_PRIORITY_CLASS,
+            'realtime': psutil.REALTIME_PRIORITY_CLASS
+        }[level]
+    return {'idle': 19, 'below_normal': 10, 'normal': 0,
+            'above_normal': -5, 'high': -10, 'realtime': -20}[level]
+
+def io_priority_args(level: str) -> Optional[Tuple]:
+    """I/O önceliği için psutil.Process.ionice argümanları; desteklenmiyorsa None"""
+    if os.name == 'nt':
+        return ({
+            'very_low': psutil.IOPRIO_VERYLOW, 'low': psutil.IOPRIO_LOW,
+            'normal': psutil.IOPRIO_NORMAL, 'high': psutil.IOPRIO_HIGH
+        }[level],)
+    if hasattr(psutil, 'IOPRIO_CLASS_BE'):
+        return {
+            'very_low': (psutil.IOPRIO_CLASS_IDLE,), 'low': (psutil.IOPRIO_CLASS_BE, 7),
+            'normal': (psutil.IOPRIO_CLASS_BE, 4), 'high': (psutil.IOPRIO_CLASS_BE, 0)
+        }[level]
+    return None
+
+class ProcessRuleStore:
+    """Kullanıcının düzenleyebileceği kural tablosu ve isabet sayaçları (JSON)"""
+    def __init__(self, path: Path = Path("process_rules.json")):
+        self.path = Path(path)
+        self.logger = Logger()
+        self._lock = threading.Lock()
+        # Arayüz ve örnekleyici thread'i aynı geçici dosyaya aynı anda yazmasın
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self.rules = self.load()
+    
+    @staticmethod
+    def normalize(rule: Dict) -> Dict:
+        match = rule.get('match', 'name')
+        if match not in ('name', 'path', 'glob'):
+            raise ValueError(f"Geçersiz eşleşme türü: {match}")
+        priority = rule.get('priority')
+        if priority is not None and priority not in PRIORITY_LEVELS:
+            raise ValueError(f"Geçersiz öncelik: {priority}")
+        io_priority = rule.get('io_priority')
+        if io_priority is not None and io_priority not in IO_PRIORITY_LEVELS:
+            raise ValueError(f"Geçersiz I/O önceliği: {io_priority}")
+        affinity = rule.get('affinity')
+        return {
+            'pattern': str(rule['pattern']),
+            'match': match,
+            'priority': priority,
+            'affinity': [int(c) for c in affinity] if affinity else None,
+            'io_priority': io_priority,
+            'enabled': bool(rule.get('enabled', True)),
+            'hits': int(rule.get('hits', 0)),
+            'last_hit': rule.get('last_hit')
+        }
+    
+    def load(self) -> List[Dict]:
+        if not self.path.exists():
+            return [self.normalize(r) for r in DEFAULT_PROCESS_RULES]
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.log("ERROR", "PROCESS_RULES", f"Kurallar okunamadı: {str(e)}")
+            if isinstance(e, ValueError):
+                # Bozuk dosya bir sonraki kayıtta varsayılanlarla ezilmesin
+                with contextlib.suppress(OSError):
+                    os.replace(self.path, self.path.with_name(self.path.name + ".bad"))
+            return [self.normalize(r) for r in DEFAULT_PROCESS_RULES]
+        
+        rules = []
+        for raw in data.get('rules', []):
+            try:
+                rules.append(self.normalize(raw))
+            except (KeyError, ValueError, TypeError) as e:
+                self.logger.log("WARNING", "PROCESS_RULES", f"Kural atlandı: {str(e)}", raw)
+        return rules
+    
+    def save(self) -> bool:
+        """Atomik yazım (geçici dosya + rename); yarıda kalan yazım mevcut kuralları bozmaz"""
+        with self._lock:
+            content = json.dumps({'rules': [dict(r) for r in self.rules]}, indent=4, ensure_ascii=False)
+            self._dirty = False
+        temp = self.path.with_name(self.path.name + ".tmp")
+        with self._write_lock:
+            try:
+                with open(temp, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp, self.path)
+                return True
+            except OSError as e:
+                self._dirty = True
+                self.logger.log("ERROR", "PROCESS_RULES", f"Kaydetme hatası: {str(e)}")
+                return False
+    
+    def flush(self):
+        if self._dirty:
+            self.save()
+    
+    def add(self, rule: Dict) -> Dict:
+        rule = self.normalize(rule)
+        with self._lock:
+            self.rules.append(rule)
+        self.save()
+        return rule
+    
+    def remove(self, index: int):
+        with self._lock:
+            del self.rules[index]
+        self.save()
+    
+    def record_hit(self, rule: Dict):
+        with self._lock:
+            rule['hits'] += 1
+            rule['last_hit'] = datetime.now().isoformat()
+            self._dirty = True
+    
+    def snapshot(self) -> List[Dict]:
+        with self._lock:
+            return [r for r in self.rules if r['enabled']]
+
+class ProcessRuleEngine:
+    """Her örnekte yeni PID'leri bulur ve eşleşen kuralı psutil ile anında uygular"""
+    def __init__(self, store: ProcessRuleStore, save_interval: float = 30.0):
+        self.store = store
+        self.save_interval = save_interval
+        self.logger = Logger()
+        self.events = deque(maxlen=200)
+        self._known = set()
+        self._last_save = time.monotonic()
+        self._rules_version = None
+        self._by_name = {}
+        self._patterns = []
+    
+    def _compile(self, rules: List[Dict]):
+        """Ad kuralları O(1) sözlük aramasıyla, yol/glob kuralları sırayla denenir"""
+        version = tuple(id(r) for r in rules)
+        if version == self._rules_version:
+            return
+        self._rules_version = version
+        self._by_name = {}
+        self._patterns = []
+        for rule in rules:
+            if rule['match'] == 'name':
+                self._by_name.setdefault(rule['pattern'].lower(), rule)
+            else:
+                self._patterns.append(rule)
+    
+    def match(self, name: str, exe: Optional[str]) -> Optional[Dict]:
+        rule = self._by_name.get(name.lower())
+        if rule is not None:
+            return rule
+        for rule in self._patterns:
+            pattern = rule['pattern'].lower()
+            if rule['match'] == 'path':
+                if exe and os.path.normcase(exe) == os.path.normcase(pattern):
+                    return rule
+            elif fnmatch.fnmatch(name.lower(), pattern) or (exe and fnmatch.fnmatch(exe.lower(), pattern)):
+                return rule
+        return None
+    
+    def update(self, snapshot: Dict):
+        """ProcessSamplerThread dinleyicisi: yalnızca yeni (pid, create_time) çiftleri işlenir"""
+        processes = snapshot['processes']
+        current = {(pid, info['create_time']) for pid, info in processes.items()}
+        new = current - self._known
+        self._known = current
+        
+        rules = self.store.snapshot()
+        if new and rules:
+            self._compile(rules)
+            for pid, _ in new:
+                self._handle(pid, processes[pid]['name'])
+        
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self._last_save = time.monotonic()
+            self.store.flush()
+    
+    def _handle(self, pid: int, name: str):
+        rule = self._by_name.get(name.lower())
+        if rule is None and self._patterns:
+            # Yol gerektiren kurallar için exe yalnızca yeni processlerde okunur
+            try:
+                exe = psutil.Process(pid).exe()
+            except (psutil.Error, OSError):
+                exe = None
+            rule = self.match(name, exe)
+        if rule is not None:
+            self.apply(pid, name, rule)
+    
+    def apply(self, pid: int, name: str, rule: Dict) -> Dict:
+        applied = {}
+        errors = []
+        try:
+            proc = psutil.Process(pid)
+        except psutil.Error as e:
+            return {'pid': pid, 'name': name, 'applied': applied, 'errors': [str(e)]}
+        
+        if rule['priority']:
+            try:
+                proc.nice(priority_value(rule['priority']))
+                applied['priority'] = rule['priority']
+            except (psutil.Error, OSError) as e:
+                errors.append(f"priority: {e}")
+        if rule['affinity'] and hasattr(proc, 'cpu_affinity'):
+            try:
+                cpus = [c for c in rule['affinity'] if c < (psutil.cpu_count() or 1)]
+                proc.cpu_affinity(cpus)
+                applied['affinity'] = cpus
+            except (psutil.Error, OSError, ValueError) as e:
+                errors.append(f"affinity: {e}")
+        if rule['io_priority'] and hasattr(proc, 'ionice'):
+            args = io_priority_args(rule['io_priority'])
+            try:
+                if args:
+                    proc.ionice(*args)
+                    applied['io_priority'] = rule['io_priority']
+            except (psutil.Error, OSError, ValueError) as e:
+                errors.append(f"io_priority: {e}")
+        
+        # Hiçbir ayar uygulanamadıysa (erişim reddi vb.) isabet sayılmaz
+        if applied:
+            self.store.record_hit(rule)
+        event = {'pid': pid, 'name': name, 'pattern': rule['pattern'],
+                 'applied': applied, 'errors': errors, 'timestamp': time.time()}
+        self.events.append(event)
+        self.logger.log("INFO" if not errors else "WARNING", "PROCESS_RULES",
+                        f"{name} ({pid}) kuralı uygulandı", event)
+        return event
+    
+    def drain_events(self) -> List[Dict]:
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+# ==============================================
+# ARKA PLAN KISITLAYICI
+# ==============================================
+CRITICAL_PROCESSES = {
+    'system', 'system idle process', 'registry', 'smss.exe', 'csrss.exe', 'wininit.exe',
+    'winlogon.exe', 'services.exe', 'lsass.exe', 'svchost.exe', 'dwm.exe', 'explorer.exe',
+    'audiodg.exe', 'fontdrvhost.exe', 'memory compression', 'systemd', 'init', 'kthreadd'
+}
+
+def foreground_pid() -> Optional[int]:
+    """Ön plandaki pencerenin process kimliği (yalnızca Windows)"""
+    if os.name != 'nt':
+        return None
+    try:
+        hwnd = ctypes.windll.user32.GetForegroundWindow()
+        pid = ctypes.c_ulong()
+        ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        return pid.value or None
+    except (AttributeError, OSError):
+        return None
+
+class BackgroundThrottler:
+    """Korunan iş yükü çalışırken ağır arka plan processlerini geçici olarak kısıtlar"""
+    def __init__(self, protected=(), allow=(), deny=(), rule_store: Optional[ProcessRuleStore] = None,
+                 cpu_threshold: float = 5.0, background_cores: int = 1, priority: str = 'idle',
+                 journal_path: Path = Path("cache") / "throttle_journal.json",
+                 foreground=foreground_pid):
+        self.protected = {n.lower() for n in protected}
+        self.allow = {n.lower() for n in allow} | CRITICAL_PROCESSES
+        self.deny = {n.lower() for n in deny}
+        self.rule_store = rule_store
+        self.cpu_threshold = cpu_threshold
+        self.background_cores = max(1, int(background_cores))
+        self.priority = priority
+        self.journal_path = journal_path
+        self.foreground = foreground
+        self.logger = Logger()
+        self.events = deque(maxlen=50)
+        self.own_pid = os.getpid()
+        self.active = False
+        # pid -> {name, create_time, nice, affinity, baseline_cpu, cpu}
+        self.throttled: Dict[int, Dict] = {}
+        self.session_started = None
+        # update örnekleyici, restore_all arayüz thread'inden çağrılır; update restore_all'u da çağırır
+        self._lock = threading.RLock()
+        # Kapatılınca listeden çıkarılmadan önce başlamış bir update da yeni kısıtlama yapmaz
+        self.enabled = True
+    
+    def protected_names(self) -> set:
+        names = set(self.protected)
+        if self.rule_store is not None:
+            names.update(r['pattern'].lower() for r in self.rule_store.snapshot() if r['match'] == 'name')
+        return names
+    
+    # --- Geri yükleme günlüğü ---
+    def _write_journal(self):
+        """Değişiklikten önce orijinal ayarlar diske yazılır (çökme sonrası kurtarma için)"""
+        entries = [
+            {'pid': pid, 'name': t['name'], 'create_time': t['create_time'],
+             'nice': t['nice'], 'affinity': t['affinity']}
+            for pid, t in self.throttled.items()
+        ]
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.journal_path.with_suffix('.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, self.journal_path)
+        except OSError as e:
+            self.logger.log("ERROR", "THROTTLE", f"Günlük yazılamadı: {str(e)}")
+    
+    def recover(self) -> int:
+        """Önceki oturumdan kalan kısıtlamaları geri alır"""
+        if not self.journal_path.exists():
+            return 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', [])
+        except (OSError, ValueError):
+            entries = []
+        
+        restored = 0
+        for entry in entries:
+            if self._restore_one(entry['pid'], entry):
+                restored += 1
+        try:
+            self.journal_path.unlink()
+        except OSError:
+            pass
+        if entries:
+            self.logger.log("WARNING", "THROTTLE",
+                            f"Önceki oturumdan {restored}/{len(entries)} process geri yüklendi")
+        return restored
+    
+    # --- Uygulama / geri alma ---
+    @staticmethod
+    def _capture(pid: int, info: Dict) -> Optional[Dict]:
+        try:
+            proc = psutil.Process(pid)
+            return {
+                'name': info['name'], 'create_time': info['create_time'],
+                'nice': proc.nice(),
+                'affinity': proc.cpu_affinity() if hasattr(proc, 'cpu_affinity') else None,
+                'baseline_cpu': info['cpu'], 'cpu': info['cpu']
+            }
+        except (psutil.Error, OSError):
+            return None
+    
+    def _apply(self, pid: int, original: Dict, cores: List[int]) -> bool:
+        try:
+            proc = psutil.Process(pid)
+            proc.nice(priority_value(self.priority))
+            if original['affinity'] is not None:
+                proc.cpu_affinity([c for c in cores if c in original['affinity']] or original['affinity'][-1:])
+            return True
+        except (psutil.Error, OSError, ValueError) as e:
+            self.logger.log("WARNING", "THROTTLE", f"{original['name']} ({pid}) kısıtlanamadı: {str(e)}")
+            self._restore_one(pid, original)
+            return False
+    
+    def _restore_one(self, pid: int, original: Dict) -> bool:
+        try:
+            proc = psutil.Process(pid)
+            # PID yeniden kullanılmışsa başka bir processe dokunulmaz
+            if abs(proc.create_time() - original['create_time']) > 1.0:
+                return False
+            proc.nice(original['nice'])
+            if original.get('affinity') is not None:
+                proc.cpu_affinity(original['affinity'])
+            return True
+        except (psutil.Error, OSError, ValueError):
+            return False
+    
+    def restore_all(self) -> Dict:
+        with self._lock:
+            report = self.report()
+            restored = sum(1 for pid, t in self.throttled.items() if self._restore_one(pid, t))
+            report['restored'] = restored
+            self.throttled.clear()
+            self.active = False
+            try:
+                self.journal_path.unlink()
+            except OSError:
+                pass
+            return report
+    
+    # --- Örnekleyici dinleyicisi ---
+    def update(self, snapshot: Dict):
+        with self._lock:
+            if self.enabled:
+                self._update(snapshot)
+    
+    def _update(self, snapshot: Dict):
+        processes = snapshot['processes']
+        protected = self.protected_names()
+        running = {pid for pid, info in processes.items() if info['name'].lower() in protected}
+        
+        if not running:
+            if self.active:
+                report = self.restore_all()
+                self.events.append({'type': 'stopped', 'report': report})
+                self.logger.log("INFO", "THROTTLE", "Korunan iş yükü bitti, ayarlar geri yüklendi", report)
+            return
+        
+        if not self.active:
+            self.active = True
+            self.session_started = snapshot['timestamp']
+            self.events.append({'type': 'started',
+                                'protected': sorted({processes[p]['name'] for p in running})})
+        
+        for pid, state in list(self.throttled.items()):
+            info = processes.get(pid)
+            if info is None or info['create_time'] != state['create_time']:
+                del self.throttled[pid]
+            else:
+                state['cpu'] = info['cpu']
+        
+        cpu_count = psutil.cpu_count() or 1
+        cores = list(range(cpu_count - min(self.background_cores, cpu_count), cpu_count))
+        skip = running | {self.own_pid, self.foreground(), 0, 4}
+        batch = {}
+        for pid, info in processes.items():
+            if pid in skip or pid in self.throttled:
+                continue
+            name = info['name'].lower()
+            if name in self.allow or name in protected:
+                continue
+            if name in self.deny or info['cpu'] >= self.cpu_threshold:
+                original = self._capture(pid, info)
+                if original is not None:
+                    batch[pid] = original
+        if not batch:
+            return
+        
+        # Orijinal ayarlar, hiçbir process değiştirilmeden önce toplu olarak günlüğe yazılır
+        self.throttled.update(batch)
+        self._write_journal()
+        failed = [pid for pid, original in batch.items() if not self._apply(pid, original, cores)]
+        for pid in failed:
+            del self.throttled[pid]
+        if failed:
+            self._write_journal()
+        self.logger.log("INFO", "THROTTLE", f"{len(self.throttled)} arka plan processi kısıtlandı")
+    
+    def report(self) -> Dict:
+        """Kısıtlanan processlerin başlangıç ve güncel CPU toplamı (tek çekirdek yüzdesi)"""
+        with self._lock:
+            throttled = list(self.throttled.values())
+        before = sum(t['baseline_cpu'] for t in throttled)
+        after = sum(t['cpu'] for t in throttled)
+        cpu_count = (psutil.cpu_count() if HAS_PSUTIL else 1) or 1
+        return {
+            'active': self.active,
+            'processes': len(throttled),
+            'names': sorted({t['name'] for t in throttled}),
+            'cpu_before': round(before, 1),
+            'cpu_after': round(after, 1),
+            'freed_percent': round(max(0.0, before - after) / cpu_count, 1)
+        }
+    
+    def drain_events(self) -> List[Dict]:
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+# ==============================================
+# PROCESS SONLANDIRMA
+# ==============================================
+class ProcessTerminator:
+    """Seçili veya kurala uyan processleri ağaçlarıyla birlikte paralel ve sınırlı sürede sonlandırır"""
+    def __init__(self, protected: Optional[set] = None, grace: float = 3.0, kill_timeout: float = 2.0,
+                 idle_cpu: float = 0.5, workers: int = 16):
+        self.protected = {n.lower() for n in (protected if protected is not None else CRITICAL_PROCESSES)}
+        self.grace = grace
+        self.kill_timeout = kill_timeout
+        self.idle_cpu = idle_cpu
+        self.workers = workers
+        self.logger = Logger()
+        self._lock = threading.Lock()
+        # (pid, başlangıç zamanı) -> son CPU kullandığı an
+        self._last_active = {}
+
+    def update(self, snapshot: Dict):
+        """Örnekleyici dinleyicisi; boşta kalma süresi için son etkin anı izler"""
+        now = snapshot['timestamp']
+        alive = set()
+        with self._lock:
+            for pid, info in snapshot['processes'].items():
+                key = (pid, info['create_time'])
+                alive.add(key)
+                if key not in self._last_active or info['cpu'] > self.idle_cpu:
+                    self._last_active[key] = now
+            for key in [k for k in self._last_active if k not in alive]:
+                del self._last_active[key]
+
+    def idle_seconds(self, pid: int, create_time: float, now: Optional[float] = None) -> Optional[float]:
+        """İzlenmeye başlandığından beri CPU kullanmadığı süre; hiç görülmediyse None"""
+        with self._lock:
+            last = self._last_active.get((pid, create_time))
+        if last is None:
+            return None
+        return (system_time() if now is None else now) - last
+
+    def match(self, pattern: str = "", min_rss_mb: float = 0, idle_minutes: float = 0) -> List[Tuple[int, float]]:
+        """Kurala uyan (PID, başlangıç zamanı) çiftleri: ad kalıbı, bellek eşiği ve boşta kalma süresi birlikte sağlanmalı"""
+        if not HAS_PSUTIL or not (pattern or min_rss_mb or idle_minutes):
+            return []
+        pattern = pattern.lower()
+        now = system_time()
+        pids = []
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'create_time']):
+            info = proc.info
+            name = (info['name'] or '').lower()
+            if pattern and not fnmatch.fnmatch(name, pattern):
+                continue
+            if min_rss_mb and (info['memory_info'] is None or info['memory_info'].rss < min_rss_mb * 1024 * 1024):
+                continue
+            if idle_minutes:
+                idle = self.idle_seconds(info['pid'], info['create_time'] or 0.0, now)
+                if idle is None or idle < idle_minutes * 60:
+                    continue
+            pids.append((info['pid'], info['create_time']))
+        return pids
+
+    def resolve(self, targets: List) -> Tuple[List, List[Dict]]:
+        """Seçimi (PID veya (PID, başlangıç zamanı)) alt süreç ağaçlarıyla genişletir; korunan ve kendi soyumuzdaki processler çıkarılır"""
+        own = set()
+        try:
+            me = psutil.Process()
+            own = {me.pid} | {p.pid for p in me.parents()}
+        except (psutil.Error, AttributeError):
+            own = {os.getpid()}
+
+        procs, skipped, seen = [], [], set()
+        for target in targets:
+            pid, create_time = target if isinstance(target, tuple) else (target, None)
+            try:
+                root = psutil.Process(pid)
+                # Seçimden bu yana PID yeniden kullanılmışsa ilgisiz ağaca dokunulmaz
+                if create_time is not None and root.create_time() != create_time:
+                    self.logger.log("INFO", "TERMINATE", f"PID {pid} başka bir processe geçmiş, atlandı")
+                    continue
+                tree = [root] + root.children(recursive=True)
+            except psutil.Error:
+                continue
+            for proc in tree:
+                if proc.pid in seen:
+                    continue
+                seen.add(proc.pid)
+                try:
+                    name = proc.name()
+                except psutil.Error:
+                    continue
+                if proc.pid in own or proc.pid in (0, 4) or name.lower() in self.protected:
+                    skipped.append({'pid': proc.pid, 'name': name})
+                    continue
+                procs.append(proc)
+        return procs, skipped
+
+    def _signal(self, proc, method: str) -> Optional[str]:
+        try:
+            getattr(proc, method)()
+            return None
+        except psutil.NoSuchProcess:
+            return None
+        except psutil.Error as e:
+            return type(e).__name__
+
+    def terminate(self, targets: List) -> Dict:
+        """Tümüne paralel terminate gönderir, birlikte bekler, süre dolunca kill ile tırmandırır"""
+        started = time.monotonic()
+        report = {'requested': len(targets), 'processes': 0, 'terminated': 0, 'killed': 0,
+                  'survived': [], 'denied': [], 'skipped': [], 'freed_rss': 0,
+                  'available_delta': 0, 'duration': 0.0}
+        if not HAS_PSUTIL or not targets:
+            return report
+
+        procs, report['skipped'] = self.resolve(targets)
+        report['processes'] = len(procs)
+        if not procs:
+            report['duration'] = round(time.monotonic() - started, 2)
+            return report
+
+        meta = {}
+        for proc in procs:
+            try:
+                meta[proc.pid] = {'name': proc.name(), 'rss': proc.memory_info().rss}
+            except psutil.Error:
+                meta[proc.pid] = {'name': '?', 'rss': 0}
+        available_before = psutil.virtual_memory().available
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(procs))) as pool:
+            errors = list(pool.map(lambda p: self._signal(p, 'terminate'), procs))
+            denied = {p.pid for p, err in zip(procs, errors) if err}
+            waiting = [p for p in procs if p.pid not in denied]
+            gone, alive = psutil.wait_procs(waiting, timeout=self.grace)
+            report['terminated'] = len(gone)
+
+            # Süre dolunca kalanlar (ve terminate reddedilenler) zorla öldürülür
+            stubborn = alive + [p for p in procs if p.pid in denied]
+            if stubborn:
+                errors = list(pool.map(lambda p: self._signal(p, 'kill'), stubborn))
+                killed, still = psutil.wait_procs(stubborn, timeout=self.kill_timeout)
+                report['killed'] = len(killed)
+                gone = gone + killed
+                report['survived'] = [{'pid': p.pid, 'name': meta[p.pid]['name']} for p in still]
+                report['denied'] = [{'pid': p.pid, 'name': meta[p.pid]['name'], 'error': err}
+                                    for p, err in zip(stubborn, errors) if err]
+
+        # RSS paylaşılan sayfaları da sayar; sistemdeki kullanılabilir bellek farkı da raporlanır
+        report['freed_rss'] = sum(meta[p.pid]['rss'] for p in gone)
+        report['available_delta'] = psutil.virtual_memory().available - available_before
+        report['names'] = sorted({meta[p.pid]['name'] for p in gone})
+        report['duration'] = round(time.monotonic() - started, 2)
+        self.logger.log("INFO", "TERMINATE",
+                        f"{len(gone)}/{len(procs)} process sonlandırıldı, {format_bytes(report['freed_rss'])} serbest",
+                        {k: report[k] for k in ('terminated', 'killed', 'duration')})
+        return report
+
+class TerminationThread(QThread):
+    result_ready = Signal(dict)
+
+    def __init__(self, terminator: ProcessTerminator, targets: List[Tuple[int, float]] = None, rule: Dict = None):
+        super().__init__()
+        self.terminator = terminator
+        self.targets = targets or []
+        self.rule = rule
+
+    def run(self):
+        try:
+            targets = self.targets or self.terminator.match(**self.rule)
+            report = self.terminator.terminate(targets)
+        except Exception as e:
+            Logger().log("ERROR", "TERMINATE", f"Hata: {str(e)}")
+            report = {'error': str(e)}
+        self.result_ready.emit(report)
+
+class TerminationRuleDialog(QDialog):
+    """Kurala göre sonlandırma için ad kalıbı, bellek ve boşta kalma eşiği"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Kurala Göre Sonlandır")
+
+        layout = QGridLayout(self)
+        layout.addWidget(QLabel("Ad kalıbı (ör. chrome*.exe):"), 0, 0)
+        self.pattern_edit = QLineEdit()
+        layout.addWidget(self.pattern_edit, 0, 1)
+        layout.addWidget(QLabel("Bellek en az (MB, 0 = yok):"), 1, 0)
+        self.rss_spin = QSpinBox()
+        self.rss_spin.setRange(0, 1024 * 1024)
+        layout.addWidget(self.rss_spin, 1, 1)
+        layout.addWidget(QLabel("Boşta en az (dk, 0 = yok):"), 2, 0)
+        self.idle_spin = QSpinBox()
+        self.idle_spin.setRange(0, 24 * 60)
+        layout.addWidget(self.idle_spin, 2, 1)
+
+        buttons = QHBoxLayout()
+        ok_btn = ModernButton("⛔ Sonlandır")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn = ModernButton("Vazgeç")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addStretch()
+        buttons.addWidget(cancel_btn)
+        buttons.addWidget(ok_btn)
+        layout.addLayout(buttons, 3, 0, 1, 2)
+
+    def rule(self) -> Dict:
+        return {'pattern': self.pattern_edit.text().strip(), 'min_rss_mb': self.rss_spin.value(),
+                'idle_minutes': self.idle_spin.value()}
+
+# ==============================================
+# DİSK ALANI ANALİZİ
+# ==============================================
+class DirectoryEntry:
+    """Tek dizinin kendi dosyaları ve alt dizinleri (dosya bazında kayıt tutulmaz)"""
+    __slots__ = ('mtime_ns', 'own_bytes', 'own_files', 'subdirs', 'top_files',
+                 'total_bytes', 'total_files')
+    
+    def __init__(self, mtime_ns, own_bytes, own_files, subdirs, top_files):
+        self.mtime_ns = mtime_ns
+        self.own_bytes = own_bytes
+        self.own_files = own_files
+        self.subdirs = subdirs
+        self.top_files = top_files
+        self.total_bytes = own_bytes
+        self.total_files = own_files
+
+class DiskSpaceAnalyzer:
+    """Birimleri listeler, dizin ağaçlarını paralel os.scandir ile boyutlandırır"""
+    def __init__(self, workers: int = 8, top_n: int = 50, files_per_dir: int = 10,
+                 tree_depth: int = 3, min_node_fraction: float = 0.01):
+        self.workers = max(1, workers)
+        self.top_n = top_n
+        self.files_per_dir = files_per_dir
+        self.tree_depth = tree_depth
+        self.min_node_fraction = min_node_fraction
+        self.logger = Logger()
+        self._caches: Dict[str, Dict[str, DirectoryEntry]] = {}
+    
+    @staticmethod
+    def list_volumes() -> List[Dict]:
+        if not HAS_PSUTIL:
+            return []
+        volumes = []
+        for part in psutil.disk_partitions(all=False):
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+            except (OSError, PermissionError):
+                continue
+            volumes.append({
+                'device': part.device,
+                'mountpoint': part.mountpoint,
+                'fstype': part.fstype,
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': usage.percent
+            })
+        return volumes
+    
+    def _scan_dir(self, path: str, cached: Optional[DirectoryEntry] = None) -> Optional[DirectoryEntry]:
+        """Dizini listeler; cached verilir ve dizin değişmemişse yalnızca dosyalar yeniden okunur"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            # Dizin mtime'ı yalnızca ekleme/silme/yeniden adlandırmada değişir; yerinde büyüyen
+            # dosyalar için boyutlar her analizde yeniden okunur
+            known = cached is not None and cached.mtime_ns == mtime_ns
+            own_bytes = own_files = 0
+            subdirs = cached.subdirs if known else []
+            files = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if not known:
+                            if entry.is_symlink() or getattr(entry, 'is_junction', lambda: False)():
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                                continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        size = entry.stat(follow_symlinks=False).st_size
+                        own_bytes += size
+                        own_files += 1
+                        files.append((size, entry.name))
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        top = heapq.nlargest(self.files_per_dir, files) if files else []
+        return DirectoryEntry(mtime_ns, own_bytes, own_files, subdirs, top)
+    
+    def _cached_entry(self, cache: Dict, path: str) -> Optional[DirectoryEntry]:
+        """Dizin mtime değişmediyse önbellekteki alt dizin listesi hâlâ geçerlidir"""
+        entry = cache.get(path)
+        if entry is None:
+            return None
+        try:
+            if os.stat(path).st_mtime_ns == entry.mtime_ns:
+                return entry
+        except OSError:
+            pass
+        return None
+    
+    def analyze(self, root: str, cancel_event: Optional[threading.Event] = None,
+                progress=None) -> Dict:
+        root = os.path.abspath(root)
+        started = time.perf_counter()
+        old_cache = self._caches.get(root, {})
+        cache: Dict[str, DirectoryEntry] = {}
+        frontier = deque([root])
+        in_flight = {}
+        rescanned = reused = reported = 0
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while frontier or in_flight:
+                if cancel_event and cancel_event.is_set():
+                    for future in in_flight:
+                        future.cancel()
+                    break
+                
+                # Eşzamanlı iş sayısı sınırlı tutulur
+                while frontier and len(in_flight) < self.workers * 4:
+                    path = frontier.popleft()
+                    cached = self._cached_entry(old_cache, path)
+                    if cached is not None:
+                        # Alt dizinler dosyaların okunmasını beklemeden kuyruğa girer
+                        frontier.extend(cached.subdirs)
+                    in_flight[pool.submit(self._scan_dir, path, cached)] = (path, cached)
+                
+                if not in_flight:
+                    continue
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, cached = in_flight.pop(future)
+                    entry = future.result()
+                    if entry is None:
+                        continue
+                    cache[path] = entry
+                    if cached is not None and entry.subdirs is cached.subdirs:
+                        reused += 1
+                        continue
+                    rescanned += 1
+                    # Kontrolden sonra değişen dizinde yalnızca yeni alt dizinler eklenir
+                    queued = set(cached.subdirs) if cached is not None else ()
+                    frontier.extend(d for d in entry.subdirs if d not in queued)
+                
+                if progress and rescanned + reused - reported >= 500:
+                    reported = rescanned + reused
+                    progress(reported)
+        
+        cancelled = bool(cancel_event and cancel_event.is_set())
+        if not cancelled:
+            self._caches[root] = cache
+        
+        self._aggregate(cache)
+        result = self._build_result(root, cache)
+        result.update({
+            'duration': round(time.perf_counter() - started, 3),
+            'rescanned_dirs': rescanned,
+            'reused_dirs': reused,
+            'cancelled': cancelled
+        })
+        self.logger.log("INFO", "DISK_ANALYZER",
+                        f"{root} analiz edildi: {format_bytes(result['total_bytes'])}",
+                        {k: result[k] for k in ('duration', 'rescanned_dirs', 'reused_dirs', 'total_files')})
+        return result
+    
+    @staticmethod
+    def _aggregate(cache: Dict[str, DirectoryEntry]):
+        # En derin dizinden köke doğru toplamlar yukarı taşınır
+        for path in sorted(cache, key=lambda p: p.count(os.sep), reverse=True):
+            entry = cache[path]
+            entry.total_bytes = entry.own_bytes
+            entry.total_files = entry.own_files
+            for sub in entry.subdirs:
+                child = cache.get(sub)
+                if child is not None:
+                    entry.total_bytes += child.total_bytes
+                    entry.total_files += child.total_files
+    
+    def _build_result(self, root: str, cache: Dict[str, DirectoryEntry]) -> Dict:
+        root_entry = cache.get(root)
+        if root_entry is None:
+            return {'root': root, 'total_bytes': 0, 'total_files': 0, 'tree': None,
+                    'largest_dirs': [], 'largest_files': []}
+        
+        largest_dirs = heapq.nlargest(
+            self.top_n, ((e.total_bytes, p) for p, e in cache.items() if p != root)
+        )
+        largest_files = heapq.nlargest(
+            self.top_n, ((size, os.path.join(p, name)) for p, e in cache.items()
+                         for size, name in e.top_files)
+        )
+        min_bytes = root_entry.total_bytes * self.min_node_fraction
+        return {
+            'root': root,
+            'total_bytes': root_entry.total_bytes,
+            'total_files': root_entry.total_files,
+            'tree': self._build_tree(cache, root, 0, min_bytes),
+            'largest_dirs': [{'path': p, 'bytes': b} for b, p in largest_dirs],
+            'largest_files': [{'path': p, 'bytes': b} for b, p in largest_files]
+        }
+    
+    def _build_tree(self, cache: Dict, path: str, depth: int, min_bytes: float) -> Dict:
+        """Treemap için sınırlı derinlikte düğüm ağacı; küçükler birleştirilir"""
+        entry = cache[path]
+        node = {'name': os.path.basename(path) or path, 'path': path,
+                'bytes': entry.total_bytes, 'files': entry.total_files, 'children': []}
+        if depth >= self.tree_depth:
+            return node
+        
+        other = entry.own_bytes
+        for sub in entry.subdirs:
+            child = cache.get(sub)
+            if child is None:
+                continue
+            if child.total_bytes >= min_bytes:
+                node['children'].append(self._build_tree(cache, sub, depth + 1, min_bytes))
+            else:
+                other += child.total_bytes
+        node['children'].sort(key=lambda n: n['bytes'], reverse=True)
+        if other and node['children']:
+            node['children'].append({'name': '(diğer)', 'path': None, 'bytes': other,
+                                     'files': None, 'children': []})
+        return node
+
+class DiskAnalysisThread(QThread):
+    progress = Signal(int)
+    result_ready = Signal(dict)
+    
+    def __init__(self, analyzer: DiskSpaceAnalyzer, root: str):
+        super().__init__()
+        self.analyzer = analyzer
+        self.root = root
+        self.cancel_event = threading.Event()
+    
+    def run(self):
+        try:
+            result = self.analyzer.analyze(self.root, self.cancel_event, self.progress.emit)
+        except Exception as e:
+            result = {'root': self.root, 'error': str(e)}
+        self.result_ready.emit(result)
+
+# ==============================================
+# YİNELENEN DOSYA BULUCU
+# ==============================================
+PARTIAL_HASH_BYTES = 64 * 1024
+FULL_HASH_CHUNK = 1024 * 1024
+
+def _hash_partial_batch(batch: List[Tuple[str, int]]) -> List[Tuple[str, Optional[str]]]:
+    """İlk ve son 64 KiB'ın özetini alır (işlem havuzunda çalışır)"""
+    results = []
+    for path, size in batch:
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                digest.update(f.read(PARTIAL_HASH_BYTES))
+                if size > PARTIAL_HASH_BYTES:
+                    f.seek(max(PARTIAL_HASH_BYTES, size - PARTIAL_HASH_BYTES))
+                    digest.update(f.read(PARTIAL_HASH_BYTES))
+            results.append((path, digest.hexdigest()))
+        except OSError:
+            results.append((path, None))
+    return results
+
+def _hash_full_batch(batch: List[Tuple[str, int]]) -> List[Tuple[str, Optional[str]]]:
+    """Dosyanın tamamını parça parça okuyarak özetler (işlem havuzunda çalışır)"""
+    results = []
+    for path, _ in batch:
+        try:
+            digest = hashlib.blake2b()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(FULL_HASH_CHUNK), b''):
+                    digest.update(chunk)
+            results.append((path, digest.hexdigest()))
+        except OSError:
+            results.append((path, None))
+    return results
+
+class DuplicateFinder:
+    """Boyut → kısmi özet → tam özet aşamalarıyla yinelenen dosyaları bulur"""
+    def __init__(self, min_size: int = 1, workers: Optional[int] = None,
+                 batch_size: int = 32, max_pending: Optional[int] = None):
+        self.min_size = max(1, min_size)
+        self.workers = workers or max(1, min(8, os.cpu_count() or 1))
+        self.batch_size = batch_size
+        # Okuma önü sınırı: havuzda aynı anda bekleyen iş paketi sayısı
+        self.max_pending = max_pending or self.workers * 2
+        self.logger = Logger()
+    
+    def _collect(self, roots: List[str], cancel_event) -> Tuple[Dict[int, List[str]], int, Dict[str, int]]:
+        by_size: Dict[int, List[str]] = {}
+        # Silme öncesi doğrulama için tarama anındaki mtime
+        mtimes: Dict[str, int] = {}
+        seen_inodes = set()
+        scanned = 0
+        stack = [os.path.abspath(r) for r in roots]
+        visited_dirs = set()
+        
+        while stack:
+            if cancel_event and cancel_event.is_set():
+                break
+            path = stack.pop()
+            if path in visited_dirs:
+                continue
+            visited_dirs.add(path)
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_symlink():
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        scanned += 1
+                        if st.st_size < self.min_size:
+                            continue
+                        # Sabit bağlantılar aynı veriyi gösterir, yer kazandırmaz
+                        if st.st_ino and st.st_nlink > 1:
+                            key = (st.st_dev, st.st_ino)
+                            if key in seen_inodes:
+                                continue
+                            seen_inodes.add(key)
+                        by_size.setdefault(st.st_size, []).append(entry.path)
+                        mtimes[entry.path] = st.st_mtime_ns
+            except OSError:
+                continue
+        
+        return {size: paths for size, paths in by_size.items() if len(paths) > 1}, scanned, mtimes
+    
+    def _hash_stage(self, pool, func, groups: List[Tuple[int, List[str]]], cancel_event,
+                    progress=None, stage: str = "") -> Dict[Tuple[int, str], List[str]]:
+        """Grupları paketler halinde havuza verir; bekleyen iş sayısı sınırlıdır"""
+        def batches():
+            batch = []
+            for size, paths in groups:
+                for path in paths:
+                    batch.append((path, size))
+                    if len(batch) >= self.batch_size:
+                        yield batch
+                        batch = []
+            if batch:
+                yield batch
+        
+        sizes = {path: size for size, paths in groups for path in paths}
+        buckets: Dict[Tuple[int, str], List[str]] = {}
+        pending = set()
+        hashed = 0
+        source = batches()
+        exhausted = False
+        
+        while pending or not exhausted:
+            while not exhausted and len(pending) < self.max_pending:
+                if cancel_event and cancel_event.is_set():
+                    exhausted = True
+                    break
+                batch = next(source, None)
+                if batch is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(func, batch))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for path, digest in future.result():
+                    hashed += 1
+                    if digest is not None:
+                        buckets.setdefault((sizes[path], digest), []).append(path)
+            if progress:
+                progress(stage, hashed)
+        
+        return {key: paths for key, paths in buckets.items() if len(paths) > 1}
+    
+    def find(self, roots: List[str], cancel_event: Optional[threading.Event] = None,
+             progress=None) -> Dict:
+        started = time.perf_counter()
+        by_size, scanned, mtimes = self._collect(roots, cancel_event)
+        candidates = sum(len(p) for p in by_size.values())
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            partial = self._hash_stage(pool, _hash_partial_batch, sorted(by_size.items()),
+                                       cancel_event, progress, "partial")
+            
+            # Kısmi özet zaten tüm dosyayı kapsıyorsa tam özet gereksiz
+            final = {key: paths for key, paths in partial.items()
+                     if key[0] <= 2 * PARTIAL_HASH_BYTES}
+            large = [(size, paths) for (size, _), paths in partial.items()
+                     if size > 2 * PARTIAL_HASH_BYTES]
+            final.update(self._hash_stage(pool, _hash_full_batch, large,
+                                          cancel_event, progress, "full"))
+        
+        groups = []
+        for (size, digest), paths in final.items():
+            paths = sorted(paths)
+            groups.append({'size': size, 'hash': digest, 'paths': paths,
+                           'mtimes': [mtimes[p] for p in paths]})
+        groups.sort(key=lambda g: g['size'] * (len(g['paths']) - 1), reverse=True)
+        result = {
+            'roots': roots,
+            'groups': groups,
+            'scanned_files': scanned,
+            'candidate_files': candidates,
+            'duplicate_files': sum(len(g['paths']) - 1 for g in groups),
+            'reclaimable_bytes': sum(g['size'] * (len(g['paths']) - 1) for g in groups),
+            'duration': round(time.perf_counter() - started, 3),
+            'cancelled': bool(cancel_event and cancel_event.is_set())
+        }
+        self.logger.log("INFO", "DUPLICATES",
+                        f"{result['duplicate_files']} yinelenen dosya, "
+                        f"{format_bytes(result['reclaimable_bytes'])} kazanılabilir",
+                        {k: result[k] for k in ('scanned_files', 'candidate_files', 'duration')})
+        return result
+    
+    @staticmethod
+    def _same_content(first: str, second: str) -> bool:
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            while True:
+                chunk = a.read(FULL_HASH_CHUNK)
+                if chunk != b.read(FULL_HASH_CHUNK):
+                    return False
+                if not chunk:
+                    return True
+    
+    @staticmethod
+    def verify(deletion: Dict) -> Optional[str]:
+        """Kopya ve korunan dosya taramadan beri değişmediyse None, değiştiyse nedeni"""
+        stats = []
+        for path, mtime_ns in ((deletion['path'], deletion['mtime_ns']),
+                               (deletion['keep'], deletion['keep_mtime_ns'])):
+            try:
+                st = os.lstat(path)
+            except OSError:
+                return f"{path} bulunamadı"
+            if st.st_size != deletion['size'] or st.st_mtime_ns != mtime_ns:
+                return f"{path} taramadan sonra değişti"
+            stats.append(st)
+        if stats[0].st_ino and (stats[0].st_dev, stats[0].st_ino) == (stats[1].st_dev, stats[1].st_ino):
+            return "korunan dosya ile aynı dosya"
+        try:
+            if not DuplicateFinder._same_content(deletion['path'], deletion['keep']):
+                return "içerik korunan dosyadan farklı"
+        except OSError as e:
+            return f"karşılaştırılamadı: {e}"
+        return None
+    
+    @staticmethod
+    def delete(deletions: List[Dict]) -> Dict:
+        """Her kopya silinmeden hemen önce korunan dosyayla yeniden karşılaştırılır"""
+        deleted = freed = 0
+        errors = []
+        skipped = []
+        for deletion in deletions:
+            path = deletion['path']
+            reason = DuplicateFinder.verify(deletion)
+            if reason is not None:
+                skipped.append(f"{path}: {reason}")
+                continue
+            try:
+                os.remove(path)
+                deleted += 1
+                freed += deletion['size']
+            except OSError as e:
+                errors.append(f"{path}: {e}")
+        if skipped:
+            Logger().log("WARNING", "DUPLICATES", f"{len(skipped)} dosya doğrulanamadığı için silinmedi",
+                         {'skipped': skipped[:20]})
+        return {'deleted_files': deleted, 'freed_bytes': freed, 'errors': errors, 'skipped': skipped}
+
+class DuplicateScanThread(QThread):
+    progress = Signal(str, int)
+    result_ready = Signal(dict)
+    
+    def __init__(self, finder: DuplicateFinder, roots: List[str]):
+        super().__init__()
+        self.finder = finder
+        self.roots = roots
+        self.cancel_event = threading.Event()
+    
+    def run(self):
+        try:
+            result = self.finder.find(self.roots, self.cancel_event, self.progress.emit)
+        except Exception as e:
+            result = {'roots': self.roots, 'error': str(e)}
+        self.result_ready.emit(result)
+
+class DuplicateReviewDialog(QDialog):
+    """Silinecek kopyaları kullanıcının onaylaması için listeler"""
+    def __init__(self, result: Dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Yinelenen Dosyalar")
+        self.resize(760, 520)
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(
+            f"{len(result['groups'])} grup, {result['duplicate_files']} kopya, "
+            f"{format_bytes(result['reclaimable_bytes'])} kazanılabilir. "
+            "İşaretli dosyalar silinecek; her gruptan ilk dosya korunur."
+        ))
+        
+        self.groups = result['groups']
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Dosya", "Boyut"])
+        self.tree.setColumnWidth(0, 580)
+        for group in result['groups']:
+            group_item = QTreeWidgetItem([f"{len(group['paths'])} kopya", format_bytes(group['size'])])
+            for i, path in enumerate(group['paths']):
+                child = QTreeWidgetItem([path, format_bytes(group['size'])])
+                child.setCheckState(0, Qt.Unchecked if i == 0 else Qt.Checked)
+                group_item.addChild(child)
+            self.tree.addTopLevelItem(group_item)
+        layout.addWidget(self.tree)
+        
+        buttons = QHBoxLayout()
+        delete_btn = ModernButton("🗑️ Seçilenleri Sil")
+        delete_btn.clicked.connect(self.accept)
+        cancel_btn = ModernButton("Vazgeç")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addStretch()
+        buttons.addWidget(cancel_btn)
+        buttons.addWidget(delete_btn)
+        layout.addLayout(buttons)
+    
+    def selected_deletions(self) -> List[Dict]:
+        """Silinecek her kopya, grubun ilk işaretsiz (korunan) dosyasıyla eşlenir"""
+        deletions = []
+        for i, group in enumerate(self.groups):
+            group_item = self.tree.topLevelItem(i)
+            checked = [group_item.child(j).checkState(0) == Qt.Checked
+                       for j in range(group_item.childCount())]
+            # Bir grubun tüm kopyaları asla silinmez
+            if all(checked):
+                continue
+            keep = checked.index(False)
+            for j, selected in enumerate(checked):
+                if selected:
+                    deletions.append({
+                        'path': group['paths'][j], 'mtime_ns': group['mtimes'][j],
+                        'keep': group['paths'][keep], 'keep_mtime_ns': group['mtimes'][keep],
+                        'size': group['size']
+                    })
+        return deletions
+
+# ==============================================
+# OPERASYON GEÇMİŞİ
+# ==============================================
+class OperationHistory:
+    def __init__(self):
+        self.history = []
+        self.max_history = 50
+        self.logger = Logger()
+    
+    def add(self, operation: str, command: str, success: bool, 
+            result: str = "", details: Dict = None):
+        entry = {
+            'id': len(self.history) + 1,
+            'timestamp': datetime.now().isoformat(),
+            'operation': operation,
+            'command': command[:100],
+            'success': success,
+            'result': result[:200],
+            'details': details or {}
+        }
+        
+        self.history.append(entry)
+        
+        if len(self.history) > self.max_history:
+            self.history.pop(0)
+        
+        self.logger.log(
+            "INFO" if success else "ERROR",
+            "HISTORY",
+            f"{operation} - {'Başarılı' if success else 'Başarısız'}",
+            entry
+        )
+    
+    def get_last(self, n: int = 10) -> List:
+        return self.history[-n:]
+    
+    def clear(self):
+        self.history.clear()
+        self.logger.log("INFO", "HISTORY", "Geçmiş temizlendi")
+
+# ==============================================
+# AYARLAR YÖNETİCİSİ
+# ==============================================
+class SettingsManager:
+    def __init__(self, save_delay: float = 0.5):
+        self.settings_file = Path("alegro_settings.json")
+        self.save_delay = save_delay
+        self.logger = Logger()
+        self._lock = threading.RLock()
+        self._save_timer = None
+        self._last_written = None
+        self.default_settings = {
+            'general': {
+                'language': 'TR',
+                'theme': 'GX',
+                'start_minimized': False,
+                'minimize_to_tray': True,
+                'check_updates': True,
+                'auto_save_reports': True,
+                'notification_window': 2.0
+            },
+            'performance': {
+                'auto_boost_threshold': 70,
+                'monitor_interval': 2000,
+                'process_sample_interval': 2000,
+                'background_monitor_interval': 10000,
+                'background_process_sample_interval': 6000,
+                'idle_after': 300,
+                'overhead_cpu_budget': 1.0,
+                'overhead_rss_budget_mb': 250,
+                'inventory_ttl': 1.0,
+                'inventory_refresh_interval': 600,
+                'inventory_label_interval': 30,
+                'metrics_archive_interval': 10,
+                'metrics_archive_days': 30,
+                'metrics_archive_max_mb': 512,
+                'enable_logging': True,
+                'enable_sounds': False
+            },
+            'optimizations': {
+                'aggressive_mode': False,
+                'backup_before_ops': True,
+                'confirm_dangerous_ops': True,
+                'undo_history_size': 20,
+                'state_probe_ttl': 60
+            },
+            'network': {
+                'probe_enabled': True,
+                'probe_targets': [dict(t) for t in DEFAULT_PROBE_TARGETS],
+                'probe_count': 10,
+                'probe_timeout': 1.0,
+                'dns_candidates': list(DEFAULT_DNS_CANDIDATES),
+                'dns_domains': list(DEFAULT_DNS_DOMAINS),
+                'dns_rounds': 3,
+                'interface_cache_ttl': 30
+            },
+            'maintenance': {
+                'enabled': True,
+                'jobs': copy.deepcopy(DEFAULT_MAINTENANCE_JOBS),
+                'idle_cpu': 15.0,
+                'idle_disk': 10.0,
+                'idle_input': 300,
+                'idle_window': 600,
+                'jitter': 900,
+                'max_deferral': 3 * 86400
+            },
+            'fleet': {
+                'key': "",
+                'bind': "127.0.0.1",
+                'port': 47800,
+                'concurrency': 8,
+                'timeout': 120.0,
+                'retries': 2
+            },
+            'throttle': {
+                'enabled': True,
+                'protected': [],
+                'allow': [],
+                'deny': [],
+                'cpu_threshold': 5.0,
+                'background_cores': 1,
+                'priority': 'idle'
+            },
+            'thermal': {
+                'freq_ratio': 0.75,
+                'load_threshold': 50.0,
+                'temp_limit': 90.0,
+                'sustain': 10,
+                'recovery': 5
+            }
         }
         self.settings = self.load_settings()
+    
+    def _read_file(self) -> Optional[Dict]:
+        with open(self.settings_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def load_settings(self) -> Dict:
+        if self.settings_file.exists():
+            try:
+                # Varsayılan ayarlarla birleştir
+                return self._merge_settings(self.default_settings, self._read_file())
+            except (OSError, ValueError) as e:
+                self.logger.log("ERROR", "SETTINGS", f"Ayar dosyası okunamadı, varsayılanlar kullanılıyor: {str(e)}")
+        return copy.deepcopy(self.default_settings)
+    
+    def _merge_settings(self, default: Dict, loaded: Dict) -> Dict:
+        """Recursive settings merge (varsayılanlar asla paylaşılmaz)"""
+        merged = copy.deepcopy(default)
+        for key, value in loaded.items():
+            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
+                merged[key] = self._merge_settings(merged[key], value)
+            else:
+                merged[key] = copy.deepcopy(value)
+        return merged
+    
+    def save_settings(self):
+        """Bekleyen kaydı iptal edip hemen, atomik olarak (geçici dosya + rename) yazar"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            content = json.dumps(self.settings, indent=4, ensure_ascii=False)
+            temp = self.settings_file.with_name(self.settings_file.name + ".tmp")
+            try:
+                with open(temp, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp, self.settings_file)
+                self._last_written = content
+                self.logger.log("INFO", "SETTINGS", "Ayarlar kaydedildi")
+                return True
+            except Exception as e:
+                self.logger.log("ERROR", "SETTINGS", f"Kaydetme hatası: {str(e)}")
+                return False
+    
+    def schedule_save(self):
+        """Art arda gelen değişiklikleri tek bir yazmada birleştirir"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.save_delay, self.save_settings)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        with self._lock:
+            pending = self._save_timer is not None
+        if pending:
+            self.save_settings()
+    
+    def reload(self) -> Optional[List[Tuple[str, str]]]:
+        """Dosya dışarıdan değiştiyse yeniden yükler ve değişen (kategori, anahtar) çiftlerini verir"""
+        try:
+            with open(self.settings_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            loaded = json.loads(content)
+        except (OSError, ValueError):
+            # Yazma sürerken okunan yarım dosya yok sayılır; bir sonraki bildirim gelir
+            return None
+        
+        with self._lock:
+            if content == self._last_written:
+                return []
+            merged = self._merge_settings(self.default_settings, loaded)
+            changes = [
+                (category, key)
+                for category in set(merged) | set(self.settings)
+                for key in set(merged.get(category, {})) | set(self.settings.get(category, {}))
+                if merged.get(category, {}).get(key) != self.settings.get(category, {}).get(key)
+            ]
+            self.settings = merged
+            self._last_written = content
+        if changes:
+            self.logger.log("INFO", "SETTINGS", f"Ayarlar diskten yeniden yüklendi: {len(changes)} değişiklik",
+                            {'changes': [f"{c}.{k}" for c, k in changes]})
+        return changes
+    
+    def get(self, category: str, key: str, default=None):
+        return self.settings.get(category, {}).get(key, default)
+    
+    def set(self, category: str, key: str, value):
+        with self._lock:
+            if category not in self.settings:
+                self.settings[category] = {}
+            self.settings[category][key] = value
+        self.schedule_save()
+
+# ==============================================
+# AĞ GECİKME ÖLÇÜMÜ
+# ==============================================
+DEFAULT_PROBE_TARGETS = [
+    {'host': '1.1.1.1', 'port': 443, 'proto': 'tcp'},
+    {'host': '8.8.8.8', 'port': 443, 'proto': 'tcp'},
+    {'host': '9.9.9.9', 'port': 443, 'proto': 'tcp'}
+]
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """Doğrusal interpolasyonla yüzdelik değer hesaplar"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * (p / 100.0)
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+class _UdpEchoProtocol(asyncio.DatagramProtocol):
+    """Sıra numaralı UDP echo yanıtlarını bekleyen future'lara dağıtır"""
+    def __init__(self):
+        self.pending = {}
+
+    def datagram_received(self, data, addr):
+        future = self.pending.pop(data, None)
+        if future is not None and not future.done():
+            future.set_result(time.perf_counter())
+
+    def error_received(self, exc):
+        pass
+
+class LatencyProbe:
+    """Hedef listesine TCP bağlantı ve UDP echo gecikmelerini eşzamanlı ölçer"""
+    def __init__(self, targets: List[Dict], count: int = 10, timeout: float = 1.0,
+                 interval: float = 0.05, concurrency: int = 16):
+        self.targets = targets
+        self.count = max(1, int(count))
+        self.timeout = float(timeout)
+        self.interval = float(interval)
+        self.concurrency = max(1, int(concurrency))
+
+    async def _tcp_rtt(self, host: str, port: int) -> Optional[float]:
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        rtt = (time.perf_counter() - start) * 1000.0
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return rtt
+
+    async def _tcp_series(self, host: str, port: int) -> List[Optional[float]]:
+        rtts = []
+        for i in range(self.count):
+            rtts.append(await self._tcp_rtt(host, port))
+            if i + 1 < self.count:
+                await asyncio.sleep(self.interval)
+        return rtts
+
+    async def _udp_series(self, host: str, port: int) -> List[Optional[float]]:
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await loop.create_datagram_endpoint(
+                _UdpEchoProtocol, remote_addr=(host, port)
+            )
+        except OSError:
+            return [None] * self.count
+
+        nonce = os.urandom(4).hex()
+        sent = []
+        try:
+            for seq in range(self.count):
+                payload = f"ALEGRO {nonce} {seq}".encode('ascii')
+                future = loop.create_future()
+                protocol.pending[payload] = future
+                sent.append((time.perf_counter(), future))
+                transport.sendto(payload)
+                if seq + 1 < self.count:
+                    await asyncio.sleep(self.interval)
+
+            rtts = []
+            for sent_at, future in sent:
+                remaining = self.timeout - (time.perf_counter() - sent_at)
+                try:
+                    received_at = await asyncio.wait_for(future, max(0.0, remaining))
+                    rtts.append((received_at - sent_at) * 1000.0)
+                except asyncio.TimeoutError:
+                    rtts.append(None)
+            return rtts
+        finally:
+            transport.close()
+
+    async def _probe_target(self, target: Dict, semaphore: asyncio.Semaphore) -> Dict:
+        host = target['host']
+        port = int(target.get('port', 443))
+        proto = target.get('proto', 'tcp').lower()
+
+        async with semaphore:
+            if proto == 'udp':
+                rtts = await self._udp_series(host, port)
+            else:
+                rtts = await self._tcp_series(host, port)
+
+        result = {'host': host, 'port': port, 'proto': proto}
+        result.update(self.summarize(rtts))
+        return result
+
+    async def run_async(self) -> Dict:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self._probe_target(t, semaphore) for t in self.targets)
+        )
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'duration': round(time.perf_counter() - started, 3),
+            'targets': list(results),
+            'overall': self.aggregate(results)
+        }
+
+    def run(self) -> Dict:
+        return asyncio.run(self.run_async())
+
+    @staticmethod
+    def summarize(rtts: List[Optional[float]]) -> Dict:
+        """Ham RTT serisinden yüzdelik, jitter ve kayıp oranı çıkarır"""
+        received = [r for r in rtts if r is not None]
+        summary = {
+            'sent': len(rtts),
+            'received': len(received),
+            'loss_percent': round(100.0 * (len(rtts) - len(received)) / len(rtts), 1) if rtts else 100.0
+        }
+        if not received:
+            summary.update({'min': None, 'avg': None, 'p50': None, 'p95': None,
+                            'p99': None, 'max': None, 'jitter': None})
+            return summary
+
+        # RFC 3550 benzeri: ardışık RTT farklarının ortalaması
+        diffs = [abs(b - a) for a, b in zip(received, received[1:])]
+        summary.update({
+            'min': round(min(received), 3),
+            'avg': round(sum(received) / len(received), 3),
+            'p50': round(percentile(received, 50), 3),
+            'p95': round(percentile(received, 95), 3),
+            'p99': round(percentile(received, 99), 3),
+            'max': round(max(received), 3),
+            'jitter': round(sum(diffs) / len(diffs), 3) if diffs else 0.0
+        })
+        return summary
+
+    @staticmethod
+    def aggregate(results: List[Dict]) -> Dict:
+        reachable = [r for r in results if r['received']]
+        sent = sum(r['sent'] for r in results)
+        received = sum(r['received'] for r in results)
+
+        def mean_of(key):
+            values = [r[key] for r in reachable if r[key] is not None]
+            return round(sum(values) / len(values), 3) if values else None
+
+        return {
+            'reachable_targets': len(reachable),
+            'loss_percent': round(100.0 * (sent - received) / sent, 1) if sent else 100.0,
+            'p50': mean_of('p50'),
+            'p95': mean_of('p95'),
+            'jitter': mean_of('jitter')
+        }
+
+    @staticmethod
+    def compare(before: Dict, after: Dict) -> Dict:
+        """İki ölçümün genel değerlerini karşılaştırır (negatif fark = iyileşme)"""
+        delta = {}
+        for key in ('p50', 'p95', 'jitter', 'loss_percent'):
+            b = before['overall'].get(key)
+            a = after['overall'].get(key)
+            delta[key] = round(a - b, 3) if a is not None and b is not None else None
+        return {'before': before['overall'], 'after': after['overall'], 'delta': delta}
+
+class LatencyProbeThread(QThread):
+    result_ready = Signal(str, dict)  # phase, result
+
+    def __init__(self, phase: str, probe: LatencyProbe):
+        super().__init__()
+        self.phase = phase
+        self.probe = probe
+
+    def run(self):
+        try:
+            result = self.probe.run()
+        except Exception as e:
+            # Başarılı ölçümle aynı anahtarlar; sonuç slotu hatayı ayrıca ele almaz
+            result = {'error': str(e), 'timestamp': datetime.now().isoformat(), 'duration': 0.0,
+                      'targets': [], 'overall': LatencyProbe.aggregate([])}
+        self.result_ready.emit(self.phase, result)
+
+# ==============================================
+# DNS KARŞILAŞTIRMASI
+# ==============================================
+DEFAULT_DNS_CANDIDATES = ['1.1.1.1', '8.8.8.8', '9.9.9.9', '208.67.222.222']
+DEFAULT_DNS_DOMAINS = [
+    'google.com', 'youtube.com', 'microsoft.com', 'cloudflare.com',
+    'steampowered.com', 'discord.com', 'wikipedia.org', 'twitch.tv'
+]
+
+def build_dns_query(domain: str, query_id: int, qtype: int = 1) -> bytes:
+    """Tek sorulu, özyinelemeli (RD) bir DNS sorgu paketi üretir"""
+    header = struct.pack('>HHHHHH', query_id, 0x0100, 1, 0, 0, 0)
+    qname = b''.join(
+        bytes([len(label)]) + label.encode('idna')
+        for label in domain.strip('.').split('.') if label
+    ) + b'\x00'
+    return header + qname + struct.pack('>HH', qtype, 1)
+
+def parse_dns_header(data: bytes) -> Optional[Tuple[int, int]]:
+    """Yanıttan (sorgu kimliği, rcode) döndürür; geçersizse None"""
+    if len(data) < 12:
+        return None
+    query_id, flags = struct.unpack('>HH', data[:4])
+    if not flags & 0x8000:
+        return None
+    return query_id, flags & 0x000F
+
+def parse_resolver(resolver: str) -> Tuple[str, int]:
+    host, sep, port = resolver.rpartition(':')
+    if sep and port.isdigit() and host and ':' not in host:
+        return host, int(port)
+    return resolver, 53
+
+class _DnsClientProtocol(asyncio.DatagramProtocol):
+    """Yanıtları sorgu kimliğine göre bekleyen future'lara dağıtır"""
+    def __init__(self):
+        self.pending = {}
+
+    def datagram_received(self, data, addr):
+        header = parse_dns_header(data)
+        if header is None:
+            return
+        future = self.pending.pop(header[0], None)
+        if future is not None and not future.done():
+            future.set_result((time.perf_counter(), header[1]))
+
+    def error_received(self, exc):
+        pass
+
+class DnsBenchmark:
+    """Aday DNS sunucularını soğuk ve önbellekli sorgularla eşzamanlı karşılaştırır"""
+    def __init__(self, resolvers: List[str], domains: List[str], rounds: int = 3,
+                 timeout: float = 1.0, concurrency: int = 8):
+        self.resolvers = resolvers
+        self.domains = domains
+        self.rounds = max(1, int(rounds))
+        self.timeout = float(timeout)
+        self.concurrency = max(1, int(concurrency))
+
+    async def _query(self, transport, protocol, domain: str) -> Optional[float]:
+        loop = asyncio.get_running_loop()
+        query_id = random.getrandbits(16)
+        while query_id in protocol.pending:
+            query_id = random.getrandbits(16)
+
+        future = loop.create_future()
+        protocol.pending[query_id] = future
+        sent_at = time.perf_counter()
+        transport.sendto(build_dns_query(domain, query_id))
+        try:
+            received_at, rcode = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            protocol.pending.pop(query_id, None)
+            return None
+        # NOERROR ve NXDOMAIN geçerli yanıttır; SERVFAIL/REFUSED kayıp sayılır
+        if rcode not in (0, 3):
+            return None
+        return (received_at - sent_at) * 1000.0
+
+    async def _benchmark_resolver(self, resolver: str, semaphore: asyncio.Semaphore) -> Dict:
+        host, port = parse_resolver(resolver)
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            try:
+                transport, protocol = await loop.create_datagram_endpoint(
+                    _DnsClientProtocol, remote_addr=(host, port)
+                )
+            except OSError:
+                cold, cached = [None] * len(self.domains), [None] * len(self.domains) * self.rounds
+            else:
+                try:
+                    # Soğuk: rastgele alt alan adı sunucunun önbelleğinde olamaz
+                    cold = await asyncio.gather(*(
+                        self._query(transport, protocol, f"{os.urandom(4).hex()}.{d}")
+                        for d in self.domains
+                    ))
+                    # Isınma turu, ardından önbellekli ölçümler
+                    await asyncio.gather(*(self._query(transport, protocol, d) for d in self.domains))
+                    cached = []
+                    for _ in range(self.rounds):
+                        cached.extend(await asyncio.gather(*(
+                            self._query(transport, protocol, d) for d in self.domains
+                        )))
+                finally:
+                    transport.close()
+
+        cold_summary = LatencyProbe.summarize(list(cold))
+        cached_summary = LatencyProbe.summarize(cached)
+        return {
+            'resolver': resolver,
+            'cold': {k: cold_summary[k] for k in ('p50', 'p95', 'loss_percent')},
+            'cached': {k: cached_summary[k] for k in ('p50', 'p95', 'loss_percent')},
+            'score': self.score(cold_summary, cached_summary)
+        }
+
+    @staticmethod
+    def score(cold: Dict, cached: Dict) -> Optional[float]:
+        """Düşük daha iyi; önbellekli p50 ağırlıklı, kayıp ağır cezalı"""
+        if cached['p50'] is None:
+            return None
+        cold_p95 = cold['p95'] if cold['p95'] is not None else cached['p95'] * 4
+        loss = (cold['loss_percent'] + cached['loss_percent']) / 2
+        return round(cached['p50'] + 0.25 * cached['p95'] + 0.5 * cold_p95 + 10.0 * loss, 3)
+
+    async def run_async(self) -> Dict:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self._benchmark_resolver(r, semaphore) for r in self.resolvers)
+        )
+        ranked = sorted(
+            (r for r in results if r['score'] is not None), key=lambda r: r['score']
+        )
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'duration': round(time.perf_counter() - started, 3),
+            'results': list(results),
+            'ranking': [r['resolver'] for r in ranked]
+        }
+
+    def run(self) -> Dict:
+        return asyncio.run(self.run_async())
+
+class NetworkInterfaceCache:
+    """psutil.net_if_stats ile bulunan aktif arayüzleri TTL süresince önbellekler"""
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._interfaces = []
+        self._expires = 0.0
+
+    def invalidate(self):
+        self._expires = 0.0
+
+    def get_active(self) -> List[str]:
+        if not HAS_PSUTIL:
+            return []
+        now = time.monotonic()
+        if now < self._expires:
+            return list(self._interfaces)
+
+        stats = psutil.net_if_stats()
+        addrs = psutil.net_if_addrs()
+        active = []
+        for name, stat in stats.items():
+            if not stat.isup:
+                continue
+            ipv4 = [a.address for a in addrs.get(name, []) if a.family == socket.AF_INET]
+            if not ipv4 or all(ip.startswith('127.') for ip in ipv4):
+                continue
+            active.append(name)
+
+        self._interfaces = sorted(active)
+        self._expires = now + self.ttl
+        return list(self._interfaces)
+
+class DnsBenchmarkThread(QThread):
+    result_ready = Signal(dict)
+
+    def __init__(self, benchmark: DnsBenchmark):
+        super().__init__()
+        self.benchmark = benchmark
+
+    def run(self):
+        try:
+            result = self.benchmark.run()
+        except Exception as e:
+            result = {'error': str(e), 'results': [], 'ranking': []}
+        self.result_ready.emit(result)
+
+# ==============================================
+# OPTİMİZASYON KATALOĞU
+# ==============================================
+REG_MM = "HKLM\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Memory Management"
+REG_DESKTOP = "HKCU\\Control Panel\\Desktop"
+# Sabit hedef GUID: şema her tıklamada yeniden kopyalanmaz
+ULTIMATE_SCHEME_GUID = "a1e9f0c3-5b7d-4e2a-9c41-7d2f0b6e8a15"
+
+BUILTIN_OPERATIONS = [
+    {
+        'id': 'optimize_power', 'name': "Güç Planı Optimizasyonu",
+        'labels': {'TR': "NİHAİ GÜÇ", 'EN': "ULTIMATE POWER"},
+        'category': 'power', 'conflict_group': 'power_scheme', 'cost': 2, 'admin': True,
+        'steps': [
+            {'cmd': f"powercfg -duplicatescheme e9a42b02-d5df-448d-aa00-03f14749eb61 {ULTIMATE_SCHEME_GUID}",
+             'check': {'type': 'power_scheme_exists', 'guid': ULTIMATE_SCHEME_GUID}}
+        ]
+    },
+    {
+        'id': 'clean_ram', 'name': "RAM Temizleme",
+        'labels': {'TR': "RAM TEMİZLE", 'EN': "CLEAN RAM"},
+        'category': 'memory', 'cost': 2, 'admin': False, 'handler': 'clean_ram',
+        'steps': [{'cmd': "ipconfig /flushdns && timeout 1"}]
+    },
+    {
+        'id': 'optimize_dns', 'name': "DNS Optimizasyonu",
+        'labels': {'TR': "DNS OPT.", 'EN': "DNS OPT."},
+        'category': 'network', 'conflict_group': 'dns', 'cost': 10, 'admin': True,
+        'handler': 'optimize_dns', 'timeout': 20, 'steps': []
+    },
+    {
+        'id': 'boost_gpu', 'name': "GPU Boost",
+        'labels': {'TR': "GPU BOOST", 'EN': "GPU BOOST"},
+        'category': 'gpu', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': 'reg add "HKLM\\SYSTEM\\CurrentControlSet\\Control\\GraphicsDrivers" /v HwSchMode /t REG_DWORD /d 2 /f',
+             'check': {'type': 'reg', 'key': "HKLM\\SYSTEM\\CurrentControlSet\\Control\\GraphicsDrivers",
+                       'value': 'HwSchMode', 'expected': 2}}
+        ]
+    },
+    {
+        'id': 'fix_mouse', 'name': "Mouse Fix",
+        'labels': {'TR': "MOUSE FIX", 'EN': "MOUSE FIX"},
+        'category': 'input', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': 'reg add "HKU\\.DEFAULT\\Control Panel\\Mouse" /v MouseSpeed /t REG_SZ /d 0 /f',
+             'check': {'type': 'reg', 'key': "HKU\\.DEFAULT\\Control Panel\\Mouse",
+                       'value': 'MouseSpeed', 'expected': "0"}}
+        ]
+    },
+    {
+        'id': 'disable_fso', 'name': "FSO Kapatma",
+        'labels': {'TR': "FSO KAPAT", 'EN': "FSO DISABLE"},
+        'category': 'gpu', 'cost': 1, 'admin': False,
+        'steps': [
+            {'cmd': 'reg add "HKCU\\System\\GameConfigStore" /v GameDVR_FSEBehavior /t REG_DWORD /d 2 /f',
+             'check': {'type': 'reg', 'key': "HKCU\\System\\GameConfigStore",
+                       'value': 'GameDVR_FSEBehavior', 'expected': 2}}
+        ]
+    },
+    {
+        'id': 'optimize_ping', 'name': "Ping Optimizasyonu",
+        'labels': {'TR': "PİNG OPT.", 'EN': "PING OPT."},
+        'category': 'network', 'conflict_group': 'tcp_stack', 'cost': 15, 'admin': True,
+        'latency_probe': True, 'timeout': 20,
+        'steps': [
+            {'cmd': 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Multimedia\\SystemProfile" /v NetworkThrottlingIndex /t REG_DWORD /d 0xffffffff /f',
+             'check': {'type': 'reg', 'key': "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Multimedia\\SystemProfile",
+                       'value': 'NetworkThrottlingIndex', 'expected': 0xffffffff}}
+        ]
+    },
+    {
+        'id': 'clean_junk', 'name': "Çöp Dosya Temizleme",
+        'labels': {'TR': "GEREKSİZ SİL", 'EN': "CLEAN JUNK"},
+        'category': 'cleanup', 'conflict_group': 'disk_io', 'cost': 60, 'admin': True,
+        'timeout': 300, 'repeat_after': 24 * 3600,
+        'steps': [
+            {'cmd': 'del /q/f/s %TEMP%\\*'},
+            {'cmd': 'del /q/f/s C:\\Windows\\Temp\\*'},
+            {'cmd': 'cleanmgr /sagerun:1', 'timeout': 1800}
+        ]
+    },
+    {
+        'id': 'set_cpu_priority', 'name': "CPU Önceliği",
+        'labels': {'TR': "CPU ÖNCELİK", 'EN': "CPU PRIORITY"},
+        'category': 'system', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Image File Execution Options\\csgo.exe\\PerfOptions" /v CpuPriorityClass /t REG_DWORD /d 3 /f',
+             'check': {'type': 'reg', 'key': "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Image File Execution Options\\csgo.exe\\PerfOptions",
+                       'value': 'CpuPriorityClass', 'expected': 3}}
+        ]
+    },
+    {
+        'id': 'clear_shaders', 'name': "Shader Temizleme",
+        'labels': {'TR': "SHADER SİL", 'EN': "SHADER FLUSH"},
+        'category': 'cleanup', 'conflict_group': 'disk_io', 'cost': 10, 'admin': False,
+        'repeat_after': 24 * 3600,
+        'steps': [
+            {'cmd': 'del /f /s /q "{path}\\*.*"', 'when_exists': "%LOCALAPPDATA%\\NVIDIA\\DXCache"},
+            {'cmd': 'del /f /s /q "{path}\\*.*"', 'when_exists': "%LOCALAPPDATA%\\AMD\\DxCache"},
+            {'cmd': 'del /f /s /q "{path}\\*.*"', 'when_exists': "%LOCALAPPDATA%\\Intel\\ShaderCache"}
+        ]
+    },
+    {
+        'id': 'fast_boot', 'name': "Hızlı Önyükleme",
+        'labels': {'TR': "HIZLI BOOT", 'EN': "FAST BOOT"},
+        'category': 'system', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': "bcdedit /set {current} bootux disabled",
+             'check': {'type': 'bcdedit', 'field': 'bootux', 'expected': 'disabled'}}
+        ]
+    },
+    {
+        'id': 'clean_logs', 'name': "Log Temizleme",
+        'labels': {'TR': "LOG TEMİZLE", 'EN': "CLEAN LOGS"},
+        'category': 'cleanup', 'cost': 5, 'admin': True, 'repeat_after': 24 * 3600,
+        'steps': [{'cmd': f'wevtutil cl {log}'} for log in ("System", "Application", "Security", "Setup")]
+    },
+    {
+        'id': 'optimize_network', 'name': "Ağ Optimizasyonu",
+        'labels': {'TR': "AĞ OPT.", 'EN': "NETWORK OPT."},
+        'category': 'network', 'conflict_group': 'tcp_stack', 'cost': 20, 'admin': True,
+        'latency_probe': True, 'timeout': 20,
+        'steps': [
+            {'cmd': 'netsh int tcp set global autotuninglevel=normal',
+             'check': {'type': 'tcp_global', 'field': 'autotuninglevel', 'expected': 'normal'}},
+            {'cmd': 'netsh int tcp set global rss=enabled',
+             'check': {'type': 'tcp_global', 'field': 'rss', 'expected': 'enabled'}},
+            {'cmd': 'netsh winsock reset', 'only_if_changed': True}
+        ]
+    },
+    {
+        'id': 'clean_registry', 'name': "Registry Temizleme",
+        'labels': {'TR': "REGISTRY TEMİZ.", 'EN': "REGISTRY CLEAN"},
+        'category': 'cleanup', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Explorer\\VolumeCaches\\Old ChkDsk Files" /v StateFlags0001 /t REG_DWORD /d 2 /f',
+             'check': {'type': 'reg', 'key': "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Explorer\\VolumeCaches\\Old ChkDsk Files",
+                       'value': 'StateFlags0001', 'expected': 2}}
+        ]
+    },
+    {
+        'id': 'set_power_plan', 'name': "Güç Planı Ayarlama",
+        'labels': {'TR': "GÜÇ PLANI", 'EN': "POWER PLAN"},
+        'category': 'power', 'conflict_group': 'power_scheme', 'cost': 1, 'admin': False,
+        'steps': [
+            {'cmd': 'powercfg -setactive 8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c',
+             'check': {'type': 'power_scheme', 'expected': "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c"}}
+        ]
+    },
+    {
+        'id': 'security_optimize', 'name': "Güvenlik Optimizasyonu",
+        'labels': {'TR': "GÜVENLİK OPT.", 'EN': "SECURITY OPT."},
+        'category': 'system', 'cost': 1, 'admin': True,
+        'steps': [
+            {'cmd': f'reg add "{REG_MM}" /v FeatureSettingsOverride /t REG_DWORD /d 3 /f',
+             'check': {'type': 'reg', 'key': REG_MM, 'value': 'FeatureSettingsOverride', 'expected': 3}},
+            {'cmd': f'reg add "{REG_MM}" /v FeatureSettingsOverrideMask /t REG_DWORD /d 3 /f',
+             'check': {'type': 'reg', 'key': REG_MM, 'value': 'FeatureSettingsOverrideMask', 'expected': 3}}
+        ]
+    },
+    {
+        'id': 'defrag_disk', 'name': "Disk Birleştirme",
+        'labels': {'TR': "DISK BİRLEŞTİR", 'EN': "DISK DEFRAG"},
+        'category': 'disk', 'conflict_group': 'disk_io', 'cost': 900, 'admin': True,
+        'timeout': 4 * 3600, 'repeat_after': 7 * 24 * 3600,
+        'steps': [{'cmd': 'defrag C: /O /U'}]
+    },
+    {
+        'id': 'optimize_services', 'name': "Servis Optimizasyonu",
+        'labels': {'TR': "SERVİS OPT.", 'EN': "SERVICE OPT."},
+        'category': 'services', 'cost': 10, 'admin': True, 'timeout': 30,
+        'steps': [
+            {'cmd': 'sc config "SysMain" start= disabled',
+             'check': {'type': 'service', 'name': 'SysMain', 'start': 'disabled'}},
+            {'cmd': 'sc stop "SysMain"',
+             'check': {'type': 'service', 'name': 'SysMain', 'state': 'stopped'}},
+            {'cmd': 'sc config "DiagTrack" start= disabled',
+             'check': {'type': 'service', 'name': 'DiagTrack', 'start': 'disabled'}},
+            {'cmd': 'sc stop "DiagTrack"',
+             'check': {'type': 'service', 'name': 'DiagTrack', 'state': 'stopped'}}
+        ]
+    },
+    {
+        'id': 'optimize_startup', 'name': "Startup Optimizasyonu",
+        'labels': {'TR': "STARTUP OPT.", 'EN': "STARTUP OPT."},
+        'category': 'system', 'cost': 1, 'admin': False,
+        'timeout': None, 'repeat_after': 24 * 3600,
+        'steps': [{'cmd': 'taskmgr'}]
+    },
+    {
+        'id': 'visual_optimize', 'name': "Görsellik Optimizasyonu",
+        'labels': {'TR': "GÖRSELLİK OPT.", 'EN': "VISUAL OPT."},
+        'category': 'visual', 'cost': 1, 'admin': False,
+        'steps': [
+            {'cmd': f'reg add "{REG_DESKTOP}" /v DragFullWindows /t REG_SZ /d 0 /f',
+             'check': {'type': 'reg', 'key': REG_DESKTOP, 'value': 'DragFullWindows', 'expected': "0"}},
+            {'cmd': f'reg add "{REG_DESKTOP}" /v MenuShowDelay /t REG_SZ /d 0 /f',
+             'check': {'type': 'reg', 'key': REG_DESKTOP, 'value': 'MenuShowDelay', 'expected': "0"}},
+            {'cmd': f'reg add "{REG_DESKTOP}\\WindowMetrics" /v MinAnimate /t REG_SZ /d 0 /f',
+             'check': {'type': 'reg', 'key': f"{REG_DESKTOP}\\WindowMetrics", 'value': 'MinAnimate', 'expected': "0"}}
+        ]
+    }
+]
+
+# Komut yerine pencere metodu çalıştıran yerleşik operasyonlar; paketler handler tanımlayamaz
+OPERATION_HANDLERS = frozenset({'clean_ram', 'optimize_dns'})
+
+class OptimizationEntry:
+    """Katalogdaki tek bir operasyonun bildirimsel tanımı"""
+    __slots__ = ('id', 'name', 'labels', 'category', 'conflict_group', 'cost', 'admin',
+                 'steps', 'handler', 'latency_probe', 'timeout', 'repeat_after', 'source')
+    
+    def __init__(self, spec: Dict, source: str = "builtin"):
+        missing = [k for k in ('id', 'name', 'labels', 'steps') if k not in spec]
+        if missing:
+            raise ValueError(f"Eksik alanlar: {', '.join(missing)}")
+        self.id = spec['id']
+        self.name = spec['name']
+        self.labels = dict(spec['labels'])
+        self.category = spec.get('category', 'other')
+        self.conflict_group = spec.get('conflict_group')
+        self.cost = float(spec.get('cost', 1))
+        self.admin = bool(spec.get('admin', True))
+        self.steps = [dict(step) for step in spec['steps']]
+        self.handler = spec.get('handler')
+        if self.handler is not None and (source != "builtin" or self.handler not in OPERATION_HANDLERS):
+            raise ValueError(f"İzin verilmeyen handler: {self.handler}")
+        self.latency_probe = bool(spec.get('latency_probe', False))
+        self.timeout = spec.get('timeout', DEFAULT_COMMAND_TIMEOUT)
+        # Durumu yoklanamayan işlem bu kadar saniye içinde boost'larda tekrar çalıştırılmaz (None = yoklama TTL'i)
+        repeat_after = spec.get('repeat_after')
+        self.repeat_after = None if repeat_after is None else float(repeat_after)
+        self.source = source
+    
+    def label(self, lang: str) -> str:
+        return self.labels.get(lang) or self.labels.get('EN') or self.id
+    
+    def commands(self) -> List[str]:
+        """Koşulları sağlanan adımların komutlarını döndürür"""
+        commands = []
+        for step in self.steps:
+            path = step.get('when_exists')
+            if path:
+                expanded = os.path.expandvars(path)
+                if not os.path.exists(expanded):
+                    continue
+                commands.append(step['cmd'].replace("{path}", expanded))
+            else:
+                commands.append(step['cmd'])
+        return commands
+    
+    def timeout_for(self, command: str) -> Optional[float]:
+        """Komutun süre bütçesi: adımdaki 'timeout', yoksa operasyonunki (None = sınırsız)"""
+        for step in self.steps:
+            template = step['cmd']
+            if 'when_exists' in step:
+                template = template.replace("{path}", os.path.expandvars(step['when_exists']))
+            if template == command:
+                return step.get('timeout', self.timeout)
+        return self.timeout
+
+class OptimizationCatalog:
+    """Operasyonları kimliğe göre O(1) sunar; eklenti paketleri ilk ihtiyaçta yüklenir"""
+    def __init__(self, operations: List[Dict] = None, packs_dir: Path = Path("packs")):
         self.logger = Logger()
+        self.packs_dir = packs_dir
+        self._entries: Dict[str, OptimizationEntry] = {}
+        self._order: List[str] = []
+        self._packs_loaded = False
+        for spec in operations if operations is not None else BUILTIN_OPERATIONS:
+            self._register(OptimizationEntry(spec))
     
-    def load_settings(self) -> Dict:
-        if self.settings_file.exists():
+    def _register(self, entry: OptimizationEntry) -> bool:
+        if entry.id in self._entries:
+            self.logger.log("WARNING", "CATALOG", f"Yinelenen operasyon kimliği atlandı: {entry.id} ({entry.source})")
+            return False
+        self._entries[entry.id] = entry
+        self._order.append(entry.id)
+        return True
+    
+    def load_packs(self) -> List[OptimizationEntry]:
+        """packs/*.json dosyalarındaki operasyonları bir kez yükler"""
+        if self._packs_loaded:
+            return [self._entries[i] for i in self._order if self._entries[i].source != "builtin"]
+        self._packs_loaded = True
+        loaded = []
+        if not self.packs_dir.is_dir():
+            return loaded
+        
+        for pack_file in sorted(self.packs_dir.glob("*.json")):
             try:
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    # Varsayılan ayarlarla birleştir
-                    return self._merge_settings(self.default_settings, loaded)
-            except:
-                return self.default_settings.copy()
-        return self.default_settings.copy()
+                with open(pack_file, 'r', encoding='utf-8') as f:
+                    pack = json.load(f)
+                for spec in pack.get('operations', []):
+                    if 'handler' in spec:
+                        # Paket, pencerenin rastgele bir metodunu çağıramaz
+                        self.logger.log("ERROR", "CATALOG",
+                                        f"handler içeren paket operasyonu reddedildi: {spec.get('id')} ({pack_file.name})")
+                        continue
+                    entry = OptimizationEntry(spec, source=pack_file.stem)
+                    if self._register(entry):
+                        loaded.append(entry)
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                self.logger.log("ERROR", "CATALOG", f"Paket yüklenemedi: {pack_file.name} - {str(e)}")
+        
+        if loaded:
+            self.logger.log("INFO", "CATALOG", f"{len(loaded)} eklenti operasyonu yüklendi")
+        return loaded
     
-    def _merge_settings(self, default: Dict, loaded: Dict) -> Dict:
-        """Recursive settings merge"""
-        merged = default.copy()
-        for key, value in loaded.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_settings(merged[key], value)
+    def get(self, op_id: str) -> Optional[OptimizationEntry]:
+        entry = self._entries.get(op_id)
+        if entry is None and not self._packs_loaded:
+            self.load_packs()
+            entry = self._entries.get(op_id)
+        return entry
+    
+    def builtin(self) -> List[OptimizationEntry]:
+        return [self._entries[i] for i in self._order if self._entries[i].source == "builtin"]
+    
+    def entries(self) -> List[OptimizationEntry]:
+        self.load_packs()
+        return [self._entries[i] for i in self._order]
+
+# ==============================================
+# SİSTEM DURUMU YOKLAMASI
+# ==============================================
+GUID_PATTERN = re.compile(r'[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}')
+TCP_GLOBAL_LABELS = {
+    'autotuninglevel': 'auto-tuning level',
+    'rss': 'receive-side scaling',
+    'ecncapability': 'ecn capability',
+    'timestamps': 'rfc 1323 timestamps'
+}
+
+try:
+    import winreg
+    HAS_WINREG = True
+except ImportError:
+    HAS_WINREG = False
+    winreg = None
+
+def run_capture(command: str, timeout: float = 10.0) -> Tuple[int, str]:
+    """Komutu pencere açmadan çalıştırır ve (dönüş kodu, çıktı) verir"""
+    try:
+        result = subprocess.run(
+            command, shell=True, capture_output=True, text=True, errors='replace',
+            timeout=timeout,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+        return result.returncode, result.stdout
+    except (subprocess.TimeoutExpired, OSError):
+        return -1, ""
+
+def probe_target(check: Dict) -> Tuple:
+    """Bir kontrolün okuduğu sistem değerini tanımlayan anahtar ('expected' hariç)"""
+    kind = check['type']
+    if kind == 'reg':
+        return ('reg', check['key'].lower(), check['value'].lower())
+    if kind == 'power_scheme':
+        return ('power_active',)
+    if kind == 'power_scheme_exists':
+        return ('power_exists', check['guid'].lower())
+    if kind == 'service':
+        return ('service_state' if 'state' in check else 'service_start', check['name'].lower())
+    if kind in ('tcp_global', 'bcdedit'):
+        return (kind, check['field'].lower())
+    raise ValueError(f"Bilinmeyen kontrol türü: {kind}")
+
+class StateProbe:
+    """Katalog hedeflerinin güncel değerlerini tek paralel geçişte toplar ve önbellekler"""
+    def __init__(self, ttl: float = 60.0, runner=run_capture, workers: int = 8,
+                 runs_path: Optional[Path] = None, clock=time.time):
+        self.ttl = ttl
+        self.runner = runner
+        self.workers = workers
+        self.logger = Logger()
+        self._snapshot: Dict[Tuple, object] = {}
+        self._taken_at = 0.0
+        self._lock = threading.Lock()
+        # Durumu okunamayan işlemlerin son başarılı çalışması (duvar saati, yeniden başlatmada korunur)
+        self.runs_path = runs_path
+        self.clock = clock
+        self._runs: Dict[str, float] = self.load_runs()
+    
+    @staticmethod
+    def checks_of(entries: List[OptimizationEntry]) -> List[Dict]:
+        return [step['check'] for entry in entries for step in entry.steps if 'check' in step]
+    
+    @staticmethod
+    def unverifiable(entry: OptimizationEntry) -> bool:
+        """Handler'lı ya da hiç kontrolü olmayan işlemin uygulanıp uygulanmadığı yoklanamaz"""
+        return bool(entry.handler) or not any('check' in step for step in entry.steps)
+    
+    def load_runs(self) -> Dict[str, float]:
+        if self.runs_path is None:
+            return {}
+        try:
+            with open(self.runs_path, 'r', encoding='utf-8') as f:
+                runs = json.load(f)
+            return {str(k): float(v) for k, v in runs.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+    
+    def record_run(self, entry: OptimizationEntry):
+        """Yoklanamayan işlemin başarıyla bittiğini kaydeder"""
+        if not self.unverifiable(entry):
+            return
+        with self._lock:
+            self._runs[entry.id] = self.clock()
+            runs = dict(self._runs)
+        if self.runs_path is None:
+            return
+        try:
+            self.runs_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.runs_path.with_suffix('.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(runs, f)
+            os.replace(temp, self.runs_path)
+        except OSError as e:
+            self.logger.log("ERROR", "STATE_PROBE", f"Çalışma kaydı yazılamadı: {str(e)}")
+    
+    def recently_run(self, entry: OptimizationEntry) -> bool:
+        """Yoklanamayan işlem tekrar aralığı (yoksa TTL) içinde başarıyla çalıştıysa True"""
+        if not self.unverifiable(entry):
+            return False
+        with self._lock:
+            last = self._runs.get(entry.id)
+        if last is None:
+            return False
+        window = self.ttl if entry.repeat_after is None else entry.repeat_after
+        return 0 <= self.clock() - last < window
+    
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = {}
+            self._taken_at = 0.0
+    
+    def cached(self, entries: List[OptimizationEntry]) -> Optional[Dict]:
+        """Tüm hedefler TTL içinde okunmuşsa önbellekteki anlık görüntüyü verir"""
+        targets = {probe_target(c) for c in self.checks_of(entries)}
+        with self._lock:
+            if time.monotonic() - self._taken_at > self.ttl:
+                return None
+            if not targets <= self._snapshot.keys():
+                return None
+            return dict(self._snapshot)
+    
+    def snapshot(self, entries: List[OptimizationEntry]) -> Dict:
+        cached = self.cached(entries)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        targets = {probe_target(c) for c in self.checks_of(entries)}
+        values = self.gather(targets)
+        with self._lock:
+            if time.monotonic() - self._taken_at > self.ttl:
+                self._snapshot = {}
+            self._snapshot.update(values)
+            self._taken_at = time.monotonic()
+            snapshot = dict(self._snapshot)
+        self.logger.log("INFO", "STATE_PROBE",
+                        f"{len(targets)} hedef {time.perf_counter() - started:.2f} sn içinde okundu")
+        return snapshot
+    
+    def gather(self, targets) -> Dict[Tuple, object]:
+        """Hedefleri kaynağa göre gruplar; her kaynak bir kez ve paralel okunur"""
+        reg_keys: Dict[str, List[str]] = {}
+        services = set()
+        jobs = []
+        for target in targets:
+            if target[0] == 'reg':
+                reg_keys.setdefault(target[1], []).append(target[2])
+            elif target[0] in ('service_start', 'service_state'):
+                services.add(target[1])
+        kinds = {t[0] for t in targets}
+        
+        for key, names in reg_keys.items():
+            jobs.append((self._read_registry, key, names))
+        for name in services:
+            jobs.append((self._read_service, name))
+        if kinds & {'power_active', 'power_exists'}:
+            jobs.append((self._read_power_schemes,))
+        if 'tcp_global' in kinds:
+            jobs.append((self._read_tcp_global,))
+        if 'bcdedit' in kinds:
+            jobs.append((self._read_bcdedit,))
+        
+        values: Dict[Tuple, object] = {}
+        if not jobs:
+            return values
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+            for result in pool.map(lambda job: job[0](*job[1:]), jobs):
+                values.update(result)
+        
+        # Okunamayan hedefler bilinmiyor (None) sayılır ve atlanmaz
+        for target in targets:
+            if target[0] == 'power_exists':
+                values[target] = target[1] in values.get(('power_list',), ())
             else:
-                merged[key] = value
-        return merged
+                values.setdefault(target, None)
+        values.pop(('power_list',), None)
+        return values
     
-    def save_settings(self):
+    def _read_registry(self, key: str, names: List[str]) -> Dict:
+        values = {}
+        if HAS_WINREG:
+            hive_name, _, sub_key = key.partition('\\')
+            hives = {
+                'hklm': winreg.HKEY_LOCAL_MACHINE, 'hkcu': winreg.HKEY_CURRENT_USER,
+                'hku': winreg.HKEY_USERS, 'hkcr': winreg.HKEY_CLASSES_ROOT
+            }
+            try:
+                with winreg.OpenKey(hives[hive_name], sub_key) as handle:
+                    for name in names:
+                        try:
+                            values[('reg', key, name)] = winreg.QueryValueEx(handle, name)[0]
+                        except OSError:
+                            values[('reg', key, name)] = None
+            except (OSError, KeyError):
+                pass
+            return values
+        
+        code, output = self.runner(f'reg query "{key}"')
+        if code != 0:
+            return values
+        for line in output.splitlines():
+            parts = line.split(None, 2)
+            if len(parts) == 3 and parts[0].lower() in names and parts[1].startswith('REG_'):
+                raw = parts[2].strip()
+                values[('reg', key, parts[0].lower())] = (
+                    int(raw, 16) if parts[1] in ('REG_DWORD', 'REG_QWORD') else raw
+                )
+        return values
+    
+    def _read_service(self, name: str) -> Dict:
+        start = state = None
+        if HAS_PSUTIL and hasattr(psutil, 'win_service_get'):
+            try:
+                service = psutil.win_service_get(name)
+                start, state = service.start_type(), service.status()
+            except Exception:
+                pass
+        else:
+            code, output = self.runner(f'sc qc "{name}"')
+            if code == 0:
+                match = re.search(r'START_TYPE\s*:\s*\d+\s+(\w+)', output)
+                start = match.group(1).lower() if match else None
+            code, output = self.runner(f'sc query "{name}"')
+            if code == 0:
+                match = re.search(r'STATE\s*:\s*\d+\s+(\w+)', output)
+                state = match.group(1).lower() if match else None
+        return {('service_start', name): start, ('service_state', name): state}
+    
+    def _read_power_schemes(self) -> Dict:
+        code, output = self.runner('powercfg /list')
+        if code != 0:
+            return {}
+        existing = set()
+        active = None
+        for line in output.splitlines():
+            match = GUID_PATTERN.search(line)
+            if match:
+                existing.add(match.group(0).lower())
+                if line.rstrip().endswith('*'):
+                    active = match.group(0).lower()
+        return {('power_active',): active, ('power_list',): existing}
+    
+    def _read_tcp_global(self) -> Dict:
+        code, output = self.runner('netsh int tcp show global')
+        values = {}
+        if code != 0:
+            return values
+        for line in output.splitlines():
+            label, sep, value = line.partition(':')
+            if not sep:
+                continue
+            label = label.strip().lower()
+            for field, text in TCP_GLOBAL_LABELS.items():
+                if text in label:
+                    values[('tcp_global', field)] = value.strip().lower()
+        return values
+    
+    def _read_bcdedit(self) -> Dict:
+        code, output = self.runner('bcdedit /enum {current}')
+        values = {}
+        if code != 0:
+            return values
+        for line in output.splitlines():
+            parts = line.split(None, 1)
+            if len(parts) == 2:
+                values[('bcdedit', parts[0].lower())] = parts[1].strip().lower()
+        return values
+    
+    @staticmethod
+    def holds(check: Dict, snapshot: Dict) -> Optional[bool]:
+        """Kontrol sağlanıyorsa True, sağlanmıyorsa False, bilinmiyorsa None"""
+        observed = snapshot.get(probe_target(check))
+        if observed is None:
+            return None
+        kind = check['type']
+        if kind == 'power_scheme_exists':
+            return bool(observed)
+        if kind == 'service':
+            expected = check.get('state', check.get('start'))
+        else:
+            expected = check['expected']
+        if isinstance(expected, int) and not isinstance(observed, int):
+            try:
+                observed = int(str(observed), 0)
+            except ValueError:
+                return False
+        if isinstance(expected, str):
+            return str(observed).strip().lower() == expected.lower()
+        return observed == expected
+    
+    def pending_commands(self, entry: OptimizationEntry, snapshot: Dict) -> Tuple[List[str], int]:
+        """İstenen durumu zaten sağlayan adımları çıkarır: (komutlar, atlanan adım sayısı)"""
+        commands = []
+        deferred = []
+        skipped = 0
+        for step in entry.steps:
+            if 'when_exists' in step:
+                expanded = os.path.expandvars(step['when_exists'])
+                if os.path.exists(expanded):
+                    commands.append(step['cmd'].replace("{path}", expanded))
+                continue
+            if step.get('only_if_changed'):
+                deferred.append(step['cmd'])
+                continue
+            if 'check' in step and self.holds(step['check'], snapshot):
+                skipped += 1
+                continue
+            commands.append(step['cmd'])
+        
+        # Ör. Winsock sıfırlaması yalnızca başka bir adım değiştiyse gerekir
+        if commands:
+            commands.extend(deferred)
+        else:
+            skipped += len(deferred)
+        return commands, skipped
+
+class StateProbeThread(QThread):
+    result_ready = Signal(dict)
+    
+    def __init__(self, probe: StateProbe, entries: List[OptimizationEntry]):
+        super().__init__()
+        self.probe = probe
+        self.entries = entries
+    
+    def run(self):
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
-            self.logger.log("INFO", "SETTINGS", "Ayarlar kaydedildi")
-            return True
+            snapshot = self.probe.snapshot(self.entries)
         except Exception as e:
-            self.logger.log("ERROR", "SETTINGS", f"Kaydetme hatası: {str(e)}")
-            return False
+            Logger().log("ERROR", "STATE_PROBE", f"Hata: {str(e)}")
+            snapshot = {}
+        self.result_ready.emit(snapshot)
+
+# ==============================================
+# BOOST GÜNLÜĞÜ
+# ==============================================
+BOOST_STEP_STATES = ('pending', 'running', 'done', 'failed', 'skipped')
+BOOST_TERMINAL_STATES = frozenset(('done', 'failed', 'skipped'))
+
+def all_succeeded(on_done):
+    """run_commands sonuç listesini tek bir on_done(success) çağrısına çevirir"""
+    if on_done is None:
+        return None
+    return lambda results: on_done(all(results))
+
+class BoostJournal:
+    """Mega Boost planı ve adım durumları için çökmeye dayanıklı, yalnızca eklemeli günlük (JSONL)"""
+    def __init__(self, path: Path = Path("cache") / "boost_journal.jsonl", sync_interval: float = 0.5):
+        self.path = Path(path)
+        self.sync_interval = sync_interval
+        self.logger = Logger()
+        self._lock = threading.Lock()
+        self._file = None
+        self._dirty = False
+        self._last_sync = 0.0
+        self._counter = 0
+        # plan -> {label, created, order, names, states}
+        self.plans: Dict[str, Dict] = self.load()
+
+    def load(self) -> Dict[str, Dict]:
+        """Günlüğü yeniden oynatır; çökme anında yarım yazılmış son satır yok sayılır"""
+        plans = {}
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except OSError:
+            return plans
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                kind, plan = record.get('type'), record.get('plan')
+                if kind == 'plan':
+                    plans[plan] = {
+                        'label': record['label'], 'created': record['created'],
+                        'order': [s['key'] for s in record['steps']],
+                        'names': {s['key']: s['name'] for s in record['steps']},
+                        'states': {s['key']: s.get('state', 'pending') for s in record['steps']}
+                    }
+                elif kind == 'step' and plan in plans and record.get('state') in BOOST_STEP_STATES:
+                    plans[plan]['states'][record['key']] = record['state']
+                elif kind == 'end':
+                    plans.pop(plan, None)
+        return plans
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def _open(self):
+        """Oturumun ilk yazımında günlük yalnızca yarım kalan planlarla yeniden yazılır (sıkıştırma)"""
+        if self._file is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix('.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            for plan, state in self.plans.items():
+                f.write(json.dumps(self._plan_record(plan, state), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    @staticmethod
+    def _plan_record(plan: str, state: Dict) -> Dict:
+        return {'type': 'plan', 'plan': plan, 'label': state['label'], 'created': state['created'],
+                'steps': [{'key': k, 'name': state['names'][k], 'state': state['states'][k]}
+                          for k in state['order']]}
+
+    def _append(self, record: Dict, force: bool = False):
+        """Satır hemen işletim sistemine yazılır; fsync en fazla sync_interval'da bir yapılır"""
+        with self._lock:
+            try:
+                self._open()
+                self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self._file.flush()
+                self._dirty = True
+                if force or time.monotonic() - self._last_sync >= self.sync_interval:
+                    self._sync()
+            except OSError as e:
+                self.logger.log("ERROR", "BOOST_JOURNAL", f"Günlük yazılamadı: {str(e)}")
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Bekleyen kayıtları diske zorlar (zamanlayıcı ve kapanışta çağrılır)"""
+        with self._lock:
+            if self._file is not None and self._dirty:
+                try:
+                    self._sync()
+                except OSError as e:
+                    self.logger.log("ERROR", "BOOST_JOURNAL", f"Günlük eşitlenemedi: {str(e)}")
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def begin(self, label: str, steps: List[Tuple[str, str]]) -> str:
+        """Planı tüm adımları 'pending' olarak kaydeder; plan kimliğini döndürür"""
+        # Yeniden oynatılan bir planın kimliği tekrar kullanılmaz
+        plan = None
+        while plan is None or plan in self.plans:
+            self._counter += 1
+            plan = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{self._counter}"
+        state = {'label': label, 'created': time.time(), 'order': [k for k, _ in steps],
+                 'names': dict(steps), 'states': {k: 'pending' for k, _ in steps}}
+        # İlk yazımdaki sıkıştırma yeni planı iki kez yazmasın diye plan kayıttan sonra eklenir
+        self._append(self._plan_record(plan, state), force=True)
+        self.plans[plan] = state
+        return plan
+
+    def mark(self, plan: Optional[str], key: str, state: str):
+        """Adım durumunu kaydeder; tüm adımlar sonuçlanınca plan kapanır"""
+        current = self.plans.get(plan)
+        if current is None or key not in current['states']:
+            return
+        current['states'][key] = state
+        self._append({'type': 'step', 'plan': plan, 'key': key, 'state': state, 't': time.time()})
+        if all(s in BOOST_TERMINAL_STATES for s in current['states'].values()):
+            self.end(plan)
+
+    def end(self, plan: str, reason: str = 'completed'):
+        if self.plans.pop(plan, None) is None:
+            return
+        self._append({'type': 'end', 'plan': plan, 'reason': reason, 't': time.time()}, force=True)
+        if not self.plans:
+            # Sürdürülecek bir şey kalmadı; günlük bir sonraki plana kadar kaldırılır
+            self.close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def unfinished(self) -> List[Dict]:
+        """Yarım kalan planlar: bekleyen ve çalışırken kesilen adımlar ayrı listelenir"""
+        plans = []
+        for plan, state in sorted(self.plans.items(), key=lambda item: item[1]['created']):
+            states = state['states']
+            plans.append({
+                'plan': plan, 'label': state['label'], 'created': state['created'],
+                'pending': [k for k in state['order'] if states[k] == 'pending'],
+                'interrupted': [k for k in state['order'] if states[k] == 'running'],
+                'remaining': [k for k in state['order'] if states[k] not in BOOST_TERMINAL_STATES],
+                'finished': sum(1 for s in states.values() if s in BOOST_TERMINAL_STATES),
+                'total': len(states),
+                'names': state['names']
+            })
+        return plans
+
+# ==============================================
+# BAKIM ZAMANLAYICI
+# ==============================================
+HEAVY_OPERATIONS = ('defrag_disk', 'clean_junk', 'clean_logs')
+DEFAULT_MAINTENANCE_JOBS = [
+    {'id': 'weekly_logs', 'operation': 'clean_logs', 'trigger': {'cron': "0 4 * * 0"}},
+    {'id': 'weekly_junk', 'operation': 'clean_junk', 'trigger': {'cron': "30 4 * * 0"}},
+    {'id': 'monthly_registry', 'operation': 'clean_registry', 'trigger': {'cron': "0 5 1 * *"}},
+    {'id': 'monthly_defrag', 'operation': 'defrag_disk', 'trigger': {'cron': "0 3 1 * *"}}
+]
+
+class CronExpression:
+    """Beş alanlı cron ifadesi: dakika saat ayın-günü ay haftanın-günü (0 = Pazar)"""
+    # Haftanın günü alanında 7 de Pazar kabul edilir
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
     
-    def get(self, category: str, key: str, default=None):
-        return self.settings.get(category, {}).get(key, default)
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron ifadesi 5 alan içermeli: {expr}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse(part, low, high) for part, (low, high) in zip(parts, self.FIELDS)
+        )
+        # Standart cron: iki gün alanı da kısıtlıysa biri yeterlidir
+        self.day_or = parts[2] != '*' and parts[4] != '*'
     
-    def set(self, category: str, key: str, value):
-        if category not in self.settings:
-            self.settings[category] = {}
-        self.settings[category][key] = value
+    @staticmethod
+    def _parse(part: str, low: int, high: int) -> frozenset:
+        values = set()
+        for item in part.split(','):
+            rng, _, step = item.partition('/')
+            step = int(step) if step else 1
+            if rng == '*':
+                start, end = low, high
+            elif '-' in rng:
+                start, end = (int(v) for v in rng.split('-', 1))
+            else:
+                start = end = int(rng)
+                if step > 1:
+                    end = high
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"Geçersiz cron alanı: {part}")
+            values.update(range(start, end + 1, step))
+        if high == 7 and 7 in values:
+            values.discard(7)
+            values.add(0)
+        return frozenset(values)
+    
+    def _day_matches(self, day: datetime) -> bool:
+        dom = day.day in self.days
+        dow = (day.isoweekday() % 7) in self.weekdays
+        return (dom or dow) if self.day_or else (dom and dow)
+    
+    def next_after(self, when: datetime) -> datetime:
+        """Verilen andan sonraki ilk eşleşen dakika"""
+        start = when.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(366 * 5):
+            if day.month in self.months and self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron ifadesi hiç eşleşmiyor: {self.expr}")
+
+class MaintenanceScheduler:
+    """Kalıcı bakım işleri: cron/aralık tetikleyici, kaçırılanları birleştirme, boşta erteleme"""
+    def __init__(self, jobs: List[Dict], state_path: Path = Path("cache") / "scheduler.json",
+                 clock=time.time, metrics=None, rng=None,
+                 idle_cpu: float = 15.0, idle_disk: float = 10.0, idle_input: float = 300.0,
+                 idle_window: float = 600.0, jitter: float = 900.0, max_deferral: float = 3 * 86400):
+        self.state_path = state_path
+        self.clock = clock
+        self.metrics = metrics
+        self.rng = rng or random.Random()
+        self.idle_cpu = idle_cpu
+        self.idle_disk = idle_disk
+        self.idle_input = idle_input
+        self.idle_window = idle_window
+        self.jitter = jitter
+        self.max_deferral = max_deferral
+        self.logger = Logger()
+        self.idle_since = None
+        self.jobs = {}
+        for spec in jobs:
+            job = dict(spec)
+            trigger = job['trigger']
+            if 'cron' in trigger:
+                job['cron'] = CronExpression(trigger['cron'])
+            elif float(trigger.get('every', 0)) <= 0:
+                raise ValueError(f"Geçersiz tetikleyici: {job['id']}")
+            job.setdefault('heavy', job['operation'] in HEAVY_OPERATIONS)
+            job.setdefault('enabled', True)
+            self.jobs[job['id']] = job
+        self.state = self.load_state()
+        # Aralık tetikleyicilerinin ilk vadesi yeniden başlatmalarda kaymasın
+        self.save_state()
+    
+    def load_state(self) -> Dict:
+        state = {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f).get('jobs', {})
+        except (OSError, ValueError):
+            pass
+        now = self.clock()
+        for job_id, job in self.jobs.items():
+            entry = state.setdefault(job_id, {})
+            entry.setdefault('last_run', None)
+            entry.setdefault('runs', 0)
+            entry.setdefault('deferred_since', None)
+            entry.setdefault('run_at', None)
+            if entry.get('next_due') is None:
+                entry['next_due'] = self.next_due(job, now)
+        return state
+    
+    def save_state(self):
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self.state_path.with_suffix('.tmp')
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump({'jobs': self.state}, f, indent=2)
+            os.replace(temp, self.state_path)
+        except OSError as e:
+            self.logger.log("ERROR", "SCHEDULER", f"Durum kaydedilemedi: {str(e)}")
+    
+    def next_due(self, job: Dict, after: float) -> float:
+        if 'cron' in job:
+            return job['cron'].next_after(datetime.fromtimestamp(after)).timestamp()
+        return after + float(job['trigger']['every'])
+    
+    def observe(self, metrics: Dict, now: float) -> bool:
+        """Boşta durumunu günceller; eşikler idle_window boyunca sağlanırsa True"""
+        input_idle = metrics.get('input_idle')
+        idle = (metrics.get('cpu', 100.0) < self.idle_cpu
+                and metrics.get('disk_busy', 100.0) < self.idle_disk
+                and (input_idle is None or input_idle >= self.idle_input))
+        if not idle:
+            self.idle_since = None
+        elif self.idle_since is None:
+            self.idle_since = now
+        return self.idle_since is not None and now - self.idle_since >= self.idle_window
+    
+    def tick(self, metrics: Optional[Dict] = None) -> List[str]:
+        """Şimdi çalışması gereken iş kimliklerini döndürür"""
+        now = self.clock()
+        if metrics is None and self.metrics is not None:
+            metrics = self.metrics()
+        sustained_idle = self.observe(metrics or {}, now)
+        
+        due = []
+        changed = False
+        for job_id, job in self.jobs.items():
+            entry = self.state[job_id]
+            if not job['enabled'] or now < entry['next_due']:
+                continue
+            
+            if entry['deferred_since'] is None:
+                entry['deferred_since'] = now
+                changed = True
+            overdue = now - entry['deferred_since'] >= self.max_deferral
+            
+            if job['heavy'] and not sustained_idle and not overdue:
+                # Koşul bozulursa titreşim gecikmesi yeniden çekilir
+                if entry['run_at'] is not None:
+                    entry['run_at'] = None
+                    changed = True
+                continue
+            
+            # Aynı anda uyanan makinelerin çakışmaması için rastgele gecikme
+            if entry['run_at'] is None and not overdue:
+                entry['run_at'] = now + self.rng.uniform(0, self.jitter)
+                changed = True
+            if overdue or now >= entry['run_at']:
+                due.append(job_id)
+        
+        if changed:
+            self.save_state()
+        return due
+    
+    def mark_run(self, job_id: str, success: Optional[bool] = None):
+        """İşi başlatılmış sayar; kaçırılan tüm tetiklemeler tek çalıştırmada birleşir.
+        Sonuç henüz bilinmiyorsa success None kalır ve record_result ile yazılır"""
+        now = self.clock()
+        entry = self.state[job_id]
+        missed = 0
+        due = entry['next_due']
+        while due <= now and missed < 1000:
+            missed += 1
+            due = self.next_due(self.jobs[job_id], due)
+        entry.update({
+            'last_run': now, 'last_success': success, 'runs': entry['runs'] + 1,
+            'next_due': self.next_due(self.jobs[job_id], now),
+            'deferred_since': None, 'run_at': None
+        })
+        self.save_state()
+        if missed > 1:
+            self.logger.log("INFO", "SCHEDULER", f"{job_id}: kaçırılan {missed} çalıştırma birleştirildi")
+        return missed
+    
+    def record_result(self, job_id: str, success: bool):
+        """Başlatılan işin gerçek sonucunu kaydeder"""
+        entry = self.state.get(job_id)
+        if entry is None:
+            return
+        entry['last_success'] = success
+        self.save_state()
+    
+    def upcoming(self) -> List[Dict]:
+        return sorted(
+            ({'id': job_id, 'operation': job['operation'], 'heavy': job['heavy'],
+              'next_due': self.state[job_id]['next_due'], 'last_run': self.state[job_id]['last_run'],
+              'deferred': self.state[job_id]['deferred_since'] is not None}
+             for job_id, job in self.jobs.items() if job['enabled']),
+            key=lambda j: j['next_due']
+        )
+
+# ==============================================
+# FİLO AJANI VE DENETLEYİCİ
+# ==============================================
+FLEET_PORT = 47800
+FLEET_MAX_LINE = 1024 * 1024
+
+def fleet_mac(key: bytes, *parts: str) -> str:
+    return hmac.new(key, "|".join(parts).encode(), hashlib.sha256).hexdigest()
+
+async def read_message(reader: asyncio.StreamReader) -> Dict:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Bağlantı kapandı")
+    return parse_message(line)
+
+def parse_message(data) -> Dict:
+    """Satırı çözer; ajan olmayan bir eşin nesne olmayan yanıtı ValueError verir"""
+    message = json.loads(data)
+    if not isinstance(message, dict):
+        raise ValueError("Mesaj bir JSON nesnesi değil")
+    return message
+
+async def write_message(writer: asyncio.StreamWriter, message: Dict):
+    writer.write(json.dumps(message, ensure_ascii=False, default=str).encode() + b"\n")
+    await writer.drain()
+
+class FleetAuthError(Exception):
+    pass
+
+class FleetChannel:
+    """El sıkışmadan sonraki mesajlar: oturum anahtarıyla HMAC ve sıra numarası taşır.
+    Araya sokulan, yeniden oynatılan veya karşı yöne yansıtılan satırlar reddedilir"""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 session_key: bytes, send_label: str, receive_label: str):
+        self.reader = reader
+        self.writer = writer
+        self.session_key = session_key
+        self.send_label = send_label
+        self.receive_label = receive_label
+        self.send_seq = 0
+        self.receive_seq = 0
+    
+    @staticmethod
+    def session_key_for(key: bytes, nonce: str, client_nonce: str) -> bytes:
+        """İki tarafın rastgele değerlerinden türetilen, bağlantıya özel anahtar"""
+        return fleet_mac(key, "session", nonce, client_nonce).encode()
+    
+    async def send(self, message: Dict):
+        body = json.dumps(message, ensure_ascii=False, default=str)
+        seq = self.send_seq
+        self.send_seq += 1
+        await write_message(self.writer, {
+            'seq': seq, 'body': body, 'mac': fleet_mac(self.session_key, self.send_label, str(seq), body)
+        })
+    
+    async def receive(self) -> Dict:
+        envelope = await read_message(self.reader)
+        seq, body = envelope.get('seq'), str(envelope.get('body', ''))
+        expected = fleet_mac(self.session_key, self.receive_label, str(self.receive_seq), body)
+        if seq != self.receive_seq or not hmac.compare_digest(expected, str(envelope.get('mac', ''))):
+            raise FleetAuthError("Mesaj imzası veya sırası geçersiz")
+        self.receive_seq += 1
+        return parse_message(body)
+
+class FleetAgent:
+    """Katalog, durum yoklaması ve metrikleri HMAC doğrulamalı JSON satırlarıyla sunar"""
+    def __init__(self, key: bytes, host: str = "127.0.0.1", port: int = FLEET_PORT,
+                 catalog: Optional[OptimizationCatalog] = None, probe: Optional[StateProbe] = None,
+                 runner=run_process, auth_timeout: float = 10.0, heartbeat: float = 10.0):
+        if not key:
+            raise ValueError("Filo anahtarı gerekli")
+        self.key = key
+        self.host = host
+        self.port = port
+        self.catalog = catalog or OptimizationCatalog()
+        self.probe = probe or StateProbe()
+        self.runner = runner
+        self.auth_timeout = auth_timeout
+        # Uzun isteklerde denetleyiciye canlılık bildirimi aralığı
+        self.heartbeat = heartbeat
+        self.hostname = socket.gethostname()
+        self.logger = Logger()
+        self.server = None
+        self._run_lock = None
+    
+    async def start(self):
+        self._run_lock = asyncio.Lock()
+        self.server = await asyncio.start_server(self.handle, self.host, self.port, limit=FLEET_MAX_LINE)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.logger.log("INFO", "FLEET_AGENT", f"Ajan dinliyor: {self.host}:{self.port}")
+        return self.server
+    
+    async def serve_forever(self):
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+    
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info('peername')
+        try:
+            channel = await asyncio.wait_for(self.authenticate(reader, writer), self.auth_timeout)
+            while True:
+                try:
+                    request = await channel.receive()
+                except ConnectionError:
+                    break
+                response = {'id': request.get('id')}
+                task = asyncio.ensure_future(self.dispatch(request.get('method'), request.get('params') or {}))
+                # İstek sürerken kalp atışı gönderilir; denetleyici ölü ajanı uzun işten ayırabilir
+                while not (await asyncio.wait({task}, timeout=self.heartbeat))[0]:
+                    await channel.send({'id': request.get('id'), 'heartbeat': True})
+                try:
+                    response['result'] = task.result()
+                    response['ok'] = True
+                except Exception as e:
+                    response.update({'ok': False, 'error': str(e)})
+                await channel.send(response)
+        except (FleetAuthError, asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
+            self.logger.log("WARNING", "FLEET_AGENT", f"{peer}: bağlantı reddedildi ({type(e).__name__}: {e})")
+        finally:
+            writer.close()
+    
+    async def authenticate(self, reader, writer):
+        """Karşılıklı doğrulama: her iki taraf da diğerinin rastgele değerini anahtarla imzalar"""
+        nonce = os.urandom(16).hex()
+        await write_message(writer, {'type': 'challenge', 'nonce': nonce, 'agent': self.hostname,
+                                     'version': APP_VERSION})
+        reply = await read_message(reader)
+        client_nonce = str(reply.get('client_nonce', ''))
+        expected = fleet_mac(self.key, "client", nonce, client_nonce)
+        if reply.get('type') != 'auth' or len(client_nonce) < 16 or not hmac.compare_digest(expected, str(reply.get('mac', ''))):
+            await write_message(writer, {'type': 'denied'})
+            raise FleetAuthError("Geçersiz imza")
+        await write_message(writer, {'type': 'welcome', 'mac': fleet_mac(self.key, "agent", client_nonce, nonce)})
+        return FleetChannel(reader, writer, FleetChannel.session_key_for(self.key, nonce, client_nonce),
+                            "agent", "client")
+    
+    async def dispatch(self, method: str, params: Dict):
+        if method == 'catalog':
+            return [{'id': e.id, 'name': e.name, 'category': e.category, 'admin': e.admin,
+                     'steps': len(e.steps), 'handler': e.handler} for e in self.catalog.entries()]
+        if method == 'metrics':
+            return self.metrics()
+        if method == 'probe':
+            entries = self._entries(params.get('operations'))
+            snapshot = await asyncio.to_thread(self.probe.snapshot, entries)
+            result = {}
+            for entry in entries:
+                commands, skipped = self.probe.pending_commands(entry, snapshot)
+                result[entry.id] = {'pending': commands, 'skipped': skipped}
+            return result
+        if method == 'run':
+            # Bağlantısı kopan bir plan arka planda sürüyor olabilir; ikinci plan kuyruğa alınmaz
+            if self._run_lock.locked():
+                raise RuntimeError("Bir plan zaten çalışıyor")
+            async with self._run_lock:
+                return await asyncio.to_thread(self.run_plan, params.get('operations'),
+                                               bool(params.get('dry_run', False)))
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    
+    def _entries(self, operations) -> List[OptimizationEntry]:
+        if not operations:
+            return self.catalog.entries()
+        entries = []
+        for op_id in operations:
+            entry = self.catalog.get(op_id)
+            if entry is None:
+                raise ValueError(f"Bilinmeyen operasyon: {op_id}")
+            entries.append(entry)
+        return entries
+    
+    def metrics(self) -> Dict:
+        metrics = {'hostname': self.hostname, 'platform': sys.platform, 'version': APP_VERSION,
+                   'timestamp': time.time()}
+        if HAS_PSUTIL:
+            metrics.update({
+                'cpu': psutil.cpu_percent(interval=None),
+                'ram': psutil.virtual_memory().percent,
+                'uptime': time.time() - psutil.boot_time()
+            })
+            try:
+                metrics['disk'] = psutil.disk_usage(os.path.abspath(os.sep)).percent
+            except OSError:
+                pass
+        return metrics
+    
+    def run_plan(self, operations, dry_run: bool = False) -> Dict:
+        """Operasyonları durum yoklamasıyla sırayla uygular (arayüz işleyicileri ajanda yoktur)"""
+        entries = self._entries(operations)
+        snapshot = self.probe.snapshot(entries)
+        results = []
+        for entry in entries:
+            result = {'operation': entry.id, 'name': entry.name, 'commands': []}
+            commands, skipped = self.probe.pending_commands(entry, snapshot)
+            result['skipped_steps'] = skipped
+            if entry.handler and not entry.steps:
+                result['status'] = 'unsupported'
+            elif self.probe.recently_run(entry):
+                result['status'] = 'recently_run'
+            elif not commands:
+                result['status'] = 'already_applied' if skipped else 'nothing_to_do'
+            elif dry_run:
+                result['status'] = 'planned'
+                result['commands'] = [{'cmd': c} for c in commands]
+            else:
+                ok = True
+                for command in commands:
+                    run = self.runner(command, entry.timeout_for(command))
+                    step_ok = run['status'] == 'ok' and run['returncode'] == 0
+                    ok = ok and step_ok
+                    result['commands'].append({
+                        'cmd': command, 'ok': step_ok, 'status': run['status'],
+                        'duration': round(run['duration'], 3),
+                        'output': (run['stdout'] if step_ok else run['stderr'])[:200]
+                    })
+                result['status'] = 'ok' if ok else 'failed'
+                if ok:
+                    self.probe.record_run(entry)
+            results.append(result)
+        if not dry_run:
+            self.probe.invalidate()
+        self.logger.log("INFO", "FLEET_AGENT", f"Plan uygulandı: {len(results)} operasyon",
+                        {'statuses': [r['status'] for r in results]})
+        return {'results': results}
+
+class FleetRunUnknown(Exception):
+    """'run' gönderildikten sonra yanıt alınamadı; plan ajanda sürüyor olabilir"""
+
+class FleetController:
+    """Planı sınırlı paralellikle tüm ajanlara dağıtır, sonuçları tek raporda toplar"""
+    def __init__(self, agents: List[str], key: bytes, concurrency: int = 8, timeout: float = 120.0,
+                 connect_timeout: float = 5.0, retries: int = 2, backoff: float = 1.0,
+                 catalog: Optional[OptimizationCatalog] = None):
+        self.agents = agents
+        self.key = key
+        self.concurrency = concurrency
+        # Tek istek ve iki mesaj (kalp atışı) arası süre sınırı
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.catalog = catalog or OptimizationCatalog()
+        self.logger = Logger()
+    
+    def run_budget(self, operations) -> Optional[float]:
+        """'run' isteğinin toplam süre sınırı: katalogdaki adım bütçelerinin toplamı (None = sınırsız)"""
+        entries = [self.catalog.get(op_id) for op_id in operations] if operations else self.catalog.entries()
+        total = self.timeout
+        for entry in entries:
+            # Bilinmeyen operasyonu ajan hemen reddeder
+            if entry is None:
+                continue
+            for step in entry.steps:
+                # timeout_for ile aynı kural; koşullu (when_exists) adımlar ajanda çalışabileceği için dahil
+                budget = step.get('timeout', entry.timeout)
+                if budget is None:
+                    return None
+                total += budget
+        return total
+    
+    @staticmethod
+    def parse_agent(agent: str) -> Tuple[str, int]:
+        host, _, port = agent.rpartition(':')
+        if not host:
+            return agent, FLEET_PORT
+        return host.strip('[]'), int(port)
+    
+    async def connect(self, agent: str) -> FleetChannel:
+        """Bağlanır ve karşılıklı kimlik doğrulamayı yapar; yeniden denenebilecek tek aşama budur"""
+        host, port = self.parse_agent(agent)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, limit=FLEET_MAX_LINE), self.connect_timeout
+        )
+        try:
+            challenge = await asyncio.wait_for(read_message(reader), self.timeout)
+            # Karşıdaki bir ajan değilse yeniden denemek sonucu değiştirmez
+            if (challenge.get('type') != 'challenge' or not isinstance(challenge.get('nonce'), str)
+                    or len(challenge['nonce']) < 16):
+                raise FleetAuthError("Ajan el sıkışması geçersiz")
+            client_nonce = os.urandom(16).hex()
+            await write_message(writer, {'type': 'auth', 'client_nonce': client_nonce,
+                                         'mac': fleet_mac(self.key, "client", challenge['nonce'], client_nonce)})
+            welcome = await asyncio.wait_for(read_message(reader), self.timeout)
+            expected = fleet_mac(self.key, "agent", client_nonce, challenge['nonce'])
+            if welcome.get('type') != 'welcome' or not hmac.compare_digest(expected, str(welcome.get('mac', ''))):
+                raise FleetAuthError("Kimlik doğrulama başarısız")
+        except BaseException:
+            writer.close()
+            raise
+        channel = FleetChannel(reader, writer,
+                               FleetChannel.session_key_for(self.key, challenge['nonce'], client_nonce),
+                               "client", "agent")
+        channel.info = {'hostname': challenge.get('agent'), 'version': challenge.get('version')}
+        return channel
+    
+    async def request(self, channel: FleetChannel, request_id: int, step: Dict) -> Dict:
+        """İsteği gönderir; kalp atışları arası self.timeout'u, toplamda adımın bütçesini aşarsa zaman aşımı"""
+        loop = asyncio.get_running_loop()
+        budget = step.get('timeout', self.timeout)
+        deadline = loop.time() + budget if budget is not None else None
+        await channel.send({'id': request_id, 'method': step['method'], 'params': step.get('params', {})})
+        while True:
+            wait = self.timeout
+            if deadline is not None:
+                wait = min(wait, deadline - loop.time())
+                if wait <= 0:
+                    raise asyncio.TimeoutError()
+            response = await asyncio.wait_for(channel.receive(), wait)
+            if not response.get('heartbeat'):
+                return response
+    
+    async def session(self, agent: str, steps: List[Dict]) -> Dict:
+        """Adımları sırayla ister; 'run' gönderildikten sonraki hatalar yeniden denenmez"""
+        channel = await self.connect(agent)
+        results = dict(channel.info)
+        ran = False
+        try:
+            for i, step in enumerate(steps):
+                try:
+                    response = await self.request(channel, i, step)
+                except (FleetAuthError, asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
+                    if step['method'] == 'run':
+                        # Ajan planı uygulamayı sürdürüyor olabilir; tekrar göndermek adımları yineler
+                        raise FleetRunUnknown(f"{type(e).__name__}: {e}" if str(e) else type(e).__name__) from e
+                    if not ran:
+                        raise
+                    response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+                if not response.get('ok'):
+                    if not ran:
+                        raise RuntimeError(f"{step['method']}: {response.get('error')}")
+                    # Plan sonucu alındı; sonraki ölçümler eksik kalır
+                    results['warning'] = f"{step['method']}: {response.get('error')}"
+                    break
+                results[step.get('as', step['method'])] = response['result']
+                ran = ran or step['method'] == 'run'
+            return results
+        finally:
+            channel.writer.close()
+    
+    async def run_agent(self, agent: str, steps: List[Dict], semaphore: asyncio.Semaphore) -> Dict:
+        async with semaphore:
+            started = time.monotonic()
+            status = 'failed'
+            error = None
+            for attempt in range(self.retries + 1):
+                try:
+                    result = await self.session(agent, steps)
+                    return {'agent': agent, 'ok': True, 'status': 'ok', 'attempts': attempt + 1,
+                            'duration': round(time.monotonic() - started, 3), **result}
+                except FleetAuthError as e:
+                    # Yanlış anahtar yeniden denemeyle düzelmez
+                    error = str(e)
+                    break
+                except FleetRunUnknown as e:
+                    status = 'unknown'
+                    error = f"Sonuç bilinmiyor, plan sürüyor olabilir ({e})"
+                    break
+                except (OSError, asyncio.TimeoutError, ConnectionError, ValueError) as e:
+                    # Bağlantı ve el sıkışma hataları (plan henüz gönderilmedi)
+                    error = f"{type(e).__name__}: {e}"
+                    if attempt < self.retries:
+                        await asyncio.sleep(self.backoff * (2 ** attempt))
+                except RuntimeError as e:
+                    # Ajanın açık hata yanıtı kesin sonuçtur
+                    error = str(e)
+                    break
+            self.logger.log("WARNING", "FLEET", f"{agent} {'yanıtsız' if status == 'unknown' else 'başarısız'}: {error}")
+            return {'agent': agent, 'ok': False, 'status': status, 'attempts': attempt + 1,
+                    'duration': round(time.monotonic() - started, 3), 'error': error}
+    
+    async def execute(self, plan: Dict) -> Dict:
+        """plan: {'operations': [...], 'dry_run': bool}; her ajanda önce/sonra metrik alınır"""
+        dry_run = plan.get('dry_run', False)
+        steps = [
+            {'method': 'metrics', 'as': 'metrics_before'},
+            {'method': 'run', 'params': {'operations': plan.get('operations'), 'dry_run': dry_run},
+             'timeout': self.timeout if dry_run else self.run_budget(plan.get('operations'))},
+            {'method': 'metrics', 'as': 'metrics_after'}
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.monotonic()
+        hosts = await asyncio.gather(*(self.run_agent(a, steps, semaphore) for a in self.agents))
+        report = self.aggregate(hosts)
+        report['duration'] = round(time.monotonic() - started, 3)
+        report['plan'] = plan
+        return report
+    
+    def run(self, plan: Dict) -> Dict:
+        return asyncio.run(self.execute(plan))
+    
+    @staticmethod
+    def aggregate(hosts: List[Dict]) -> Dict:
+        operations: Dict[str, Dict[str, int]] = {}
+        for host in hosts:
+            for result in host.get('run', {}).get('results', []):
+                counts = operations.setdefault(result['operation'], {})
+                counts[result['status']] = counts.get(result['status'], 0) + 1
+        
+        metrics = {}
+        for key in ('cpu', 'ram', 'disk'):
+            for phase in ('metrics_before', 'metrics_after'):
+                values = [h[phase][key] for h in hosts if h.get(phase, {}).get(key) is not None]
+                if values:
+                    metrics.setdefault(key, {})[phase.split('_')[1]] = {
+                        'avg': round(sum(values) / len(values), 1), 'max': round(max(values), 1)
+                    }
+        
+        return {
+            'agents': len(hosts),
+            'succeeded': sum(1 for h in hosts if h['ok']),
+            'failed': [{'agent': h['agent'], 'error': h['error']} for h in hosts if h['status'] == 'failed'],
+            'unknown': [{'agent': h['agent'], 'error': h['error']} for h in hosts if h['status'] == 'unknown'],
+            'operations': operations,
+            'metrics': metrics,
+            'hosts': hosts
+        }
+    
+    @staticmethod
+    def format_report(report: Dict) -> str:
+        lines = [f"FİLO RAPORU: {report['succeeded']}/{report['agents']} ajan başarılı ({report['duration']} sn)"]
+        for op_id, counts in sorted(report['operations'].items()):
+            lines.append(f"  {op_id}: " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+        for key, phases in report['metrics'].items():
+            lines.append(f"  {key}: " + ", ".join(f"{p} ort. %{v['avg']} / tepe %{v['max']}" for p, v in phases.items()))
+        for failure in report['failed']:
+            lines.append(f"  ❌ {failure['agent']}: {failure['error']}")
+        for pending in report['unknown']:
+            lines.append(f"  ⏳ {pending['agent']}: {pending['error']}")
+        return "\n".join(lines)
+
+def fleet_key(settings: SettingsManager) -> bytes:
+    key = os.environ.get("ALEGRO_FLEET_KEY") or settings.get('fleet', 'key', "")
+    return key.encode() if key else b""
+
+def run_fleet_cli(argv: List[str]) -> int:
+    """Arayüzsüz filo modları: --agent veya --fleet"""
+    parser = argparse.ArgumentParser(prog=APP_NAME)
+    parser.add_argument('--agent', action='store_true', help="Filo ajanı olarak çalış")
+    parser.add_argument('--bind', help="Ajan dinleme adresi")
+    parser.add_argument('--port', type=int, help="Ajan portu")
+    parser.add_argument('--fleet', help="Virgülle ayrılmış ajan listesi (host:port)")
+    parser.add_argument('--ops', default="", help="Virgülle ayrılmış operasyon kimlikleri (boş = tümü)")
+    parser.add_argument('--dry-run', action='store_true', help="Yalnızca uygulanacak komutları listele")
+    parser.add_argument('--concurrency', type=int, help="Aynı anda bağlanılacak ajan sayısı")
+    args = parser.parse_args(argv)
+    
+    settings = SettingsManager()
+    key = fleet_key(settings)
+    if not key:
+        print("Filo anahtarı ayarlanmamış (ALEGRO_FLEET_KEY veya fleet.key)")
+        return 2
+    
+    if args.agent:
+        agent = FleetAgent(key, args.bind or settings.get('fleet', 'bind', "127.0.0.1"),
+                           args.port or settings.get('fleet', 'port', FLEET_PORT))
+        try:
+            asyncio.run(agent.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+    
+    controller = FleetController(
+        [a.strip() for a in args.fleet.split(',') if a.strip()], key,
+        concurrency=args.concurrency or settings.get('fleet', 'concurrency', 8),
+        timeout=settings.get('fleet', 'timeout', 120.0),
+        retries=settings.get('fleet', 'retries', 2)
+    )
+    report = controller.run({'operations': [o for o in args.ops.split(',') if o] or None,
+                             'dry_run': args.dry_run})
+    print(FleetController.format_report(report))
+    Logger().save_report("Fleet_Report", json.dumps(report, indent=2, ensure_ascii=False, default=str))
+    return 0 if not report['failed'] and not report['unknown'] else 1
+
+# ==============================================
+# BİLDİRİM BİRLEŞTİRİCİ
+# ==============================================
+class NotificationAggregator:
+    """Bildirimleri zaman penceresi ve toplu iş (ör. Mega Boost) bazında birleştirir"""
+    def __init__(self, window: float = 2.0, max_lines: int = 3, stale_after: float = 600.0,
+                 clock=time.monotonic):
+        self.window = window
+        self.max_lines = max_lines
+        self.stale_after = stale_after
+        self.clock = clock
+        # Senkron kapsamdaki etkin toplu iş; asenkron devamlar hold/release ile bağlanır
+        self.current = None
+        self._pending = []
+        self._batches = {}
+        self._counter = 0
+
+    def begin(self, label: str) -> str:
+        self._counter += 1
+        batch = f"batch-{self._counter}"
+        self._batches[batch] = {
+            'label': label, 'total': 0, 'done': 0, 'failed': [], 'suppressed': 0,
+            'outstanding': 0, 'closed': False, 'running': set(),
+            'started': self.clock(), 'touched': self.clock()
+        }
+        return batch
+
+    @contextlib.contextmanager
+    def scope(self, batch: Optional[str]):
+        previous, self.current = self.current, batch
+        try:
+            yield
+        finally:
+            self.current = previous
+
+    def _get(self, batch: Optional[str]) -> Optional[Dict]:
+        state = self._batches.get(batch) if batch else None
+        if state is not None:
+            state['touched'] = self.clock()
+        return state
+
+    def close(self, batch: Optional[str]):
+        """Yeni adım beklenmiyor; bekleyen adım ve devamlar bitince özet üretilir"""
+        state = self._get(batch)
+        if state is not None:
+            state['closed'] = True
+
+    def hold(self, batch: Optional[str] = None) -> Optional[str]:
+        """Toplu işe ait asenkron bir devam (thread sonucu, zincirdeki sonraki adım) kaydeder"""
+        batch = batch or self.current
+        state = self._get(batch)
+        if state is None:
+            return None
+        state['outstanding'] += 1
+        return batch
+
+    def release(self, batch: Optional[str]):
+        state = self._get(batch)
+        if state is not None:
+            state['outstanding'] -= 1
+
+    def step_started(self, batch: Optional[str], name: str):
+        state = self._get(batch)
+        if state is not None:
+            state['total'] += 1
+            state['outstanding'] += 1
+
+    def step_progress(self, batch: Optional[str], name: str, percent: int):
+        state = self._get(batch)
+        if state is None:
+            return
+        if percent < 100:
+            state['running'].add(name)
+        else:
+            state['running'].discard(name)
+
+    def step_finished(self, batch: Optional[str], name: str, success: bool, detail: str = ""):
+        state = self._get(batch)
+        if state is None:
+            return
+        state['done'] += 1
+        state['outstanding'] -= 1
+        state['running'].discard(name)
+        if not success:
+            state['failed'].append(name)
+
+    def post(self, title: str, message: str, batch: Optional[str] = None) -> bool:
+        """Toplu işe aitse yalnızca sayılır; değilse pencere sonunda birleştirilmek üzere bekletilir"""
+        state = self._get(batch or self.current)
+        if state is not None:
+            state['suppressed'] += 1
+            return False
+        self._pending.append((title, message))
+        return True
+
+    def progress(self) -> Optional[Dict]:
+        """Süren toplu işlerin birleşik ilerlemesi; yoksa None"""
+        active = [s for s in self._batches.values() if s['total']]
+        if not active:
+            return None
+        return {
+            'label': ", ".join(s['label'] for s in active),
+            'done': sum(s['done'] for s in active),
+            'total': sum(s['total'] for s in active),
+            'running': sum(len(s['running']) for s in active)
+        }
+
+    def flush(self) -> List[Tuple[str, str]]:
+        """Biten toplu işlerin özetleri ve penceredeki tekil bildirimlerin birleşimi"""
+        now = self.clock()
+        notifications = []
+        for batch, state in list(self._batches.items()):
+            stale = now - state['touched'] > self.stale_after
+            if not (state['closed'] and state['outstanding'] <= 0) and not stale:
+                continue
+            del self._batches[batch]
+            notifications.append(self._summary(state, now, stale))
+
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            notifications.append(pending[0])
+        elif pending:
+            lines = list(dict.fromkeys(f"{title}: {message}" for title, message in pending))
+            extra = len(lines) - self.max_lines
+            body = "\n".join(lines[:self.max_lines]) + (f"\n+{extra} bildirim daha" if extra > 0 else "")
+            notifications.append((f"{len(pending)} bildirim", body))
+        return notifications
+
+    def _summary(self, state: Dict, now: float, stale: bool) -> Tuple[str, str]:
+        ok = state['done'] - len(state['failed'])
+        message = f"{state['label']}: {ok}/{state['total']} adım başarılı ({now - state['started']:.1f} sn)"
+        if state['failed']:
+            shown = ", ".join(state['failed'][:self.max_lines])
+            more = len(state['failed']) - self.max_lines
+            message += f"\nHatalı: {shown}" + (f" +{more}" if more > 0 else "")
+        if stale:
+            message += "\nBazı adımlardan yanıt alınamadı"
+        title = "Tamamlandı" if not state['failed'] and not stale else "Tamamlandı (hatalı)"
+        return title, message
 
 # ==============================================
 # GÜNCELLEME KONTROLÜ
@@ -405,6 +5853,288 @@ class UpdateChecker(QThread):
         except:
             pass  # Sessizce devam et
 
+# ==============================================
+# TEMA DERLEYİCİ
+# ==============================================
+THEMES = {
+    "GX": {"accent": "#ff0033", "accent_hover": "#ff3355", "bg": "#0a0a0a", "card": "#111"},
+    "EMERALD": {"accent": "#00cc88", "accent_hover": "#33ddaa", "bg": "#0a140a", "card": "#112211"},
+    "BLUE": {"accent": "#0088ff", "accent_hover": "#33a0ff", "bg": "#0a0a14", "card": "#111122"},
+    "PURPLE": {"accent": "#aa00ff", "accent_hover": "#bb33ff", "bg": "#0a0a14", "card": "#111122"}
+}
+
+# Temaya bağlı kurallar; her tema pencerenin "theme" özelliğiyle kapsamlanır
+THEME_STYLESHEET = """
+{root} {{ background-color: {bg}; }}
+{scope} QDialog {{ background-color: {bg}; }}
+{scope} QGroupBox {{ color: {accent}; border: 1px solid {accent}; }}
+{scope} QPushButton {{ background-color: {card}; }}
+{scope} QPushButton:hover {{ border-color: {accent}; color: {accent}; }}
+{scope} QPushButton[variant="accent"] {{ background-color: {accent}; color: white; }}
+{scope} QPushButton[variant="accent"]:hover {{ background-color: {accent_hover}; color: white; }}
+{scope} QProgressBar {{ background: {card}; }}
+{scope} QProgressBar::chunk {{ background-color: {accent}; }}
+{scope} QAbstractScrollArea {{ background: {card}; }}
+{scope} QTabWidget::pane {{ background: {card}; }}
+{scope} QLabel#appTitle {{ color: {accent}; }}
+"""
+
+# Temadan bağımsız kurallar; widget'lar objectName ve dinamik özelliklerle seçilir
+BASE_STYLESHEET = """
+QWidget { color: white; font-family: 'Segoe UI'; }
+QGroupBox { border-radius: 8px; margin-top: 10px; font-weight: bold; }
+QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px 0 5px; }
+QPushButton { border: 1px solid #333; border-radius: 6px; padding: 8px 12px; font-weight: bold; }
+QPushButton:pressed { background-color: #222; }
+QPushButton:disabled { background-color: #666666; color: #aaaaaa; }
+QPushButton[variant="accent"] { border: none; border-radius: 8px; padding: 10px 15px; font-size: 12px; }
+QPushButton#megaBoost {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #ff0033, stop:1 #ff6600);
+    color: white; font-size: 18px; font-weight: 900;
+    border-radius: 10px; border: 3px solid #ff9900;
+}
+QPushButton#megaBoost:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #ff3355, stop:1 #ff8844);
+    color: white;
+}
+QPushButton#megaBoost:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #cc0029, stop:1 #cc5500);
+}
+QProgressBar { border: none; border-radius: 6px; text-align: center; }
+QProgressBar::chunk { border-radius: 6px; }
+QAbstractScrollArea { border: 1px solid #333; border-radius: 5px; }
+QListWidget::item { padding: 5px; border-bottom: 1px solid #2a2a2a; }
+QListWidget::item:selected { background: #333; }
+QListWidget#historyList { font-size: 11px; }
+QListWidget#historyList::item { padding: 8px; }
+QTextEdit, QLabel[role="mono"] { color: #ccc; font-family: Consolas, monospace; }
+QTabWidget::pane { border: 1px solid #333; }
+QTabBar::tab { background: #222; color: #aaa; padding: 8px 15px; }
+QTabBar::tab:selected { background: #333; color: white; }
+QTabBar::tab:hover { background: #2a2a2a; }
+QLabel#appTitle { font-size: 24px; font-weight: bold; }
+QLabel#appVersion { color: #888; font-size: 11px; }
+QFrame#statusFrame { background: #111; border: 1px solid #333; border-radius: 10px; padding: 10px; }
+QGroupBox#scoreGroup { color: #ffcc00; border: 2px solid #ffcc00; }
+QLabel#scoreLabel { font-size: 32px; font-weight: bold; color: #ffcc00; }
+QGroupBox[metric] { border-radius: 6px; font-weight: normal; }
+QGroupBox[metric="cpu"] { color: #ff0033; border: 1px solid #ff0033; }
+QGroupBox[metric="ram"] { color: #0078d7; border: 1px solid #0078d7; }
+QGroupBox[metric="disk"] { color: #00cc00; border: 1px solid #00cc00; }
+QProgressBar[metric] { border: 1px solid #333; border-radius: 5px; background: #1a1a1a; height: 20px; }
+QProgressBar[metric="cpu"]::chunk { background-color: #ff0033; border-radius: 5px; }
+QProgressBar[metric="ram"]::chunk { background-color: #0078d7; border-radius: 5px; }
+QProgressBar[metric="disk"]::chunk { background-color: #00cc00; border-radius: 5px; }
+"""
+
+# Tema değişiminde yalnızca bu türler yeniden cilalanır
+THEMED_WIDGETS = (QMainWindow, QDialog, QPushButton, QGroupBox, QProgressBar,
+                  QAbstractScrollArea, QTabWidget)
+
+class ThemeManager:
+    """Tüm temaları tek uygulama stil sayfasına bir kez derler"""
+    _blocks: Dict[str, str] = {}
+    _compiled: Optional[str] = None
+    
+    @classmethod
+    def theme_block(cls, theme: str) -> str:
+        block = cls._blocks.get(theme)
+        if block is None:
+            block = cls._blocks[theme] = THEME_STYLESHEET.format(
+                root=f'QMainWindow[theme="{theme}"]',
+                scope=f'*[theme="{theme}"]',
+                **THEMES[theme]
+            )
+        return block
+    
+    @classmethod
+    def stylesheet(cls) -> str:
+        if cls._compiled is None:
+            cls._compiled = "".join(cls.theme_block(t) for t in THEMES) + BASE_STYLESHEET
+        return cls._compiled
+    
+    @classmethod
+    def apply(cls, window: QWidget, theme: str) -> bool:
+        """Tema değişimi: stil sayfası yeniden ayrıştırılmaz, yalnızca özellik değişir"""
+        app = QApplication.instance()
+        if app is None:
+            return False
+        if theme not in THEMES:
+            theme = "GX"
+        if app.styleSheet() != cls.stylesheet():
+            window.setProperty("theme", theme)
+            app.setStyleSheet(cls.stylesheet())
+            return True
+        if window.property("theme") == theme:
+            return False
+        
+        window.setProperty("theme", theme)
+        style = window.style()
+        for widget in [window] + window.findChildren(QWidget):
+            if isinstance(widget, THEMED_WIDGETS) or widget.objectName() == "appTitle":
+                style.unpolish(widget)
+                style.polish(widget)
+                widget.update()
+        return True
+
+# ==============================================
+# GRAFİKLER
+# ==============================================
+CHART_WINDOWS = [("5 dk", 300), ("1 saat", 3600), ("24 saat", 86400)]
+
+class MetricChart(QWidget):
+    """Halka tampondan piksel başına min/max seyreltmeyle çizilen, artımlı güncellenen zaman grafiği"""
+    def __init__(self, title: str, values: RingBuffer, timestamps: RingBuffer, color: str,
+                 maximum: Optional[float] = 100.0, formatter=None, span: float = 300, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.values = values
+        self.timestamps = timestamps
+        # None: görünen tepe değere göre otomatik ölçek
+        self.maximum = maximum
+        self.formatter = formatter or (lambda v: f"%{v:.0f}")
+        self.span = span
+        self.margin = 4
+        self.setMinimumHeight(70)
+        self._pen = QPen(QColor(color))
+        self._pen.setCosmetic(True)
+        self._pen.setWidthF(1.2)
+        # Her piksel sütunu için [sütun, min, max]; tamamlanan sütunlar önbellekteki yola eklenir
+        self._bins = deque()
+        self._path = QPainterPath()
+        self._path_points = 0
+        self._origin = 0
+        self._seconds_per_px = 1.0
+        self._width = 0
+        self._seen = 0
+    
+    def plot_width(self) -> int:
+        return max(1, self.width() - 2 * self.margin)
+    
+    def set_span(self, seconds: float):
+        self.span = seconds
+        self.rebuild()
+        self.update()
+    
+    def rebuild(self):
+        """Yolu tampondaki görünen pencereden baştan kurar (boyut/pencere değişimi, geride kalma)"""
+        self._width = self.plot_width()
+        self._seconds_per_px = self.span / self._width
+        self._bins.clear()
+        self._path = QPainterPath()
+        self._path_points = 0
+        self._seen = self.values.total_appended
+        count = min(len(self.values), len(self.timestamps))
+        if not count:
+            return
+        times = self.timestamps.tail(count)
+        values = self.values.tail(count)
+        start = bisect.bisect_left(times, times[-1] - self.span)
+        self._origin = int(times[start] // self._seconds_per_px)
+        for t, v in zip(times[start:], values[start:]):
+            self._add(t, v)
+        self._trim()
+    
+    def refresh(self):
+        """Son çağrıdan bu yana eklenen örnekleri işler; yalnızca yeni sütunlar yola eklenir"""
+        new = self.values.total_appended - self._seen
+        if new <= 0 and self._width == self.plot_width():
+            return
+        if self._width != self.plot_width() or new > min(len(self.values), len(self.timestamps)):
+            self.rebuild()
+        else:
+            for t, v in zip(self.timestamps.tail(new), self.values.tail(new)):
+                self._add(t, v)
+            self._seen += new
+            self._trim()
+        self.update()
+    
+    def _add(self, timestamp: float, value: float):
+        col = int(timestamp // self._seconds_per_px) - self._origin
+        bins = self._bins
+        if bins:
+            last = bins[-1]
+            if col == last[0]:
+                if value < last[1]:
+                    last[1] = value
+                elif value > last[2]:
+                    last[2] = value
+                return
+            if col < last[0]:
+                # Saat geri gitti; sütun sırası bozulmasın
+                return
+            self._append_path(last)
+        bins.append([col, value, value])
+    
+    def _append_path(self, column: List):
+        col, low, high = column
+        if self._path_points:
+            self._path.lineTo(col, low)
+        else:
+            self._path.moveTo(col, low)
+        if high != low:
+            self._path.lineTo(col, high)
+        self._path_points += 2
+    
+    def _trim(self):
+        if not self._bins:
+            return
+        left = self._bins[-1][0] - self._width
+        while self._bins and self._bins[0][0] < left:
+            self._bins.popleft()
+        # Ekrandan çıkan noktalar yolda birikir; sınır aşılınca görünen sütunlardan yeniden kurulur
+        if self._path_points > 4 * self._width:
+            self._path = QPainterPath()
+            self._path_points = 0
+            for column in list(self._bins)[:-1]:
+                self._append_path(column)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.rebuild()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        theme = THEMES.get(self.window().property("theme"), THEMES["GX"])
+        painter.fillRect(self.rect(), QColor(theme['card']))
+        m, w, h = self.margin, self._width, max(1, self.height() - 2 * self.margin)
+        
+        painter.setPen(QColor(255, 255, 255, 25))
+        for i in (1, 2, 3):
+            y = m + h * i // 4
+            painter.drawLine(m, y, m + w, y)
+        
+        top = self.maximum
+        if self._bins:
+            if top is None:
+                top = max(column[2] for column in self._bins) * 1.1 or 1.0
+            col, low, high = self._bins[-1]
+            painter.save()
+            painter.setClipRect(m, m, w, h)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self._pen)
+            # Yol sütun/değer uzayında tutulur; kaydırma ve ölçek yalnızca dönüşümle yapılır
+            painter.setTransform(QTransform(1, 0, 0, -h / top, m + w - col, m + h))
+            painter.drawPath(self._path)
+            tail = QPainterPath()
+            if self._path_points:
+                tail.moveTo(self._path.currentPosition())
+                tail.lineTo(col, low)
+            else:
+                tail.moveTo(col, low)
+            tail.lineTo(col, high)
+            painter.drawPath(tail)
+            painter.restore()
+        
+        painter.setPen(QColor("#dddddd"))
+        last = self.values.last(None)
+        text = f"{self.title}  {self.formatter(last) if last is not None else '-'}"
+        painter.drawText(m + 4, m + 14, text)
+        if self.maximum is None and top:
+            painter.drawText(self.rect().adjusted(0, m, -m - 4, 0), Qt.AlignRight | Qt.AlignTop,
+                             self.formatter(top))
+        painter.end()
+
 # ==============================================
 # ÖZELLEŞTİRİLMİŞ BUTONLAR
 # ==============================================
@@ -414,28 +6144,11 @@ class ModernButton(QPushButton):
         self.setMinimumHeight(45)
         self.setCursor(Qt.PointingHandCursor)
         
-    def set_style(self, color="#ff0033", hover_color="#ff3355"):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: #cc0029;
-            }}
-            QPushButton:disabled {{
-                background-color: #666666;
-                color: #aaaaaa;
-            }}
-        """)
+    def set_style(self, variant="accent"):
+        """Derlenmiş tema içindeki buton varyantını seçer"""
+        self.setProperty("variant", variant)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 # ==============================================
 # ANA PENCERE
@@ -446,12 +6159,26 @@ class AlegroUltimate(QMainWindow):
         
         # Initialize components
         self.logger = Logger()
+        self.catalog = OptimizationCatalog()
         self.settings_manager = SettingsManager()
-        self.system_monitor = SystemMonitor()
+        thermal = lambda key, default: self.settings_manager.get('thermal', key, default)
+        self.system_monitor = SystemMonitor(
+            inventory=HardwareInventory(
+                dynamic_ttl=self.settings_manager.get('performance', 'inventory_ttl', 1.0)
+            ),
+            throttle=ThrottleDetector(
+                freq_ratio=thermal('freq_ratio', 0.75), load_threshold=thermal('load_threshold', 50.0),
+                temp_limit=thermal('temp_limit', 90.0), sustain=thermal('sustain', 10),
+                recovery=thermal('recovery', 5)
+            )
+        )
         self.operation_history = OperationHistory()
         
         # Set window properties
-        self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
+        title = f"{APP_NAME} v{APP_VERSION}"
+        if isinstance(psutil, ReplayBackend):
+            title += f" [İz tekrarı {psutil.speed:g}x: {psutil.path.name}]"
+        self.setWindowTitle(title)
         self.setFixedSize(900, 750)
         self.setWindowIcon(get_application_icon())
         
@@ -461,6 +6188,49 @@ class AlegroUltimate(QMainWindow):
         self.boost_score = 0
         self.applied_ops = set()
         self.worker_threads = []
+        self.cancel_generation = 0
+        self.monitor_mode = 'active'
+        self.overhead = OverheadBudget(
+            self.settings_manager.get('performance', 'overhead_cpu_budget', 1.0),
+            self.settings_manager.get('performance', 'overhead_rss_budget_mb', 250)
+        )
+        self.latency_results = []
+        self.dns_benchmark = None
+        self.interface_cache = NetworkInterfaceCache(
+            self.settings_manager.get('network', 'interface_cache_ttl', 30)
+        )
+        self.state_probe = StateProbe(
+            self.settings_manager.get('optimizations', 'state_probe_ttl', 60),
+            runs_path=Path("cache") / "operation_runs.json"
+        )
+        self.rule_store = ProcessRuleStore()
+        self.trace_recorder = None
+        # İz kaydı açık olmasa da örnekler dışa aktarım için diske arşivlenir
+        self.metrics_archive = MetricsArchive(
+            interval=self.settings_manager.get('performance', 'metrics_archive_interval', 10),
+            retention_days=self.settings_manager.get('performance', 'metrics_archive_days', 30),
+            max_bytes=self.settings_manager.get('performance', 'metrics_archive_max_mb', 512) * 1024 * 1024
+        )
+        self.notifier = NotificationAggregator(
+            self.settings_manager.get('general', 'notification_window', 2.0)
+        )
+        
+        # Aynı pencerede gelen bildirimler ve geçmiş listesi yenilemeleri tek seferde işlenir
+        self.notification_timer = QTimer(self)
+        self.notification_timer.setSingleShot(True)
+        self.notification_timer.timeout.connect(self.deliver_notifications)
+        self.history_refresh_timer = QTimer(self)
+        self.history_refresh_timer.setSingleShot(True)
+        self.history_refresh_timer.setInterval(100)
+        self.history_refresh_timer.timeout.connect(self.update_history_list)
+        
+        # Boost adımlarının durumu; fsync'ler kısa bir pencerede toplanır
+        self.boost_journal = BoostJournal()
+        self.boost_plans = set()
+        self.journal_sync_timer = QTimer(self)
+        self.journal_sync_timer.setSingleShot(True)
+        self.journal_sync_timer.setInterval(int(self.boost_journal.sync_interval * 1000))
+        self.journal_sync_timer.timeout.connect(self.boost_journal.sync)
         
         # System tray
         self.tray_icon = None
@@ -469,12 +6239,85 @@ class AlegroUltimate(QMainWindow):
         self.init_ui()
         self.setup_tray()
         
+        # Third-party operation packs are loaded after the window is up
+        QTimer.singleShot(0, self.load_operation_packs)
+        # Çökme/kapanma nedeniyle yarım kalan boost varsa sürdürmesi önerilir
+        QTimer.singleShot(0, self.offer_boost_resume)
+        
+        # Scheduled maintenance
+        self.scheduler = None
+        if self.settings_manager.get('maintenance', 'enabled', True):
+            get = lambda key, default: self.settings_manager.get('maintenance', key, default)
+            try:
+                self.scheduler = MaintenanceScheduler(
+                    get('jobs', DEFAULT_MAINTENANCE_JOBS), metrics=self.maintenance_metrics,
+                    idle_cpu=get('idle_cpu', 15.0), idle_disk=get('idle_disk', 10.0),
+                    idle_input=get('idle_input', 300), idle_window=get('idle_window', 600),
+                    jitter=get('jitter', 900), max_deferral=get('max_deferral', 3 * 86400)
+                )
+            except (KeyError, ValueError) as e:
+                self.logger.log("ERROR", "SCHEDULER", f"Bakım işleri yüklenemedi: {str(e)}")
+        if self.scheduler is not None:
+            self.maintenance_timer = QTimer(self)
+            self.maintenance_timer.timeout.connect(self.run_due_maintenance)
+            self.maintenance_timer.start(30000)
+        
+        # Filo araçlarının diskte yaptığı ayar değişiklikleri anında uygulanır
+        self.settings_reload_timer = QTimer(self)
+        self.settings_reload_timer.setSingleShot(True)
+        self.settings_reload_timer.setInterval(200)
+        self.settings_reload_timer.timeout.connect(self.reload_settings_from_disk)
+        self.settings_watcher = QFileSystemWatcher(self)
+        self.settings_watcher.directoryChanged.connect(self.settings_reload_timer.start)
+        self.settings_watcher.fileChanged.connect(self.settings_reload_timer.start)
+        self.watch_settings_file()
+        
         # Start monitoring
+        self.memory_analyzer = MemoryLeakDetector()
         if HAS_PSUTIL:
+            self.process_sampler_thread = ProcessSamplerThread(
+                ProcessSampler(),
+                self.settings_manager.get('performance', 'process_sample_interval', 2000)
+            )
+            self.rule_engine = ProcessRuleEngine(self.rule_store)
+            self.terminator = ProcessTerminator(
+                protected=CRITICAL_PROCESSES | {n.lower() for n in self.settings_manager.get('throttle', 'protected', [])}
+            )
+            self.throttler = BackgroundThrottler(
+                protected=self.settings_manager.get('throttle', 'protected', []),
+                allow=self.settings_manager.get('throttle', 'allow', []),
+                deny=self.settings_manager.get('throttle', 'deny', []),
+                rule_store=self.rule_store,
+                cpu_threshold=self.settings_manager.get('throttle', 'cpu_threshold', 5.0),
+                background_cores=self.settings_manager.get('throttle', 'background_cores', 1),
+                priority=self.settings_manager.get('throttle', 'priority', 'idle')
+            )
+            # Çökmüş bir önceki oturumun kısıtlamaları geri alınır
+            self.throttler.recover()
+            self.process_sampler_thread.listeners.append(self.memory_analyzer.update)
+            self.process_sampler_thread.listeners.append(self.rule_engine.update)
+            self.process_sampler_thread.listeners.append(self.terminator.update)
+            self.process_sampler_thread.listeners.append(self.metrics_archive.record_processes)
+            if self.settings_manager.get('throttle', 'enabled', True):
+                self.process_sampler_thread.listeners.append(self.throttler.update)
+            self.process_sampler_thread.snapshot_ready.connect(self.on_process_snapshot)
+            self.process_sampler_thread.start()
+            
             self.monitor_timer = QTimer()
             self.monitor_timer.timeout.connect(self.update_system_monitor)
             self.monitor_timer.start(self.settings_manager.get('performance', 'monitor_interval', 2000))
         
+        # Hardware inventory: the cached copy is shown at once, a fresh one is collected in the background
+        self.inventory_thread = None
+        self.inventory_timer = QTimer(self)
+        self.inventory_timer.timeout.connect(self.refresh_inventory)
+        self.inventory_timer.start(self.settings_manager.get('performance', 'inventory_refresh_interval', 600) * 1000)
+        QTimer.singleShot(0, self.refresh_inventory)
+        # Etiketteki RAM/çalışma süresi gibi dinamik satırlar izleme döngüsünden ayrı, yavaş tazelenir
+        self.inventory_label_timer = QTimer(self)
+        self.inventory_label_timer.timeout.connect(self.tick_inventory_label)
+        self.inventory_label_timer.start(self.settings_manager.get('performance', 'inventory_label_interval', 30) * 1000)
+        
         # Check for updates
         if self.settings_manager.get('general', 'check_updates', True):
             self.update_checker = UpdateChecker()
@@ -487,6 +6330,9 @@ class AlegroUltimate(QMainWindow):
     # UI INITIALIZATION
     # ==============================================
     def init_ui(self):
+        # Apply the compiled theme first so widgets are polished only once
+        self.update_theme()
+        
         # Central widget and main layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -505,16 +6351,11 @@ class AlegroUltimate(QMainWindow):
         # TAB WIDGET
         self.tab_widget = QTabWidget()
         self.tab_widget.setDocumentMode(True)
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane { border: 1px solid #333; background: #111; }
-            QTabBar::tab { background: #222; color: #aaa; padding: 8px 15px; }
-            QTabBar::tab:selected { background: #333; color: white; }
-            QTabBar::tab:hover { background: #2a2a2a; }
-        """)
         
         # Create tabs
         self.create_optimizations_tab()
         self.create_monitor_tab()
+        self.create_tools_tab()
         self.create_history_tab()
         self.create_settings_tab()
         
@@ -525,20 +6366,21 @@ class AlegroUltimate(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_label = QLabel("🔧 Sistem hazır")
         self.status_bar.addWidget(self.status_label)
-        
-        # Apply theme
-        self.update_theme()
+        self.batch_progress = QProgressBar()
+        self.batch_progress.setMaximumWidth(220)
+        self.batch_progress.hide()
+        self.status_bar.addPermanentWidget(self.batch_progress)
     
     def create_top_bar(self):
         layout = QHBoxLayout()
         
         # Logo/Title
         title_label = QLabel(f"⚡ {APP_NAME}")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ff0033;")
+        title_label.setObjectName("appTitle")
         
         # Version
         version_label = QLabel(f"v{APP_VERSION}")
-        version_label.setStyleSheet("color: #888; font-size: 11px;")
+        version_label.setObjectName("appVersion")
         
         # Spacer
         layout.addWidget(title_label)
@@ -563,49 +6405,29 @@ class AlegroUltimate(QMainWindow):
     
     def create_status_frame(self):
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background: linear-gradient(to right, #111, #222);
-                border: 1px solid #333;
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        frame.setObjectName("statusFrame")
         
         layout = QHBoxLayout(frame)
         
         # CPU
-        cpu_group = self.create_metric_widget("CPU", "#ff0033", 0)
+        cpu_group = self.create_metric_widget("CPU", 0)
         self.cpu_bar = cpu_group.findChild(QProgressBar)
         
         # RAM
-        ram_group = self.create_metric_widget("RAM", "#0078d7", 0)
+        ram_group = self.create_metric_widget("RAM", 0)
         self.ram_bar = ram_group.findChild(QProgressBar)
         
         # DISK
-        disk_group = self.create_metric_widget("DISK", "#00cc00", 0)
+        disk_group = self.create_metric_widget("DISK", 0)
         self.disk_bar = disk_group.findChild(QProgressBar)
         
         # PERFORMANCE SCORE
         score_group = QGroupBox("PERFORMANS SKORU")
-        score_group.setStyleSheet("""
-            QGroupBox {
-                color: #ffcc00;
-                border: 2px solid #ffcc00;
-                border-radius: 8px;
-                margin-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        score_group.setObjectName("scoreGroup")
         score_layout = QVBoxLayout()
         self.score_label = QLabel("--")
         self.score_label.setAlignment(Qt.AlignCenter)
-        self.score_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #ffcc00;")
+        self.score_label.setObjectName("scoreLabel")
         score_layout.addWidget(self.score_label)
         score_group.setLayout(score_layout)
         
@@ -614,21 +6436,9 @@ class AlegroUltimate(QMainWindow):
         
         return frame
     
-    def create_metric_widget(self, name, color, value):
+    def create_metric_widget(self, name, value):
         group = QGroupBox(name)
-        group.setStyleSheet(f"""
-            QGroupBox {{
-                color: {color};
-                border: 1px solid {color};
-                border-radius: 6px;
-                margin-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-        """)
+        group.setProperty("metric", name.lower())
         
         layout = QVBoxLayout()
         
@@ -636,19 +6446,7 @@ class AlegroUltimate(QMainWindow):
         progress_bar.setValue(value)
         progress_bar.setTextVisible(True)
         progress_bar.setFormat(f"{name}: %p%")
-        progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid #333;
-                border-radius: 5px;
-                text-align: center;
-                background: #1a1a1a;
-                height: 20px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 5px;
-            }}
-        """)
+        progress_bar.setProperty("metric", name.lower())
         
         layout.addWidget(progress_bar)
         group.setLayout(layout)
@@ -664,65 +6462,25 @@ class AlegroUltimate(QMainWindow):
         # ULTIMATE BOOST BUTTON
         self.mega_boost_btn = ModernButton("⚡ ULTIMATE MEGA BOOST ⚡")
         self.mega_boost_btn.setMinimumHeight(70)
-        self.mega_boost_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 #ff0033, stop:1 #ff6600);
-                color: white;
-                font-size: 18px;
-                font-weight: 900;
-                border-radius: 10px;
-                border: 3px solid #ff9900;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 #ff3355, stop:1 #ff8844);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 #cc0029, stop:1 #cc5500);
-            }
-        """)
+        self.mega_boost_btn.setObjectName("megaBoost")
         self.mega_boost_btn.clicked.connect(self.mega_boost)
-        layout.addWidget(self.mega_boost_btn)
+        
+        self.cancel_btn = ModernButton("⏹ İPTAL")
+        self.cancel_btn.setMinimumHeight(70)
+        self.cancel_btn.setToolTip("Çalışan ve sıradaki tüm komutları durdurur")
+        self.cancel_btn.clicked.connect(self.cancel_all)
+        
+        boost_row = QHBoxLayout()
+        boost_row.addWidget(self.mega_boost_btn, 1)
+        boost_row.addWidget(self.cancel_btn)
+        layout.addLayout(boost_row)
         
         # OPTIMIZATION BUTONS GRID
         self.optimization_grid = QGridLayout()
         
-        texts = {
-            "TR": [
-                "NİHAİ GÜÇ", "RAM TEMİZLE", "DNS OPT.", "GPU BOOST",
-                "MOUSE FIX", "FSO KAPAT", "PİNG OPT.", "GEREKSİZ SİL",
-                "CPU ÖNCELİK", "SHADER SİL", "HIZLI BOOT", "LOG TEMİZLE",
-                "AĞ OPT.", "REGISTRY TEMİZ.", "GÜÇ PLANI", "GÜVENLİK OPT.",
-                "DISK BİRLEŞTİR", "SERVİS OPT.", "STARTUP OPT.", "GÖRSELLİK OPT."
-            ],
-            "EN": [
-                "ULTIMATE POWER", "CLEAN RAM", "DNS OPT.", "GPU BOOST",
-                "MOUSE FIX", "FSO DISABLE", "PING OPT.", "CLEAN JUNK",
-                "CPU PRIORITY", "SHADER FLUSH", "FAST BOOT", "CLEAN LOGS",
-                "NETWORK OPT.", "REGISTRY CLEAN", "POWER PLAN", "SECURITY OPT.",
-                "DISK DEFRAG", "SERVICE OPT.", "STARTUP OPT.", "VISUAL OPT."
-            ]
-        }
-        
         self.optimization_buttons = []
-        optimization_funcs = [
-            self.optimize_power, self.clean_ram, self.optimize_dns, self.boost_gpu,
-            self.fix_mouse, self.disable_fso, self.optimize_ping, self.clean_junk,
-            self.set_cpu_priority, self.clear_shaders, self.fast_boot, self.clean_logs,
-            self.optimize_network, self.clean_registry, self.set_power_plan,
-            self.security_optimize, self.defrag_disk, self.optimize_services,
-            self.optimize_startup, self.visual_optimize
-        ]
-        
-        current_texts = texts[self.current_lang]
-        for i in range(len(optimization_funcs)):
-            btn = ModernButton(current_texts[i])
-            btn.setMinimumHeight(50)
-            btn.clicked.connect(lambda checked, idx=i: self.run_optimization(idx))
-            self.optimization_buttons.append(btn)
-            self.optimization_grid.addWidget(btn, i // 4, i % 4)
+        for entry in self.catalog.builtin():
+            self.add_optimization_button(entry)
         
         grid_widget = QWidget()
         grid_widget.setLayout(self.optimization_grid)
@@ -730,61 +6488,330 @@ class AlegroUltimate(QMainWindow):
         
         self.tab_widget.addTab(widget, "⚡ Optimizasyonlar")
     
+    def add_optimization_button(self, entry):
+        btn = ModernButton(entry.label(self.current_lang))
+        btn.setMinimumHeight(50)
+        btn.setProperty("op_id", entry.id)
+        btn.clicked.connect(lambda checked, op_id=entry.id: self.run_optimization(op_id))
+        
+        i = len(self.optimization_buttons)
+        self.optimization_buttons.append(btn)
+        self.optimization_grid.addWidget(btn, i // 4, i % 4)
+    
+    def load_operation_packs(self):
+        """Eklenti paketleri açılıştan sonra, ayrı olarak yüklenir"""
+        for entry in self.catalog.load_packs():
+            self.add_optimization_button(entry)
+    
     def create_monitor_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # REAL-TIME CHARTS (simulated)
         monitor_group = QGroupBox("🎯 Canlı Sistem İzleme")
         monitor_layout = QVBoxLayout()
         
+        # Real-time charts drawn from the ring-buffer store
+        chart_header = QHBoxLayout()
+        chart_header.addWidget(QLabel("📈 Geçmiş:"))
+        self.chart_span_combo = QComboBox()
+        for label, seconds in CHART_WINDOWS:
+            self.chart_span_combo.addItem(label, seconds)
+        self.chart_span_combo.currentIndexChanged.connect(self.set_chart_span)
+        chart_header.addWidget(self.chart_span_combo)
+        chart_header.addStretch()
+        monitor_layout.addLayout(chart_header)
+        
+        history = self.system_monitor.history
+        times = self.system_monitor.history_times
+        self.charts = [
+            MetricChart("CPU", history['cpu'], times, "#ff9900"),
+            MetricChart("RAM", history['ram'], times, "#00cc88"),
+            MetricChart("Disk", history['disk'], times, "#0088ff"),
+            MetricChart("Ağ", history['network'], times, "#aa00ff", maximum=None,
+                        formatter=lambda v: f"{format_bytes(v)}/s")
+        ]
+        chart_grid = QGridLayout()
+        for i, chart in enumerate(self.charts):
+            chart_grid.addWidget(chart, i // 2, i % 2)
+        monitor_layout.addLayout(chart_grid)
+        
         # Process list
         self.process_list = QListWidget()
-        self.process_list.setStyleSheet("""
-            QListWidget {
-                background: #1a1a1a;
-                border: 1px solid #333;
-                border-radius: 5px;
-            }
-            QListWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #2a2a2a;
-            }
-            QListWidget::item:selected {
-                background: #333;
-            }
-        """)
+        self.process_rows = []
+        self.process_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.process_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.process_list.customContextMenuRequested.connect(self.show_process_menu)
         
         # Update process list
         self.update_process_list()
         
+        # Per-device I/O rates
+        self.io_label = QLabel("G/Ç etkinliği yok")
+        self.io_label.setProperty("role", "mono")
+        monitor_layout.addWidget(QLabel("📶 G/Ç Hızları:"))
+        monitor_layout.addWidget(self.io_label)
+        
         monitor_layout.addWidget(QLabel("📊 Çalışan Processler:"))
         monitor_layout.addWidget(self.process_list)
         
-        # System info
-        info_text = QTextEdit()
-        info_text.setReadOnly(True)
-        info_text.setStyleSheet("""
-            QTextEdit {
-                background: #1a1a1a;
-                color: #ccc;
-                border: 1px solid #333;
-                border-radius: 5px;
-                font-family: Consolas, monospace;
-            }
-        """)
-        
-        sys_info = self.system_monitor.get_system_info()
-        info_text.setPlainText(json.dumps(sys_info, indent=2, ensure_ascii=False))
+        process_buttons = QHBoxLayout()
+        self.terminate_rule_btn = ModernButton("⛔ Kurala Göre Sonlandır")
+        self.terminate_rule_btn.setEnabled(HAS_PSUTIL)
+        self.terminate_rule_btn.clicked.connect(self.terminate_by_rule)
+        process_buttons.addWidget(self.terminate_rule_btn)
+        
+        # Trace recording for reproducing lag reports
+        self.trace_btn = ModernButton("⏺ İz Kaydını Başlat")
+        self.trace_btn.setEnabled(HAS_PSUTIL)
+        self.trace_btn.clicked.connect(self.toggle_trace_recording)
+        process_buttons.addWidget(self.trace_btn)
+        monitor_layout.addLayout(process_buttons)
+        
+        # Memory growth / reclaim candidates
+        self.memory_list = QListWidget()
+        self.memory_list.setMaximumHeight(140)
+        monitor_layout.addWidget(QLabel("🧠 Bellek Tüketicileri (📈 = büyüyor):"))
+        monitor_layout.addWidget(self.memory_list)
+        
+        # Hardware inventory
+        self.inventory_label = QLabel()
+        self.inventory_label.setProperty("role", "mono")
+        self.inventory_label.setWordWrap(True)
+        self.update_inventory_label()
         
         monitor_layout.addWidget(QLabel("🖥️ Sistem Bilgileri:"))
-        monitor_layout.addWidget(info_text)
+        monitor_layout.addWidget(self.inventory_label)
         
         monitor_group.setLayout(monitor_layout)
         layout.addWidget(monitor_group)
         
         self.tab_widget.addTab(widget, "📊 Monitor")
     
+    def create_tools_tab(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        
+        # DISK SPACE ANALYZER
+        space_group = QGroupBox("💽 Disk Alanı Analizi")
+        space_layout = QVBoxLayout()
+        
+        volume_layout = QHBoxLayout()
+        self.volume_combo = QComboBox()
+        for volume in DiskSpaceAnalyzer.list_volumes():
+            self.volume_combo.addItem(
+                f"{volume['mountpoint']} ({format_bytes(volume['used'])} / "
+                f"{format_bytes(volume['total'])}, %{volume['percent']:.0f})",
+                volume['mountpoint']
+            )
+        self.analyze_btn = ModernButton("🔍 Analiz Et")
+        self.analyze_btn.clicked.connect(self.start_disk_analysis)
+        volume_layout.addWidget(self.volume_combo, 1)
+        volume_layout.addWidget(self.analyze_btn)
+        space_layout.addLayout(volume_layout)
+        
+        self.space_tree = QTreeWidget()
+        self.space_tree.setHeaderLabels(["Klasör", "Boyut", "Dosya"])
+        self.space_tree.setColumnWidth(0, 420)
+        space_layout.addWidget(self.space_tree)
+        
+        self.largest_files_list = QListWidget()
+        self.largest_files_list.setMaximumHeight(120)
+        space_layout.addWidget(QLabel("📁 En Büyük Dosyalar:"))
+        space_layout.addWidget(self.largest_files_list)
+        
+        space_group.setLayout(space_layout)
+        layout.addWidget(space_group)
+        
+        # DUPLICATE FILE FINDER
+        dup_group = QGroupBox("🧬 Yinelenen Dosyalar")
+        dup_layout = QVBoxLayout()
+        
+        self.duplicate_roots = QListWidget()
+        self.duplicate_roots.setMaximumHeight(70)
+        dup_layout.addWidget(self.duplicate_roots)
+        
+        dup_buttons = QHBoxLayout()
+        add_root_btn = ModernButton("➕ Klasör Ekle")
+        add_root_btn.clicked.connect(self.add_duplicate_root)
+        self.duplicate_scan_btn = ModernButton("🔎 Tara")
+        self.duplicate_scan_btn.clicked.connect(self.start_duplicate_scan)
+        dup_buttons.addWidget(add_root_btn)
+        dup_buttons.addWidget(self.duplicate_scan_btn)
+        dup_layout.addLayout(dup_buttons)
+        
+        dup_group.setLayout(dup_layout)
+        layout.addWidget(dup_group)
+        
+        # GAME RULES
+        rules_group = QGroupBox("🎮 Oyun Kuralları")
+        rules_layout = QVBoxLayout()
+        
+        self.rule_list = QListWidget()
+        self.rule_list.setMaximumHeight(90)
+        rules_layout.addWidget(self.rule_list)
+        
+        rule_buttons = QHBoxLayout()
+        add_rule_btn = ModernButton("➕ Kural Ekle")
+        add_rule_btn.clicked.connect(self.add_process_rule)
+        remove_rule_btn = ModernButton("🗑️ Kuralı Sil")
+        remove_rule_btn.clicked.connect(self.remove_process_rule)
+        rule_buttons.addWidget(add_rule_btn)
+        rule_buttons.addWidget(remove_rule_btn)
+        rules_layout.addLayout(rule_buttons)
+        
+        rules_group.setLayout(rules_layout)
+        layout.addWidget(rules_group)
+        self.refresh_rule_list()
+        
+        self.disk_analyzer = DiskSpaceAnalyzer()
+        self.duplicate_finder = DuplicateFinder()
+        self.tab_widget.addTab(widget, "🧰 Araçlar")
+    
+    def refresh_rule_list(self):
+        self.rule_list.clear()
+        for rule in self.rule_store.rules:
+            affinity = ",".join(map(str, rule['affinity'])) if rule['affinity'] else "tümü"
+            self.rule_list.addItem(
+                f"{rule['pattern']} ({rule['match']}) → öncelik: {rule['priority'] or '-'} | "
+                f"çekirdek: {affinity} | I/O: {rule['io_priority'] or '-'} | isabet: {rule['hits']}"
+            )
+    
+    def add_process_rule(self):
+        pattern, ok = QInputDialog.getText(self, "Kural Ekle", "Process adı, tam yol veya glob (ör. *\\steamapps\\*.exe):")
+        if not ok or not pattern.strip():
+            return
+        pattern = pattern.strip()
+        priority, ok = QInputDialog.getItem(self, "Kural Ekle", "CPU önceliği:", list(PRIORITY_LEVELS), 4, False)
+        if not ok:
+            return
+        io_priority, ok = QInputDialog.getItem(self, "Kural Ekle", "I/O önceliği:", list(IO_PRIORITY_LEVELS), 2, False)
+        if not ok:
+            return
+        cores, ok = QInputDialog.getText(self, "Kural Ekle", "Çekirdekler (ör. 0,1,2,3; boş = tümü):")
+        if not ok:
+            return
+        
+        if any(ch in pattern for ch in "*?["):
+            match = 'glob'
+        elif os.sep in pattern or '/' in pattern:
+            match = 'path'
+        else:
+            match = 'name'
+        try:
+            affinity = [int(c) for c in cores.replace(" ", "").split(",") if c] or None
+            self.rule_store.add({'pattern': pattern, 'match': match, 'priority': priority,
+                                 'affinity': affinity, 'io_priority': io_priority})
+        except ValueError as e:
+            QMessageBox.warning(self, "Kural Ekle", f"Geçersiz kural: {str(e)}")
+            return
+        self.refresh_rule_list()
+        self.show_notification("Başarılı", f"Kural eklendi: {pattern}")
+    
+    def remove_process_rule(self):
+        row = self.rule_list.currentRow()
+        if row < 0:
+            return
+        self.rule_store.remove(row)
+        self.refresh_rule_list()
+    
+    def add_duplicate_root(self):
+        path = QFileDialog.getExistingDirectory(self, "Taranacak Klasör")
+        if path:
+            self.duplicate_roots.addItem(path)
+    
+    def start_duplicate_scan(self):
+        roots = [self.duplicate_roots.item(i).text() for i in range(self.duplicate_roots.count())]
+        if not roots:
+            self.show_notification("Bilgi", "Önce taranacak klasör ekleyin")
+            return
+        
+        self.duplicate_scan_btn.setEnabled(False)
+        thread = DuplicateScanThread(self.duplicate_finder, roots)
+        thread.progress.connect(
+            lambda stage, n: self.status_label.setText(f"🧬 Özetlenen dosya ({stage}): {n}")
+        )
+        thread.result_ready.connect(self.review_duplicates)
+        self.start_thread(thread)
+    
+    def review_duplicates(self, result):
+        self.duplicate_scan_btn.setEnabled(True)
+        if 'error' in result:
+            self.show_notification("Hata", f"Tarama başarısız: {result['error'][:50]}")
+            return
+        
+        self.operation_history.add(
+            "Yinelenen Dosya Taraması", "duplicate-scan", True,
+            f"{result['duplicate_files']} kopya, {format_bytes(result['reclaimable_bytes'])} kazanılabilir",
+            {k: result[k] for k in ('roots', 'scanned_files', 'duplicate_files',
+                                    'reclaimable_bytes', 'duration')}
+        )
+        self.update_history_list()
+        
+        if not result['groups']:
+            self.show_notification("Bilgi", "Yinelenen dosya bulunamadı")
+            return
+        
+        dialog = DuplicateReviewDialog(result, self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        
+        deletions = dialog.selected_deletions()
+        if not deletions:
+            return
+        outcome = DuplicateFinder.delete(deletions)
+        summary = f"{outcome['deleted_files']} dosya silindi, {format_bytes(outcome['freed_bytes'])} kazanıldı"
+        if outcome['skipped']:
+            summary += f", {len(outcome['skipped'])} dosya değiştiği için atlandı"
+        self.operation_history.add(
+            "Yinelenen Dosya Temizleme", "duplicate-delete", not outcome['errors'], summary,
+            {'reclaimable_bytes': result['reclaimable_bytes'], **outcome}
+        )
+        self.update_history_list()
+        self.show_notification("Başarılı" if not outcome['skipped'] else "Uyarı", summary)
+    
+    def start_disk_analysis(self):
+        root = self.volume_combo.currentData()
+        if not root:
+            return
+        
+        self.analyze_btn.setEnabled(False)
+        thread = DiskAnalysisThread(self.disk_analyzer, root)
+        thread.progress.connect(lambda n: self.status_label.setText(f"💽 Taranan klasör: {n}"))
+        thread.result_ready.connect(self.show_disk_analysis)
+        self.start_thread(thread)
+    
+    def show_disk_analysis(self, result):
+        self.analyze_btn.setEnabled(True)
+        if 'error' in result:
+            self.show_notification("Hata", f"Disk analizi başarısız: {result['error'][:50]}")
+            return
+        
+        self.space_tree.clear()
+        
+        def add_node(parent, node):
+            item = QTreeWidgetItem([node['name'], format_bytes(node['bytes']),
+                                    str(node['files']) if node['files'] is not None else ""])
+            item.setToolTip(0, node['path'] or "")
+            if parent is None:
+                self.space_tree.addTopLevelItem(item)
+            else:
+                parent.addChild(item)
+            for child in node['children']:
+                add_node(item, child)
+            return item
+        
+        if result['tree']:
+            add_node(None, result['tree']).setExpanded(True)
+        
+        self.largest_files_list.clear()
+        for entry in result['largest_files'][:20]:
+            self.largest_files_list.addItem(f"{format_bytes(entry['bytes'])}  {entry['path']}")
+        
+        self.status_label.setText(
+            f"💽 {result['root']}: {format_bytes(result['total_bytes'])}, {result['total_files']} dosya, "
+            f"{result['duration']} sn ({result['reused_dirs']} klasörün yapısı önbellekten)"
+        )
+    
     def create_history_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -793,21 +6820,7 @@ class AlegroUltimate(QMainWindow):
         history_layout = QVBoxLayout()
         
         self.history_list = QListWidget()
-        self.history_list.setStyleSheet("""
-            QListWidget {
-                background: #1a1a1a;
-                border: 1px solid #333;
-                border-radius: 5px;
-                font-size: 11px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #2a2a2a;
-            }
-            QListWidget::item:selected {
-                background: #333;
-            }
-        """)
+        self.history_list.setObjectName("historyList")
         
         # Add sample history
         self.update_history_list()
@@ -816,13 +6829,57 @@ class AlegroUltimate(QMainWindow):
         clear_btn = ModernButton("🗑️ Geçmişi Temizle")
         clear_btn.clicked.connect(self.clear_history)
         
+        # Analiz için metrik arşivi, process görüntüleri ve geçmiş sütunlu dosyalara
+        self.export_btn = ModernButton(f"📦 Dışa Aktar ({export_formats()[0].upper()})")
+        self.export_btn.clicked.connect(self.export_data)
+        self.export_thread = None
+        
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.export_btn)
+        buttons.addWidget(clear_btn)
         history_layout.addWidget(self.history_list)
-        history_layout.addWidget(clear_btn)
+        history_layout.addLayout(buttons)
         history_group.setLayout(history_layout)
         layout.addWidget(history_group)
         
         self.tab_widget.addTab(widget, "📜 Geçmiş")
     
+    def export_data(self):
+        if self.export_thread is not None and self.export_thread.isRunning():
+            self.export_thread.cancel()
+            return
+        out_dir = QFileDialog.getExistingDirectory(self, "Dışa Aktarım Klasörü")
+        if not out_dir:
+            return
+        days, ok = QInputDialog.getInt(self, "Dışa Aktar", "Son kaç gün aktarılsın? (0 = tümü)", 7, 0, 3650)
+        if not ok:
+            return
+        
+        # Açık arşiv parçası kapatılır; bir sonraki örnek yeni parçaya yazılır
+        self.metrics_archive.close()
+        exporter = ColumnarExporter(out_dir, since=time.time() - days * 86400 if days else None)
+        self.export_thread = ExportThread(exporter)
+        self.export_thread.progress.connect(
+            lambda name, rows: self.status_label.setText(f"📦 Aktarılıyor: {name} ({rows} satır)")
+        )
+        self.export_thread.result_ready.connect(self.on_export_finished)
+        self.start_thread(self.export_thread)
+        self.export_btn.setText("⏹ Aktarımı Durdur")
+    
+    def on_export_finished(self, report):
+        self.export_btn.setText(f"📦 Dışa Aktar ({export_formats()[0].upper()})")
+        if 'error' in report:
+            self.show_notification("Hata", f"Dışa aktarım başarısız: {report['error'][:50]}")
+            return
+        rows = ", ".join(f"{table} {info['rows']}" for table, info in report['tables'].items())
+        summary = f"{report['format']}: {rows} satır ({report['duration']} sn)"
+        if report['cancelled']:
+            summary += ", yarıda durduruldu"
+        self.operation_history.add("Dışa Aktarım", "export", not report['cancelled'], summary, report)
+        self.schedule_history_refresh()
+        self.status_label.setText(f"📦 {summary}")
+        self.show_notification("Dışa Aktarım", summary)
+    
     def create_settings_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -913,21 +6970,34 @@ class AlegroUltimate(QMainWindow):
         if not HAS_PSUTIL:
             return
         
-        # Update progress bars
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        ram_percent = psutil.virtual_memory().percent
+        # Bloklamayan okumalar: CPU son çağrıdan bu yana ölçülür
+        cpu_percent = psutil.cpu_percent(interval=None)
+        # RAM ve disk, rapor ve istatistiklerle paylaşılan kısa TTL'li önbellekten
+        dynamic = self.system_monitor.inventory.dynamic()
+        ram_percent = dynamic['ram']['percent']
+        disk_percent = dynamic['disk']['percent'] if dynamic['disk'] else 0.0
+        if self.trace_recorder is not None:
+            self.trace_recorder.record_system(cpu_percent)
+        self.metrics_archive.record(cpu_percent)
+        
+        rates = self.system_monitor.record_tick(cpu_percent, ram_percent, disk_percent)
+        self.overhead.sample()
+        self.apply_monitor_mode()
+        self.handle_thermal_events()
+        
+        # Görünmeyen widget'lar güncellenmez
+        if self.monitor_mode != 'active':
+            return
         
         self.cpu_bar.setValue(int(cpu_percent))
         self.ram_bar.setValue(int(ram_percent))
-        
-        try:
-            disk_percent = psutil.disk_usage('/').percent
-            self.disk_bar.setValue(int(disk_percent))
-        except:
-            pass
+        self.disk_bar.setValue(int(disk_percent))
+        self.update_io_label(rates)
+        for chart in self.charts:
+            chart.refresh()
         
         # Update performance score
-        score = self.system_monitor.get_performance_score()
+        score = self.system_monitor.get_performance_score(cpu_percent)
         self.score_label.setText(f"{score}")
         self.boost_score = score
         
@@ -935,13 +7005,109 @@ class AlegroUltimate(QMainWindow):
         status_msg = f"CPU: {cpu_percent:.1f}% | RAM: {ram_percent:.1f}% | Skor: {score}"
         self.status_label.setText(status_msg)
     
+    def handle_thermal_events(self):
+        for event in self.system_monitor.throttle.drain_events():
+            episode = event['episode']
+            details = []
+            if episode['min_ratio'] is not None:
+                details.append(f"frekans oranı %{episode['min_ratio'] * 100:.0f}")
+            if episode['max_temp'] is not None:
+                details.append(f"sıcaklık {episode['max_temp']:.0f}°C")
+            summary = ", ".join(details) or ", ".join(episode['reasons'])
+            if event['type'] == 'started':
+                self.show_notification("Termal Kısılma", f"CPU kısılıyor: {summary}")
+                continue
+            self.operation_history.add("Termal Kısılma", "thermal", False,
+                                       f"{episode['duration']:.0f} sn, {summary}", episode)
+            self.schedule_history_refresh()
+    
+    def refresh_inventory(self):
+        """Statik donanım envanterini arka planda yeniden toplar"""
+        if self.inventory_thread is not None and self.inventory_thread.isRunning():
+            return
+        self.inventory_thread = HardwareInventoryThread(self.system_monitor.inventory)
+        self.inventory_thread.result_ready.connect(lambda changed: self.update_inventory_label())
+        self.start_thread(self.inventory_thread)
+    
+    def update_inventory_label(self):
+        self.inventory_label.setText("\n".join(self.system_monitor.inventory.summary_lines()))
+    
+    def tick_inventory_label(self):
+        # Gizli/boşta pencerede etiket yeniden kurulmaz
+        if self.monitor_mode == 'active':
+            self.update_inventory_label()
+    
+    def set_chart_span(self, index):
+        for chart in self.charts:
+            chart.set_span(self.chart_span_combo.itemData(index))
+    
+    def desired_monitor_mode(self):
+        if not self.isVisible() or self.isMinimized():
+            return 'background'
+        idle = user_idle_seconds()
+        if idle is not None and idle >= self.settings_manager.get('performance', 'idle_after', 300):
+            return 'background'
+        return 'active'
+    
+    def apply_monitor_mode(self):
+        """Gizli/boşta iken düşük maliyetli moda geçer; aralıklar kaynak bütçesine göre uzatılır"""
+        if not hasattr(self, 'monitor_timer'):
+            return
+        mode = self.desired_monitor_mode()
+        if mode == 'active':
+            monitor = self.settings_manager.get('performance', 'monitor_interval', 2000)
+            sampler = self.settings_manager.get('performance', 'process_sample_interval', 2000)
+        else:
+            monitor = self.settings_manager.get('performance', 'background_monitor_interval', 10000)
+            sampler = self.settings_manager.get('performance', 'background_process_sample_interval', 6000)
+        factor = self.overhead.factor
+        monitor, sampler = int(monitor * factor), int(sampler * factor)
+        
+        if self.monitor_timer.interval() != monitor:
+            self.monitor_timer.setInterval(monitor)
+        if self.process_sampler_thread.interval_ms != sampler:
+            self.process_sampler_thread.set_interval(sampler)
+        
+        if mode != self.monitor_mode:
+            self.monitor_mode = mode
+            self.logger.log("INFO", "MONITOR", f"İzleme modu: {mode} ({monitor} ms)")
+            if mode == 'active':
+                # Geri dönüşte bayat değerler gösterilmez
+                QTimer.singleShot(0, self.update_system_monitor)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.apply_monitor_mode()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.apply_monitor_mode()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.apply_monitor_mode()
+    
+    def update_io_label(self, rates):
+        lines = []
+        for name, r in sorted(rates['nics'].items()):
+            if r['rx_bps'] or r['tx_bps']:
+                lines.append(f"🌐 {name}: ↓ {format_bytes(r['rx_bps'])}/s  ↑ {format_bytes(r['tx_bps'])}/s")
+        for name, r in sorted(rates['disks'].items()):
+            if r['read_iops'] or r['write_iops']:
+                lines.append(f"💽 {name}: R {format_bytes(r['read_bps'])}/s  W {format_bytes(r['write_bps'])}/s  "
+                             f"{r['read_iops'] + r['write_iops']:.0f} IOPS  {r['latency_ms']:.1f} ms")
+        self.io_label.setText("\n".join(lines) or "G/Ç etkinliği yok")
+    
     def update_process_list(self):
         if not HAS_PSUTIL:
             return
         
         self.process_list.clear()
+        # Satırların (pid, başlangıç zamanı, ad) karşılığı; item verisine yazmak listeyi belirgin biçimde yavaşlatıyor
+        self.process_rows = []
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'create_time']):
                 try:
                     info = proc.info
                     if info['cpu_percent'] > 0.1 or info['memory_percent'] > 0.1:
@@ -955,11 +7121,143 @@ class AlegroUltimate(QMainWindow):
                             item.setForeground(QColor("#ff9900"))  # Orange for medium usage
                         
                         self.process_list.addItem(item)
+                        self.process_rows.append((info['pid'], info['create_time'], info['name']))
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
         except Exception as e:
             self.logger.log("ERROR", "PROCESS_LIST", f"Hata: {str(e)}")
     
+    def show_process_menu(self, pos):
+        menu = QMenu(self)
+        items = self.process_list.selectedItems()
+        if HAS_PSUTIL and items:
+            rows = [self.process_rows[self.process_list.row(item)] for item in items]
+            # PID yeniden kullanımına karşı kimlik başlangıç zamanıyla birlikte taşınır
+            targets = [(pid, create_time) for pid, create_time, _ in rows]
+            menu.addAction(f"⛔ Seçilenleri Sonlandır ({len(targets)}, alt süreçlerle)",
+                           lambda: self.terminate_processes(targets=targets))
+            names = sorted({name for _, _, name in rows if name})
+            if len(names) == 1:
+                menu.addAction(f"⛔ Tüm '{names[0]}' Processlerini Sonlandır",
+                               lambda: self.terminate_processes(rule={'pattern': names[0]}))
+            menu.addSeparator()
+        menu.addAction("🔄 Yenile", self.update_process_list)
+        menu.exec(self.process_list.mapToGlobal(pos))
+    
+    def terminate_by_rule(self):
+        dialog = TerminationRuleDialog(self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        rule = dialog.rule()
+        if not (rule['pattern'] or rule['min_rss_mb'] or rule['idle_minutes']):
+            QMessageBox.information(self, "Kurala Göre Sonlandır", "En az bir koşul girilmeli.")
+            return
+        self.terminate_processes(rule=rule)
+    
+    def terminate_processes(self, targets=None, rule=None):
+        """Seçimi veya kuralı arka planda ağaçlarıyla birlikte sonlandırır"""
+        target = f"{len(targets)} process" if targets else ", ".join(
+            f"{k}={v}" for k, v in rule.items() if v)
+        if self.settings_manager.get('optimizations', 'confirm_dangerous_ops', True):
+            reply = QMessageBox.question(self, "Process Sonlandır",
+                                         f"{target} alt süreçleriyle birlikte sonlandırılsın mı?\n"
+                                         "Kaydedilmemiş veriler kaybolabilir.",
+                                         QMessageBox.Yes | QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        thread = TerminationThread(self.terminator, targets=targets, rule=rule)
+        thread.result_ready.connect(lambda report: self.on_termination_finished(target, report))
+        self.start_thread(thread)
+        self.status_label.setText(f"Sonlandırılıyor: {target}")
+    
+    def on_termination_finished(self, target, report):
+        if 'error' in report:
+            self.operation_history.add("Process Sonlandırma", target, False, report['error'], report)
+        else:
+            ended = report['terminated'] + report['killed']
+            summary = (f"{ended}/{report['processes']} sonlandırıldı ({report['killed']} zorla), "
+                       f"{format_bytes(report['freed_rss'])} serbest, {report['duration']} sn")
+            if report['survived']:
+                summary += f", kapanmayan: {', '.join(p['name'] for p in report['survived'])}"
+            if report['skipped']:
+                summary += f", korunan: {', '.join(sorted({p['name'] for p in report['skipped']}))}"
+            self.operation_history.add("Process Sonlandırma", target, not report['survived'], summary, report)
+            self.show_notification("Process Sonlandırma", summary)
+        self.update_history_list()
+        self.update_process_list()
+    
+    def on_process_snapshot(self, snapshot):
+        events = self.rule_engine.drain_events()
+        for event in events:
+            self.operation_history.add(
+                f"Oyun Kuralı: {event['name']}", f"rule:{event['pattern']}", not event['errors'],
+                ", ".join(f"{k}={v}" for k, v in event['applied'].items()) or "; ".join(event['errors']),
+                event
+            )
+        if events:
+            self.schedule_history_refresh()
+            self.refresh_rule_list()
+            self.show_notification("Oyun Kuralı", ", ".join(sorted({e['name'] for e in events})))
+        
+        for event in self.throttler.drain_events():
+            if event['type'] == 'started':
+                self.show_notification("Arka Plan Kısıtlama", f"Korunan: {', '.join(event['protected'])}")
+            else:
+                report = event['report']
+                summary = (f"{report['processes']} process kısıtlandı, "
+                           f"CPU {report['cpu_before']}% → {report['cpu_after']}%, "
+                           f"serbest kalan ~%{report['freed_percent']}")
+                self.operation_history.add("Arka Plan Kısıtlama", "throttle", True, summary, report)
+                self.schedule_history_refresh()
+                self.show_notification("Arka Plan Kısıtlama", summary)
+        
+        if self.monitor_mode != 'active':
+            return
+        self.memory_list.clear()
+        for c in self.memory_analyzer.candidates(10):
+            memory = c['uss'] if c['uss'] is not None else c['rss']
+            item = QListWidgetItem(
+                f"{'📈' if c['leaking'] else '  '} PID: {c['pid']} | {c['name']} | "
+                f"{format_bytes(memory)} | {c['slope_mb_min']:+.2f} MB/dk"
+            )
+            if c['leaking']:
+                item.setForeground(QColor("#ff9900"))
+            self.memory_list.addItem(item)
+    
+    def toggle_trace_recording(self):
+        """Sistem ve process örneklerinin iz dosyasına kaydını başlatır/durdurur"""
+        if self.trace_recorder is None:
+            path = Path("recordings") / f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz"
+            try:
+                self.trace_recorder = TraceRecorder(path)
+            except OSError as e:
+                self.logger.log("ERROR", "TRACE", f"İz kaydı başlatılamadı: {str(e)}")
+                return
+            self.process_sampler_thread.listeners.append(self.trace_recorder.record_processes)
+            self.trace_btn.setText("⏹ İz Kaydını Durdur")
+            self.logger.log("INFO", "TRACE", "İz kaydı başladı", {'path': str(path)})
+            return
+        
+        self.stop_trace_recording()
+    
+    def stop_trace_recording(self):
+        recorder, self.trace_recorder = self.trace_recorder, None
+        if recorder is None:
+            return
+        listeners = self.process_sampler_thread.listeners
+        if recorder.record_processes in listeners:
+            listeners.remove(recorder.record_processes)
+        recorder.close()
+        details = {'path': str(recorder.path), 'frames': recorder.frames, 'size': recorder.size()}
+        self.logger.log("INFO", "TRACE", "İz kaydı durdu", details)
+        self.operation_history.add(
+            "İz Kaydı", "trace", True,
+            f"{recorder.frames} kare, {format_bytes(details['size'])} → {recorder.path}", details
+        )
+        self.update_history_list()
+        self.trace_btn.setText("⏺ İz Kaydını Başlat")
+        self.show_notification("İz Kaydı", f"Kaydedildi: {recorder.path}")
+    
     def update_history_list(self):
         self.history_list.clear()
         history = self.operation_history.get_last(20)
@@ -1011,223 +7309,177 @@ class AlegroUltimate(QMainWindow):
         self.show_notification("Bilgi", f"Tema değiştirildi: {text}")
     
     def update_theme(self):
-        themes = {
-            "GX": {"accent": "#ff0033", "bg": "#0a0a0a", "card": "#111"},
-            "EMERALD": {"accent": "#00cc88", "bg": "#0a140a", "card": "#112211"},
-            "BLUE": {"accent": "#0088ff", "bg": "#0a0a14", "card": "#111122"},
-            "PURPLE": {"accent": "#aa00ff", "bg": "#0a0a14", "card": "#111122"}
-        }
-        
-        theme = themes.get(self.current_theme, themes["GX"])
-        
-        style = f"""
-            QMainWindow {{
-                background-color: {theme['bg']};
-            }}
-            QWidget {{
-                color: white;
-                font-family: 'Segoe UI';
-            }}
-            QGroupBox {{
-                color: {theme['accent']};
-                border: 1px solid {theme['accent']};
-                border-radius: 8px;
-                margin-top: 10px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-            QPushButton {{
-                background-color: {theme['card']};
-                border: 1px solid #333;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                border-color: {theme['accent']};
-                color: {theme['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: #222;
-            }}
-            QProgressBar {{
-                background: {theme['card']};
-                border: none;
-                border-radius: 6px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {theme['accent']};
-                border-radius: 6px;
-            }}
-            QListWidget, QTextEdit {{
-                background: {theme['card']};
-                border: 1px solid #333;
-                border-radius: 5px;
-            }}
-        """
-        
-        self.setStyleSheet(style)
+        ThemeManager.apply(self, self.current_theme)
     
     def update_optimization_buttons(self):
-        texts = {
-            "TR": [
-                "NİHAİ GÜÇ", "RAM TEMİZLE", "DNS OPT.", "GPU BOOST",
-                "MOUSE FIX", "FSO KAPAT", "PİNG OPT.", "GEREKSİZ SİL",
-                "CPU ÖNCELİK", "SHADER SİL", "HIZLI BOOT", "LOG TEMİZLE",
-                "AĞ OPT.", "REGISTRY TEMİZ.", "GÜÇ PLANI", "GÜVENLİK OPT.",
-                "DISK BİRLEŞTİR", "SERVİS OPT.", "STARTUP OPT.", "GÖRSELLİK OPT."
-            ],
-            "EN": [
-                "ULTIMATE POWER", "CLEAN RAM", "DNS OPT.", "GPU BOOST",
-                "MOUSE FIX", "FSO DISABLE", "PING OPT.", "CLEAN JUNK",
-                "CPU PRIORITY", "SHADER FLUSH", "FAST BOOT", "CLEAN LOGS",
-                "NETWORK OPT.", "REGISTRY CLEAN", "POWER PLAN", "SECURITY OPT.",
-                "DISK DEFRAG", "SERVICE OPT.", "STARTUP OPT.", "VISUAL OPT."
-            ]
-        }
-        
-        current_texts = texts[self.current_lang]
-        for i, btn in enumerate(self.optimization_buttons):
-            if i < len(current_texts):
-                btn.setText(current_texts[i])
+        for btn in self.optimization_buttons:
+            entry = self.catalog.get(btn.property("op_id"))
+            if entry:
+                btn.setText(entry.label(self.current_lang))
     
     # ==============================================
     # OPTIMIZATION FUNCTIONS
     # ==============================================
-    def run_optimization(self, index):
-        optimization_funcs = [
-            self.optimize_power, self.clean_ram, self.optimize_dns, self.boost_gpu,
-            self.fix_mouse, self.disable_fso, self.optimize_ping, self.clean_junk,
-            self.set_cpu_priority, self.clear_shaders, self.fast_boot, self.clean_logs,
-            self.optimize_network, self.clean_registry, self.set_power_plan,
-            self.security_optimize, self.defrag_disk, self.optimize_services,
-            self.optimize_startup, self.visual_optimize
-        ]
+    def run_optimization(self, op_id, on_done=None):
+        """Katalog işlemini çalıştırır; on_done(success) sonuç belli olunca çağrılır"""
+        entry = self.catalog.get(op_id)
+        if entry is None:
+            self.logger.log("WARNING", "CATALOG", f"Bilinmeyen operasyon: {op_id}")
+            if on_done:
+                on_done(False)
+            return
+        
+        on_done = self.recording_run(entry, on_done)
+        if entry.handler:
+            getattr(self, entry.handler)(entry, on_done)
+            return
         
-        if index < len(optimization_funcs):
-            func = optimization_funcs[index]
-            func()
+        def apply(snapshot):
+            # Zaten uygulanmış işlem başarılı sayılır
+            if not self.apply_entry(entry, snapshot, on_done=on_done) and on_done:
+                on_done(True)
+        self.with_state_snapshot([entry], apply)
     
-    def optimize_power(self):
-        command = "powercfg -duplicatescheme e9a42b02-d5df-448d-aa00-03f14749eb61"
-        self.run_command("Güç Planı Optimizasyonu", command)
+    def maintenance_metrics(self):
+        disks = self.system_monitor.io_sampler.disks.values()
+        return {
+            'cpu': self.system_monitor.history['cpu'].last(100.0),
+            'disk_busy': max((d.series['busy_percent'].last(0.0) for d in disks), default=0.0),
+            'input_idle': user_idle_seconds()
+        }
     
-    def clean_ram(self):
-        command = "ipconfig /flushdns && timeout 1"
-        self.run_command("RAM Temizleme", command)
+    def run_due_maintenance(self):
+        for job_id in self.scheduler.tick():
+            job = self.scheduler.jobs[job_id]
+            entry = self.catalog.get(job['operation'])
+            if entry is None:
+                self.logger.log("WARNING", "SCHEDULER", f"{job_id}: bilinmeyen operasyon {job['operation']}")
+                self.scheduler.mark_run(job_id, False)
+                continue
+            missed = self.scheduler.mark_run(job_id)
+            self.run_optimization(entry.id, self.maintenance_step(job_id, entry, missed))
     
-    def optimize_dns(self):
-        command = 'netsh interface ip set dns name="Ethernet" static 8.8.8.8'
-        self.run_command("DNS Optimizasyonu", command)
+    def maintenance_step(self, job_id, entry, missed):
+        """Zamanlanmış işin gerçek sonucunu zamanlayıcıya ve geçmişe yazan callback"""
+        def finished(success):
+            if self.scheduler is not None:
+                self.scheduler.record_result(job_id, success)
+            self.operation_history.add(f"Zamanlanmış Bakım: {entry.name}", f"schedule:{job_id}", success,
+                                       f"{'Tamamlandı' if success else 'Başarısız'} (birleştirilen: {missed})",
+                                       {'job': job_id, 'missed': missed})
+            self.schedule_history_refresh()
+        return finished
     
-    def boost_gpu(self):
-        command = 'reg add "HKLM\\SYSTEM\\CurrentControlSet\\Control\\GraphicsDrivers" /v HwSchMode /t REG_DWORD /d 2 /f'
-        self.run_command("GPU Boost", command)
+    def format_maintenance_report(self):
+        if self.scheduler is None:
+            return "Kapalı"
+        lines = []
+        for job in self.scheduler.upcoming():
+            entry = self.catalog.get(job['operation'])
+            last = datetime.fromtimestamp(job['last_run']).strftime('%Y-%m-%d %H:%M') if job['last_run'] else "hiç"
+            lines.append(f"{entry.name if entry else job['operation']}: "
+                         f"sonraki {datetime.fromtimestamp(job['next_due']).strftime('%Y-%m-%d %H:%M')}, "
+                         f"son {last}{' (boşta bekleniyor)' if job['deferred'] else ''}")
+        return chr(10).join(lines) or "İş yok"
     
-    def fix_mouse(self):
-        command = 'reg add "HKU\\.DEFAULT\\Control Panel\\Mouse" /v MouseSpeed /t REG_SZ /d 0 /f'
-        self.run_command("Mouse Fix", command)
+    def with_state_snapshot(self, entries, callback):
+        """Önbellek tazeyse hemen, değilse arka planda yoklayıp callback'i çağırır"""
+        callback = self.batch_bound(callback)
+        if not StateProbe.checks_of(entries):
+            callback({})
+            return
+        
+        snapshot = self.state_probe.cached(entries)
+        if snapshot is not None:
+            callback(snapshot)
+            return
+        
+        thread = StateProbeThread(self.state_probe, entries)
+        thread.result_ready.connect(callback)
+        self.start_thread(thread)
     
-    def disable_fso(self):
-        command = 'reg add "HKCU\\System\\GameConfigStore" /v GameDVR_FSEBehavior /t REG_DWORD /d 2 /f'
-        self.run_command("FSO Kapatma", command)
+    def apply_entry(self, entry, snapshot, notify_skip=True, on_done=None):
+        """Yalnızca istenen durumu henüz sağlamayan adımları çalıştırır"""
+        commands, skipped = self.state_probe.pending_commands(entry, snapshot)
+        if not commands and skipped:
+            if notify_skip:
+                self.operation_history.add(entry.name, "state-probe", True,
+                                           "Zaten uygulanmış, atlandı", {'skipped_steps': skipped})
+                self.update_history_list()
+                self.show_notification("Bilgi", f"{entry.name} zaten uygulanmış")
+            return False
+        
+        self.run_steps(entry, commands, on_done)
+        return True
     
-    def optimize_ping(self):
-        command = 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Multimedia\\SystemProfile" /v NetworkThrottlingIndex /t REG_DWORD /d 0xffffffff /f'
-        self.run_command("Ping Optimizasyonu", command)
+    def run_steps(self, entry, commands, on_done=None):
+        """Adımları çalıştırır; on_done(success) tümü bittiğinde çağrılır (iptalde çağrılmaz)"""
+        timeouts = [entry.timeout_for(cmd) for cmd in commands]
+        if not commands:
+            self.show_notification("Bilgi", f"{entry.name}: uygulanacak adım yok")
+            if on_done:
+                on_done(True)
+        elif entry.latency_probe:
+            self.run_with_latency_probe(entry.name, commands, timeouts, on_done)
+        elif len(commands) == 1:
+            callback = (lambda success, result: on_done(success)) if on_done else None
+            self.run_command(entry.name, commands[0], callback, timeouts[0])
+        else:
+            self.run_commands(entry.name, commands, all_succeeded(on_done), timeouts)
     
-    def clean_junk(self):
-        commands = [
-            'del /q/f/s %TEMP%\\*',
-            'del /q/f/s C:\\Windows\\Temp\\*',
-            'cleanmgr /sagerun:1'
-        ]
-        self.run_commands("Çöp Dosya Temizleme", commands)
+    def clean_ram(self, entry, on_done=None):
+        # En çok bellek tüketen ve büyüyen processler hedeflenir
+        candidates = self.memory_analyzer.candidates(10)
+        trimmed = [c for c in candidates if trim_working_set(c['pid'])]
+        if candidates:
+            self.operation_history.add(
+                "RAM Hedefleri", "trim-working-set", True,
+                ", ".join(f"{c['name']} ({format_bytes(c['rss'])})" for c in candidates[:5]),
+                {'candidates': candidates, 'trimmed': [c['pid'] for c in trimmed]}
+            )
+        
+        self.run_steps(entry, entry.commands(), on_done)
     
-    def set_cpu_priority(self):
-        command = 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion\\Image File Execution Options\\csgo.exe\\PerfOptions" /v CpuPriorityClass /t REG_DWORD /d 3 /f'
-        self.run_command("CPU Önceliği", command)
+    def optimize_dns(self, entry, on_done=None):
+        benchmark = DnsBenchmark(
+            self.settings_manager.get('network', 'dns_candidates', DEFAULT_DNS_CANDIDATES),
+            self.settings_manager.get('network', 'dns_domains', DEFAULT_DNS_DOMAINS),
+            rounds=self.settings_manager.get('network', 'dns_rounds', 3)
+        )
+        thread = DnsBenchmarkThread(benchmark)
+        thread.result_ready.connect(self.batch_bound(lambda result: self.apply_dns_benchmark(result, on_done)))
+        self.start_thread(thread)
+        self.show_notification("Başlatıldı", "DNS karşılaştırması başlatıldı")
     
-    def clear_shaders(self):
-        paths = [
-            r"%LOCALAPPDATA%\NVIDIA\DXCache",
-            r"%LOCALAPPDATA%\AMD\DxCache",
-            r"%LOCALAPPDATA%\Intel\ShaderCache"
-        ]
+    def apply_dns_benchmark(self, result, on_done=None):
+        self.dns_benchmark = result
+        # Yalnızca standart portta çalışan sunucular arayüzlere atanabilir
+        ranking = [r for r in result['ranking'] if parse_resolver(r)[1] == 53]
+        best = ", ".join(ranking[:2]) or "yok"
+        self.operation_history.add("DNS Karşılaştırması", "dns-benchmark", bool(ranking),
+                                   f"En hızlı: {best}", result)
+        self.update_history_list()
         
-        commands = []
-        for path in paths:
-            expanded = os.path.expandvars(path)
-            if os.path.exists(expanded):
-                commands.append(f'del /f /s /q "{expanded}\\*.*"')
+        if not ranking:
+            self.show_notification("Hata", "Yanıt veren DNS sunucusu bulunamadı")
+            if on_done:
+                on_done(False)
+            return
+        
+        interfaces = self.interface_cache.get_active()
+        if not interfaces:
+            self.show_notification("Hata", "Aktif ağ arayüzü bulunamadı")
+            if on_done:
+                on_done(False)
+            return
         
-        if commands:
-            self.run_commands("Shader Temizleme", commands)
-        else:
-            self.show_notification("Bilgi", "Shader cache bulunamadı")
-    
-    def fast_boot(self):
-        command = "bcdedit /set {current} bootux disabled"
-        self.run_command("Hızlı Önyükleme", command)
-    
-    def clean_logs(self):
         commands = []
-        for log in ["System", "Application", "Security", "Setup"]:
-            commands.append(f'wevtutil cl {log}')
-        self.run_commands("Log Temizleme", commands)
-    
-    def optimize_network(self):
-        commands = [
-            'netsh int tcp set global autotuninglevel=normal',
-            'netsh int tcp set global rss=enabled',
-            'netsh winsock reset'
-        ]
-        self.run_commands("Ağ Optimizasyonu", commands)
-    
-    def clean_registry(self):
-        command = 'reg add "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Explorer\\VolumeCaches\\Old ChkDsk Files" /v StateFlags0001 /t REG_DWORD /d 2 /f'
-        self.run_command("Registry Temizleme", command)
-    
-    def set_power_plan(self):
-        command = 'powercfg -setactive 8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c'
-        self.run_command("Güç Planı Ayarlama", command)
-    
-    def security_optimize(self):
-        commands = [
-            'reg add "HKLM\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Memory Management" /v FeatureSettingsOverride /t REG_DWORD /d 3 /f',
-            'reg add "HKLM\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Memory Management" /v FeatureSettingsOverrideMask /t REG_DWORD /d 3 /f'
-        ]
-        self.run_commands("Güvenlik Optimizasyonu", commands)
-    
-    def defrag_disk(self):
-        command = 'defrag C: /O /U'
-        self.run_command("Disk Birleştirme", command)
-    
-    def optimize_services(self):
-        commands = [
-            'sc config "SysMain" start= disabled',
-            'sc stop "SysMain"',
-            'sc config "DiagTrack" start= disabled',
-            'sc stop "DiagTrack"'
-        ]
-        self.run_commands("Servis Optimizasyonu", commands)
-    
-    def optimize_startup(self):
-        command = 'taskmgr'
-        self.run_command("Startup Optimizasyonu", command)
-    
-    def visual_optimize(self):
-        commands = [
-            'reg add "HKCU\\Control Panel\\Desktop" /v DragFullWindows /t REG_SZ /d 0 /f',
-            'reg add "HKCU\\Control Panel\\Desktop" /v MenuShowDelay /t REG_SZ /d 0 /f',
-            'reg add "HKCU\\Control Panel\\Desktop\\WindowMetrics" /v MinAnimate /t REG_SZ /d 0 /f'
-        ]
-        self.run_commands("Görsellik Optimizasyonu", commands)
+        for name in interfaces:
+            commands.append(f'netsh interface ip set dns name="{name}" static {ranking[0]}')
+            if len(ranking) > 1:
+                commands.append(f'netsh interface ip add dns name="{name}" {ranking[1]} index=2')
+        entry = self.catalog.get('optimize_dns')
+        self.run_commands(entry.name, commands, all_succeeded(on_done), [entry.timeout] * len(commands))
     
     def mega_boost(self):
         reply = QMessageBox.question(self, "MEGA BOOST",
@@ -1236,47 +7488,259 @@ class AlegroUltimate(QMainWindow):
                                    QMessageBox.Yes | QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.show_notification("Başlatıldı", "Mega Boost başlatıldı...")
-            
-            # Run all optimizations
-            for i in range(20):
-                self.run_optimization(i)
-                time.sleep(0.5)
-            
-            self.boost_score = 100
-            self.show_notification("Tamamlandı", "Tüm optimizasyonlar uygulandı!")
+            entries = self.catalog.entries()
+            plan = self.boost_journal.begin("Mega Boost", [(e.id, e.name) for e in entries])
+            self.start_boost("Mega Boost", entries, plan)
+    
+    def start_boost(self, label, entries, plan=None):
+        generation = self.cancel_generation
+        # İptalde kapatılacak planlar; bitmiş olanlar günlükten zaten düşmüştür
+        self.boost_plans = {p for p in self.boost_plans if p in self.boost_journal.plans}
+        if plan is not None:
+            self.boost_plans.add(plan)
+        # Adım bildirimleri bastırılır; tümü bitince tek özet gösterilir
+        self.in_batch(label, lambda: self.with_state_snapshot(
+            entries, lambda snapshot: self.apply_mega_boost(entries, snapshot, generation, plan)))
+    
+    def apply_mega_boost(self, entries, snapshot, generation=None, plan=None):
+        if generation is not None and generation != self.cancel_generation:
+            self.logger.log("INFO", "MEGA_BOOST", "Yoklama sırasında iptal edildi")
+            if plan is not None:
+                # Bilerek iptal edilen boost sonraki açılışta sürdürülmek üzere önerilmez
+                self.boost_journal.end(plan, 'cancelled')
+            return
+        started = time.perf_counter()
+        skipped = []
+        for entry in entries:
+            # Durumu yoklanamayan işlem (ör. defrag) yakın zamanda bittiyse her boost'ta yeniden koşmaz
+            if self.state_probe.recently_run(entry):
+                skipped.append(entry.name)
+                self.boost_journal.mark(plan, entry.id, 'skipped')
+                continue
+            on_done = self.recording_run(entry, self.boost_step(plan, entry))
+            if entry.handler:
+                getattr(self, entry.handler)(entry, on_done)
+            elif not self.apply_entry(entry, snapshot, notify_skip=False, on_done=on_done):
+                skipped.append(entry.name)
+                self.boost_journal.mark(plan, entry.id, 'skipped')
+        
+        if skipped:
+            self.operation_history.add("Mega Boost", "state-probe", True,
+                                       f"{len(skipped)} işlem zaten uygulanmış ya da yakın zamanda çalışmış, atlandı",
+                                       {'skipped': skipped})
+            self.schedule_history_refresh()
+        self.logger.log("INFO", "MEGA_BOOST",
+                        f"{len(entries) - len(skipped)} işlem başlatıldı, {len(skipped)} atlandı "
+                        f"({time.perf_counter() - started:.3f} sn)")
+        
+        self.boost_score = 100
+    
+    def boost_step(self, plan, entry):
+        """Adımı günlükte 'running' işaretler; sonucunu kaydeden callback'i döndürür"""
+        if plan is None:
+            return None
+        self.boost_journal.mark(plan, entry.id, 'running')
+        self.schedule_journal_sync()
+        
+        def finished(success):
+            self.boost_journal.mark(plan, entry.id, 'done' if success else 'failed')
+            self.schedule_journal_sync()
+        return finished
+    
+    def recording_run(self, entry, on_done=None):
+        """Yoklanamayan işlemin başarılı çalışmasını kaydedip sonucu on_done'a iletir"""
+        if not StateProbe.unverifiable(entry):
+            return on_done
+        
+        def finished(success):
+            if success:
+                self.state_probe.record_run(entry)
+            if on_done:
+                on_done(success)
+        return finished
+    
+    def schedule_journal_sync(self):
+        if self.boost_journal.dirty and not self.journal_sync_timer.isActive():
+            self.journal_sync_timer.start()
+    
+    def offer_boost_resume(self):
+        """Önceki oturumda yarım kalan boost planlarını yalnızca kalan adımlarla sürdürmeyi önerir"""
+        for plan in self.boost_journal.unfinished():
+            names = [plan['names'][key] for key in plan['remaining']]
+            started = datetime.fromtimestamp(plan['created']).strftime('%Y-%m-%d %H:%M')
+            reply = QMessageBox.question(
+                self, "Yarım Kalan İşlem",
+                f"{started} tarihinde başlayan {plan['label']} tamamlanmadı "
+                f"({plan['finished']}/{plan['total']} adım bitti).\n\n"
+                f"Kalan: {', '.join(names[:8])}{' …' if len(names) > 8 else ''}\n\n"
+                "Yalnızca kalan adımlar sürdürülsün mü?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply == QMessageBox.Yes:
+                self.resume_boost(plan)
+            else:
+                self.boost_journal.end(plan['plan'], 'abandoned')
+                self.logger.log("INFO", "BOOST_JOURNAL", f"{plan['label']} sürdürülmedi", {'plan': plan['plan']})
+    
+    def resume_boost(self, plan):
+        entries = []
+        for key in plan['remaining']:
+            entry = self.catalog.get(key)
+            if entry is None:
+                self.logger.log("WARNING", "BOOST_JOURNAL", f"Katalogda olmayan adım atlandı: {key}")
+                self.boost_journal.mark(plan['plan'], key, 'skipped')
+            else:
+                entries.append(entry)
+        if plan['interrupted']:
+            # Çalışırken kesilen adımların etkisi tekrar denemeden önce taze yoklamayla görülür
+            self.state_probe.invalidate()
+        self.logger.log("INFO", "BOOST_JOURNAL",
+                        f"{plan['label']} sürdürülüyor: {len(entries)} adım "
+                        f"({len(plan['interrupted'])} yarıda kesilmiş)", {'plan': plan['plan']})
+        if entries:
+            self.start_boost(f"{plan['label']} (devam)", entries, plan['plan'])
     
     # ==============================================
     # COMMAND EXECUTION
     # ==============================================
-    def run_command(self, operation_name, command):
-        worker = WorkerThread(operation_name, command)
+    def start_thread(self, thread):
+        """Thread'i başlatır; biten thread'ler bekleyen sinyalleri teslim edildikten sonra silinir"""
+        for t in self.worker_threads:
+            if not t.isRunning():
+                t.deleteLater()
+        self.worker_threads = [t for t in self.worker_threads if t.isRunning()]
+        # Pencereye bağlı olduğundan Python referansı düşse de kuyruktaki sonuç sinyali kaybolmaz
+        thread.setParent(self)
+        thread.start()
+        self.worker_threads.append(thread)
+    
+    def cancel_all(self):
+        """Çalışan komutları süreç ağaçlarıyla sonlandırır, sıradakileri başlatmaz"""
+        self.cancel_generation += 1
+        # İptal edilen komut zincirleri on_done çağırmaz; açık boost planları burada kapatılır
+        for plan in self.boost_plans:
+            self.boost_journal.end(plan, 'cancelled')
+        self.boost_plans.clear()
+        running = [t for t in self.worker_threads if t.isRunning() and hasattr(t, 'cancel')]
+        for thread in running:
+            thread.cancel()
+        self.logger.log("WARNING", "CANCEL", f"{len(running)} çalışan komut iptal edildi")
+        self.show_notification("İptal", f"{len(running)} çalışan komut durduruluyor")
+        return len(running)
+    
+    def run_command(self, operation_name, command, callback=None, timeout=DEFAULT_COMMAND_TIMEOUT):
+        batch = self.notifier.current
+        self.notifier.step_started(batch, operation_name)
+        worker = WorkerThread(operation_name, command, timeout)
         worker.log_signal.connect(self.handle_log)
-        worker.finished.connect(lambda success, result: self.command_finished(operation_name, success, result, command))
-        worker.start()
+        worker.progress.connect(lambda percent: self.update_batch_progress(batch, operation_name, percent))
+        worker.finished.connect(
+            lambda success, result: self.command_finished(operation_name, success, result, command, batch)
+        )
+        if callback:
+            worker.finished.connect(self.batch_bound(callback))
+        self.start_thread(worker)
+        self.show_notification("Başlatıldı", f"{operation_name} başlatıldı", batch=batch)
+        self.update_batch_progress(batch, operation_name, 0)
+    
+    def run_commands(self, operation_name, commands, on_all_done=None, timeouts=None):
+        """Komutları arayüzü bekletmeden sırayla, biri bitince diğerini başlatarak çalıştırır"""
+        if len(commands) > 1 and self.notifier.current is None:
+            self.in_batch(operation_name, lambda: self.run_commands(operation_name, commands, on_all_done, timeouts))
+            return
+        results = []
+        generation = self.cancel_generation
+        
+        def start_next():
+            if generation != self.cancel_generation:
+                self.logger.log("INFO", "CANCEL", f"{operation_name}: {len(commands) - len(results)} adım çalıştırılmadı")
+                return
+            if len(results) == len(commands):
+                if on_all_done:
+                    on_all_done(results)
+                return
+            i = len(results)
+            timeout = timeouts[i] if timeouts else DEFAULT_COMMAND_TIMEOUT
+            self.run_command(f"{operation_name} ({i+1}/{len(commands)})", commands[i], step_done, timeout)
+        
+        def step_done(success, result):
+            results.append(success)
+            start_next()
+        
+        start_next()
+    
+    def run_with_latency_probe(self, operation_name, commands, timeouts=None, on_done=None):
+        """Ağ komutlarını öncesi ve sonrası gecikme ölçümüyle çalıştırır"""
+        if not self.settings_manager.get('network', 'probe_enabled', True):
+            self.run_commands(operation_name, commands, all_succeeded(on_done), timeouts)
+            return
+        if self.notifier.current is None:
+            self.in_batch(operation_name,
+                          lambda: self.run_with_latency_probe(operation_name, commands, timeouts, on_done))
+            return
         
-        self.worker_threads.append(worker)
-        self.show_notification("Başlatıldı", f"{operation_name} başlatıldı")
+        before_result = {}
+        generation = self.cancel_generation
+        
+        def before_probe(phase, before):
+            if generation != self.cancel_generation:
+                return
+            before_result['value'] = before
+            self.run_commands(operation_name, commands, commands_done, timeouts)
+        
+        def commands_done(results):
+            before_result['success'] = all(results)
+            self.start_latency_probe("after", after_probe)
+        
+        def after_probe(phase, after):
+            comparison = LatencyProbe.compare(before_result['value'], after)
+            comparison['operation'] = operation_name
+            comparison['timestamp'] = after['timestamp']
+            self.latency_results.append(comparison)
+            self.latency_results = self.latency_results[-10:]
+            
+            delta = comparison['delta']
+            summary = (f"p50 Δ {delta['p50']} ms | p95 Δ {delta['p95']} ms | "
+                       f"jitter Δ {delta['jitter']} ms | kayıp Δ {delta['loss_percent']}%")
+            self.operation_history.add(f"Gecikme Ölçümü: {operation_name}", "latency-probe",
+                                       after['overall']['reachable_targets'] > 0, summary, comparison)
+            self.schedule_history_refresh()
+            self.show_notification("Gecikme Ölçümü", summary)
+            if on_done:
+                on_done(before_result['success'])
+        
+        self.start_latency_probe("before", before_probe)
     
-    def run_commands(self, operation_name, commands):
-        for i, cmd in enumerate(commands):
-            time.sleep(0.5)
-            self.run_command(f"{operation_name} ({i+1}/{len(commands)})", cmd)
+    def start_latency_probe(self, phase, callback):
+        probe = LatencyProbe(
+            self.settings_manager.get('network', 'probe_targets', DEFAULT_PROBE_TARGETS),
+            count=self.settings_manager.get('network', 'probe_count', 10),
+            timeout=self.settings_manager.get('network', 'probe_timeout', 1.0)
+        )
+        thread = LatencyProbeThread(phase, probe)
+        thread.result_ready.connect(self.batch_bound(callback))
+        self.start_thread(thread)
+        self.logger.log("INFO", "LATENCY", f"Gecikme ölçümü başlatıldı ({phase})")
     
-    def command_finished(self, operation_name, success, result, command):
+    def command_finished(self, operation_name, success, result, command, batch=None):
+        # Sistem durumu değişmiş olabilir
+        self.state_probe.invalidate()
+        
         # Add to history
         self.operation_history.add(operation_name, command, success, result)
+        self.notifier.step_finished(batch, operation_name, success)
         
         # Update UI
-        self.update_history_list()
+        self.schedule_history_refresh()
+        self.update_batch_progress(batch, operation_name, 100)
         
         if success:
-            self.show_notification("Başarılı", f"{operation_name} tamamlandı")
+            self.show_notification("Başarılı", f"{operation_name} tamamlandı", batch=batch)
             if operation_name not in self.applied_ops:
                 self.applied_ops.add(operation_name)
                 self.boost_score = min(100, self.boost_score + 5)
         else:
-            self.show_notification("Hata", f"{operation_name} başarısız: {result[:50]}")
+            self.show_notification("Hata", f"{operation_name} başarısız: {result[:50]}", batch=batch)
     
     def handle_log(self, level, operation, message):
         self.logger.log(level, operation, message)
@@ -1330,17 +7794,100 @@ class AlegroUltimate(QMainWindow):
             self.quit_app()
     
     def quit_app(self):
+        if hasattr(self, 'process_sampler_thread'):
+            self.process_sampler_thread.stop()
+            self.throttler.restore_all()
+            self.stop_trace_recording()
+        self.metrics_archive.close()
+        self.boost_journal.close()
+        self.rule_store.flush()
+        self.settings_manager.flush()
+        # Çalışan komutların süreç ağaçları kapanmadan önce temizlenir; kapanışta
+        # yarım kalan boost iptal sayılmaz, sonraki açılışta sürdürülebilir
+        self.boost_plans.clear()
+        self.cancel_all()
+        deadline = time.monotonic() + 5
+        for thread in self.worker_threads:
+            thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
         if self.tray_icon:
             self.tray_icon.hide()
         QApplication.instance().quit()
     
-    def show_notification(self, title, message, duration=3000):
+    # ==============================================
+    # NOTIFICATIONS
+    # ==============================================
+    def in_batch(self, label, start):
+        """Çok adımlı bir işi toplu iş olarak başlatır: bir başlangıç ve bir özet bildirimi"""
+        batch = self.notifier.begin(label)
+        self.display_notification("Başlatıldı", f"{label} başlatıldı...")
+        try:
+            with self.notifier.scope(batch):
+                start()
+        finally:
+            self.notifier.close(batch)
+            self.schedule_notifications()
+        return batch
+    
+    def batch_bound(self, callback):
+        """Asenkron devamı, kaydedildiği andaki toplu işin kapsamında çalıştırır"""
+        batch = self.notifier.hold()
+        if batch is None:
+            return callback
+        
+        def bound(*args):
+            try:
+                with self.notifier.scope(batch):
+                    return callback(*args)
+            finally:
+                self.notifier.release(batch)
+                self.schedule_notifications()
+        return bound
+    
+    def schedule_notifications(self):
+        if not self.notification_timer.isActive():
+            self.notification_timer.start(int(self.notifier.window * 1000))
+    
+    def schedule_history_refresh(self):
+        if not self.history_refresh_timer.isActive():
+            self.history_refresh_timer.start()
+    
+    def deliver_notifications(self):
+        for title, message in self.notifier.flush():
+            self.display_notification(title, message)
+        self.update_batch_progress()
+    
+    def update_batch_progress(self, batch=None, operation_name=None, percent=None):
+        """Süren toplu işlerin ilerlemesini durum çubuğu ve tepsi ipucunda gösterir"""
+        if operation_name is not None:
+            self.notifier.step_progress(batch, operation_name, percent)
+        progress = self.notifier.progress()
+        if progress is None:
+            self.batch_progress.hide()
+            if self.tray_icon:
+                self.tray_icon.setToolTip(APP_NAME)
+            return
+        self.batch_progress.setMaximum(progress['total'])
+        self.batch_progress.setValue(progress['done'])
+        self.batch_progress.setFormat(f"{progress['label']}: %v/%m")
+        self.batch_progress.show()
+        if self.tray_icon:
+            self.tray_icon.setToolTip(f"{APP_NAME}\n{progress['label']}: {progress['done']}/{progress['total']} adım"
+                                      f" ({progress['running']} çalışıyor)")
+    
+    def show_notification(self, title, message, duration=3000, batch=None):
+        """Bildirimi birleştiriciye bırakır; toplu işe aitse yalnızca özete sayılır"""
+        self.notifier.post(title, message, batch)
+        self.schedule_notifications()
+    
+    def display_notification(self, title, message, duration=3000):
         if self.tray_icon:
             self.tray_icon.showMessage(title, message, QSystemTrayIcon.Information, duration)
         else:
             self.status_label.setText(f"{title}: {message}")
     
     def show_statistics(self):
+        overhead = self.overhead.status()
+        budget_state = "⚠️ AŞILDI" if overhead['over_cpu'] or overhead['over_rss'] else "✅ bütçe içinde"
         stats = f"""
         📊 ALEGRO ULTIMATE İSTATİSTİKLERİ
         =================================
@@ -1350,6 +7897,15 @@ class AlegroUltimate(QMainWindow):
         • Sistem Sağlığı: {self.system_monitor.get_performance_score()}/100
         • Geçmiş Kayıt: {len(self.operation_history.history)}
         
+        DONANIM:
+        {chr(10).join(f"• {line}" for line in self.system_monitor.inventory.summary_lines())}
+        • Termal Kısılma: {len(self.system_monitor.throttle.episodes)} dönem, son 10 dk %{self.system_monitor.throttle.throttled_share():.0f}
+        
+        UYGULAMA KAYNAK KULLANIMI ({budget_state}):
+        • CPU: %{overhead['cpu_percent']} (ort. %{overhead['cpu_avg']} / bütçe %{overhead['cpu_budget']})
+        • RSS: {format_bytes(overhead['rss'])} / bütçe {format_bytes(overhead['rss_budget'])}
+        • İzleme Modu: {'tam hız' if self.monitor_mode == 'active' else 'arka plan'} (aralık ×{overhead['factor']})
+        
         UYGULANAN OPTİMİZASYONLAR:
         {', '.join(sorted(self.applied_ops)) if self.applied_ops else 'Henüz yok'}
         """
@@ -1363,6 +7919,12 @@ class AlegroUltimate(QMainWindow):
         Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         Versiyon: {APP_VERSION}
         
+        DONANIM ENVANTERİ:
+        {chr(10).join(self.system_monitor.inventory.summary_lines())}
+        
+        TERMAL / FREKANS KISILMASI:
+        {chr(10).join(self.system_monitor.throttle.summary_lines())}
+        
         SİSTEM BİLGİLERİ:
         {json.dumps(self.system_monitor.get_system_info(), indent=2, ensure_ascii=False)}
         
@@ -1372,6 +7934,32 @@ class AlegroUltimate(QMainWindow):
         • Disk Kullanımı: {self.disk_bar.value() if hasattr(self, 'disk_bar') else 'N/A'}%
         • Performans Skoru: {self.boost_score}/100
         
+        G/Ç HIZLARI (ortalama / tepe):
+        {chr(10).join(self.format_io_report()) or 'Veri yok'}
+        
+        BELLEK TÜKETİCİLERİ (bellek, büyüme):
+        {chr(10).join([f"{'📈 ' if c['leaking'] else ''}{c['name']} (PID {c['pid']}): "
+                       f"{format_bytes(c['uss'] if c['uss'] is not None else c['rss'])}, {c['slope_mb_min']:+.2f} MB/dk"
+                       for c in self.memory_analyzer.candidates(10)]) or 'Veri yok'}
+        
+        AĞ GECİKME ÖLÇÜMLERİ (önce → sonra):
+        {chr(10).join([f"{r['operation']}: p50 {r['before']['p50']} → {r['after']['p50']} ms, "
+                       f"p95 {r['before']['p95']} → {r['after']['p95']} ms, "
+                       f"jitter {r['before']['jitter']} → {r['after']['jitter']} ms, "
+                       f"kayıp {r['before']['loss_percent']}% → {r['after']['loss_percent']}%"
+                       for r in self.latency_results]) or 'Henüz ölçüm yok'}
+        
+        ARKA PLAN KISITLAMA:
+        {self.format_throttle_report()}
+        
+        DNS KARŞILAŞTIRMASI (önbellekli p50/p95, soğuk p50/p95):
+        {chr(10).join([f"{r['resolver']}: {r['cached']['p50']}/{r['cached']['p95']} ms, "
+                       f"{r['cold']['p50']}/{r['cold']['p95']} ms, skor {r['score']}"
+                       for r in (self.dns_benchmark or {}).get('results', [])]) or 'Henüz ölçüm yok'}
+        
+        ZAMANLANMIŞ BAKIM:
+        {self.format_maintenance_report()}
+        
         İŞLEM GEÇMİŞİ:
         {chr(10).join([f"{h['timestamp']} - {h['operation']} ({'✅' if h['success'] else '❌'})" 
                       for h in self.operation_history.get_last(10)])}
@@ -1390,6 +7978,27 @@ class AlegroUltimate(QMainWindow):
         QMessageBox.information(self, "Rapor Oluşturuldu", 
                               f"Rapor başarıyla oluşturuldu:\n{report_file}")
     
+    def format_throttle_report(self):
+        if not hasattr(self, 'throttler') or not self.throttler.active:
+            return "Aktif değil"
+        report = self.throttler.report()
+        return (f"{report['processes']} process ({', '.join(report['names'][:8])}), "
+                f"CPU {report['cpu_before']}% → {report['cpu_after']}%, serbest kalan ~%{report['freed_percent']}")
+    
+    def format_io_report(self):
+        sampler = self.system_monitor.io_sampler
+        lines = []
+        for name, series in sorted(sampler.nics.items()):
+            stats = series.summary()
+            lines.append(f"{name}: ↓ {format_bytes(stats['rx_bps']['avg'])}/s / {format_bytes(stats['rx_bps']['max'])}/s, "
+                         f"↑ {format_bytes(stats['tx_bps']['avg'])}/s / {format_bytes(stats['tx_bps']['max'])}/s")
+        for name, series in sorted(sampler.disks.items()):
+            stats = series.summary()
+            lines.append(f"{name}: R {format_bytes(stats['read_bps']['avg'])}/s, W {format_bytes(stats['write_bps']['avg'])}/s, "
+                         f"IOPS {stats['read_iops']['avg'] + stats['write_iops']['avg']:.0f}, "
+                         f"gecikme {stats['latency_ms']['avg']} / {stats['latency_ms']['max']} ms")
+        return lines
+    
     def show_help(self):
         help_text = f"""
         {APP_NAME} v{APP_VERSION} KULLANIM KILAVUZU
@@ -1472,21 +8081,125 @@ class AlegroUltimate(QMainWindow):
             self.show_notification("Başarılı", "Ayarlar kaydedildi")
             
             # Apply new settings
-            self.current_lang = self.settings_manager.get('general', 'language', 'TR')
-            self.current_theme = self.settings_manager.get('general', 'theme', 'GX')
+            self.apply_settings([('general', 'language'), ('general', 'theme'),
+                                 ('performance', 'monitor_interval')])
+        else:
+            self.show_notification("Hata", "Ayarlar kaydedilemedi")
+    
+    def watch_settings_file(self):
+        # os.replace dosya izini düşürür; klasör izlenir, dosya her seferinde yeniden eklenir
+        path = self.settings_manager.settings_file.resolve()
+        watched = set(self.settings_watcher.files()) | set(self.settings_watcher.directories())
+        for target in (path.parent, path):
+            if str(target) not in watched and target.exists():
+                self.settings_watcher.addPath(str(target))
+    
+    def reload_settings_from_disk(self):
+        self.watch_settings_file()
+        changes = self.settings_manager.reload()
+        if changes:
+            self.apply_settings(changes)
+            self.show_notification("Ayarlar", f"Diskten {len(changes)} ayar yeniden yüklendi")
+    
+    def apply_settings(self, changes):
+        """Değişen ayarları çalışan bileşenlere ve ayar widget'larına uygular"""
+        categories = {category for category, _ in changes}
+        keys = set(changes)
+        get = self.settings_manager.get
+        
+        if ('general', 'language') in keys:
+            self.current_lang = get('general', 'language', 'TR')
             self.update_optimization_buttons()
+            self.lang_combo.blockSignals(True)
+            self.lang_combo.setCurrentText("Türkçe (TR)" if self.current_lang == "TR" else "English (EN)")
+            self.lang_combo.blockSignals(False)
+        if ('general', 'theme') in keys:
+            self.current_theme = get('general', 'theme', 'GX')
             self.update_theme()
+            names = {"GX": "Gaming Extreme (GX)", "EMERALD": "Emerald Green",
+                     "BLUE": "Dark Blue", "PURPLE": "Purple Haze"}
+            self.theme_combo.blockSignals(True)
+            self.theme_combo.setCurrentText(names.get(self.current_theme, "Gaming Extreme (GX)"))
+            self.theme_combo.blockSignals(False)
+        if ('general', 'notification_window') in keys:
+            self.notifier.window = get('general', 'notification_window', 2.0)
+        
+        if 'performance' in categories:
+            for spin, key, default in ((self.threshold_spin, 'auto_boost_threshold', 70),
+                                       (self.interval_spin, 'monitor_interval', 2000)):
+                spin.blockSignals(True)
+                spin.setValue(get('performance', key, default))
+                spin.blockSignals(False)
+            self.threshold_slider.setValue(self.threshold_spin.value())
+            self.overhead.cpu_budget = get('performance', 'overhead_cpu_budget', 1.0)
+            self.overhead.rss_budget = get('performance', 'overhead_rss_budget_mb', 250) * 1024 * 1024
+            self.system_monitor.inventory.dynamic_ttl = get('performance', 'inventory_ttl', 1.0)
+            self.inventory_timer.setInterval(get('performance', 'inventory_refresh_interval', 600) * 1000)
+            self.inventory_label_timer.setInterval(get('performance', 'inventory_label_interval', 30) * 1000)
+            self.metrics_archive.interval = get('performance', 'metrics_archive_interval', 10)
+            self.metrics_archive.retention_days = get('performance', 'metrics_archive_days', 30)
+            self.metrics_archive.max_bytes = get('performance', 'metrics_archive_max_mb', 512) * 1024 * 1024
+            if HAS_PSUTIL:
+                self.apply_monitor_mode()
+        
+        if ('optimizations', 'state_probe_ttl') in keys:
+            self.state_probe.ttl = get('optimizations', 'state_probe_ttl', 60)
+        
+        if 'throttle' in categories and hasattr(self, 'throttler'):
+            throttler = self.throttler
+            throttler.protected = {n.lower() for n in get('throttle', 'protected', [])}
+            throttler.allow = {n.lower() for n in get('throttle', 'allow', [])} | CRITICAL_PROCESSES
+            throttler.deny = {n.lower() for n in get('throttle', 'deny', [])}
+            self.terminator.protected = CRITICAL_PROCESSES | throttler.protected
+            throttler.cpu_threshold = get('throttle', 'cpu_threshold', 5.0)
+            throttler.background_cores = max(1, int(get('throttle', 'background_cores', 1)))
+            throttler.priority = get('throttle', 'priority', 'idle')
             
-            # Update monitor interval
-            if HAS_PSUTIL and hasattr(self, 'monitor_timer'):
-                self.monitor_timer.setInterval(self.interval_spin.value())
-        else:
-            self.show_notification("Hata", "Ayarlar kaydedilemedi")
+            listeners = self.process_sampler_thread.listeners
+            enabled = get('throttle', 'enabled', True)
+            throttler.enabled = enabled
+            if enabled and throttler.update not in listeners:
+                listeners.append(throttler.update)
+            elif not enabled and throttler.update in listeners:
+                listeners.remove(throttler.update)
+                # Örnekleyicide süren bir update bitene kadar beklenir; sonrakiler kısıtlama yapmaz
+                throttler.restore_all()
+        
+        if 'thermal' in categories:
+            detector = self.system_monitor.throttle
+            detector.freq_ratio = get('thermal', 'freq_ratio', 0.75)
+            detector.load_threshold = get('thermal', 'load_threshold', 50.0)
+            detector.temp_limit = get('thermal', 'temp_limit', 90.0)
+            detector.sustain = get('thermal', 'sustain', 10)
+            detector.recovery = get('thermal', 'recovery', 5)
 
 # ==============================================
 # APPLICATION ENTRY POINT
 # ==============================================
 if __name__ == "__main__":
+    # Yinelenen dosya bulucunun işlem havuzu için (PyInstaller)
+    multiprocessing.freeze_support()
+    
+    # Headless fleet modes
+    if any(arg in ('--agent', '--fleet') or arg.startswith('--fleet=') for arg in sys.argv[1:]):
+        sys.exit(run_fleet_cli(sys.argv[1:]))
+    
+    # Headless columnar export of recorded traces and operation history
+    if any(arg == '--export' or arg.startswith('--export=') for arg in sys.argv[1:]):
+        sys.exit(run_export_cli(sys.argv[1:]))
+    
+    # Trace replay: a recorded trace is fed to the app in place of psutil
+    if '--replay' in sys.argv[1:]:
+        replay_parser = argparse.ArgumentParser(prog="AlegroM.py")
+        replay_parser.add_argument('--replay', required=True, help="Kaydedilmiş iz dosyası (.jsonl.gz)")
+        replay_parser.add_argument('--speed', type=float, default=1.0, help="Tekrar hızı, 1-100x")
+        replay_parser.add_argument('--loop', action='store_true', help="İz bitince başa sar")
+        replay_args, _ = replay_parser.parse_known_args()
+        try:
+            install_system_backend(ReplayBackend(replay_args.replay, replay_args.speed, replay_args.loop))
+        except (OSError, ValueError) as e:
+            replay_parser.error(str(e))
+    
     # Check if already running
     if not check_single_instance():
         print(f"{APP_NAME} zaten çalışıyor!")
@@ -0,0 +1,416 @@
+"""
+Alegro Ultimate benchmark paketi
+
+Arayüz ve izleme yollarını Qt'nin offscreen platformunda, sentetik bir sistem
+arka ucu (5000 sahte process, hızlı değişen sayaçlar) ve sahte komut
+çalıştırıcıyla ölçer. Sonuçlar baseline.json ile karşılaştırılır; gerileme
+varsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --update-baseline
+    python benchmarks/run_benchmarks.py --only update_process_list --tolerance 0.3
+    python benchmarks/run_benchmarks.py --alloc-tolerance 0.2 --p95-tolerance 1.0
+
+Baseline makineye bağlıdır; farklı bir makinede önce --update-baseline çalıştırın.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+sys.path.insert(0, str(ROOT))
+
+# ==============================================
+# SENTETİK SİSTEM ARKA UCU
+# ==============================================
+svmem = namedtuple('svmem', 'total available percent used free')
+sdiskusage = namedtuple('sdiskusage', 'total used free percent')
+snetio = namedtuple('snetio', 'bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout')
+sdiskio = namedtuple('sdiskio', 'read_count write_count read_bytes write_bytes read_time write_time busy_time')
+sdiskpart = namedtuple('sdiskpart', 'device mountpoint fstype opts')
+snicstats = namedtuple('snicstats', 'isup duplex speed mtu')
+pmem = namedtuple('pmem', 'rss vms')
+pfullmem = namedtuple('pfullmem', 'rss vms uss')
+scpufreq = namedtuple('scpufreq', 'current min max')
+shwtemp = namedtuple('shwtemp', 'label current high critical')
+
+class SyntheticError(Exception):
+    pass
+
+class SyntheticNoSuchProcess(SyntheticError):
+    pass
+
+class SyntheticProcess:
+    """psutil.Process'un benchmark yollarında kullanılan alt kümesi"""
+    def __init__(self, backend, pid):
+        self._backend = backend
+        self.pid = pid
+        self.info = {}
+
+    def _row(self):
+        row = self._backend.table.get(self.pid)
+        if row is None:
+            raise SyntheticNoSuchProcess(self.pid)
+        return row
+
+    @contextmanager
+    def oneshot(self):
+        yield
+
+    def name(self):
+        return self._row()['name']
+
+    def exe(self):
+        return f"C:\\Program Files\\{self._row()['name']}"
+
+    def create_time(self):
+        return self._row()['create_time']
+
+    def cpu_percent(self, interval=None):
+        return self._row()['cpu']
+
+    def memory_info(self):
+        row = self._row()
+        return pmem(row['rss'], row['rss'] * 2)
+
+    def memory_full_info(self):
+        row = self._row()
+        return pfullmem(row['rss'], row['rss'] * 2, int(row['rss'] * 0.7))
+
+    def memory_percent(self):
+        return self._row()['rss'] / self._backend.total_memory * 100
+
+    def nice(self, value=None):
+        row = self._row()
+        if value is None:
+            return row['nice']
+        row['nice'] = value
+
+    def cpu_affinity(self, cpus=None):
+        row = self._row()
+        if cpus is None:
+            return list(row['affinity'])
+        row['affinity'] = list(cpus)
+
+    def children(self, recursive=False):
+        return []
+
+class SyntheticBackend:
+    """Sabit tohumlu, her çağrıda ilerleyen sahte psutil modülü"""
+    Error = SyntheticError
+    NoSuchProcess = SyntheticNoSuchProcess
+    AccessDenied = type('SyntheticAccessDenied', (SyntheticError,), {})
+    ZombieProcess = type('SyntheticZombieProcess', (SyntheticNoSuchProcess,), {})
+    # Ağ sayaçları psutil'in nowrap düzeltmesi olmadan 32 bitte taşar
+    counter_bits = 32
+
+    def __init__(self, processes=5000, nics=4, disks=4, seed=42):
+        self.rng = random.Random(seed)
+        self.total_memory = 32 * 1024 ** 3
+        self.cores = 16
+        names = [f"app{i % 700}.exe" for i in range(processes)]
+        self.table = {
+            pid: {'name': name, 'cpu': 0.0, 'rss': self.rng.randint(1, 800) * 1024 ** 2,
+                  'create_time': 1_700_000_000.0 + pid, 'nice': 0, 'affinity': list(range(self.cores))}
+            for pid, name in zip(range(1000, 1000 + processes * 4, 4), names)
+        }
+        self.next_pid = 1000 + processes * 4
+        self.nic_counters = {f"eth{i}": [0] * 8 for i in range(nics)}
+        self.disk_counters = {f"PhysicalDrive{i}": [0] * 7 for i in range(disks)}
+
+    def advance(self):
+        """Sayaçları hızla ilerletir, processlerin bir kısmını değiştirir"""
+        rng = self.rng
+        for row in self.table.values():
+            row['cpu'] = rng.random() * 3 if rng.random() < 0.9 else rng.random() * 60
+            row['rss'] += rng.randint(-4096, 8192)
+        # Process devri: birkaç çıkış, birkaç yeni başlatma
+        for pid in rng.sample(list(self.table), 10):
+            del self.table[pid]
+        for _ in range(10):
+            self.table[self.next_pid] = {
+                'name': f"new{self.next_pid % 50}.exe", 'cpu': rng.random() * 10,
+                'rss': rng.randint(1, 200) * 1024 ** 2, 'create_time': time.time(),
+                'nice': 0, 'affinity': list(range(self.cores))
+            }
+            self.next_pid += 4
+        for counters in self.nic_counters.values():
+            for i, step in enumerate((50_000_000, 20_000_000, 40_000, 20_000, 1, 1, 1, 1)):
+                # 32 bit sayaç taşması da kapsansın
+                counters[i] = (counters[i] + rng.randint(0, step)) % 2 ** 32
+        for counters in self.disk_counters.values():
+            for i, step in enumerate((2000, 2000, 100_000_000, 100_000_000, 500, 500, 900)):
+                counters[i] += rng.randint(0, step)
+
+    # --- psutil modül fonksiyonları ---
+    def process_iter(self, attrs=None):
+        for pid, row in list(self.table.items()):
+            proc = SyntheticProcess(self, pid)
+            proc.info = {
+                'pid': pid, 'name': row['name'], 'cpu_percent': row['cpu'],
+                'memory_info': pmem(row['rss'], row['rss'] * 2),
+                'memory_percent': row['rss'] / self.total_memory * 100,
+                'create_time': row['create_time']
+            }
+            yield proc
+
+    def Process(self, pid=None):
+        return SyntheticProcess(self, pid if pid is not None else next(iter(self.table)))
+
+    def cpu_percent(self, interval=None, percpu=False):
+        value = self.rng.random() * 100
+        return [value] * self.cores if percpu else value
+
+    def cpu_count(self, logical=True):
+        return self.cores if logical else self.cores // 2
+
+    def cpu_freq(self, percpu=False):
+        if not percpu:
+            return scpufreq(3600.0, 800.0, 5000.0)
+        return [scpufreq(self.rng.uniform(2400.0, 5000.0), 800.0, 5000.0) for _ in range(self.cores)]
+
+    def sensors_temperatures(self, fahrenheit=False):
+        return {'coretemp': [shwtemp(f"Core {i}", self.rng.uniform(55.0, 95.0), 90.0, 100.0)
+                             for i in range(self.cores // 2)]}
+
+    def virtual_memory(self):
+        used = int(self.total_memory * 0.55)
+        return svmem(self.total_memory, self.total_memory - used, 55.0, used, self.total_memory - used)
+
+    def disk_usage(self, path):
+        total = 1024 ** 4
+        return sdiskusage(total, total // 2, total // 2, 50.0)
+
+    def disk_partitions(self, all=False):
+        return [sdiskpart("C:\\", "C:\\", "NTFS", "rw")]
+
+    def net_io_counters(self, pernic=False):
+        if not pernic:
+            return snetio(*(sum(c[i] for c in self.nic_counters.values()) for i in range(8)))
+        return {name: snetio(*c) for name, c in self.nic_counters.items()}
+
+    def disk_io_counters(self, perdisk=False):
+        if not perdisk:
+            return sdiskio(*(sum(c[i] for c in self.disk_counters.values()) for i in range(7)))
+        return {name: sdiskio(*c) for name, c in self.disk_counters.items()}
+
+    def net_if_stats(self):
+        return {name: snicstats(True, 2, 1000, 1500) for name in self.nic_counters}
+
+    def net_if_addrs(self):
+        return {name: [] for name in self.nic_counters}
+
+    def boot_time(self):
+        return 1_700_000_000.0
+
+    def wait_procs(self, procs, timeout=None):
+        return procs, []
+
+def fake_runner(command, timeout=None, cancel_event=None, poll=0.1):
+    return {'returncode': 0, 'stdout': "OK", 'stderr': "", 'status': 'ok', 'duration': 0.0}
+
+# ==============================================
+# ÖLÇÜM
+# ==============================================
+def measure(func, iterations, warmup=3, rounds=3):
+    """Çağrı başına gecikme (ms) ve bellek ayırma (tepe KB, ayrılan blok) ölçer"""
+    for _ in range(warmup):
+        func()
+
+    # Gürültüyü azaltmak için en iyi medyanlı tur kullanılır
+    latencies = None
+    for _ in range(rounds):
+        current = []
+        for _ in range(iterations):
+            started = time.perf_counter_ns()
+            func()
+            current.append((time.perf_counter_ns() - started) / 1e6)
+        if latencies is None or statistics.median(current) < statistics.median(latencies):
+            latencies = current
+
+    # Ayırma ölçümü ayrı geçişte: tracemalloc zamanlamayı bozar
+    alloc_runs = max(1, iterations // 5)
+    tracemalloc.start()
+    peaks, blocks = [], []
+    for _ in range(alloc_runs):
+        tracemalloc.reset_peak()
+        before_size, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        peaks.append((peak - before_size) / 1024)
+        blocks.append(sum(max(0, s.count_diff) for s in after.compare_to(before, 'lineno')))
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'iterations': iterations,
+        'median_ms': round(statistics.median(latencies), 3),
+        'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+        'peak_kb': round(statistics.median(peaks), 1),
+        'alloc_blocks': int(statistics.median(blocks))
+    }
+
+def build_benchmarks(alegro, window, backend):
+    history = alegro.OperationHistory()
+    for i in range(50):
+        history.add(f"İşlem {i}", f"cmd {i}", i % 3 != 0, "sonuç", {'i': i})
+    window.operation_history = history
+    logger = alegro.Logger()
+    sampler = alegro.ProcessSampler()
+    counter = iter(range(10 ** 9))
+
+    def monitor_tick():
+        backend.advance()
+        window.update_system_monitor()
+
+    def process_snapshot():
+        backend.advance()
+        snapshot = sampler.sample()
+        window.memory_analyzer.update(snapshot)
+        window.rule_engine.update(snapshot)
+        window.on_process_snapshot(snapshot)
+
+    # İstekteki iddia: 1000 process için tick başına milisaniyeler
+    detector = alegro.MemoryLeakDetector()
+    leak_ticks = iter(range(10 ** 9))
+    leak_pids = range(1000, 2000)
+
+    def leak_detector_tick():
+        i = next(leak_ticks)
+        detector.update({'timestamp': i * 2.0, 'processes': {
+            pid: {'name': "p", 'create_time': 1.0, 'rss': (pid + i) * 4096.0, 'uss': None} for pid in leak_pids}})
+        detector.candidates()
+
+    for _ in range(detector.window):
+        leak_detector_tick()
+
+    def history_add():
+        n = next(counter)
+        history.add(f"İşlem {n}", "reg add HKLM\\Software\\Test /v X /d 1 /f", n % 2 == 0, "tamam", {'n': n})
+
+    def run_command():
+        window.command_finished("Benchmark", True, "OK", "echo ok")
+
+    return {
+        'update_system_monitor': (monitor_tick, 200),
+        'update_process_list': (window.update_process_list, 20),
+        'process_snapshot': (process_snapshot, 20),
+        'MemoryLeakDetector.1000': (leak_detector_tick, 100),
+        'OperationHistory.add': (history_add, 2000),
+        'update_history_list': (window.update_history_list, 500),
+        'Logger.log': (lambda: logger.log("INFO", "BENCH", "mesaj", {'a': 1, 'b': [1, 2, 3]}), 2000),
+        'command_finished': (run_command, 500),
+        'generate_report': (window.generate_report, 20)
+    }
+
+# Ölçüt başına mutlak pay: çok küçük değerlerde ölçüm gürültüsü göreli toleransı aşmasın
+METRIC_SLACK = {'median_ms': 0.25, 'p95_ms': 0.5, 'peak_kb': 16, 'alloc_blocks': 16}
+
+def compare(results, baseline, tolerance, alloc_tolerance=0.5, p95_tolerance=1.5):
+    # Kuyruk gecikmesi medyandan gürültülü, ayırma sayısı ise zamanlamadan bağımsızdır
+    tolerances = {'median_ms': tolerance, 'peak_kb': tolerance,
+                  'p95_ms': p95_tolerance, 'alloc_blocks': alloc_tolerance}
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, slack in METRIC_SLACK.items():
+            # Eski baseline dosyalarında bulunmayan ölçütler atlanır
+            if metric not in base:
+                continue
+            limit = base[metric] * (1 + tolerances[metric])
+            if result[metric] > limit + slack:
+                regressions.append(f"{name}.{metric}: {result[metric]} > {base[metric]} "
+                                   f"(+%{tolerances[metric] * 100:.0f})")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Alegro Ultimate benchmark paketi")
+    parser.add_argument('--update-baseline', action='store_true', help="Sonuçları baseline olarak kaydet")
+    parser.add_argument('--tolerance', type=float, default=0.75, help="İzin verilen göreli gerileme (0.75 = %%75)")
+    parser.add_argument('--alloc-tolerance', type=float, default=0.5, help="Ayırma sayısı (alloc_blocks) toleransı")
+    parser.add_argument('--p95-tolerance', type=float, default=1.5, help="p95 gecikme toleransı")
+    parser.add_argument('--only', action='append', help="Yalnızca verilen benchmark(lar)")
+    parser.add_argument('--processes', type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    # Uygulama log/rapor klasörlerini geçici dizine yazar
+    workdir = tempfile.mkdtemp(prefix="alegro_bench_")
+    os.chdir(workdir)
+    with open("alegro_settings.json", "w", encoding="utf-8") as f:
+        json.dump({'general': {'check_updates': False},
+                   'maintenance': {'enabled': False},
+                   'throttle': {'enabled': False}}, f)
+
+    import AlegroM as alegro
+    from PySide6.QtWidgets import QApplication, QMessageBox
+
+    backend = SyntheticBackend(args.processes)
+    alegro.install_system_backend(backend, fake_runner)
+    QMessageBox.information = staticmethod(lambda *a, **k: None)
+    QMessageBox.question = staticmethod(lambda *a, **k: QMessageBox.No)
+
+    app = QApplication.instance() or QApplication([])
+    window = alegro.AlegroUltimate()
+    window.show()
+    app.processEvents()
+    # Arka plan örnekleyici ve zamanlayıcılar ölçümü bozmasın
+    window.process_sampler_thread.stop()
+    window.monitor_timer.stop()
+    # Konsol çıktısı ortama bağlıdır; log dosyaya yazılmaya devam eder
+    for handler in list(logging.getLogger().handlers):
+        if type(handler) is logging.StreamHandler:
+            logging.getLogger().removeHandler(handler)
+
+    benchmarks = build_benchmarks(alegro, window, backend)
+    results = {}
+    for name, (func, iterations) in benchmarks.items():
+        if args.only and name not in args.only:
+            continue
+        results[name] = measure(func, iterations)
+        app.processEvents()
+        r = results[name]
+        print(f"{name:<24} median {r['median_ms']:>9.3f} ms  p95 {r['p95_ms']:>9.3f} ms  "
+              f"peak {r['peak_kb']:>9.1f} KB  blocks {r['alloc_blocks']:>7}")
+
+    window.quit_app()
+
+    if args.update_baseline:
+        baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8")) if BASELINE_FILE.exists() else {}
+        baseline.update(results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Baseline güncellendi: {BASELINE_FILE}")
+        return 0
+
+    if not BASELINE_FILE.exists():
+        print("Baseline yok; --update-baseline ile oluşturun")
+        return 0
+    regressions = compare(results, json.loads(BASELINE_FILE.read_text(encoding="utf-8")), args.tolerance,
+                          args.alloc_tolerance, args.p95_tolerance)
+    if regressions:
+        print("\n!!! PERFORMANS GERİLEMESİ !!!")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nBaseline ile uyumlu")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
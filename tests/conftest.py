@@ -0,0 +1,35 @@
+"""
+Alegro Ultimate testleri
+
+Modül, benchmark paketinde olduğu gibi Qt'nin offscreen platformunda ve geçici
+bir çalışma klasöründe içe aktarılır; günlük, rapor ve önbellek klasörleri depoya
+yazılmaz.
+
+Kullanım:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(tempfile.mkdtemp(prefix="alegro_test_"))
+
+import AlegroM  # noqa: E402
+
+
+@pytest.fixture
+def alegro():
+    return AlegroM
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,49 @@
+"""BackgroundThrottler: örnekleyici thread'indeki update ile arayüzdeki restore_all yarışı"""
+import threading
+
+
+def snapshot():
+    return {'timestamp': 0.0, 'processes': {
+        101: {'name': 'game.exe', 'cpu': 90.0, 'create_time': 1.0},
+        202: {'name': 'heavy.exe', 'cpu': 40.0, 'create_time': 2.0},
+    }}
+
+
+def test_restore_all_waits_for_running_update(alegro, tmp_path):
+    throttler = alegro.BackgroundThrottler(protected={'game.exe'}, deny={'heavy.exe'},
+                                           journal_path=tmp_path / 'throttle_journal.json',
+                                           foreground=lambda: None)
+    inside, release = threading.Event(), threading.Event()
+    applied, restored = [], []
+
+    def capture(pid, info):
+        # Örnekleyici update'in ortasında, process henüz kısıtlanmadan bekler
+        inside.set()
+        release.wait(5)
+        return {'name': info['name'], 'create_time': info['create_time'], 'nice': 0, 'affinity': None,
+                'baseline_cpu': info['cpu'], 'cpu': info['cpu']}
+    throttler._capture = capture
+    throttler._apply = lambda pid, original, cores: applied.append(pid) or True
+    throttler._restore_one = lambda pid, original: restored.append(pid) or True
+
+    sampler = threading.Thread(target=throttler.update, args=(snapshot(),))
+    sampler.start()
+    assert inside.wait(5)
+
+    # Ayarlardan kapatma: arayüz thread'i
+    throttler.enabled = False
+    ui = threading.Thread(target=throttler.restore_all)
+    ui.start()
+    ui.join(0.2)
+    assert ui.is_alive()
+
+    release.set()
+    sampler.join(5)
+    ui.join(5)
+    assert applied == [202] and restored == [202]
+    assert throttler.throttled == {} and not throttler.active
+    assert not throttler.journal_path.exists()
+
+    # Listeden çıkarılmadan önce kopyalanmış bir çağrı artık kısıtlama yapmaz
+    throttler.update(snapshot())
+    assert throttler.throttled == {} and applied == [202]
@@ -0,0 +1,34 @@
+"""Benchmark karşılaştırması: her ölçüt kendi toleransıyla denetlenir"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def bench():
+    path = Path(__file__).resolve().parent.parent / 'benchmarks' / 'run_benchmarks.py'
+    spec = importlib.util.spec_from_file_location('run_benchmarks', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+BASE = {'median_ms': 10.0, 'p95_ms': 20.0, 'peak_kb': 100.0, 'alloc_blocks': 1000}
+
+
+def test_alloc_regression_is_reported_alone(bench):
+    result = dict(BASE, alloc_blocks=2000)
+    (line,) = bench.compare({'tick': result}, {'tick': BASE}, tolerance=0.75)
+    assert line.startswith("tick.alloc_blocks")
+    assert bench.compare({'tick': dict(BASE, alloc_blocks=1400)}, {'tick': BASE}, tolerance=0.75) == []
+    assert bench.compare({'tick': result}, {'tick': BASE}, tolerance=0.75, alloc_tolerance=1.5) == []
+
+
+def test_p95_has_own_tolerance_and_old_baselines_pass(bench):
+    result = dict(BASE, p95_ms=60.0)
+    (line,) = bench.compare({'tick': result}, {'tick': BASE}, tolerance=0.75)
+    assert line.startswith("tick.p95_ms")
+
+    old = {'median_ms': 10.0, 'peak_kb': 100.0}
+    assert bench.compare({'tick': result}, {'tick': old}, tolerance=0.75) == []
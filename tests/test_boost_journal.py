@@ -0,0 +1,118 @@
+"""BoostJournal: çökmeden sonra yeniden oynatma, sıkıştırma, adım durumları ve günlüğün kaldırılması"""
+import json
+
+import pytest
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / 'cache' / 'boost_journal.jsonl'
+
+
+def journal(alegro, path):
+    return alegro.BoostJournal(path, sync_interval=0.0)
+
+
+def lines(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_running_step_is_marked_done_or_failed(alegro, path):
+    j = journal(alegro, path)
+    plan = j.begin("Mega Boost", [('a', "A"), ('b', "B"), ('c', "C")])
+    j.mark(plan, 'a', 'running')
+    j.mark(plan, 'b', 'running')
+    assert j.unfinished()[0]['interrupted'] == ['a', 'b']
+
+    j.mark(plan, 'a', 'done')
+    j.mark(plan, 'b', 'failed')
+    j.close()
+    (state,) = journal(alegro, path).unfinished()
+    assert state['interrupted'] == [] and state['pending'] == ['c']
+    assert state['finished'] == 2 and state['remaining'] == ['c']
+
+
+def test_truncated_last_line_is_ignored(alegro, path):
+    j = journal(alegro, path)
+    plan = j.begin("Mega Boost", [('a', "A"), ('b', "B")])
+    j.mark(plan, 'a', 'running')
+    j.close()
+    # Çökme anında yarım yazılmış satır
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "step", "plan": "%s", "key": "a", "sta' % plan)
+
+    (state,) = journal(alegro, path).unfinished()
+    assert state['plan'] == plan
+    assert state['interrupted'] == ['a'] and state['pending'] == ['b']
+
+
+def test_first_write_compacts_to_unfinished_plans(alegro, path):
+    j = journal(alegro, path)
+    plan = j.begin("Mega Boost", [('a', "A"), ('b', "B")])
+    for key in ('a', 'b'):
+        j.mark(plan, key, 'running')
+    j.mark(plan, 'a', 'done')
+    j.close()
+    assert len(lines(path)) == 4
+
+    j = journal(alegro, path)
+    other = j.begin("Tek Adım", [('x', "X")])
+    records = lines(path)
+    # Eski plan tek satırda son durumuyla, ardından yeni plan
+    assert [r['type'] for r in records] == ['plan', 'plan']
+    steps = {s['key']: s['state'] for s in records[0]['steps']}
+    assert records[0]['plan'] == plan and steps == {'a': 'done', 'b': 'running'}
+    assert records[1]['plan'] == other
+    j.close()
+
+
+def test_file_is_removed_when_no_plan_is_left(alegro, path):
+    j = journal(alegro, path)
+    first = j.begin("Mega Boost", [('a', "A")])
+    second = j.begin("Mega Boost", [('b', "B")])
+    j.mark(first, 'a', 'done')
+    assert path.exists()
+
+    j.end(second, 'cancelled')
+    assert not path.exists()
+    assert journal(alegro, path).unfinished() == []
+    # Kapanmış plana gelen geç sonuçlar günlüğü yeniden açmaz
+    j.mark(second, 'b', 'done')
+    assert not path.exists()
+
+
+class Window:
+    """Pencereden yalnızca iptal yollarını ödünç alan sahte nesne"""
+    def __init__(self, alegro, path):
+        self.boost_journal = journal(alegro, path)
+        self.boost_plans = set()
+        self.cancel_generation = 0
+        self.worker_threads = []
+        self.logger = alegro.Logger()
+
+    def show_notification(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def window(alegro, path):
+    for name in ('apply_mega_boost', 'cancel_all'):
+        setattr(Window, name, getattr(alegro.AlegroUltimate, name))
+    return Window(alegro, path)
+
+
+def test_cancel_during_probe_ends_plan(alegro, window, path):
+    plan = window.boost_journal.begin("Mega Boost", [('a', "A")])
+    generation = window.cancel_generation
+    window.cancel_generation += 1
+    window.apply_mega_boost([], {}, generation, plan)
+    assert window.boost_journal.unfinished() == [] and not path.exists()
+
+
+def test_cancel_all_ends_running_plans(alegro, window, path):
+    plan = window.boost_journal.begin("Mega Boost", [('a', "A"), ('b', "B")])
+    window.boost_plans.add(plan)
+    window.boost_journal.mark(plan, 'a', 'running')
+    window.cancel_all()
+    assert window.boost_journal.unfinished() == [] and not path.exists()
+    assert window.boost_plans == set()
@@ -0,0 +1,45 @@
+"""DiskSpaceAnalyzer: yeniden analizde önbellek ve yerinde büyüyen dosyalar"""
+import os
+
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'x' * size)
+
+
+def test_reanalysis_sees_files_growing_in_place(alegro, tmp_path):
+    write(tmp_path / 'a' / 'log.txt', 1000)
+    write(tmp_path / 'a' / 'b' / 'vm.img', 5000)
+    write(tmp_path / 'c' / 'db.sqlite', 2000)
+    analyzer = alegro.DiskSpaceAnalyzer(workers=2)
+
+    first = analyzer.analyze(str(tmp_path))
+    assert first['total_bytes'] == 8000 and first['total_files'] == 3
+    assert first['rescanned_dirs'] == 4 and first['reused_dirs'] == 0
+
+    mtime = os.stat(tmp_path / 'a').st_mtime_ns
+    with open(tmp_path / 'a' / 'log.txt', 'ab') as f:
+        f.write(b'y' * 9000)
+    # Yerinde büyüme dizin mtime'ını değiştirmez
+    assert os.stat(tmp_path / 'a').st_mtime_ns == mtime
+
+    second = analyzer.analyze(str(tmp_path))
+    assert second['reused_dirs'] == 4 and second['rescanned_dirs'] == 0
+    assert second['total_bytes'] == 17000
+    assert second['largest_files'][0] == {'path': str(tmp_path / 'a' / 'log.txt'), 'bytes': 10000}
+    sizes = {d['path']: d['bytes'] for d in second['largest_dirs']}
+    assert sizes[str(tmp_path / 'a')] == 15000
+
+
+def test_reanalysis_rescans_changed_directories(alegro, tmp_path):
+    write(tmp_path / 'a' / 'one.bin', 100)
+    analyzer = alegro.DiskSpaceAnalyzer(workers=2)
+    analyzer.analyze(str(tmp_path))
+
+    write(tmp_path / 'a' / 'new' / 'two.bin', 300)
+    (tmp_path / 'a' / 'one.bin').unlink()
+    result = analyzer.analyze(str(tmp_path))
+    assert result['total_bytes'] == 300 and result['total_files'] == 1
+    # Kök değişmedi; 'a' ve yeni alt dizin taranır
+    assert result['reused_dirs'] == 1 and result['rescanned_dirs'] == 2
+    assert [f['path'] for f in result['largest_files']] == [str(tmp_path / 'a' / 'new' / 'two.bin')]
@@ -0,0 +1,156 @@
+"""DnsBenchmark: yerel sahte DNS sunucularıyla soğuk/önbellekli ölçüm ve sıralama"""
+import socket
+import struct
+import threading
+from collections import namedtuple
+
+import pytest
+
+snicstats = namedtuple('snicstats', 'isup duplex speed mtu')
+snicaddr = namedtuple('snicaddr', 'family address netmask broadcast ptp')
+
+
+class StubResolver:
+    """İlk kez sorulan adları cold_delay, önbellekteki adları cached_delay sonra yanıtlar"""
+    def __init__(self, cold_delay=0.0, cached_delay=0.0, rcode=0, drop_every=0, silent=False):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.1)
+        self.address = f"127.0.0.1:{self.sock.getsockname()[1]}"
+        self.cold_delay = cold_delay
+        self.cached_delay = cached_delay
+        self.rcode = rcode
+        self.drop_every = drop_every
+        self.silent = silent
+        self.cache = set()
+        self.queries = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, addr = self.sock.recvfrom(512)
+            except OSError:
+                continue
+            self.queries += 1
+            if self.silent or (self.drop_every and self.queries % self.drop_every == 0):
+                continue
+            qname = data[12:data.index(b'\x00', 12)]
+            delay = self.cached_delay if qname in self.cache else self.cold_delay
+            self.cache.add(qname)
+            query_id, = struct.unpack('>H', data[:2])
+            reply = struct.pack('>HHHHHH', query_id, 0x8180 | self.rcode, 1, 0, 0, 0) + data[12:]
+            if delay:
+                threading.Timer(delay, self._reply, (reply, addr)).start()
+            else:
+                self._reply(reply, addr)
+
+    def _reply(self, reply, addr):
+        try:
+            self.sock.sendto(reply, addr)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+
+DOMAINS = ['a.test', 'b.test', 'c.test', 'd.test']
+
+
+def by_resolver(result):
+    return {r['resolver']: r for r in result['results']}
+
+
+def test_parse_resolver(alegro):
+    assert alegro.parse_resolver('1.1.1.1') == ('1.1.1.1', 53)
+    assert alegro.parse_resolver('127.0.0.1:5353') == ('127.0.0.1', 5353)
+    # IPv6 adresindeki iki nokta port sayılmaz
+    assert alegro.parse_resolver('2606:4700::1111') == ('2606:4700::1111', 53)
+
+
+def test_cold_and_cached_percentiles(alegro):
+    with StubResolver(cold_delay=0.05) as server:
+        result = alegro.DnsBenchmark([server.address], DOMAINS, rounds=2, timeout=1.0).run()
+    entry = result['results'][0]
+    assert entry['cold']['loss_percent'] == 0.0 and entry['cached']['loss_percent'] == 0.0
+    assert entry['cold']['p50'] >= 50.0
+    assert entry['cold']['p50'] <= entry['cold']['p95']
+    # Rastgele alt alan adları önbelleğe düşmez; tekrarlanan adlar düşer
+    assert entry['cached']['p50'] < 25.0
+    # Soğuk + ısınma + 2 önbellekli tur
+    assert server.queries == len(DOMAINS) * 4
+
+
+def test_ranking_prefers_fast_resolver(alegro):
+    with StubResolver(cold_delay=0.02) as fast, \
+            StubResolver(cold_delay=0.08, cached_delay=0.03) as slow:
+        result = alegro.DnsBenchmark([slow.address, fast.address], DOMAINS, rounds=2).run()
+    assert result['ranking'] == [fast.address, slow.address]
+    scores = by_resolver(result)
+    assert scores[fast.address]['score'] < scores[slow.address]['score']
+
+
+def test_lossy_resolver_ranks_after_clean_one(alegro):
+    with StubResolver() as clean, StubResolver(drop_every=3) as lossy:
+        result = alegro.DnsBenchmark([lossy.address, clean.address], DOMAINS, rounds=3,
+                                     timeout=0.3).run()
+    assert by_resolver(result)[lossy.address]['cached']['loss_percent'] > 0
+    assert result['ranking'] == [clean.address, lossy.address]
+
+
+@pytest.mark.parametrize('kwargs', [{'silent': True}, {'rcode': 2}])
+def test_non_responding_resolver_ranks_last(alegro, kwargs):
+    with StubResolver() as good, StubResolver(**kwargs) as bad:
+        result = alegro.DnsBenchmark([bad.address, good.address], DOMAINS, rounds=1,
+                                     timeout=0.3).run()
+    failed = by_resolver(result)[bad.address]
+    assert failed['score'] is None
+    assert failed['cached']['loss_percent'] == 100.0
+    # Skoru olmayan sunucu sıralamaya girmez, dolayısıyla hiçbir zaman uygulanmaz
+    assert result['ranking'] == [good.address]
+
+
+def test_unreachable_resolver(alegro):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(('127.0.0.1', 0))
+        address = f"127.0.0.1:{s.getsockname()[1]}"
+    result = alegro.DnsBenchmark([address], DOMAINS, rounds=1, timeout=0.2).run()
+    assert result['ranking'] == []
+    assert result['results'][0]['cold']['loss_percent'] == 100.0
+
+
+def test_interface_cache_returns_only_up_interfaces(alegro, monkeypatch):
+    calls = []
+    stats = {
+        'eth0': snicstats(True, 2, 1000, 1500),
+        'wlan0': snicstats(False, 0, 0, 1500),
+        'lo': snicstats(True, 0, 0, 65536),
+        'tap0': snicstats(True, 2, 100, 1500),
+    }
+    addrs = {
+        'eth0': [snicaddr(socket.AF_INET, '192.168.1.10', None, None, None)],
+        'wlan0': [snicaddr(socket.AF_INET, '192.168.1.11', None, None, None)],
+        'lo': [snicaddr(socket.AF_INET, '127.0.0.1', None, None, None)],
+        # IPv4 adresi olmayan arayüze DNS atanmaz
+        'tap0': [snicaddr(socket.AF_INET6, 'fe80::1', None, None, None)],
+    }
+    monkeypatch.setattr(alegro.psutil, 'net_if_stats', lambda: calls.append(1) or stats)
+    monkeypatch.setattr(alegro.psutil, 'net_if_addrs', lambda: addrs)
+
+    cache = alegro.NetworkInterfaceCache(ttl=60)
+    assert cache.get_active() == ['eth0']
+    stats['wlan0'] = snicstats(True, 2, 300, 1500)
+    # TTL dolmadan arayüzler yeniden sorgulanmaz
+    assert cache.get_active() == ['eth0']
+    assert len(calls) == 1
+    cache.invalidate()
+    assert cache.get_active() == ['eth0', 'wlan0']
+    assert len(calls) == 2
@@ -0,0 +1,85 @@
+"""DuplicateFinder: bulma, inceleme seçimi ve silmeden önce yeniden doğrulama"""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def scanned(alegro, tmp_path):
+    data = os.urandom(200_000)
+    for name in ('keep.bin', 'copy1.bin', 'copy2.bin'):
+        (tmp_path / name).write_bytes(data)
+    (tmp_path / 'unique.bin').write_bytes(os.urandom(200_000))
+    result = alegro.DuplicateFinder(workers=2).find([str(tmp_path)])
+    assert len(result['groups']) == 1
+    return result
+
+
+def deletions_for(result):
+    group = result['groups'][0]
+    return [{'path': path, 'mtime_ns': mtime, 'keep': group['paths'][0],
+             'keep_mtime_ns': group['mtimes'][0], 'size': group['size']}
+            for path, mtime in zip(group['paths'][1:], group['mtimes'][1:])]
+
+
+def test_review_dialog_pairs_copies_with_kept_file(alegro, qapp, scanned):
+    dialog = alegro.DuplicateReviewDialog(scanned)
+    deletions = dialog.selected_deletions()
+    group = scanned['groups'][0]
+    assert [d['path'] for d in deletions] == group['paths'][1:]
+    assert {d['keep'] for d in deletions} == {group['paths'][0]}
+
+
+def test_delete_unchanged_copies(alegro, scanned):
+    outcome = alegro.DuplicateFinder.delete(deletions_for(scanned))
+    assert outcome['deleted_files'] == 2 and outcome['freed_bytes'] == 400_000
+    assert outcome['skipped'] == [] and outcome['errors'] == []
+    assert os.path.exists(scanned['groups'][0]['paths'][0])
+
+
+def test_modified_copy_is_skipped(alegro, scanned):
+    deletions = deletions_for(scanned)
+    victim = deletions[0]['path']
+    # Aynı boyut, farklı içerik: yalnızca mtime/içerik kontrolü yakalar
+    with open(victim, 'r+b') as f:
+        f.write(b'changed')
+    outcome = alegro.DuplicateFinder.delete(deletions)
+    assert os.path.exists(victim)
+    assert outcome['deleted_files'] == 1
+    assert len(outcome['skipped']) == 1 and victim in outcome['skipped'][0]
+
+
+def test_changed_content_with_restored_mtime_is_skipped(alegro, scanned):
+    deletions = deletions_for(scanned)
+    victim = deletions[0]['path']
+    st = os.stat(victim)
+    with open(victim, 'r+b') as f:
+        f.write(b'changed')
+    os.utime(victim, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert alegro.DuplicateFinder.verify(deletions[0]) == "içerik korunan dosyadan farklı"
+    assert alegro.DuplicateFinder.delete(deletions[:1])['deleted_files'] == 0
+    assert os.path.exists(victim)
+
+
+@pytest.mark.parametrize('change', ['remove', 'modify'])
+def test_missing_or_changed_kept_file_blocks_deletion(alegro, scanned, change):
+    deletions = deletions_for(scanned)
+    keep = deletions[0]['keep']
+    if change == 'remove':
+        os.remove(keep)
+    else:
+        with open(keep, 'ab') as f:
+            f.write(b'more')
+    outcome = alegro.DuplicateFinder.delete(deletions)
+    assert outcome['deleted_files'] == 0
+    assert len(outcome['skipped']) == 2
+    assert all(os.path.exists(d['path']) for d in deletions)
+
+
+def test_moved_copy_is_skipped(alegro, scanned):
+    deletions = deletions_for(scanned)
+    victim = deletions[0]['path']
+    os.rename(victim, victim + '.moved')
+    outcome = alegro.DuplicateFinder.delete(deletions[:1])
+    assert outcome['deleted_files'] == 0 and outcome['errors'] == []
+    assert 'bulunamadı' in outcome['skipped'][0]
@@ -0,0 +1,321 @@
+"""FleetAgent/FleetController: yerel çoklu ajanla doğrulama, paralellik, zaman aşımı ve toplama"""
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+
+KEY = b"test-fleet-key"
+
+
+def operations(step_timeout=30):
+    return [
+        {'id': 'op_a', 'name': "A", 'labels': {'EN': "A"}, 'steps': [{'cmd': "step-a1"}, {'cmd': "step-a2"}]},
+        {'id': 'op_b', 'name': "B", 'labels': {'EN': "B"}, 'timeout': step_timeout,
+         'steps': [{'cmd': "step-b"}]},
+    ]
+
+
+class FakeRunner:
+    """run_process yerine: çağrıları sayar, eşzamanlılığı ölçer, istenirse bekler/başarısız olur"""
+    def __init__(self, delay=0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, command, timeout=None):
+        with self._lock:
+            self.calls.append(command)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        ok = command not in self.fail
+        return {'status': 'ok', 'returncode': 0 if ok else 1, 'duration': self.delay,
+                'stdout': "done", 'stderr': "" if ok else "boom"}
+
+
+def make_agent(alegro, tmp_path, runner, **kwargs):
+    catalog = alegro.OptimizationCatalog(operations(kwargs.pop('step_timeout', 30)), packs_dir=tmp_path / 'packs')
+    return alegro.FleetAgent(KEY, "127.0.0.1", 0, catalog=catalog, runner=runner, **kwargs)
+
+
+def make_controller(alegro, tmp_path, agents, key=KEY, step_timeout=30, **kwargs):
+    kwargs.setdefault('backoff', 0.01)
+    catalog = alegro.OptimizationCatalog(operations(step_timeout), packs_dir=tmp_path / 'packs')
+    return alegro.FleetController(agents, key, catalog=catalog, **kwargs)
+
+
+async def start(agents):
+    for agent in agents:
+        await agent.start()
+    return [f"127.0.0.1:{agent.port}" for agent in agents]
+
+
+async def stop(agents):
+    for agent in agents:
+        agent.server.close()
+        await agent.server.wait_closed()
+
+
+def test_plan_runs_on_all_agents_and_aggregates(alegro, tmp_path):
+    runners = [FakeRunner(), FakeRunner(fail={"step-b"}), FakeRunner()]
+
+    async def main():
+        agents = [make_agent(alegro, tmp_path, r) for r in runners]
+        addresses = await start(agents)
+        try:
+            return await make_controller(alegro, tmp_path, addresses).execute({'operations': None})
+        finally:
+            await stop(agents)
+
+    report = asyncio.run(main())
+    assert report['agents'] == 3 and report['succeeded'] == 3
+    assert report['failed'] == [] and report['unknown'] == []
+    assert report['operations'] == {'op_a': {'ok': 3}, 'op_b': {'ok': 2, 'failed': 1}}
+    assert set(report['metrics']['ram']) == {'before', 'after'}
+    assert all(h['attempts'] == 1 and h['status'] == 'ok' for h in report['hosts'])
+    assert [r.calls for r in runners] == [["step-a1", "step-a2", "step-b"]] * 3
+    text = alegro.FleetController.format_report(report)
+    assert "3/3 ajan başarılı" in text and "op_b: failed=1, ok=2" in text
+
+
+def test_wrong_key_fails_without_retry_or_run(alegro, tmp_path):
+    runner = FakeRunner()
+
+    async def main():
+        agents = [make_agent(alegro, tmp_path, runner)]
+        addresses = await start(agents)
+        try:
+            return await make_controller(alegro, tmp_path, addresses, key=b"wrong", retries=3).execute({})
+        finally:
+            await stop(agents)
+
+    report = asyncio.run(main())
+    host = report['hosts'][0]
+    assert host['status'] == 'failed' and host['attempts'] == 1
+    assert "doğrulama" in host['error']
+    assert runner.calls == []
+
+
+def test_concurrency_is_bounded(alegro, tmp_path):
+    runner = FakeRunner(delay=0.1)
+
+    async def main():
+        # Ajanlar aynı runner'ı paylaşır: aynı anda çalışan plan sayısı ölçülür
+        agents = [make_agent(alegro, tmp_path, runner) for _ in range(6)]
+        addresses = await start(agents)
+        try:
+            return await make_controller(alegro, tmp_path, addresses, concurrency=2).execute(
+                {'operations': ['op_b']})
+        finally:
+            await stop(agents)
+
+    report = asyncio.run(main())
+    assert report['succeeded'] == 6
+    assert runner.max_running == 2
+    assert len(runner.calls) == 6
+
+
+def test_unreachable_agent_is_retried(alegro, tmp_path):
+    import socket
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        address = f"127.0.0.1:{s.getsockname()[1]}"
+    report = make_controller(alegro, tmp_path, [address], retries=2).run({})
+    host = report['hosts'][0]
+    assert host['status'] == 'failed' and host['attempts'] == 3
+    assert "ConnectionRefusedError" in host['error']
+
+
+def test_run_timeout_is_reported_unknown_and_never_resent(alegro, tmp_path):
+    runner = FakeRunner(delay=1.5)
+
+    async def main():
+        agents = [make_agent(alegro, tmp_path, runner, heartbeat=0.1)]
+        addresses = await start(agents)
+        try:
+            controller = make_controller(alegro, tmp_path, addresses, step_timeout=0.3,
+                                         timeout=0.5, retries=3)
+            assert controller.run_budget(['op_b']) == pytest.approx(0.8)
+            report = await controller.execute({'operations': ['op_b']})
+            # Ajandaki plan bitene kadar beklenir; ikinci bir çalıştırma gelmemeli
+            await asyncio.sleep(1.2)
+            return report
+        finally:
+            await stop(agents)
+
+    report = asyncio.run(main())
+    host = report['hosts'][0]
+    assert host['status'] == 'unknown' and host['attempts'] == 1
+    assert report['unknown'][0]['agent'] == host['agent'] and report['failed'] == []
+    assert runner.calls == ["step-b"]
+    assert "⏳" in alegro.FleetController.format_report(report)
+
+
+def test_heartbeats_keep_long_run_alive(alegro, tmp_path):
+    runner = FakeRunner(delay=1.0)
+
+    async def main():
+        agents = [make_agent(alegro, tmp_path, runner, heartbeat=0.1)]
+        addresses = await start(agents)
+        try:
+            # İstek başına süre 0.4 sn, plan bütçesi 30 sn: kalp atışları bağlantıyı canlı tutar
+            return await make_controller(alegro, tmp_path, addresses, timeout=0.4).execute(
+                {'operations': ['op_b']})
+        finally:
+            await stop(agents)
+
+    report = asyncio.run(main())
+    assert report['succeeded'] == 1
+    assert report['operations'] == {'op_b': {'ok': 1}}
+
+
+def test_silent_agent_times_out_during_handshake(alegro, tmp_path):
+    async def main():
+        async def silent(reader, writer):
+            await asyncio.sleep(5)
+        server = await asyncio.start_server(silent, '127.0.0.1', 0)
+        address = f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        try:
+            return await make_controller(alegro, tmp_path, [address], timeout=0.2, retries=1).execute({})
+        finally:
+            server.close()
+
+    report = asyncio.run(main())
+    host = report['hosts'][0]
+    # Plan gönderilmeden önceki zaman aşımı güvenle yeniden denenir
+    assert host['status'] == 'failed' and host['attempts'] == 2
+    assert "TimeoutError" in host['error']
+
+
+async def handshake(alegro, port, key=KEY):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    challenge = json.loads(await reader.readline())
+    client_nonce = os.urandom(16).hex()
+    writer.write(json.dumps({'type': 'auth', 'client_nonce': client_nonce,
+                             'mac': alegro.fleet_mac(key, "client", challenge['nonce'], client_nonce)}).encode() + b"\n")
+    welcome = json.loads(await reader.readline())
+    assert welcome['type'] == 'welcome'
+    channel = alegro.FleetChannel(reader, writer,
+                                  alegro.FleetChannel.session_key_for(key, challenge['nonce'], client_nonce),
+                                  "client", "agent")
+    return channel
+
+
+@pytest.mark.parametrize('attack', ['unsigned', 'replay', 'reflect'])
+def test_injected_messages_are_rejected(alegro, tmp_path, attack):
+    runner = FakeRunner()
+
+    async def main():
+        agent = make_agent(alegro, tmp_path, runner)
+        await agent.start()
+        try:
+            channel = await handshake(alegro, agent.port)
+            await channel.send({'id': 0, 'method': 'metrics'})
+            assert (await channel.receive())['ok']
+            run = {'id': 1, 'method': 'run', 'params': {'operations': ['op_b']}}
+            if attack == 'unsigned':
+                line = json.dumps(run)
+            elif attack == 'replay':
+                # İmzalı ilk mesaj yeniden gönderilir (sıra numarası 0)
+                body = json.dumps({'id': 0, 'method': 'run', 'params': {'operations': ['op_b']}})
+                line = json.dumps({'seq': 0, 'body': body,
+                                   'mac': alegro.fleet_mac(channel.session_key, "client", "0", body)})
+            else:
+                # Ajanın yönü ile imzalanmış mesaj istemci mesajı sayılmaz
+                body = json.dumps(run)
+                line = json.dumps({'seq': 1, 'body': body,
+                                   'mac': alegro.fleet_mac(channel.session_key, "agent", "1", body)})
+            channel.writer.write(line.encode() + b"\n")
+            await channel.writer.drain()
+            # Ajan bağlantıyı yanıt vermeden kapatır
+            assert await asyncio.wait_for(channel.reader.readline(), 2) == b""
+        finally:
+            agent.server.close()
+
+    asyncio.run(main())
+    assert runner.calls == []
+
+
+def test_agent_rejects_second_concurrent_run(alegro, tmp_path):
+    runner = FakeRunner(delay=0.5)
+
+    async def main():
+        agent = make_agent(alegro, tmp_path, runner, heartbeat=0.1)
+        await agent.start()
+        try:
+            first, second = await handshake(alegro, agent.port), await handshake(alegro, agent.port)
+            run = {'method': 'run', 'params': {'operations': ['op_b']}}
+            await first.send({'id': 0, **run})
+            while not agent._run_lock.locked():
+                await asyncio.sleep(0.01)
+            await second.send({'id': 0, **run})
+            response = await second.receive()
+            while (await first.receive()).get('heartbeat'):
+                pass
+            return response
+        finally:
+            agent.server.close()
+
+    response = asyncio.run(main())
+    assert response['ok'] is False and "zaten çalışıyor" in response['error']
+    assert runner.calls == ["step-b"]
+
+
+@pytest.mark.parametrize('greeting', [b'[1, 2]\n', b'{"hello": 1}\n', b'"text"\n', b'not json\n',
+                                      b'{"type": "challenge", "nonce": 5}\n'])
+def test_non_agent_peer_fails_only_its_host(alegro, tmp_path, greeting):
+    runner = FakeRunner()
+
+    async def main():
+        async def impostor(reader, writer):
+            writer.write(greeting)
+            await writer.drain()
+            await reader.read()
+        server = await asyncio.start_server(impostor, '127.0.0.1', 0)
+        agents = [make_agent(alegro, tmp_path, runner)]
+        addresses = await start(agents) + [f"127.0.0.1:{server.sockets[0].getsockname()[1]}"]
+        try:
+            return await make_controller(alegro, tmp_path, addresses, timeout=1.0, retries=1).execute(
+                {'operations': ['op_b']})
+        finally:
+            server.close()
+            await stop(agents)
+
+    report = asyncio.run(main())
+    # Rapor yine de üretilir; yalnızca sahte eş başarısız sayılır
+    good, bad = report['hosts']
+    assert good['status'] == 'ok' and bad['status'] == 'failed'
+    assert report['succeeded'] == 1 and [h['agent'] for h in report['failed']] == [bad['agent']]
+
+
+@pytest.mark.parametrize('reply', [b'[]\n', b'{"client_nonce": ["x"]}\n', b'null\n'])
+def test_agent_rejects_malformed_auth_and_keeps_serving(alegro, tmp_path, reply):
+    runner = FakeRunner()
+
+    async def main():
+        agent = make_agent(alegro, tmp_path, runner)
+        await agent.start()
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', agent.port)
+            await reader.readline()
+            writer.write(reply)
+            await writer.drain()
+            # Ajan bağlantıyı kapatır; sonraki denetleyici normal çalışır
+            while await asyncio.wait_for(reader.readline(), 2):
+                pass
+            writer.close()
+            return await make_controller(alegro, tmp_path, [f"127.0.0.1:{agent.port}"]).execute(
+                {'operations': ['op_b']})
+        finally:
+            agent.server.close()
+
+    report = asyncio.run(main())
+    assert report['succeeded'] == 1 and runner.calls == ["step-b"]
@@ -0,0 +1,47 @@
+"""HardwareInventory: disk önbelleğine kayıt/yükleme ve yenileme"""
+import json
+
+
+def test_save_load_round_trip(alegro, tmp_path):
+    path = tmp_path / 'cache' / 'hardware.json'
+    inventory = alegro.HardwareInventory(path)
+    inventory.static = dict(inventory.basic_static(),
+                            app_version="0.0-eski",
+                            cpu={'model': "Test CPU", 'physical_cores': 4, 'logical_cores': 8},
+                            volumes=[{'device': "/dev/sda1", 'mountpoint': "/", 'fstype': "ext4", 'total': 1024}])
+    inventory.collected = 1234.5
+    inventory.save()
+
+    loaded = alegro.HardwareInventory(path)
+    assert loaded.collected == 1234.5
+    assert loaded.static['cpu']['model'] == "Test CPU"
+    assert loaded.static['volumes'] == inventory.static['volumes']
+    # Bu çalıştırmaya ait alanlar önbellekten ezilmez
+    assert loaded.static['app_version'] == alegro.APP_VERSION
+
+
+def test_other_version_or_corrupt_file_is_ignored(alegro, tmp_path):
+    path = tmp_path / 'hardware.json'
+    path.write_text(json.dumps({'version': alegro.INVENTORY_VERSION + 1, 'collected': 1.0,
+                                'static': {'volumes': [1]}}), encoding='utf-8')
+    inventory = alegro.HardwareInventory(path)
+    assert inventory.collected is None and 'volumes' not in inventory.static
+
+    path.write_text("{yarım", encoding='utf-8')
+    assert alegro.HardwareInventory(path).collected is None
+
+
+def test_refresh_reports_change_and_persists(alegro, tmp_path, monkeypatch):
+    path = tmp_path / 'hardware.json'
+    inventory = alegro.HardwareInventory(path)
+    static = dict(inventory.basic_static(), volumes=[])
+    monkeypatch.setattr(inventory, 'collect_static', lambda: dict(static))
+
+    assert inventory.refresh()
+    assert not inventory.refresh()
+    assert json.loads(path.read_text(encoding='utf-8'))['static']['volumes'] == []
+
+
+def test_dynamic_ttl_default_matches_settings(alegro, tmp_path):
+    defaults = alegro.SettingsManager().default_settings['performance']
+    assert alegro.HardwareInventory(tmp_path / 'hardware.json').dynamic_ttl == defaults['inventory_ttl']
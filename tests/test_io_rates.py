@@ -0,0 +1,32 @@
+"""IORateSampler: sayaç sıfırlanması ve taşması"""
+from collections import namedtuple
+
+snetio = namedtuple('snetio', 'bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout')
+
+
+def nic(recv, sent=0):
+    return snetio(sent, recv, 0, 0, 0, 0, 0, 0)
+
+
+def test_counter_delta_reset_and_wrap(alegro):
+    assert alegro.counter_delta(150, 100) == 50
+    # Sıfırlanma (NIC yeniden bağlandı): sahte ~4 GB sıçrama üretilmez
+    assert alegro.counter_delta(100, 5_000_000) is None
+    # Ham 32 bit sayaç veren arka uçta taşma düzeltilir
+    assert alegro.counter_delta(100, 2 ** 32 - 50, wrap_bits=32) == 150
+    assert alegro.counter_delta(100, 2 ** 40, wrap_bits=32) is None
+
+
+def test_sampler_skips_reset_sample(alegro, monkeypatch):
+    readings = iter([nic(5_000_000), nic(6_000_000), nic(100), nic(1_100)])
+    monkeypatch.setattr(alegro.psutil, 'net_io_counters', lambda pernic=True: {'eth0': next(readings)})
+    monkeypatch.setattr(alegro.psutil, 'disk_io_counters', lambda perdisk=True: {})
+    sampler = alegro.IORateSampler()
+
+    rates = [sampler.sample(now=float(t))['nics'].get('eth0') for t in range(4)]
+    assert rates[0] is None
+    assert rates[1]['rx_bps'] == 1_000_000
+    # Sıfırlanma örneği atlanır, sonraki örnek yeni tabandan hesaplanır
+    assert rates[2] is None
+    assert rates[3]['rx_bps'] == 1_000
+    assert sampler.nics['eth0'].series['rx_bps'].values() == [1_000_000, 1_000]
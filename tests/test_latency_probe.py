@@ -0,0 +1,230 @@
+"""LatencyProbe: yerel TCP/UDP echo sunucularına karşı RTT, jitter ve kayıp"""
+import socket
+import threading
+import time
+
+import pytest
+
+
+class UdpEchoServer:
+    """Gelen datagramları geri yollar; drop_every > 0 ise her n'inci paketi düşürür"""
+    def __init__(self, delay=0.0, drop_every=0):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.1)
+        self.port = self.sock.getsockname()[1]
+        self.delay = delay
+        self.drop_every = drop_every
+        self.received = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except OSError:
+                continue
+            self.received += 1
+            if self.drop_every and self.received % self.drop_every == 0:
+                continue
+            if self.delay:
+                threading.Timer(self.delay, self._reply, (data, addr)).start()
+            else:
+                self._reply(data, addr)
+
+    def _reply(self, data, addr):
+        try:
+            self.sock.sendto(data, addr)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+
+class TcpEchoServer:
+    """Bağlantıları kabul edip kapatır (TCP ölçümü bağlantı kurulum süresidir)"""
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen(64)
+        self.sock.settimeout(0.1)
+        self.port = self.sock.getsockname()[1]
+        self.accepted = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                continue
+            self.accepted += 1
+            conn.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+
+def closed_port(kind):
+    """Dinleyicisi olmayan yerel bir port"""
+    with socket.socket(socket.AF_INET, kind) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_summarize_percentiles_jitter_and_loss(alegro):
+    summary = alegro.LatencyProbe.summarize([10.0, 20.0, None, 30.0, 40.0])
+    assert summary['sent'] == 5
+    assert summary['received'] == 4
+    assert summary['loss_percent'] == 20.0
+    assert summary['min'] == 10.0 and summary['max'] == 40.0
+    assert summary['p50'] == 25.0
+    assert summary['p95'] == pytest.approx(38.5)
+    # Kayıp paket atlanır; ardışık alınan RTT farkları 10 ms
+    assert summary['jitter'] == 10.0
+
+
+def test_summarize_all_lost(alegro):
+    summary = alegro.LatencyProbe.summarize([None, None])
+    assert summary['loss_percent'] == 100.0
+    assert summary['p50'] is None and summary['jitter'] is None
+
+
+def test_tcp_echo_rtt(alegro):
+    with TcpEchoServer() as server:
+        result = alegro.LatencyProbe(
+            [{'host': '127.0.0.1', 'port': server.port, 'proto': 'tcp'}],
+            count=5, timeout=1.0, interval=0.0
+        ).run()
+    target = result['targets'][0]
+    assert target['received'] == 5 and target['loss_percent'] == 0.0
+    assert 0 < target['p50'] <= target['p95'] <= target['max'] < 1000
+    assert result['overall']['reachable_targets'] == 1
+
+
+def test_udp_echo_rtt_reflects_server_delay(alegro):
+    with UdpEchoServer(delay=0.03) as server:
+        result = alegro.LatencyProbe(
+            [{'host': '127.0.0.1', 'port': server.port, 'proto': 'udp'}],
+            count=6, timeout=1.0, interval=0.01
+        ).run()
+    target = result['targets'][0]
+    assert target['loss_percent'] == 0.0
+    assert target['p50'] >= 30.0
+    assert target['jitter'] is not None and target['jitter'] < target['p50']
+
+
+def test_udp_dropped_packets_count_as_loss(alegro):
+    with UdpEchoServer(drop_every=2) as server:
+        result = alegro.LatencyProbe(
+            [{'host': '127.0.0.1', 'port': server.port, 'proto': 'udp'}],
+            count=10, timeout=0.3, interval=0.01
+        ).run()
+    target = result['targets'][0]
+    assert target['sent'] == 10
+    assert target['received'] == 5
+    assert target['loss_percent'] == 50.0
+
+
+@pytest.mark.parametrize('proto, kind', [('tcp', socket.SOCK_STREAM), ('udp', socket.SOCK_DGRAM)])
+def test_unreachable_port_is_total_loss(alegro, proto, kind):
+    started = time.monotonic()
+    result = alegro.LatencyProbe(
+        [{'host': '127.0.0.1', 'port': closed_port(kind), 'proto': proto}],
+        count=3, timeout=0.3, interval=0.0
+    ).run()
+    target = result['targets'][0]
+    assert target['received'] == 0 and target['loss_percent'] == 100.0
+    assert target['p50'] is None
+    assert result['overall']['reachable_targets'] == 0
+    # Zaman aşımı paket başına değil seri boyunca sınırlı kalır
+    assert time.monotonic() - started < 3 * 0.3 + 1.0
+
+
+def test_targets_are_probed_concurrently(alegro):
+    with UdpEchoServer(delay=0.2) as a, UdpEchoServer(delay=0.2) as b:
+        started = time.monotonic()
+        result = alegro.LatencyProbe(
+            [{'host': '127.0.0.1', 'port': a.port, 'proto': 'udp'},
+             {'host': '127.0.0.1', 'port': b.port, 'proto': 'udp'}],
+            count=1, timeout=1.0, concurrency=2
+        ).run()
+        elapsed = time.monotonic() - started
+    assert [t['received'] for t in result['targets']] == [1, 1]
+    assert elapsed < 0.38
+
+
+def test_compare_reports_improvement_as_negative_delta(alegro):
+    before = {'overall': {'p50': 20.0, 'p95': 40.0, 'jitter': 5.0, 'loss_percent': 10.0}}
+    after = {'overall': {'p50': 15.0, 'p95': 30.0, 'jitter': 5.0, 'loss_percent': None}}
+    delta = alegro.LatencyProbe.compare(before, after)['delta']
+    assert delta == {'p50': -5.0, 'p95': -10.0, 'jitter': 0.0, 'loss_percent': None}
+
+
+class FailingProbe:
+    def run(self):
+        raise OSError("ağ yok")
+
+
+class ProbeWindow:
+    """run_with_latency_probe'u ödünç alan sahte pencere; ölçümler hazır sonuçlarla döner"""
+    def __init__(self, alegro, results):
+        self.results = results
+        self.cancel_generation = 0
+        self.latency_results = []
+        self.operation_history = alegro.OperationHistory()
+        self.settings_manager = self
+        self.notifier = self
+        self.current = object()
+        self.notifications = []
+
+    def get(self, category, key, default=None):
+        return default
+
+    def run_commands(self, name, commands, on_all_done, timeouts=None):
+        on_all_done([True] * len(commands))
+
+    def start_latency_probe(self, phase, callback):
+        callback(phase, self.results[phase])
+
+    def schedule_history_refresh(self):
+        pass
+
+    def show_notification(self, title, message):
+        self.notifications.append(title)
+
+
+def test_failed_after_probe_still_finishes_the_step(alegro, qapp):
+    thread = alegro.LatencyProbeThread("after", FailingProbe())
+    emitted = []
+    thread.result_ready.connect(lambda phase, result: emitted.append(result))
+    thread.run()
+    (failed,) = emitted
+    assert failed['error'] == "ağ yok" and failed['timestamp']
+
+    before = {'timestamp': "2026-01-01T00:00:00", 'targets': [],
+              'overall': {'p50': 20.0, 'p95': 40.0, 'jitter': 5.0, 'loss_percent': 0.0, 'reachable_targets': 1}}
+    ProbeWindow.run_with_latency_probe = alegro.AlegroUltimate.run_with_latency_probe
+    window = ProbeWindow(alegro, {'before': before, 'after': failed})
+    done = []
+    window.run_with_latency_probe("Ping", ["cmd"], on_done=done.append)
+
+    # Komutlar başarılı; yalnızca ölçüm başarısız kaydedilir
+    assert done == [True]
+    (entry,) = window.operation_history.history
+    assert entry['success'] is False and entry['details']['timestamp'] == failed['timestamp']
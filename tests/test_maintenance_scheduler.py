@@ -0,0 +1,177 @@
+"""CronExpression ve MaintenanceScheduler: sahte saat ve sahte metriklerle"""
+from datetime import datetime
+
+import pytest
+
+BUSY = {'cpu': 80.0, 'disk_busy': 50.0, 'input_idle': 0}
+IDLE = {'cpu': 2.0, 'disk_busy': 1.0, 'input_idle': 3600}
+
+
+class Clock:
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.parametrize('expr, weekdays', [
+    ('0 3 * * 7', {0}),
+    ('0 3 * * 0', {0}),
+    ('0 3 * * 5-7', {5, 6, 0}),
+    ('0 3 * * *', set(range(7))),
+])
+def test_cron_sunday_as_seven(alegro, expr, weekdays):
+    assert alegro.CronExpression(expr).weekdays == frozenset(weekdays)
+
+
+@pytest.mark.parametrize('expr', ['0 3 * * 8', '60 * * * *', '0 3 * *', '0 3 32 * *'])
+def test_cron_rejects_invalid_fields(alegro, expr):
+    with pytest.raises(ValueError):
+        alegro.CronExpression(expr)
+
+
+def test_cron_next_after(alegro):
+    # 2026-10-19 Pazartesi
+    monday = datetime(2026, 10, 19, 12, 0)
+    assert alegro.CronExpression('0 3 * * 7').next_after(monday) == datetime(2026, 10, 25, 3, 0)
+    assert alegro.CronExpression('*/15 * * * *').next_after(monday) == datetime(2026, 10, 19, 12, 15)
+    # İki gün alanı kısıtlıysa biri yeterli: ayın 1'i veya Cuma
+    assert alegro.CronExpression('0 5 1 * 5').next_after(monday) == datetime(2026, 10, 23, 5, 0)
+
+
+@pytest.fixture
+def make_scheduler(alegro, tmp_path):
+    def make(jobs, clock, metrics=None, **kwargs):
+        kwargs.setdefault('jitter', 0.0)
+        return alegro.MaintenanceScheduler(jobs, state_path=tmp_path / 'scheduler.json', clock=clock,
+                                           metrics=metrics, **kwargs)
+    return make
+
+
+def test_light_job_runs_when_due(make_scheduler):
+    clock = Clock(1_000_000.0)
+    scheduler = make_scheduler([{'id': 'ping', 'operation': 'optimize_ping', 'trigger': {'every': 3600}}],
+                               clock, metrics=lambda: BUSY)
+    assert scheduler.tick() == []
+    clock.advance(3600)
+    assert scheduler.tick() == ['ping']
+    scheduler.mark_run('ping')
+    assert scheduler.tick() == []
+    assert scheduler.state['ping']['next_due'] == clock.now + 3600
+
+
+def test_heavy_job_waits_for_sustained_idle(make_scheduler):
+    clock = Clock(1_000_000.0)
+    metrics = {'value': BUSY}
+    scheduler = make_scheduler([{'id': 'junk', 'operation': 'clean_junk', 'trigger': {'every': 60}}],
+                               clock, metrics=lambda: metrics['value'], idle_window=600)
+    clock.advance(60)
+    assert scheduler.tick() == []
+    assert scheduler.upcoming()[0]['deferred']
+
+    metrics['value'] = IDLE
+    assert scheduler.tick() == []
+    clock.advance(599)
+    assert scheduler.tick() == []
+    # Kısa bir yük boşta penceresini sıfırlar
+    metrics['value'] = BUSY
+    clock.advance(2)
+    assert scheduler.tick() == []
+    metrics['value'] = IDLE
+    scheduler.tick()
+    clock.advance(600)
+    assert scheduler.tick() == ['junk']
+
+
+def test_heavy_job_runs_after_max_deferral(make_scheduler):
+    clock = Clock(1_000_000.0)
+    scheduler = make_scheduler([{'id': 'junk', 'operation': 'clean_junk', 'trigger': {'every': 60}}],
+                               clock, metrics=lambda: BUSY, max_deferral=3600, jitter=900.0)
+    clock.advance(60)
+    assert scheduler.tick() == []
+    clock.advance(3600)
+    # Süresi aşılan iş titreşim beklemeden çalışır
+    assert scheduler.tick() == ['junk']
+
+
+def test_jitter_delays_due_job(alegro, make_scheduler):
+    import random
+    clock = Clock(1_000_000.0)
+    scheduler = make_scheduler([{'id': 'ping', 'operation': 'optimize_ping', 'trigger': {'every': 60}}],
+                               clock, metrics=lambda: IDLE, jitter=900.0, rng=random.Random(1))
+    clock.advance(60)
+    assert scheduler.tick() == []
+    run_at = scheduler.state['ping']['run_at']
+    assert clock.now < run_at <= clock.now + 900
+    clock.now = run_at
+    assert scheduler.tick() == ['ping']
+
+
+def test_missed_runs_coalesce_and_state_persists(alegro, make_scheduler):
+    clock = Clock(1_000_000.0)
+    jobs = [{'id': 'ping', 'operation': 'optimize_ping', 'trigger': {'every': 3600}}]
+    scheduler = make_scheduler(jobs, clock, metrics=lambda: IDLE)
+    first_due = scheduler.state['ping']['next_due']
+
+    # Yeniden başlatma ilk vadeyi kaydırmaz
+    clock.advance(1800)
+    assert make_scheduler(jobs, clock).state['ping']['next_due'] == first_due
+
+    clock.advance(5 * 3600)
+    scheduler = make_scheduler(jobs, clock, metrics=lambda: IDLE)
+    assert scheduler.tick() == ['ping']
+    assert scheduler.mark_run('ping') == 5
+    assert scheduler.state['ping']['runs'] == 1
+
+
+def test_outcome_is_recorded_when_operation_finishes(make_scheduler):
+    clock = Clock(1_000_000.0)
+    jobs = [{'id': 'ping', 'operation': 'optimize_ping', 'trigger': {'every': 60}}]
+    scheduler = make_scheduler(jobs, clock)
+    scheduler.mark_run('ping')
+    # Başlatılan işin sonucu henüz bilinmez
+    assert scheduler.state['ping']['last_success'] is None
+    scheduler.record_result('ping', False)
+    assert make_scheduler(jobs, clock).state['ping']['last_success'] is False
+
+
+def test_window_records_real_maintenance_outcome(alegro, make_scheduler):
+    clock = Clock(1_000_000.0)
+    scheduler = make_scheduler([{'id': 'logs', 'operation': 'clean_logs', 'trigger': {'every': 60}},
+                                {'id': 'gone', 'operation': 'no_such_op', 'trigger': {'every': 60}}],
+                               clock, metrics=lambda: IDLE, idle_window=0)
+    clock.advance(60)
+
+    class Window:
+        maintenance_step = alegro.AlegroUltimate.maintenance_step
+        run_due_maintenance = alegro.AlegroUltimate.run_due_maintenance
+
+        def __init__(self):
+            self.scheduler = scheduler
+            self.catalog = alegro.OptimizationCatalog()
+            self.operation_history = alegro.OperationHistory()
+            self.logger = alegro.Logger()
+            self.started = []
+
+        def run_optimization(self, op_id, on_done=None):
+            self.started.append((op_id, on_done))
+
+        def schedule_history_refresh(self):
+            pass
+
+    window = Window()
+    window.run_due_maintenance()
+    assert [op for op, _ in window.started] == ['clean_logs']
+    # Bilinmeyen operasyon başarısız olarak işaretlenir; başlatılan işin sonucu bekleniyor
+    assert scheduler.state['gone']['last_success'] is False
+    assert scheduler.state['logs']['last_success'] is None
+    assert window.operation_history.history == []
+
+    window.started[0][1](False)
+    assert scheduler.state['logs']['last_success'] is False
+    entry = window.operation_history.history[-1]
+    assert entry['success'] is False and entry['command'] == 'schedule:logs'
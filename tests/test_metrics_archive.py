@@ -0,0 +1,178 @@
+"""MetricsArchive: örnek aralığı, saatlik parçalar, saklama sınırları ve dışa aktarımın arşivi okuması"""
+import csv
+import gzip
+import os
+import time
+
+import pytest
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(alegro, monkeypatch):
+    clock = Clock(time.time() - 7200)
+    monkeypatch.setattr(alegro, 'system_time', clock)
+    return clock
+
+
+def test_samples_are_throttled_and_segmented(alegro, tmp_path, clock):
+    archive = alegro.MetricsArchive(tmp_path / 'metrics', interval=10, segment=60)
+    for _ in range(120):
+        archive.record(12.5)
+        clock.now += 1
+    archive.close()
+
+    segments = sorted((tmp_path / 'metrics').glob("trace_*.jsonl.gz"))
+    # 120 sn'de 12 örnek; her parça 60 sn
+    frames = [[r for r in alegro.read_trace(p) if r['type'] == 'system'] for p in segments]
+    assert sum(len(f) for f in frames) == 12
+    assert [len(f) for f in frames] == [6, 6]
+
+
+def test_exporter_reads_archive(alegro, tmp_path, clock):
+    archive = alegro.MetricsArchive(tmp_path / 'metrics', interval=5)
+    for _ in range(4):
+        archive.record(40.0)
+        clock.now += 5
+    archive.close()
+
+    exporter = alegro.ColumnarExporter(tmp_path / 'out', fmt='csv', archive_dir=tmp_path / 'metrics',
+                                       traces_dir=tmp_path / 'recordings', logs_dir=tmp_path / 'logs',
+                                       host='testhost')
+    report = exporter.export(('metrics',))
+    assert report['traces'] == 1 and report['tables']['metrics']['rows'] == 4
+    with gzip.open(report['tables']['metrics']['path'], 'rt', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert {row['cpu_percent'] for row in rows} == {'40.0'}
+    assert rows[0]['source'].startswith("trace_")
+
+
+def test_prune_applies_retention_then_size(alegro, tmp_path):
+    directory = tmp_path / 'metrics'
+    directory.mkdir()
+    now = time.time()
+    for index, age_days in enumerate((40, 3, 2, 1)):
+        path = directory / f"trace_2026010{index}_000000.jsonl.gz"
+        path.write_bytes(b"x" * 1000)
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    archive = alegro.MetricsArchive(directory, retention_days=30, max_bytes=2500)
+    assert archive.prune() == 2
+    assert sorted(p.name for p in directory.iterdir()) == ["trace_20260102_000000.jsonl.gz",
+                                                           "trace_20260103_000000.jsonl.gz"]
+
+
+def snapshot(now, processes):
+    return {'timestamp': now, 'processes': {
+        pid: {'name': name, 'cpu': cpu, 'rss': rss, 'uss': None, 'create_time': 1000.0 + pid}
+        for pid, (name, cpu, rss) in processes.items()
+    }}
+
+
+# Ardışık process durumları: ekleme, değişiklik, çıkış
+STATES = [
+    {1: ("init", 0.0, 100), 2: ("game", 50.0, 2000)},
+    {1: ("init", 0.0, 100), 2: ("game", 60.0, 2100), 3: ("chat", 1.0, 300)},
+    {1: ("init", 0.0, 100), 3: ("chat", 2.0, 300)},
+    {1: ("init", 0.0, 100), 3: ("chat", 2.0, 300), 4: ("bot", 5.0, 50)},
+    {4: ("bot", 6.0, 60)},
+]
+
+
+def exporter(alegro, tmp_path, **kwargs):
+    kwargs.setdefault('fmt', 'csv')
+    return alegro.ColumnarExporter(tmp_path / 'out', archive_dir=tmp_path / 'metrics',
+                                   traces_dir=tmp_path / 'recordings', logs_dir=tmp_path / 'logs',
+                                   host='testhost', **kwargs)
+
+
+def read_csv(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_processes_are_rebuilt_from_keyframes_and_deltas(alegro, tmp_path, clock):
+    start = clock.now
+    recorder = alegro.TraceRecorder(tmp_path / 'recordings' / 'trace_test.jsonl.gz', keyframe_every=2)
+    for index, state in enumerate(STATES):
+        recorder.record_processes(snapshot(start + index, state))
+    recorder.close()
+    frames = [r for r in alegro.read_trace(recorder.path) if r['type'] == 'processes']
+    assert [bool(f.get('full')) for f in frames] == [True, False, True, False, True]
+
+    report = exporter(alegro, tmp_path, process_interval=0).export(('processes',))
+    rows = read_csv(report['tables']['processes']['path'])
+    rebuilt = {}
+    for row in rows:
+        stamp = alegro.datetime.fromisoformat(row['timestamp']).timestamp()
+        rebuilt.setdefault(round(stamp - start), {})[int(row['pid'])] = (
+            row['name'], float(row['cpu_percent']), int(row['rss']))
+    assert rebuilt == dict(enumerate(STATES))
+
+
+def test_archive_records_process_snapshots(alegro, tmp_path, clock):
+    archive = alegro.MetricsArchive(tmp_path / 'metrics', interval=10)
+    for second in range(30):
+        archive.record_processes(snapshot(clock.now + second, STATES[0]))
+    archive.close()
+
+    report = exporter(alegro, tmp_path, process_interval=0).export(('processes',))
+    # 30 sn'de 3 anlık görüntü, her biri 2 process
+    assert report['tables']['processes']['rows'] == 6
+
+
+def test_time_range_filters_rows(alegro, tmp_path, clock):
+    start = clock.now
+    archive = alegro.MetricsArchive(tmp_path / 'metrics', interval=0)
+    for second in range(10):
+        clock.now = start + second
+        archive.record(float(second))
+        archive.record_processes(snapshot(clock.now, STATES[second % len(STATES)]))
+    archive.close()
+
+    report = exporter(alegro, tmp_path, since=start + 3, until=start + 6,
+                      process_interval=0).export(('metrics', 'processes'))
+    metrics = read_csv(report['tables']['metrics']['path'])
+    assert [float(row['cpu_percent']) for row in metrics] == [3.0, 4.0, 5.0, 6.0]
+    processes = read_csv(report['tables']['processes']['path'])
+    # Aralıktan önceki kareler durumu kurar; yalnızca aralıktakiler yazılır
+    expected = sum(len(STATES[second % len(STATES)]) for second in range(3, 7))
+    assert len(processes) == expected
+
+
+@pytest.mark.parametrize('fmt', ['arrow', 'parquet'])
+def test_columnar_sinks(alegro, tmp_path, clock, fmt):
+    pa = pytest.importorskip('pyarrow')
+    if fmt not in alegro.export_formats():
+        pytest.skip(f"{fmt} kullanılamıyor")
+    archive = alegro.MetricsArchive(tmp_path / 'metrics', interval=0)
+    for second in range(5):
+        clock.now += 1
+        archive.record(10.0 + second)
+        archive.record_processes(snapshot(clock.now, STATES[0]))
+    archive.close()
+
+    report = exporter(alegro, tmp_path, fmt=fmt, chunk_rows=2,
+                      process_interval=0).export(('metrics', 'processes'))
+    assert report['format'] == fmt
+    tables = {}
+    for name, info in report['tables'].items():
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            tables[name] = pq.read_table(info['path'])
+        else:
+            with pa.OSFile(info['path'], 'rb') as f:
+                tables[name] = pa.ipc.open_file(f).read_all()
+    metrics, processes = tables['metrics'], tables['processes']
+    assert metrics.num_rows == 5 and processes.num_rows == 10
+    assert report['tables']['metrics']['chunks'] == 3
+    assert metrics.schema.field('timestamp').type == pa.timestamp('us', tz='UTC')
+    assert metrics.column('cpu_percent').to_pylist() == [10.0, 11.0, 12.0, 13.0, 14.0]
+    assert set(processes.column('name').to_pylist()) == {"init", "game"}
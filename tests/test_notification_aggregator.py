@@ -0,0 +1,97 @@
+"""NotificationAggregator: toplu iş özetleri, asenkron devamlar, zaman aşımı ve pencere birleştirme"""
+import pytest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def notifier(alegro, clock):
+    return alegro.NotificationAggregator(window=2.0, max_lines=3, stale_after=600.0, clock=clock)
+
+
+def test_batch_drains_to_single_summary(notifier, clock):
+    batch = notifier.begin("Mega Boost")
+    with notifier.scope(batch):
+        for name in ("A", "B", "C"):
+            notifier.step_started(batch, name)
+            # Adım bildirimleri özet dışında gösterilmez
+            assert not notifier.post("Başarılı", f"{name} tamam")
+    notifier.close(batch)
+    notifier.step_finished(batch, "A", True)
+    notifier.step_finished(batch, "B", False)
+    assert notifier.flush() == []
+
+    clock.now += 4.0
+    notifier.step_finished(batch, "C", True)
+    (summary,) = notifier.flush()
+    assert summary == ("Tamamlandı (hatalı)", "Mega Boost: 2/3 adım başarılı (4.0 sn)\nHatalı: B")
+    assert notifier.progress() is None and notifier.flush() == []
+
+
+def test_held_continuation_keeps_batch_open(notifier):
+    batch = notifier.begin("DNS")
+    with notifier.scope(batch):
+        held = notifier.hold()
+    assert held == batch
+    notifier.close(batch)
+    assert notifier.flush() == []
+
+    # Devam kendi adımını başlatıp bıraktıktan sonra özet çıkar
+    notifier.step_started(held, "netsh")
+    notifier.release(held)
+    notifier.step_finished(held, "netsh", True)
+    (summary,) = notifier.flush()
+    assert summary[0] == "Tamamlandı" and summary[1].startswith("DNS: 1/1 adım başarılı")
+
+
+def test_stale_batch_is_reported_after_timeout(notifier, clock):
+    batch = notifier.begin("Mega Boost")
+    notifier.step_started(batch, "A")
+    notifier.step_started(batch, "B")
+    notifier.close(batch)
+    notifier.step_finished(batch, "A", True)
+    clock.now += 600.0
+    assert notifier.flush() == []
+
+    clock.now += 0.1
+    (summary,) = notifier.flush()
+    assert summary[0] == "Tamamlandı (hatalı)"
+    assert summary[1].startswith("Mega Boost: 1/2") and summary[1].endswith("Bazı adımlardan yanıt alınamadı")
+    # Geç gelen sonuç kapanmış toplu işi yeniden açmaz
+    notifier.step_finished(batch, "B", True)
+    assert notifier.flush() == []
+
+
+def test_notifications_in_one_window_are_merged(notifier):
+    assert notifier.post("Hata", "X başarısız")
+    (single,) = notifier.flush()
+    assert single == ("Hata", "X başarısız")
+
+    for message in ("A", "B", "A", "C", "D"):
+        notifier.post("Bilgi", message)
+    (merged,) = notifier.flush()
+    assert merged[0] == "5 bildirim"
+    # Tekrarlar tek satır, fazlası sayı olarak gösterilir
+    assert merged[1] == "Bilgi: A\nBilgi: B\nBilgi: C\n+1 bildirim daha"
+    assert notifier.flush() == []
+
+
+def test_progress_combines_running_batches(notifier):
+    first = notifier.begin("Mega Boost")
+    second = notifier.begin("Temizlik")
+    notifier.step_started(first, "A")
+    notifier.step_progress(first, "A", 40)
+    notifier.step_started(second, "B")
+    notifier.step_finished(second, "B", True)
+    assert notifier.progress() == {'label': "Mega Boost, Temizlik", 'done': 1, 'total': 2, 'running': 1}
@@ -0,0 +1,35 @@
+"""OptimizationCatalog: eklenti paketleri ve handler beyaz listesi"""
+import json
+
+import pytest
+
+
+def op(op_id, **extra):
+    return {'id': op_id, 'name': op_id, 'labels': {'EN': op_id}, 'steps': [{'cmd': f"echo {op_id}"}], **extra}
+
+
+def test_pack_entry_with_handler_is_rejected(alegro, tmp_path):
+    packs = tmp_path / 'packs'
+    packs.mkdir()
+    (packs / 'third_party.json').write_text(json.dumps({'operations': [
+        op('pack_quit', handler='quit_app'),
+        op('pack_ram', handler='clean_ram'),
+        op('pack_ok'),
+    ]}), encoding='utf-8')
+
+    catalog = alegro.OptimizationCatalog(packs_dir=packs)
+    loaded = catalog.load_packs()
+    # Reddedilen girdiler paketin geri kalanını engellemez
+    assert [e.id for e in loaded] == ['pack_ok']
+    assert catalog.get('pack_quit') is None and catalog.get('pack_ram') is None
+
+
+def test_builtin_handlers_are_whitelisted(alegro, tmp_path):
+    catalog = alegro.OptimizationCatalog(packs_dir=tmp_path / 'packs')
+    handlers = {e.handler for e in catalog.builtin() if e.handler}
+    assert handlers and handlers <= alegro.OPERATION_HANDLERS
+
+    with pytest.raises(ValueError):
+        alegro.OptimizationEntry(op('typo', handler='clean_rma'))
+    with pytest.raises(ValueError):
+        alegro.OptimizationEntry(op('pack', handler='clean_ram'), source='pack')
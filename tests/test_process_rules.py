@@ -0,0 +1,104 @@
+"""ProcessRuleStore/ProcessRuleEngine: atomik kayıt, isabet sayımı, canlı uygulama (Linux)"""
+import json
+import subprocess
+import sys
+
+import psutil
+import pytest
+
+
+@pytest.fixture
+def store(alegro, tmp_path):
+    return alegro.ProcessRuleStore(tmp_path / 'process_rules.json')
+
+
+@pytest.fixture
+def children():
+    procs = [subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']) for _ in range(3)]
+    yield procs
+    for proc in procs:
+        proc.kill()
+        proc.wait()
+
+
+def snapshot(procs):
+    return {'timestamp': 0.0, 'processes': {
+        p.pid: {'name': psutil.Process(p.pid).name(), 'create_time': psutil.Process(p.pid).create_time()}
+        for p in procs
+    }}
+
+
+def test_save_is_atomic(alegro, store, monkeypatch):
+    store.add({'pattern': 'game.exe', 'priority': 'high'})
+    before = store.path.read_text(encoding='utf-8')
+
+    def disk_full(fd):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(alegro.os, 'fsync', disk_full)
+    store.record_hit(store.rules[-1])
+    assert store.save() is False
+    # Yarıda kalan yazım mevcut dosyaya dokunmaz, kayıt yeniden denenir
+    assert store.path.read_text(encoding='utf-8') == before
+    assert store._dirty
+    monkeypatch.undo()
+    store.flush()
+    assert json.loads(store.path.read_text(encoding='utf-8'))['rules'][-1]['hits'] == 1
+
+
+def test_corrupt_file_is_kept_aside(alegro, tmp_path):
+    path = tmp_path / 'process_rules.json'
+    path.write_text('{"rules": [{"pattern": "mine.exe"', encoding='utf-8')
+    store = alegro.ProcessRuleStore(path)
+    assert [r['pattern'] for r in store.rules] == [r['pattern'] for r in alegro.DEFAULT_PROCESS_RULES]
+    store.save()
+    assert (tmp_path / 'process_rules.json.bad').read_text(encoding='utf-8').startswith('{"rules"')
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="nice/affinity Linux'ta doğrulanır")
+def test_rule_applies_nice_and_affinity_to_new_children(alegro, store, children):
+    name = psutil.Process(children[0].pid).name()
+    store.rules = []
+    rule = store.add({'pattern': name, 'match': 'name', 'priority': 'below_normal', 'affinity': [0]})
+    engine = alegro.ProcessRuleEngine(store)
+
+    engine.update(snapshot(children))
+    for child in children:
+        proc = psutil.Process(child.pid)
+        assert proc.nice() == 10
+        assert proc.cpu_affinity() == [0]
+    assert rule['hits'] == len(children)
+    events = engine.drain_events()
+    assert {e['pid'] for e in events} == {c.pid for c in children}
+    assert all(e['applied'] == {'priority': 'below_normal', 'affinity': [0]} for e in events)
+
+    # Aynı processler bir sonraki örnekte yeniden işlenmez
+    engine.update(snapshot(children))
+    assert rule['hits'] == len(children)
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="glob/exe eşleşmesi Linux'ta doğrulanır")
+def test_glob_rule_matches_executable_path(alegro, store, children):
+    store.rules = []
+    rule = store.add({'pattern': '*python*', 'match': 'glob', 'priority': 'idle'})
+    engine = alegro.ProcessRuleEngine(store)
+    engine.update(snapshot(children[:1]))
+    assert psutil.Process(children[0].pid).nice() == 19
+    assert rule['hits'] == 1
+
+
+def test_failed_apply_is_not_counted_as_hit(alegro, store, monkeypatch):
+    class Denied:
+        pid = 1234
+
+        def nice(self, value=None):
+            raise alegro.psutil.AccessDenied(1234)
+
+        def cpu_affinity(self, cpus=None):
+            raise alegro.psutil.AccessDenied(1234)
+
+    monkeypatch.setattr(alegro.psutil, 'Process', lambda pid: Denied())
+    rule = store.add({'pattern': 'game.exe', 'priority': 'high', 'affinity': [0]})
+    event = alegro.ProcessRuleEngine(store).apply(1234, 'game.exe', rule)
+    assert event['applied'] == {}
+    assert len(event['errors']) == 2
+    assert rule['hits'] == 0 and rule['last_hit'] is None
@@ -0,0 +1,132 @@
+"""ProcessTerminator: süreç ağaçları, terminate -> kill tırmandırması, korunan processler ve süre sınırı (Linux)"""
+import ctypes
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'), reason="POSIX sinyalleri gerekir")
+
+CHILD = "import signal, sys, time\n" \
+        "if sys.argv[1] == 'stubborn': signal.signal(signal.SIGTERM, signal.SIG_IGN)\n" \
+        "print('ready', flush=True)\n" \
+        "time.sleep(60)\n"
+
+ROOT = f"""
+import json, subprocess, sys, threading, time
+child = {CHILD!r}
+procs = [subprocess.Popen([sys.executable, '-c', child, mode], stdout=subprocess.PIPE, text=True)
+         for mode in ('stubborn', 'polite')]
+for proc in procs:
+    proc.stdout.readline()
+sleeper = subprocess.Popen(['sleep', '60'])
+for proc in procs + [sleeper]:
+    threading.Thread(target=proc.wait, daemon=True).start()
+print(json.dumps({{'stubborn': procs[0].pid, 'polite': procs[1].pid, 'sleep': sleeper.pid}}), flush=True)
+time.sleep(60)
+"""
+
+
+PR_SET_CHILD_SUBREAPER = 36
+
+
+@pytest.fixture
+def tree():
+    # Öksüz kalan torunlar test sürecine bağlanır ve psutil tarafından biçilir;
+    # aksi halde init'i biçmeyen konteynerlerde zombi olarak "hayatta" kalırlar
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.prctl(PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0)
+    root = subprocess.Popen([sys.executable, '-c', ROOT], stdout=subprocess.PIPE, text=True)
+    pids = json.loads(root.stdout.readline())
+    pids['root'] = root.pid
+    yield pids
+    for pid in pids.values():
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    root.wait()
+    # Kök biçildikten sonra torunlar test sürecine bağlanmıştır
+    for pid in pids.values():
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+    libc.prctl(PR_SET_CHILD_SUBREAPER, 0, 0, 0, 0)
+
+
+def alive(pid):
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def test_tree_is_terminated_with_kill_escalation(alegro, tree):
+    terminator = alegro.ProcessTerminator(protected={'sleep'}, grace=0.5, kill_timeout=2.0)
+    report = terminator.terminate([tree['root']])
+
+    # Kök ve iki Python alt süreci; 'sleep' korunduğu için atlanır
+    assert report['processes'] == 3
+    assert report['skipped'] == [{'pid': tree['sleep'], 'name': 'sleep'}]
+    assert report['terminated'] == 2 and report['killed'] == 1
+    assert report['survived'] == [] and report['denied'] == []
+    assert not alive(tree['root']) and not alive(tree['polite']) and not alive(tree['stubborn'])
+    assert alive(tree['sleep'])
+
+
+def test_protected_root_is_skipped_but_children_are_not(alegro, tree):
+    name = psutil.Process(tree['root']).name()
+    terminator = alegro.ProcessTerminator(protected={name}, grace=0.5, kill_timeout=1.0)
+    report = terminator.terminate([tree['root']])
+
+    # Tüm Python süreçleri aynı adı taşır: yalnız 'sleep' sonlandırılır
+    assert {p['pid'] for p in report['skipped']} == {tree['root'], tree['stubborn'], tree['polite']}
+    assert report['processes'] == 1 and report['terminated'] == 1
+    assert not alive(tree['sleep']) and alive(tree['root'])
+
+
+def test_own_process_is_never_signalled(alegro):
+    terminator = alegro.ProcessTerminator(protected=set(), grace=0.2, kill_timeout=0.2)
+    report = terminator.terminate([os.getpid()])
+    assert report['processes'] == 0
+    assert report['skipped'][0]['pid'] == os.getpid()
+
+
+def test_total_time_is_capped_when_kill_fails(alegro, tree, monkeypatch):
+    # Öldürülemeyen bir süreç (ör. D durumunda) taklit edilir: kill sinyali yutulur
+    real_kill = psutil.Process.kill
+
+    def kill(self):
+        if self.pid != tree['stubborn']:
+            real_kill(self)
+    monkeypatch.setattr(psutil.Process, 'kill', kill)
+
+    terminator = alegro.ProcessTerminator(protected={'sleep'}, grace=0.5, kill_timeout=0.5)
+    started = time.monotonic()
+    report = terminator.terminate([tree['root']])
+    elapsed = time.monotonic() - started
+
+    assert elapsed < terminator.grace + terminator.kill_timeout + 1.0
+    assert report['duration'] <= round(elapsed, 2) + 0.01
+    assert report['survived'] == [{'pid': tree['stubborn'], 'name': psutil.Process(tree['stubborn']).name()}]
+    assert report['terminated'] == 2 and report['killed'] == 0
+    assert alive(tree['stubborn'])
+
+
+def test_reused_pid_is_not_signalled(alegro, tree):
+    terminator = alegro.ProcessTerminator(protected=set(), grace=0.5, kill_timeout=0.5)
+    create_time = psutil.Process(tree['root']).create_time()
+    # Seçimdeki başlangıç zamanı tutmuyor: PID artık başka bir processe ait sayılır
+    report = terminator.terminate([(tree['root'], create_time - 10)])
+    assert report['processes'] == 0
+    assert all(alive(pid) for pid in tree.values())
+
+    report = terminator.terminate([(tree['root'], create_time)])
+    assert report['processes'] == 4
+    assert not any(alive(pid) for pid in tree.values())
@@ -0,0 +1,100 @@
+"""run_process / kill_process_tree: süre aşımı, iptal ve geride torun süreç kalmaması (Linux)"""
+import ctypes
+import os
+import signal
+import sys
+import threading
+
+import psutil
+import pytest
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'), reason="POSIX süreç grupları gerekir")
+
+PR_SET_CHILD_SUBREAPER = 36
+
+
+@pytest.fixture
+def reaper():
+    # Öldürülen shell'in torunları test sürecine bağlanır ve burada biçilir
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.prctl(PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0)
+    spawned = []
+    yield spawned
+    for pid in spawned:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    while True:
+        try:
+            if os.waitpid(-1, os.WNOHANG) == (0, 0):
+                break
+        except ChildProcessError:
+            break
+    libc.prctl(PR_SET_CHILD_SUBREAPER, 0, 0, 0, 0)
+
+
+def alive(pid):
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def grandchild(pidfile, reaper):
+    pid = int(pidfile.read_text().strip())
+    reaper.append(pid)
+    return pid
+
+
+def test_output_and_exit_code(alegro):
+    result = alegro.run_process("echo merhaba; echo hata >&2; exit 3", timeout=10)
+    assert result['status'] == 'ok' and result['returncode'] == 3
+    assert result['stdout'] == "merhaba\n" and result['stderr'] == "hata\n"
+
+
+def test_timeout_kills_shell_child(alegro, reaper, tmp_path):
+    pidfile = tmp_path / 'child.pid'
+    result = alegro.run_process(f"sleep 30 & echo $! > {pidfile}; wait", timeout=0.5)
+    assert result['status'] == 'timeout'
+    assert result['duration'] < 10
+    assert not alive(grandchild(pidfile, reaper))
+
+
+def test_sigterm_ignoring_tree_is_killed(alegro, reaper, tmp_path):
+    pidfile = tmp_path / 'child.pid'
+    # Yok sayılan sinyal exec ile alt sürece de geçer; ağaç ancak SIGKILL ile durur
+    result = alegro.run_process(f"trap '' TERM; sleep 30 & echo $! > {pidfile}; wait", timeout=0.5)
+    assert result['status'] == 'timeout'
+    # Torun çıktı borusunu açık tutsaydı communicate() onun bitmesini beklerdi
+    assert result['duration'] < 10
+    assert not alive(grandchild(pidfile, reaper))
+
+
+def test_cancel_event_stops_unbounded_command(alegro, reaper, tmp_path):
+    pidfile = tmp_path / 'child.pid'
+    cancel = threading.Event()
+    timer = threading.Timer(0.3, cancel.set)
+    timer.start()
+    try:
+        result = alegro.run_process(f"sleep 30 & echo $! > {pidfile}; wait", timeout=None, cancel_event=cancel)
+    finally:
+        timer.cancel()
+    assert result['status'] == 'cancelled'
+    assert result['duration'] < 10
+    assert not alive(grandchild(pidfile, reaper))
+
+
+def test_process_group_fallback_without_psutil(alegro, reaper, tmp_path, monkeypatch):
+    monkeypatch.setattr(alegro, 'HAS_PSUTIL', False)
+    pidfile = tmp_path / 'child.pid'
+    result = alegro.run_process(f"sleep 30 & echo $! > {pidfile}; wait", timeout=0.5)
+    assert result['status'] == 'timeout'
+    assert result['duration'] < 10
+    assert not alive(grandchild(pidfile, reaper))
+
+
+def test_kill_process_tree_of_missing_pid(alegro):
+    proc = psutil.Popen([sys.executable, '-c', "pass"])
+    proc.wait()
+    assert alegro.kill_process_tree(proc.pid) == 0
@@ -0,0 +1,117 @@
+"""StateProbe: yoklanamayan işlemlerin tekrar aralığı ve boost'ta yeniden çalıştırılmaması"""
+import pytest
+
+
+def entry(alegro, op_id, **extra):
+    spec = {'id': op_id, 'name': op_id, 'labels': {'EN': op_id}, 'steps': [{'cmd': f"echo {op_id}"}]}
+    spec.update(extra)
+    return alegro.OptimizationEntry(spec)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def test_unchecked_entry_is_held_for_repeat_window(alegro, clock):
+    probe = alegro.StateProbe(ttl=60, clock=clock)
+    defrag = entry(alegro, 'defrag', repeat_after=3600)
+    assert not probe.recently_run(defrag)
+
+    probe.record_run(defrag)
+    clock.now += 3599
+    assert probe.recently_run(defrag)
+    clock.now += 1
+    assert not probe.recently_run(defrag)
+
+
+def test_ttl_is_default_window_and_checked_entries_are_never_held(alegro, clock):
+    probe = alegro.StateProbe(ttl=60, clock=clock)
+    ram = entry(alegro, 'clean_ram', handler='clean_ram')
+    checked = entry(alegro, 'reg', steps=[{'cmd': "reg add", 'check': {'type': 'reg', 'key': "K",
+                                                                       'value': 'V', 'expected': 1}}])
+    probe.record_run(ram)
+    probe.record_run(checked)
+    clock.now += 30
+    assert probe.recently_run(ram)
+    # Kontrolü olan işlem her seferinde yoklanır; kayıt tutulmaz
+    assert not probe.recently_run(checked)
+    clock.now += 30
+    assert not probe.recently_run(ram)
+
+
+def test_runs_survive_restart(alegro, clock, tmp_path):
+    path = tmp_path / 'cache' / 'operation_runs.json'
+    defrag = entry(alegro, 'defrag', repeat_after=3600)
+    alegro.StateProbe(runs_path=path, clock=clock).record_run(defrag)
+    assert alegro.StateProbe(runs_path=path, clock=clock).recently_run(defrag)
+
+    path.write_text("{bozuk", encoding='utf-8')
+    assert not alegro.StateProbe(runs_path=path, clock=clock).recently_run(defrag)
+
+
+def test_builtin_unchecked_entries_have_long_windows(alegro, tmp_path):
+    catalog = alegro.OptimizationCatalog(packs_dir=tmp_path / 'packs')
+    defrag = catalog.get('defrag_disk')
+    assert alegro.StateProbe.unverifiable(defrag)
+    assert defrag.repeat_after >= 24 * 3600
+
+
+class Window:
+    """Pencereden yalnızca boost döngüsünü ödünç alan sahte nesne"""
+    def __init__(self, alegro, tmp_path, clock):
+        self.state_probe = alegro.StateProbe(clock=clock)
+        self.boost_journal = alegro.BoostJournal(tmp_path / 'boost_journal.jsonl', sync_interval=0.0)
+        self.operation_history = alegro.OperationHistory()
+        self.cancel_generation = 0
+        self.logger = alegro.Logger()
+        self.applied = []
+
+    def apply_entry(self, entry, snapshot, notify_skip=True, on_done=None):
+        self.applied.append(entry.id)
+        if on_done:
+            on_done(True)
+        return True
+
+    def clean_ram(self, entry, on_done):
+        self.applied.append(entry.id)
+        if on_done:
+            on_done(True)
+
+    def schedule_history_refresh(self):
+        pass
+
+    def schedule_journal_sync(self):
+        pass
+
+
+@pytest.fixture
+def window(alegro, tmp_path, clock):
+    for name in ('apply_mega_boost', 'boost_step', 'recording_run'):
+        setattr(Window, name, getattr(alegro.AlegroUltimate, name))
+    return Window(alegro, tmp_path, clock)
+
+
+def test_repeat_boost_skips_recently_run_entries(alegro, window, clock):
+    entries = [entry(alegro, 'defrag', repeat_after=3600),
+               entry(alegro, 'clean_ram', handler='clean_ram'),
+               entry(alegro, 'reg', steps=[{'cmd': "reg add", 'check': {'type': 'reg', 'key': "K",
+                                                                         'value': 'V', 'expected': 1}}])]
+    window.apply_mega_boost(entries, {})
+    assert window.applied == ['defrag', 'clean_ram', 'reg']
+
+    window.applied = []
+    clock.now += 120
+    plan = window.boost_journal.begin("Mega Boost", [(e.id, e.name) for e in entries])
+    window.apply_mega_boost(entries, {}, plan=plan)
+    # TTL'i dolan RAM temizliği ve kontrollü adım yeniden çalışır; defrag bekler
+    assert window.applied == ['clean_ram', 'reg']
+    assert window.boost_journal.unfinished() == []
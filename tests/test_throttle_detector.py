@@ -0,0 +1,154 @@
+"""ThrottleDetector: sahte sensör kaynağıyla dönem sınırları, boşta frekans düşüşü ve yalnız sıcaklık yolu"""
+from collections import namedtuple
+
+import pytest
+
+Freq = namedtuple('Freq', 'current min max')
+Temp = namedtuple('Temp', 'label current high critical')
+
+
+class FakeSensors:
+    """psutil yerine: çekirdek frekansları ve sıcaklıklar testten ayarlanır"""
+    def __init__(self, ratio=1.0, cores=4, top=3000.0, temps=None, freq=True):
+        self.ratio = ratio
+        self.cores = cores
+        self.top = top
+        self.temps = temps or {}
+        self.freq = freq
+        self.temp_reads = 0
+
+    def cpu_freq(self, percpu=False):
+        if not self.freq:
+            raise NotImplementedError("frekans okunamıyor")
+        return [Freq(self.top * self.ratio, 800.0, self.top) for _ in range(self.cores)]
+
+    def sensors_temperatures(self):
+        self.temp_reads += 1
+        return self.temps
+
+
+def run(detector, start, end, load, step=1.0):
+    t = start
+    while t <= end:
+        detector.sample(t, load)
+        t += step
+
+
+@pytest.fixture
+def sensors():
+    return FakeSensors()
+
+
+@pytest.fixture
+def detector(alegro, sensors):
+    return alegro.ThrottleDetector(sensors=sensors, sustain=10.0, recovery=5.0, temp_interval=0.0)
+
+
+def test_episode_starts_only_after_sustain(detector, sensors):
+    sensors.ratio = 0.5
+    run(detector, 0, 9, load=90)
+    assert detector.active is None and detector.drain_events() == []
+
+    detector.sample(10, 90)
+    assert detector.last['throttled'] is True
+    (event,) = detector.drain_events()
+    assert event['type'] == 'started'
+    assert event['episode']['start'] == 0 and event['episode']['reasons'] == ['frekans']
+    assert event['episode']['min_ratio'] == 0.5
+
+
+def test_short_dip_is_not_an_episode(detector, sensors):
+    sensors.ratio = 0.5
+    run(detector, 0, 8, load=90)
+    sensors.ratio = 1.0
+    detector.sample(9, 90)
+    # Yeni düşüş kendi başlangıcından sayılır
+    sensors.ratio = 0.5
+    run(detector, 10, 19, load=90)
+    assert detector.active is None
+    detector.sample(20, 90)
+    assert detector.active['start'] == 10
+    assert list(detector.episodes) == []
+
+
+def test_recovery_closes_episode_at_first_clear_sample(detector, sensors):
+    sensors.ratio = 0.5
+    run(detector, 0, 19, load=90)
+    sensors.ratio = 1.0
+    run(detector, 20, 24, load=90)
+    assert detector.active is not None
+
+    detector.sample(25, 90)
+    assert detector.active is None
+    (episode,) = detector.episodes
+    assert episode['start'] == 0 and episode['end'] == 20 and episode['duration'] == 20
+    assert [e['type'] for e in detector.drain_events()] == ['started', 'ended']
+    assert detector.throttled_seconds() == 20
+    assert detector.throttled_seconds(since=15) == 5
+
+
+def test_relapse_during_recovery_extends_episode(detector, sensors):
+    sensors.ratio = 0.5
+    run(detector, 0, 12, load=90)
+    sensors.ratio = 1.0
+    run(detector, 13, 16, load=90)
+    sensors.ratio = 0.6
+    detector.sample(17, 90)
+    sensors.ratio = 1.0
+    run(detector, 18, 22, load=90)
+    assert detector.active is not None
+    detector.sample(23, 90)
+    (episode,) = detector.episodes
+    assert episode['end'] == 18 and episode['min_ratio'] == 0.5
+
+
+def test_idle_downclock_is_not_throttling(detector, sensors):
+    sensors.ratio = 0.3
+    run(detector, 0, 60, load=5)
+    assert detector.active is None and list(detector.episodes) == []
+    assert detector.throttled_share() == 0.0
+
+    # Aynı frekans yük altında kısılmadır
+    run(detector, 61, 71, load=detector.load_threshold)
+    assert detector.active is not None
+
+
+def test_turbo_is_capped_at_full_speed(detector, sensors):
+    sensors.ratio = 1.2
+    detector.sample(0, 100)
+    assert detector.last['ratio'] == 1.0
+
+
+def test_temperature_only_path(alegro):
+    sensors = FakeSensors(freq=False, temps={
+        'coretemp': [Temp('Package id 0', 95.0, None, None), Temp('Core 0', 80.0, 100.0, 105.0)],
+        # Öncelikli CPU sensörü varken diğer aygıtlar yok sayılır
+        'nvme': [Temp('Composite', 99.0, 80.0, 90.0)],
+    })
+    detector = alegro.ThrottleDetector(sensors=sensors, temp_limit=90.0, sustain=10.0, recovery=5.0,
+                                       temp_interval=0.0)
+    # Frekans okunamazken sıcaklık yükten bağımsız olarak tek başına yeterlidir
+    run(detector, 0, 10, load=0)
+    assert detector.last['ratio'] is None
+    assert detector.last['temperature'] == 95.0 and detector.last['limit'] == 90.0
+    assert detector.active['reasons'] == ['sıcaklık'] and detector.active['max_temp'] == 95.0
+
+    sensors.temps['coretemp'][0] = Temp('Package id 0', 85.0, None, None)
+    run(detector, 11, 16, load=0)
+    (episode,) = detector.episodes
+    assert episode['end'] == 11 and episode['min_ratio'] is None
+    assert any("sıcaklık" in line for line in detector.summary_lines())
+
+
+def test_sensor_limit_overrides_default(alegro):
+    sensors = FakeSensors(freq=False, temps={'k10temp': [Temp('Tctl', 85.0, 80.0, 95.0)]})
+    detector = alegro.ThrottleDetector(sensors=sensors, temp_limit=90.0, temp_interval=0.0)
+    detector.sample(0, 0)
+    assert detector.last['limit'] == 80.0 and detector._episode is not None
+
+
+def test_temperature_is_read_once_per_interval(alegro):
+    sensors = FakeSensors(temps={'coretemp': [Temp('Core 0', 60.0, 100.0, 105.0)]})
+    detector = alegro.ThrottleDetector(sensors=sensors, temp_interval=5.0)
+    run(detector, 0, 9, load=50)
+    assert sensors.temp_reads == 2
@@ -0,0 +1,147 @@
+"""TraceRecorder/read_trace/ReplayBackend: kayıt→tekrar, geri sarma, döngüde sayaç kaydırma, yarım dosya"""
+import gzip
+import json
+
+import pytest
+
+
+class Clock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+# Ardışık process durumları: ekleme, değişiklik, çıkış
+STATES = [
+    {1: ("init", 0.0, 100), 2: ("game", 50.0, 2000)},
+    {1: ("init", 0.0, 100), 2: ("game", 60.0, 2100), 3: ("chat", 1.0, 300)},
+    {1: ("init", 0.0, 100), 3: ("chat", 2.0, 300)},
+    {1: ("init", 0.0, 100), 3: ("chat", 2.0, 300), 4: ("bot", 5.0, 50)},
+    {4: ("bot", 6.0, 60)},
+]
+
+
+def snapshot(now, state):
+    return {'timestamp': now, 'processes': {
+        pid: {'name': name, 'cpu': cpu, 'rss': rss, 'uss': None, 'create_time': 1000.0 + pid}
+        for pid, (name, cpu, rss) in state.items()
+    }}
+
+
+def system_frame(t, cpu, recv):
+    return {'type': 'system', 't': t, 'cpu': cpu, 'memory': [8000, 4000, 50.0, 4000, 4000],
+            'disk_usage': None, 'freq': None,
+            'nics': {'eth0': [10, recv, 1, 1, 0, 0, 0, 0]}, 'disks': {}}
+
+
+def write_trace(alegro, path, frames):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        header = {'type': 'header', 'format': alegro.TRACE_FORMAT, 'version': alegro.TRACE_VERSION,
+                  'started': 1000.0, 'hostname': 'test', 'cpu_count': 2, 'cpu_cores': 1}
+        for record in [header] + frames:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+@pytest.fixture
+def recorded(alegro, tmp_path, monkeypatch):
+    """STATES'i 1 sn aralıkla, her 2 karede bir tam kare olacak şekilde kaydeder"""
+    clock = Clock(5000.0)
+    monkeypatch.setattr(alegro, 'system_time', clock)
+    recorder = alegro.TraceRecorder(tmp_path / 'trace_test.jsonl.gz', keyframe_every=2)
+    for index, state in enumerate(STATES):
+        clock.now = 5000.0 + index
+        recorder.record_system(10.0 * index)
+        recorder.record_processes(snapshot(clock.now, state))
+    recorder.close()
+    return recorder.path
+
+
+def table(backend):
+    return {p.info['pid']: (p.info['name'], p.info['cpu_percent'], p.info['memory_info'].rss)
+            for p in backend.process_iter(['pid', 'name', 'cpu_percent', 'memory_info'])}
+
+
+def test_round_trip_follows_frames(alegro, recorded):
+    records = list(alegro.read_trace(recorded))
+    assert records[0]['type'] == 'header' and records[0]['started'] == 5000.0
+    frames = [r for r in records if r['type'] == 'processes']
+    assert [bool(f.get('full')) for f in frames] == [True, False, True, False, True]
+
+    clock = Clock()
+    backend = alegro.ReplayBackend(recorded, clock=clock, real=None)
+    assert backend.duration == 4.0
+    for index, state in enumerate(STATES):
+        clock.now = index + 0.5
+        assert table(backend) == state
+        assert backend.cpu_percent() == 10.0 * index
+        # Tekrar sonunda zaman son karede durur
+        assert backend.trace_time() == pytest.approx(5000.0 + min(index + 0.5, backend.duration))
+
+
+def test_rewind_rebuilds_from_nearest_keyframe(alegro, recorded):
+    clock = Clock()
+    backend = alegro.ReplayBackend(recorded, clock=clock, real=None)
+    clock.now = 3.5
+    assert table(backend) == STATES[3]
+    # Geri sarma: 1. kare bir ara karedir, 0. tam kareden kurulur
+    clock.now = 1.5
+    assert table(backend) == STATES[1]
+    clock.now = 0.0
+    assert table(backend) == STATES[0]
+    clock.now = 2.5
+    assert table(backend) == STATES[2]
+
+
+def test_loop_offsets_counters_per_lap(alegro, tmp_path):
+    path = write_trace(alegro, tmp_path / 'trace_loop.jsonl.gz',
+                       [system_frame(0, 10.0, 100), system_frame(1, 20.0, 200), system_frame(2, 30.0, 300)])
+    clock = Clock()
+    backend = alegro.ReplayBackend(path, clock=clock, loop=True, real=None)
+    seen = []
+    for now in (0.5, 1.5, 2.5, 3.5, 4.5, 5.5):
+        clock.now = now
+        seen.append(backend.net_io_counters(pernic=True)['eth0'].bytes_recv)
+    # Her turda sayaç bir tur boyu (200) kayar; geri gitmez
+    assert seen == [100, 200, 300, 400, 500, 600]
+    assert backend.net_io_counters().bytes_recv == 600
+    assert backend.cpu_percent() == 20.0
+    assert not backend.finished
+
+
+def test_non_loop_holds_last_frame(alegro, tmp_path):
+    path = write_trace(alegro, tmp_path / 'trace_once.jsonl.gz',
+                       [system_frame(0, 10.0, 100), system_frame(2, 30.0, 300)])
+    clock = Clock()
+    backend = alegro.ReplayBackend(path, clock=clock, speed=2.0, real=None)
+    clock.now = 0.5
+    assert backend.cpu_percent() == 10.0 and not backend.finished
+    clock.now = 50.0
+    assert backend.elapsed() == 2.0 and backend.finished
+    assert backend.cpu_percent() == 30.0
+    assert backend.net_io_counters(pernic=True)['eth0'].bytes_recv == 300
+
+
+def test_truncated_gzip_tail_is_tolerated(alegro, tmp_path, recorded):
+    data = recorded.read_bytes()
+    truncated = tmp_path / 'trace_crash.jsonl.gz'
+    truncated.write_bytes(data[:len(data) - 40])
+
+    records = list(alegro.read_trace(truncated))
+    complete = list(alegro.read_trace(recorded))
+    assert 0 < len(records) < len(complete)
+    assert records == complete[:len(records)]
+    backend = alegro.ReplayBackend(truncated, clock=Clock(), real=None)
+    assert backend.duration <= 4.0
+
+
+def test_invalid_trace_is_rejected(alegro, tmp_path):
+    path = tmp_path / 'trace_bad.jsonl.gz'
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'header', 'format': 'other'}) + "\n")
+    with pytest.raises(ValueError):
+        alegro.ReplayBackend(path, clock=Clock(), real=None)
+    with pytest.raises(ValueError):
+        alegro.ReplayBackend(path, speed=500, clock=Clock(), real=None)